@@ -0,0 +1,192 @@
+"""Synthetic networks for the scaling benchmarks.
+
+The networks are built from the line and transformer catalogues of Roseau Load Flow, like the test
+networks of ``scripts/generate_test_networks.py``, but their size is configurable. A network is made
+of a MV source feeding radial MV feeders of MV/LV substations. Each substation supplies radial LV
+feeders of loaded buses. With ``meshed=True``, the ends of neighbouring MV feeders are connected
+by a line and the ends of neighbouring LV feeders are connected by a closed switch.
+
+The sizes of the benchmarked networks default to 1k and 10k buses. Larger sizes can be benchmarked
+by setting the ``ROSEAU_BENCHMARK_SIZES`` environment variable, e.g.
+``ROSEAU_BENCHMARK_SIZES=1000,10000,100000,200000 pytest benchmarks/``.
+"""
+
+import math
+import os
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+import pytest
+from shapely import LineString, Point
+
+import roseau.load_flow as rlf
+import roseau.load_flow_single as rlfs
+
+type Package = Literal["rlf", "rlfs"]
+type Topology = Literal["radial", "meshed"]
+
+BENCHMARK_SIZES = tuple(int(s) for s in os.getenv("ROSEAU_BENCHMARK_SIZES", "1000,10000").split(","))
+
+# Structure of the synthetic networks
+N_LV_FEEDERS = 4  # LV feeders per substation
+LV_FEEDER_LENGTH = 12  # LV buses per LV feeder
+N_SUBSTATIONS_PER_MV_FEEDER = 25
+BUSES_PER_SUBSTATION = 2 + N_LV_FEEDERS * LV_FEEDER_LENGTH  # MV bus, LV busbar and the LV feeders buses
+
+# Geometry of the synthetic networks (degrees)
+ORIGIN = (-1.3184, 48.6479)
+MV_STEP = 0.005
+LV_STEP = 0.0004
+
+
+def generate_synthetic_network(
+    package: Package, n_buses: int, *, meshed: bool = False, seed: int = 42
+) -> rlf.ElectricalNetwork | rlfs.ElectricalNetwork:
+    """Generate a synthetic MV/LV network of approximately ``n_buses`` buses.
+
+    Args:
+        package:
+            ``"rlf"`` for a multi-phase network, ``"rlfs"`` for a single-phase equivalent network.
+
+        n_buses:
+            The approximate number of buses of the network. It is rounded to a multiple of the
+            number of buses of a substation.
+
+        meshed:
+            If True, the MV and the LV feeders are meshed, otherwise the network is radial.
+
+        seed:
+            The seed of the random generator of the loads powers and the LV lines lengths.
+
+    Returns:
+        The generated network.
+    """
+    rng = np.random.default_rng(seed)
+    is_multi_phase = package == "rlf"
+    m = rlf if is_multi_phase else rlfs
+    n_substations = max(1, round((n_buses - 1) / BUSES_PER_SUBSTATION))
+    n_mv_feeders = math.ceil(n_substations / N_SUBSTATIONS_PER_MV_FEEDER)
+
+    if is_multi_phase:
+        mv_lp = rlf.LineParameters.from_catalogue(name="U_AL_240", nb_phases=3)
+        lv_lp = rlf.LineParameters.from_catalogue(name="U_AL_150", nb_phases=4)
+    else:
+        mv_lp = rlfs.LineParameters.from_catalogue(name="U_AL_240")
+        lv_lp = rlfs.LineParameters.from_catalogue(name="U_AL_150")
+    tp = m.TransformerParameters.from_catalogue(name="FT 400kVA 15/20kV(20) 400V Dyn11")
+
+    mv_kw = {"phases": "abc"} if is_multi_phase else {}
+    lv_kw = {"phases": "abcn"} if is_multi_phase else {}
+    buses, lines, transformers, switches, loads = [], [], [], [], []
+    ground_kw, line_kw = {}, {}
+
+    # MV source
+    source_point = Point(*ORIGIN)
+    source_bus = m.Bus(id="mv_source", geometry=source_point, nominal_voltage=20e3, **mv_kw)
+    buses.append(source_bus)
+    if is_multi_phase:
+        source = rlf.VoltageSource(id="source", bus=source_bus, voltages=20e3, phases="abc")
+        ground = rlf.Ground(id="ground")
+        ground_kw = {
+            "grounds": [ground],
+            "potential_refs": [rlf.PotentialRef(id="pref", element=ground)],
+            "ground_connections": [],
+        }
+        line_kw = {"ground": ground}  # for the shunt admittances of the lines
+    else:
+        source = rlfs.VoltageSource(id="source", bus=source_bus, voltage=20e3)
+
+    def add_line(line_id, bus1, bus2, parameters, length):
+        geometry = LineString([bus1.geometry, bus2.geometry])
+        lines.append(m.Line(line_id, bus1, bus2, parameters=parameters, length=length, geometry=geometry, **line_kw))
+
+    def add_load(load_id, bus, power):
+        if is_multi_phase:
+            phase = "abc"[rng.integers(3)]
+            loads.append(rlf.PowerLoad(load_id, bus, powers=[power], phases=f"{phase}n"))
+        else:
+            loads.append(rlfs.PowerLoad(load_id, bus, power=power))
+
+    feeder_ends = []
+    previous_mv_bus = source_bus
+    for s in range(n_substations):
+        f, i = divmod(s, N_SUBSTATIONS_PER_MV_FEEDER)
+        angle = 2 * np.pi * f / n_mv_feeders
+        direction = complex(math.cos(angle), math.sin(angle))
+        center = complex(*ORIGIN) + (i + 1) * MV_STEP * direction
+
+        # MV bus and line from the previous MV bus of the feeder
+        mv_bus = m.Bus(id=f"mv{s}", geometry=Point(center.real, center.imag), nominal_voltage=20e3, **mv_kw)
+        buses.append(mv_bus)
+        add_line(f"mv_line{s}", source_bus if i == 0 else previous_mv_bus, mv_bus, mv_lp, length=0.5)
+        previous_mv_bus = mv_bus
+        if i == N_SUBSTATIONS_PER_MV_FEEDER - 1 or s == n_substations - 1:
+            feeder_ends.append(mv_bus)
+
+        # Substation
+        lv_bus = m.Bus(id=f"lv{s}", geometry=Point(center.real, center.imag), nominal_voltage=400, **lv_kw)
+        buses.append(lv_bus)
+        transformers.append(m.Transformer(id=f"tr{s}", bus_hv=mv_bus, bus_lv=lv_bus, parameters=tp))
+        if is_multi_phase:
+            ground_kw["ground_connections"].append(rlf.GroundConnection(id=f"gc{s}", ground=ground, element=lv_bus))
+
+        # LV feeders
+        lv_ends = []
+        for j in range(N_LV_FEEDERS):
+            lv_direction = direction * complex(math.cos(np.pi * j / N_LV_FEEDERS), math.sin(np.pi * j / N_LV_FEEDERS))
+            previous_bus = lv_bus
+            for k in range(LV_FEEDER_LENGTH):
+                point = center + (k + 1) * LV_STEP * lv_direction
+                bus = m.Bus(id=f"lv{s}_{j}_{k}", geometry=Point(point.real, point.imag), nominal_voltage=400, **lv_kw)
+                buses.append(bus)
+                add_line(f"lv_line{s}_{j}_{k}", previous_bus, bus, lv_lp, length=rng.uniform(0.02, 0.05))
+                add_load(f"load{s}_{j}_{k}", bus, complex(rng.uniform(1e3, 6e3), rng.uniform(0, 1e3)))
+                previous_bus = bus
+            lv_ends.append(previous_bus)
+        if meshed:
+            for j in range(N_LV_FEEDERS - 1):
+                switches.append(m.Switch(id=f"sw{s}_{j}", bus1=lv_ends[j], bus2=lv_ends[j + 1], **lv_kw))
+
+    if meshed:
+        for f in range(len(feeder_ends) - 1):
+            add_line(f"mv_loop{f}", feeder_ends[f], feeder_ends[f + 1], mv_lp, length=2.0)
+
+    return m.ElectricalNetwork(
+        buses=buses,
+        lines=lines,
+        transformers=transformers,
+        switches=switches,
+        loads=loads,
+        sources=[source],
+        **ground_kw,
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_network() -> Callable[..., rlf.ElectricalNetwork | rlfs.ElectricalNetwork]:
+    """A cached factory of synthetic networks.
+
+    The networks are shared by the benchmarks of a session: they must not be modified.
+    """
+    cache: dict[tuple[Package, int, Topology], rlf.ElectricalNetwork | rlfs.ElectricalNetwork] = {}
+
+    def get(package: Package, n_buses: int, topology: Topology = "radial"):
+        key = (package, n_buses, topology)
+        if key not in cache:
+            cache[key] = generate_synthetic_network(package, n_buses, meshed=topology == "meshed")
+        return cache[key]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def synthetic_network_generator() -> Callable[..., rlf.ElectricalNetwork | rlfs.ElectricalNetwork]:
+    """The generator of synthetic networks, to benchmark the construction of networks."""
+    return generate_synthetic_network
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    # Parametrize the scaling benchmarks by network size
+    if "n_buses" in metafunc.fixturenames:
+        metafunc.parametrize("n_buses", BENCHMARK_SIZES, ids=lambda n: f"{n}buses")
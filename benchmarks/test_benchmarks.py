@@ -1,8 +1,10 @@
 """Performance benchmarks for Roseau Load Flow, measured with CodSpeed."""
 
 import json
+import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 import roseau.load_flow as rlf
@@ -80,6 +82,32 @@ def test_rlfs_to_dict(benchmark, rlfs_network_path):
     benchmark(en.to_dict, include_results=True)
 
 
+# Network copy benchmarks
+# -----------------------
+def test_rlf_copy(benchmark, rlf_network_path):
+    """Benchmark the copy of rlf.ElectricalNetwork."""
+    en = rlf.ElectricalNetwork.from_json(rlf_network_path)
+    benchmark(en.copy, include_results=True)
+
+
+def test_rlfs_copy(benchmark, rlfs_network_path):
+    """Benchmark the copy of rlfs.ElectricalNetwork."""
+    en = rlfs.ElectricalNetwork.from_json(rlfs_network_path)
+    benchmark(en.copy, include_results=True)
+
+
+# Catalogue benchmarks
+# --------------------
+def test_rlf_from_catalogue(benchmark):
+    """Benchmark the creation of rlf.ElectricalNetwork from the catalogue (cached after the first call)."""
+    benchmark(rlf.ElectricalNetwork.from_catalogue, name="MVFeeder251", load_point_name="Summer")
+
+
+def test_rlfs_from_catalogue(benchmark):
+    """Benchmark the creation of rlfs.ElectricalNetwork from the catalogue (cached after the first call)."""
+    benchmark(rlfs.ElectricalNetwork.from_catalogue, name="MVFeeder251", load_point_name="Summer")
+
+
 # DGS serialization benchmarks
 # ----------------------------
 def test_rlf_from_dgs(benchmark, dgs_network_path):
@@ -284,3 +312,47 @@ def test_rlfs_elements_results_extraction(benchmark, rlfs_network_path):
             _ = src.res_current.m
             _ = src.res_voltage.m
             _ = src.res_power.m
+
+
+# Memory footprint benchmarks
+# ---------------------------
+def _element_nbytes(element: "rlf.utils.mixins.AbstractElement") -> int:
+    """The approximate number of bytes owned by an element (including its branch sides and arrays)."""
+    nbytes = sys.getsizeof(element)
+    for cls in type(element).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            value = getattr(element, name, None)
+            if isinstance(value, np.ndarray | list | set | dict):
+                nbytes += sys.getsizeof(value)
+            elif isinstance(value, rlf.utils.mixins.AbstractElement) and name in {"_side1", "_side2"}:
+                nbytes += _element_nbytes(value)
+    return nbytes
+
+
+def _elements_nbytes(en: rlf.ElectricalNetwork | rlfs.ElectricalNetwork) -> dict[str, float]:
+    """The mean number of bytes per element type of a network."""
+    sizes: dict[str, list[int]] = {}
+    for elements in en._elements_by_type.values():
+        for element in elements.values():
+            sizes.setdefault(element.element_type, []).append(_element_nbytes(element))
+    return {element_type: sum(s) / len(s) for element_type, s in sizes.items()}
+
+
+def test_rlf_elements_memory(benchmark, record_property, rlf_network_path):
+    """Benchmark the creation of rlf.ElectricalNetwork and record the bytes used per element type."""
+    with open(rlf_network_path, encoding="utf-8") as f:
+        network_dict = json.load(f)
+    en = benchmark(rlf.ElectricalNetwork.from_dict, network_dict, include_results=False)
+    assert not any(hasattr(e, "__dict__") for e in en._elements)
+    for element_type, nbytes in _elements_nbytes(en).items():
+        record_property(f"{element_type}_nbytes", nbytes)
+
+
+def test_rlfs_elements_memory(benchmark, record_property, rlfs_network_path):
+    """Benchmark the creation of rlfs.ElectricalNetwork and record the bytes used per element type."""
+    with open(rlfs_network_path, encoding="utf-8") as f:
+        network_dict = json.load(f)
+    en = benchmark(rlfs.ElectricalNetwork.from_dict, network_dict, include_results=False)
+    assert not any(hasattr(e, "__dict__") for e in en._elements)
+    for element_type, nbytes in _elements_nbytes(en).items():
+        record_property(f"{element_type}_nbytes", nbytes)
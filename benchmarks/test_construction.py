@@ -0,0 +1,116 @@
+"""Microbenchmarks of the construction of the elements of Roseau Load Flow.
+
+Each benchmark creates ``N_ELEMENTS`` elements of one type, connected to buses created beforehand,
+either free (``"free"``) or already part of a network (``"network"``, the new elements are then
+added to the network). The throughput of a plain run is recorded in the ``elements_per_minute``
+property and compared to the target of ``THROUGHPUT_TARGET`` elements per minute in the
+``meets_target`` property. The throughputs measured by instrumented runs (CodSpeed) are much lower
+and must not be compared to the target.
+
+Loading trusted data (e.g. ``ElectricalNetwork.from_json``) runs the same checks, there is no
+unvalidated fast path: on a network of 10k buses, the checks take less than a tenth of the time of
+``from_dict``, which is dominated by the initialization of the solver of the engine. Pass
+``copy=False`` to ``from_dict`` to skip the copy of the input dictionary instead.
+"""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+import roseau.load_flow as rlf
+import roseau.load_flow_single as rlfs
+
+N_ELEMENTS = 10_000
+THROUGHPUT_TARGET = 1_000_000  # elements per minute
+
+type Builder = Callable[[list, int], object]
+
+
+def _rlf_builders() -> dict[str, Builder]:
+    lp = rlf.LineParameters(id="lp", z_line=(0.2 + 0.1j) * np.eye(4, dtype=np.complex128))
+    tp = rlf.TransformerParameters.from_catalogue(name="FT 100kVA 15/20kV(20) 400V Dyn11")
+    ground = rlf.Ground(id="ground")
+    return {
+        "bus": lambda buses, i: rlf.Bus(id=f"new{i}", phases="abcn"),
+        "line": lambda buses, i: rlf.Line(id=i, bus1=buses[i], bus2=buses[i + 1], parameters=lp, length=0.1),
+        "switch": lambda buses, i: rlf.Switch(id=i, bus1=buses[i], bus2=buses[i + 1]),
+        "transformer": lambda buses, i: rlf.Transformer(id=i, bus_hv=buses[i], bus_lv=buses[i + 1], parameters=tp),
+        "power_load": lambda buses, i: rlf.PowerLoad(id=i, bus=buses[i], powers=[1000, 1000, 1000]),
+        "current_load": lambda buses, i: rlf.CurrentLoad(id=i, bus=buses[i], currents=[5, 5, 5]),
+        "impedance_load": lambda buses, i: rlf.ImpedanceLoad(id=i, bus=buses[i], impedances=[50, 50, 50]),
+        "voltage_source": lambda buses, i: rlf.VoltageSource(id=i, bus=buses[i], voltages=230),
+        "ground_connection": lambda buses, i: rlf.GroundConnection(id=i, ground=ground, element=buses[i]),
+        "potential_ref": lambda buses, i: rlf.PotentialRef(id=i, element=buses[i]),
+    }
+
+
+def _rlfs_builders() -> dict[str, Builder]:
+    lp = rlfs.LineParameters(id="lp", z_line=0.2 + 0.1j)
+    tp = rlfs.TransformerParameters.from_catalogue(name="FT 100kVA 15/20kV(20) 400V Dyn11")
+    return {
+        "bus": lambda buses, i: rlfs.Bus(id=f"new{i}"),
+        "line": lambda buses, i: rlfs.Line(id=i, bus1=buses[i], bus2=buses[i + 1], parameters=lp, length=0.1),
+        "switch": lambda buses, i: rlfs.Switch(id=i, bus1=buses[i], bus2=buses[i + 1]),
+        "transformer": lambda buses, i: rlfs.Transformer(id=i, bus_hv=buses[i], bus_lv=buses[i + 1], parameters=tp),
+        "power_load": lambda buses, i: rlfs.PowerLoad(id=i, bus=buses[i], power=3000),
+        "current_load": lambda buses, i: rlfs.CurrentLoad(id=i, bus=buses[i], current=5),
+        "impedance_load": lambda buses, i: rlfs.ImpedanceLoad(id=i, bus=buses[i], impedance=50),
+        "voltage_source": lambda buses, i: rlfs.VoltageSource(id=i, bus=buses[i], voltage=400),
+    }
+
+
+BUILDERS = {"rlf": _rlf_builders, "rlfs": _rlfs_builders}
+CASES = [(package, et) for package, builders in BUILDERS.items() for et in builders()]
+
+
+def _setup_buses(package: str, connection: str) -> list:
+    """Create the buses the elements are connected to, part of a network if ``connection="network"``."""
+    if package == "rlf":
+        buses = [rlf.Bus(id=i, phases="abcn") for i in range(N_ELEMENTS + 1)]
+    else:
+        buses = [rlfs.Bus(id=i) for i in range(N_ELEMENTS + 1)]
+    if connection == "network":
+        # A feeder of lines with a source at its start, the elements are added in parallel
+        if package == "rlf":
+            lp = rlf.LineParameters(id="feeder", z_line=0.1 * np.eye(4, dtype=np.complex128))
+            for i in range(N_ELEMENTS):
+                rlf.Line(id=f"feeder{i}", bus1=buses[i], bus2=buses[i + 1], parameters=lp, length=0.1)
+            rlf.VoltageSource(id="source", bus=buses[0], voltages=230)
+            rlf.PotentialRef(id="pref", element=buses[0])
+            rlf.ElectricalNetwork.from_element(buses[0])
+        else:
+            lp = rlfs.LineParameters(id="feeder", z_line=0.1)
+            for i in range(N_ELEMENTS):
+                rlfs.Line(id=f"feeder{i}", bus1=buses[i], bus2=buses[i + 1], parameters=lp, length=0.1)
+            rlfs.VoltageSource(id="source", bus=buses[0], voltage=400)
+            rlfs.ElectricalNetwork.from_element(buses[0])
+    return buses
+
+
+def _create_elements(builder: Builder, buses: list) -> None:
+    for i in range(N_ELEMENTS):
+        builder(buses, i)
+
+
+@pytest.mark.parametrize("connection", ("free", "network"))
+@pytest.mark.parametrize(("package", "element_type"), CASES, ids=[f"{p}-{et}" for p, et in CASES])
+def test_element_construction(benchmark, record_property, package, element_type, connection):
+    """Benchmark the creation of many elements of one type."""
+    if connection == "network" and element_type == "bus":
+        pytest.skip("New buses are never connected to a network.")
+
+    def setup():
+        # New parameters and ground for each run, the ground joins the network of the buses
+        return (BUILDERS[package]()[element_type], _setup_buses(package, connection)), {}
+
+    # Measure the throughput of a plain run
+    args, _ = setup()
+    start = time.perf_counter()
+    _create_elements(*args)
+    throughput = 60 * N_ELEMENTS / (time.perf_counter() - start)
+    record_property("elements_per_minute", round(throughput))
+    record_property("meets_target", throughput >= THROUGHPUT_TARGET)
+
+    benchmark.pedantic(_create_elements, setup=setup, rounds=1)
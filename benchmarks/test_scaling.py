@@ -0,0 +1,396 @@
+"""Scaling benchmarks of Roseau Load Flow on synthetic networks of increasing size.
+
+Each benchmark measures the time of one stage of a typical study and records the peak memory
+allocated by the stage (``peak_memory_bytes`` property). Comparing the results of the different
+sizes shows stages whose cost grows faster than the size of the network.
+
+The creation of networks from data frames is also benchmarked for a total number of rows given by
+the ``ROSEAU_BENCHMARK_ROWS`` environment variable, e.g. ``ROSEAU_BENCHMARK_ROWS=400000`` for the
+size of a nightly import of an asset database. The number of rows is recorded in the ``n_rows``
+property. These benchmarks are skipped when the variable is not set.
+"""
+
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+import shapely
+
+import roseau.load_flow as rlf
+import roseau.load_flow_single as rlfs
+from roseau.load_flow.testing import assert_json_close
+from roseau.load_flow.utils.spatial import SpatialIndex
+
+PACKAGES = pytest.mark.parametrize("package", ("rlf", "rlfs"))
+TOPOLOGIES = pytest.mark.parametrize("topology", ("radial", "meshed"))
+BENCHMARK_ROWS = tuple(int(n) for n in os.getenv("ROSEAU_BENCHMARK_ROWS", "").split(",") if n)
+
+
+def _package(package: str):
+    return rlf if package == "rlf" else rlfs
+
+
+def _record_peak_memory(record_property, func, /, *args, **kwargs) -> None:
+    """Record the peak memory allocated by a call of ``func``."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    record_property("peak_memory_bytes", peak)
+
+
+# Construction benchmarks
+# -----------------------
+@PACKAGES
+@TOPOLOGIES
+def test_construction(benchmark, record_property, synthetic_network_generator, package, n_buses, topology):
+    """Benchmark the creation of the elements and the network (including its validation)."""
+    meshed = topology == "meshed"
+    _record_peak_memory(record_property, synthetic_network_generator, package, n_buses, meshed=meshed)
+    benchmark(synthetic_network_generator, package, n_buses, meshed=meshed)
+
+
+def _create_feeder(package: str, n_buses: int) -> None:
+    """Create a feeder of ``n_buses`` buses connected by lines sharing the same parameters."""
+    pkg = _package(package)
+    if package == "rlf":
+        buses = [pkg.Bus(id=i, phases="abcn") for i in range(n_buses)]
+        lp = pkg.LineParameters(id="lp", z_line=(0.2 + 0.1j) * np.eye(4, dtype=np.complex128))
+    else:
+        buses = [pkg.Bus(id=i) for i in range(n_buses)]
+        lp = pkg.LineParameters(id="lp", z_line=0.2 + 0.1j)
+    lengths = np.full(n_buses - 1, 0.1)
+    pkg.Line.from_arrays(list(range(n_buses - 1)), buses[:-1], buses[1:], parameters=lp, lengths=lengths)
+
+
+@PACKAGES
+def test_lines_from_arrays(benchmark, record_property, package, n_buses):
+    """Benchmark the creation of many lines sharing the same parameters."""
+    _record_peak_memory(record_property, _create_feeder, package, n_buses)
+    benchmark(_create_feeder, package, n_buses)
+
+
+def _attach_loads(package: str, n_loads: int) -> None:
+    """Attach ``n_loads`` loads to the single bus of a network and disconnect them."""
+    pkg = _package(package)
+    if package == "rlf":
+        bus = pkg.Bus(id="bus", phases="abcn")
+        pkg.VoltageSource(id="source", bus=bus, voltages=230)
+        pkg.PotentialRef(id="pref", element=bus)
+        pkg.ElectricalNetwork.from_element(bus)
+        loads = [pkg.PowerLoad(id=i, bus=bus, powers=[100, 100, 100]) for i in range(n_loads)]
+    else:
+        bus = pkg.Bus(id="bus")
+        pkg.VoltageSource(id="source", bus=bus, voltage=400)
+        pkg.ElectricalNetwork.from_element(bus)
+        loads = [pkg.PowerLoad(id=i, bus=bus, power=300) for i in range(n_loads)]
+    for load in loads:
+        load.disconnect()
+
+
+@PACKAGES
+@pytest.mark.parametrize("n_loads", (10_000,), ids=lambda n: f"{n}loads")
+def test_high_degree_bus(benchmark, record_property, package, n_loads):
+    """Benchmark the connection and disconnection of many loads on a single bus."""
+    _record_peak_memory(record_property, _attach_loads, package, n_loads)
+    benchmark(_attach_loads, package, n_loads)
+
+
+@PACKAGES
+def test_copy(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the copy of the network."""
+    en = synthetic_network(package, n_buses)
+    _record_peak_memory(record_property, en.copy)
+    benchmark(en.copy)
+
+
+# Serialization benchmarks
+# ------------------------
+@PACKAGES
+def test_to_dict(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the serialization of the network to a dictionary."""
+    en = synthetic_network(package, n_buses)
+    _record_peak_memory(record_property, en.to_dict, include_results=False)
+    benchmark(en.to_dict, include_results=False)
+
+
+@PACKAGES
+def test_from_dict(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the creation of the network from a dictionary."""
+    data = synthetic_network(package, n_buses).to_dict(include_results=False)
+    from_dict = _package(package).ElectricalNetwork.from_dict
+    _record_peak_memory(record_property, from_dict, data, include_results=False)
+    benchmark(from_dict, data, include_results=False)
+
+
+def _network_frames(en) -> dict:
+    """The frames and the parameters to create a copy of a network with `from_frames`."""
+    extra = {}
+    if en.is_multi_phase:
+        extra = {
+            "grounds": en.grounds_frame,
+            "potential_refs": en.potential_refs_frame,
+            "ground_connections": en.ground_connections_frame,
+        }
+    return {
+        "buses": en.buses_frame,
+        "lines": en.lines_frame,
+        "transformers": en.transformers_frame,
+        "switches": en.switches_frame,
+        "loads": en.loads_frame,
+        "sources": en.sources_frame,
+        "lines_params": {line.parameters.id: line.parameters for line in en.lines.values()},
+        "transformers_params": {tr.parameters.id: tr.parameters for tr in en.transformers.values()},
+        **extra,
+    }
+
+
+def _count_rows(frames: dict) -> int:
+    """The total number of rows of the frames returned by `_network_frames`."""
+    return sum(len(frame) for key, frame in frames.items() if not key.endswith("_params"))
+
+
+@PACKAGES
+def test_from_frames(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the creation of the network from data frames."""
+    frames = _network_frames(synthetic_network(package, n_buses))
+    from_frames = _package(package).ElectricalNetwork.from_frames
+    record_property("n_rows", _count_rows(frames))
+    _record_peak_memory(record_property, from_frames, **frames)
+    benchmark(from_frames, **frames)
+
+
+@PACKAGES
+@pytest.mark.skipif(not BENCHMARK_ROWS, reason="ROSEAU_BENCHMARK_ROWS is not set")
+@pytest.mark.parametrize("n_rows", BENCHMARK_ROWS, ids=lambda n: f"{n}rows")
+def test_from_frames_rows(benchmark, record_property, synthetic_network, package, n_rows):
+    """Benchmark the creation of a network from data frames with a total of about ``n_rows`` rows."""
+    # The number of rows per bus does not depend on the size of the synthetic networks
+    small = synthetic_network(package, 1000)
+    rows_per_bus = _count_rows(_network_frames(small)) / len(small.buses)
+    frames = _network_frames(synthetic_network(package, round(n_rows / rows_per_bus)))
+    from_frames = _package(package).ElectricalNetwork.from_frames
+    record_property("n_rows", _count_rows(frames))
+    _record_peak_memory(record_property, from_frames, **frames)
+    benchmark.pedantic(from_frames, kwargs=frames, rounds=3)
+
+
+@PACKAGES
+def test_to_json(benchmark, record_property, synthetic_network, package, n_buses, tmp_path):
+    """Benchmark the serialization of the network to a JSON file."""
+    en = synthetic_network(package, n_buses)
+    path = tmp_path / "network.json"
+    _record_peak_memory(record_property, en.to_json, path, include_results=False)
+    benchmark(en.to_json, path, include_results=False)
+
+
+@PACKAGES
+def test_from_json(benchmark, record_property, synthetic_network, package, n_buses, tmp_path):
+    """Benchmark the creation of the network from a JSON file."""
+    path = synthetic_network(package, n_buses).to_json(tmp_path / "network.json", include_results=False)
+    from_json = _package(package).ElectricalNetwork.from_json
+    _record_peak_memory(record_property, from_json, path, include_results=False)
+    benchmark(from_json, path, include_results=False)
+
+
+def test_rlfs_to_dgs(benchmark, record_property, synthetic_network, n_buses):
+    """Benchmark the serialization of rlfs.ElectricalNetwork to a DGS dictionary."""
+    en = synthetic_network("rlfs", n_buses)
+    _record_peak_memory(record_property, en.to_dgs_dict)
+    benchmark(en.to_dgs_dict)
+
+
+def test_rlfs_to_dgs_file(benchmark, record_property, synthetic_network, n_buses, tmp_path):
+    """Benchmark the serialization of rlfs.ElectricalNetwork to a DGS JSON file."""
+    en = synthetic_network("rlfs", n_buses)
+    path = tmp_path / "network.json"
+    _record_peak_memory(record_property, en.to_dgs_file, path)
+    benchmark(en.to_dgs_file, path)
+
+
+# RLF conversion benchmarks
+# -------------------------
+def test_rlfs_from_rlf(benchmark, record_property, synthetic_network, n_buses):
+    """Benchmark the conversion of rlf.ElectricalNetwork to rlfs.ElectricalNetwork."""
+    en_m = synthetic_network("rlf", n_buses)
+    _record_peak_memory(record_property, rlfs.ElectricalNetwork.from_rlf, en_m, on_incompatible="ignore")
+    benchmark(rlfs.ElectricalNetwork.from_rlf, en_m, on_incompatible="ignore")
+
+
+# Comparison benchmarks
+# ---------------------
+def _assert_json_close(en, other) -> None:
+    """Compare the dictionaries of two networks like the tests did before `ElectricalNetwork.diff`."""
+    assert_json_close(en.to_dict(include_results=False), other.to_dict(include_results=False))
+
+
+@PACKAGES
+def test_diff(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the comparison of the network with its copy.
+
+    The speedup over the comparison of their dictionaries with `assert_json_close` measured by
+    plain runs is recorded in the ``speedup`` property.
+    """
+    en = synthetic_network(package, n_buses)
+    other = en.copy()
+    start = time.perf_counter()
+    en.diff(other)
+    diff_time = time.perf_counter() - start
+    start = time.perf_counter()
+    _assert_json_close(en, other)
+    record_property("speedup", round((time.perf_counter() - start) / diff_time, 1))
+    _record_peak_memory(record_property, en.diff, other)
+    benchmark(en.diff, other)
+
+
+@PACKAGES
+def test_assert_json_close(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the comparison of the dictionaries of the network and its copy, the baseline of `test_diff`."""
+    en = synthetic_network(package, n_buses)
+    other = en.copy()
+    _record_peak_memory(record_property, _assert_json_close, en, other)
+    benchmark(_assert_json_close, en, other)
+
+
+# Data preparation benchmarks
+# ---------------------------
+@PACKAGES
+@TOPOLOGIES
+@pytest.mark.parametrize("geometry", (False, True), ids=("no_geometry", "geometry"))
+def test_to_graph(benchmark, record_property, synthetic_network, package, n_buses, topology, geometry):
+    """Benchmark the conversion of the network to a networkx graph, with or without the geometries."""
+    en = synthetic_network(package, n_buses, topology)
+    _record_peak_memory(record_property, en.to_graph, geometry=geometry)
+    benchmark(en.to_graph, geometry=geometry)
+
+
+@PACKAGES
+@TOPOLOGIES
+def test_to_sparse_graph(benchmark, record_property, synthetic_network, package, n_buses, topology):
+    """Benchmark the conversion of the network to sparse incidence and adjacency matrices."""
+    en = synthetic_network(package, n_buses, topology)
+    _record_peak_memory(record_property, en.to_sparse_graph, weight="length")
+    benchmark(en.to_sparse_graph, weight="length")
+
+
+@PACKAGES
+@TOPOLOGIES
+def test_to_rustworkx(benchmark, record_property, synthetic_network, package, n_buses, topology):
+    """Benchmark the conversion of the network to a rustworkx graph."""
+    en = synthetic_network(package, n_buses, topology)
+    _record_peak_memory(record_property, en.to_rustworkx)
+    benchmark(en.to_rustworkx)
+
+
+@PACKAGES
+def test_frames(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the creation of the data frames of the network elements."""
+    en = synthetic_network(package, n_buses)
+
+    def _frames():
+        _ = en.buses_frame
+        _ = en.lines_frame
+        _ = en.transformers_frame
+        _ = en.switches_frame
+        _ = en.loads_frame
+        _ = en.sources_frame
+
+    _record_peak_memory(record_property, _frames)
+    benchmark(_frames)
+
+
+@PACKAGES
+def test_map_data(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the preparation of the data of the interactive map plots."""
+    en = synthetic_network(package, n_buses)
+    plotting = _package(package).plotting
+
+    def _map_data():
+        buses = plotting._get_buses_data_for_map_plot(en, with_results=False)
+        _ = plotting._get_lines_data_for_map_plot(en, with_results=False)
+        _ = plotting._get_transformers_data_for_map_plot(en, with_results=False, buses_frame=buses)
+        _ = plotting._get_switches_data_for_map_plot(en, with_results=False)
+
+    _record_peak_memory(record_property, _map_data)
+    benchmark(_map_data)
+
+
+# Spatial query benchmarks
+# ------------------------
+def _query_points(en, n_points: int, seed: int = 42):
+    """Random points in the bounding box of the buses of the network."""
+    xmin, ymin, xmax, ymax = shapely.total_bounds([bus.geometry for bus in en.buses.values()])
+    rng = np.random.default_rng(seed)
+    return np.column_stack((rng.uniform(xmin, xmax, n_points), rng.uniform(ymin, ymax, n_points)))
+
+
+@PACKAGES
+def test_spatial_index(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the creation of the spatial indexes of the buses and the lines."""
+    en = synthetic_network(package, n_buses)
+
+    def _indexes():
+        _ = SpatialIndex(en.buses.values())
+        _ = SpatialIndex(en.lines.values())
+
+    _record_peak_memory(record_property, _indexes)
+    benchmark(_indexes)
+
+
+@PACKAGES
+@pytest.mark.parametrize("k", (1, 5))
+def test_nearest_buses(benchmark, record_property, synthetic_network, package, n_buses, k):
+    """Benchmark the search of the nearest buses of 1000 points with a cached spatial index."""
+    en = synthetic_network(package, n_buses)
+    points = _query_points(en, 1000)
+    _record_peak_memory(record_property, en.nearest_buses, points, k=k)
+    benchmark(en.nearest_buses, points, k=k)
+
+
+@PACKAGES
+def test_elements_within(benchmark, record_property, synthetic_network, package, n_buses):
+    """Benchmark the search of the elements within 100 small polygons with cached spatial indexes."""
+    en = synthetic_network(package, n_buses)
+    polygons = shapely.buffer(shapely.points(_query_points(en, 100)), 0.002)
+
+    def _within():
+        for polygon in polygons:
+            _ = en.elements_within(polygon)
+
+    _record_peak_memory(record_property, _within)
+    benchmark(_within)
+
+
+# Load flow benchmarks (they require a license)
+# ---------------------------------------------
+@pytest.mark.no_patch_engine
+@PACKAGES
+@TOPOLOGIES
+def test_solve_load_flow(benchmark, record_property, synthetic_network_generator, package, n_buses, topology):
+    """Benchmark a cold load flow on the network."""
+    en = synthetic_network_generator(package, n_buses, meshed=topology == "meshed")
+    _record_peak_memory(record_property, en.solve_load_flow, warm_start=False)
+    benchmark(en.solve_load_flow, warm_start=False)
+
+
+@pytest.mark.no_patch_engine
+@PACKAGES
+def test_results_extraction(benchmark, record_property, synthetic_network_generator, package, n_buses):
+    """Benchmark the extraction of the results data frames of the network."""
+    en = synthetic_network_generator(package, n_buses)
+    en.solve_load_flow()
+
+    def _extract():
+        _ = en.res_buses
+        _ = en.res_lines
+        _ = en.res_transformers
+        _ = en.res_switches
+        _ = en.res_loads
+        _ = en.res_sources
+
+    _record_peak_memory(record_property, _extract)
+    benchmark(_extract)
@@ -20,8 +20,12 @@ from roseau.load_flow.__about__ import (
     __status__,
     __url__,
 )
+from roseau.load_flow.aggregation import ResultsAggregator
 from roseau.load_flow.constants import SQRT3
+from roseau.load_flow.contingency import Contingency, ContingencyAnalysis
+from roseau.load_flow.diff import NetworkDiff
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.graph import SparseGraph
 from roseau.load_flow.license import License, activate_license, deactivate_license, get_license
 from roseau.load_flow.models import (
     AbstractBranch,
@@ -48,7 +52,10 @@ from roseau.load_flow.models import (
     VoltageSource,
 )
 from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.probabilistic import PowerDistribution, ProbabilisticAnalysis
+from roseau.load_flow.reduction import NetworkReduction
 from roseau.load_flow.sym import ALPHA, ALPHA2, NegativeSequence, PositiveSequence, ZeroSequence
+from roseau.load_flow.tap_control import TapChanger, TapControlResult
 from roseau.load_flow.types import Insulator, LineType, Material, TransformerCooling, TransformerInsulation
 from roseau.load_flow.units import Q_, ureg
 from roseau.load_flow.utils import show_versions
@@ -72,6 +79,16 @@ __all__ = [
     "sym",
     # Electrical Network
     "ElectricalNetwork",
+    "Contingency",
+    "ContingencyAnalysis",
+    "NetworkDiff",
+    "NetworkReduction",
+    "PowerDistribution",
+    "ProbabilisticAnalysis",
+    "ResultsAggregator",
+    "SparseGraph",
+    "TapChanger",
+    "TapControlResult",
     # Buses
     "Bus",
     # Core models
@@ -0,0 +1,59 @@
+import concurrent.futures
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+import numpy as np
+
+from roseau.load_flow.exceptions import RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import JsonDict
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork
+
+type IntArray = np.ndarray[tuple[int], np.dtype[np.int32]]
+type BoolMatrix = np.ndarray[tuple[int, int], np.dtype[np.bool_]]
+
+DIVERGENCE_CODES: Final = (
+    RoseauLoadFlowExceptionCode.NO_LOAD_FLOW_CONVERGENCE,
+    RoseauLoadFlowExceptionCode.BAD_JACOBIAN,
+    RoseauLoadFlowExceptionCode.NAN_VALUE,
+)
+"""The errors of the load flow of a variant reported as a divergence."""
+
+
+class BatchSolver(Protocol):
+    """A solver of batches of variants of a network."""
+
+    def solve(self, batch: Any, /) -> tuple[Any, ...]: ...
+
+
+# The solver of a worker process
+_worker_solver: BatchSolver | None = None
+
+
+def init_worker(
+    solver_class: Callable[..., BatchSolver], network_class: type["AbstractNetwork"], data: JsonDict, *args: Any
+) -> None:
+    """Create the solver of a worker process from the dictionary of the network and its results."""
+    global _worker_solver
+    network = network_class.from_dict(data, include_results=True)
+    _worker_solver = solver_class(network, *args)
+
+
+def solve_in_worker(batch: Any) -> tuple[Any, ...]:
+    """Solve a batch of variants with the solver of the worker process."""
+    assert _worker_solver is not None
+    return _worker_solver.solve(batch)
+
+
+def worker_pool(
+    n_jobs: int, solver_class: Callable[..., BatchSolver], network: "AbstractNetwork", *args: Any
+) -> concurrent.futures.ProcessPoolExecutor:
+    """A pool of worker processes solving the variants of a network with the base case results.
+
+    The batches are solved by mapping :func:`solve_in_worker` on the pool.
+    """
+    data = network.to_dict(include_results=True)
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=init_worker, initargs=(solver_class, type(network), data, *args)
+    )
@@ -0,0 +1,283 @@
+"""
+This module provides the aggregation of the results of many load flows of a network.
+
+A :class:`ResultsAggregator` attached to a network updates running statistics of the voltage
+levels of the buses and of the loadings of the lines and transformers after each load flow of the
+network. Its memory does not depend on the number of load flows: the mean and the standard
+deviation are computed with the algorithm of Welford and the quantiles are estimated with the P²
+algorithm of Jain and Chlamtac.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+import pandas as pd
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import FloatArray
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork, _ResLimits
+
+logger = logging.getLogger(__name__)
+
+# The element types whose results are aggregated and the name of their ID in the index
+_ELEMENT_TYPES: Final = {"bus": "bus_id", "line": "line_id", "transformer": "transformer_id"}
+
+
+class _P2Quantiles:
+    """Estimate quantiles of many series of values at once with the P² algorithm.
+
+    Each quantile of each series is tracked by five markers whose heights approximate the minimum,
+    the quantile, the maximum and two intermediate quantiles. See R. Jain and I. Chlamtac, "The P²
+    algorithm for dynamic calculation of quantiles and histograms without storing observations",
+    Communications of the ACM, 1985.
+    """
+
+    def __init__(self, probabilities: Sequence[float], size: int) -> None:
+        p = np.asarray(probabilities, dtype=np.float64)[:, None]
+        zeros, ones = np.zeros_like(p), np.ones_like(p)
+        self.probabilities = p[:, 0]
+        self.count = 0
+        # The first values, until the five markers can be placed
+        self.first = np.empty((5, size), dtype=np.float64)
+        # The heights and positions of the markers of each quantile (axis 0) and series (axis 1)
+        self.heights = np.empty((len(p), size, 5), dtype=np.float64)
+        self.positions = np.tile(np.arange(5, dtype=np.float64), (len(p), size, 1))
+        # The desired positions of the markers, the same for all the series
+        self.desired = np.hstack([zeros, 2 * p, 4 * p, 2 + 2 * p, 4 * ones])
+        self.increments = np.hstack([zeros, p / 2, p, (1 + p) / 2, ones])
+
+    def update(self, values: FloatArray) -> None:
+        if self.count < 5:
+            self.first[self.count] = values
+            self.count += 1
+            if self.count == 5:
+                self.heights[:] = np.sort(self.first, axis=0).T
+            return
+        self.count += 1
+        q, n = self.heights, self.positions
+        q[:, :, 0] = np.minimum(q[:, :, 0], values)
+        q[:, :, 4] = np.maximum(q[:, :, 4], values)
+        # The markers above the new value move up
+        n[:, :, 1:4] += values[None, :, None] < q[:, :, 1:4]
+        n[:, :, 4] += 1
+        self.desired += self.increments
+
+        # Adjust the heights of the middle markers that are too far from their desired positions
+        for i in (1, 2, 3):
+            d = self.desired[:, i, None] - n[:, :, i]
+            up = (d >= 1) & (n[:, :, i + 1] - n[:, :, i] > 1)
+            down = (d <= -1) & (n[:, :, i - 1] - n[:, :, i] < -1)
+            if not (up.any() or down.any()):
+                continue
+            s = up.astype(np.float64) - down.astype(np.float64)
+            qi, ql, qr = q[:, :, i], q[:, :, i - 1], q[:, :, i + 1]
+            ni, nl, nr = n[:, :, i], n[:, :, i - 1], n[:, :, i + 1]
+            parabolic = qi + s / (nr - nl) * (
+                (ni - nl + s) * (qr - qi) / (nr - ni) + (nr - ni - s) * (qi - ql) / (ni - nl)
+            )
+            linear = np.where(s > 0, qi + (qr - qi) / (nr - ni), qi - (ql - qi) / (nl - ni))
+            new = np.where((ql < parabolic) & (parabolic < qr), parabolic, linear)
+            q[:, :, i] = np.where(up | down, new, qi)
+            n[:, :, i] += s
+
+    def estimate(self) -> FloatArray:
+        """The estimated quantiles, one row per quantile."""
+        if self.count >= 5:
+            return self.heights[:, :, 2].copy()
+        elif self.count == 0:
+            return np.full(self.heights.shape[:2], np.nan)
+        else:
+            return np.quantile(self.first[: self.count], self.probabilities, axis=0)
+
+
+class _RunningStatistics:
+    """The running statistics of the results of the elements of a type."""
+
+    def __init__(self, limits: "_ResLimits", quantiles: Sequence[float]) -> None:
+        self.ids = limits.ids
+        self.element_index = limits.element_index
+        self.phases = limits.phases
+        size = len(limits.values)
+        self.count = 0
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.violations = np.zeros(size, dtype=np.int64)
+        self.quantiles = _P2Quantiles(quantiles, size)
+
+    def matches(self, limits: "_ResLimits") -> bool:
+        """Whether the results are those of the same elements."""
+        return (
+            len(limits.values) == len(self.mean)
+            and limits.ids == self.ids
+            and (self.phases is None or np.array_equal(limits.phases, self.phases))
+        )
+
+    def update(self, limits: "_ResLimits") -> None:
+        values = limits.values
+        self.count += 1
+        np.minimum(self.min, values, out=self.min)
+        np.maximum(self.max, values, out=self.max)
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+        self.violations += limits.violated
+        self.quantiles.update(values)
+
+    def to_frame(self, id_name: str, quantile_names: Sequence[str]) -> pd.DataFrame:
+        ids = np.asarray(self.ids, dtype=object)[self.element_index]
+        if self.phases is None:
+            index = pd.Index(ids, name=id_name)
+        else:
+            index = pd.MultiIndex.from_arrays([ids, self.phases.astype(object)], names=[id_name, "phase"])
+        data = {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.full(len(self.mean), np.nan),
+        }
+        data.update(zip(quantile_names, self.quantiles.estimate(), strict=True))
+        data["violations"] = self.violations
+        data["violation_ratio"] = self.violations / self.count
+        return pd.DataFrame(data, index=index)
+
+
+class ResultsAggregator:
+    """Running statistics of the results of the load flows of a network.
+
+    Once attached to a network with :meth:`attach`, the aggregator is updated after each successful
+    load flow of the network. It keeps, for each phase of each element, the minimum, the maximum,
+    the mean, the standard deviation and estimated quantiles of the voltage levels of the buses that
+    have a nominal voltage and of the loadings of the lines that have ampacities and of the
+    transformers, and the number of load flows where their limits are violated. Its memory does not
+    depend on the number of load flows.
+
+    The quantiles are estimated with the P² algorithm: their accuracy improves with the number of
+    load flows and is usually good after a few hundred load flows.
+    """
+
+    def __init__(self, *, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> None:
+        """ResultsAggregator constructor.
+
+        Args:
+            quantiles:
+                The probabilities of the estimated quantiles, between 0 and 1. The quantile of
+                probability ``0.95`` is named ``q95`` in the dataframes.
+        """
+        quantiles = [float(q) for q in quantiles]
+        if not all(0.0 < q < 1.0 for q in quantiles):
+            msg = f"The probabilities of the quantiles must be strictly between 0 and 1, got {quantiles}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_AGGREGATOR)
+        self.quantiles: tuple[float, ...] = tuple(quantiles)
+        self._network: AbstractNetwork | None = None
+        self._statistics: dict[str, _RunningStatistics] = {}
+        self._n_results = 0
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self._n_results} load flows, quantiles={list(self.quantiles)}>"
+
+    @property
+    def network(self) -> "AbstractNetwork | None":
+        """The network the aggregator is attached to, if any."""
+        return self._network
+
+    @property
+    def n_results(self) -> int:
+        """The number of load flow results aggregated."""
+        return self._n_results
+
+    def attach(self, network: "AbstractNetwork") -> None:
+        """Update the statistics after each load flow of a network.
+
+        The statistics of the results of the network already aggregated are kept, call
+        :meth:`reset` to discard them.
+
+        Args:
+            network:
+                The network whose load flow results are aggregated.
+        """
+        if self._network is not None:
+            msg = f"The results aggregator is already attached to the network {self._network.name!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_AGGREGATOR)
+        network._results_aggregators.append(self)
+        self._network = network
+
+    def detach(self) -> None:
+        """Stop updating the statistics after the load flows of the network."""
+        if self._network is not None:
+            self._network._results_aggregators.remove(self)
+            self._network = None
+
+    def reset(self) -> None:
+        """Discard the aggregated statistics."""
+        self._statistics = {}
+        self._n_results = 0
+
+    def update(self, network: "AbstractNetwork") -> None:
+        """Aggregate the current load flow results of a network.
+
+        This method is called after each load flow of the attached network. It can also be called
+        directly to aggregate the results of a network that is not attached.
+
+        Args:
+            network:
+                The network with valid load flow results. Its elements must be the same for all the
+                aggregated results.
+        """
+        network._check_valid_results()
+        res_limits = network._get_res_limits()
+        if not self._statistics:
+            self._statistics = {et: _RunningStatistics(res_limits[et], self.quantiles) for et in _ELEMENT_TYPES}
+        elif not all(self._statistics[et].matches(res_limits[et]) for et in _ELEMENT_TYPES):
+            msg = (
+                "The elements of the network are not those of the aggregated results. Call "
+                "`reset()` to aggregate the results of different elements."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_AGGREGATOR)
+        for et in _ELEMENT_TYPES:
+            self._statistics[et].update(res_limits[et])
+        self._n_results += 1
+
+    def _to_frame(self, element_type: str) -> pd.DataFrame:
+        if not self._statistics:
+            msg = "The results aggregator has no results, solve a load flow of the network first."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_AGGREGATOR)
+        quantile_names = [f"q{100 * q:g}" for q in self.quantiles]
+        return self._statistics[element_type].to_frame(_ELEMENT_TYPES[element_type], quantile_names)
+
+    @property
+    def buses(self) -> pd.DataFrame:
+        """The statistics of the voltage levels of the buses that have a nominal voltage.
+
+        The dataframe is indexed like :attr:`ElectricalNetwork.res_buses_voltages
+        <roseau.load_flow.ElectricalNetwork.res_buses_voltages>` and has the columns ``min``,
+        ``max``, ``mean``, ``std``, the quantiles, ``violations`` (the number of load flows where
+        the voltage level is outside the limits of the bus) and ``violation_ratio``.
+        """
+        return self._to_frame("bus")
+
+    @property
+    def lines(self) -> pd.DataFrame:
+        """The statistics of the loadings of the lines that have ampacities.
+
+        The dataframe is indexed like :attr:`ElectricalNetwork.res_lines
+        <roseau.load_flow.ElectricalNetwork.res_lines>`, see :attr:`buses` for the columns.
+        """
+        return self._to_frame("line")
+
+    @property
+    def transformers(self) -> pd.DataFrame:
+        """The statistics of the loadings of the transformers.
+
+        The dataframe is indexed by the IDs of the transformers, see :attr:`buses` for the columns.
+        """
+        return self._to_frame("transformer")
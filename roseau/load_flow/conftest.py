@@ -1,7 +1,11 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.utils import mixins
+
 HERE = Path(__file__).parent.expanduser().absolute()
 TEST_ALL_NETWORKS_DATA_FOLDER = HERE / "tests" / "data" / "networks"
 
@@ -34,3 +38,34 @@ def dgs_special_networks_dir() -> Path:
 @pytest.fixture(scope="session")
 def test_networks_path() -> Path:
     return TEST_ALL_NETWORKS_DATA_FOLDER
+
+
+@pytest.fixture
+def fake_load_flow(monkeypatch):
+    """Fake the load flows of the networks, without the engine and its license.
+
+    The fixture is a function taking a function ``potentials(network)`` that returns the potentials of
+    the buses by ID, it may raise an exception to fake a divergence. The load flows then set these
+    potentials as the results of the buses and return ``iterations``. The returned list records the
+    network, the ``warm_start`` and ``solver`` arguments and the validity of the network of each load
+    flow.
+    """
+    calls = []
+
+    def fake(potentials, iterations=2):
+        def solve_load_flow(self, max_iterations=20, tolerance=1e-6, warm_start=True, solver="newton", **kwargs):
+            calls.append({"network": self, "warm_start": warm_start, "solver": solver, "valid": self._valid})
+            for bus_id, bus_potentials in potentials(self).items():
+                bus = self.buses[bus_id]
+                bus._res_potentials = np.asarray(bus_potentials, dtype=np.complex128)
+                bus._fetch_results = False
+                bus._no_results = False
+            self._no_results = False
+            self._results_valid = True
+            self._results_generation = next(mixins._results_generations)
+            return iterations, 1e-8
+
+        monkeypatch.setattr(ElectricalNetwork, "solve_load_flow", solve_load_flow)
+        return calls
+
+    return fake
@@ -0,0 +1,292 @@
+"""
+This module provides the contingency analysis of networks.
+
+A :class:`Contingency` is the outage of one or more elements of a network, modelled by the opening
+of switches. A line or a transformer is taken out of service by opening the switches connected in
+series with it. :meth:`ElectricalNetwork.solve_contingencies()
+<roseau.load_flow.ElectricalNetwork.solve_contingencies>` solves the load flow of each contingency
+starting from the solution of the base case and returns a :class:`ContingencyAnalysis` holding the
+violations of the limits of the buses, lines and transformers of every contingency.
+"""
+
+import dataclasses
+import logging
+import math
+import os
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+import pandas as pd
+
+from roseau.load_flow._parallel import DIVERGENCE_CODES, BoolMatrix, IntArray, solve_in_worker, worker_pool
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import BoolArray, ContingencyStatus, FloatArray, Id, JsonDict
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+_STATUSES: Final[tuple[ContingencyStatus, ...]] = ("islanded", "diverged", "solved")
+"""The statuses of the contingencies, from the most severe to the least severe."""
+
+# The element types whose violations are reported
+_VIOLATION_TYPES: Final = ("bus", "line", "transformer")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Contingency:
+    """The outage of elements of a network, modelled by the opening of switches."""
+
+    id: Id
+    """The ID of the contingency."""
+
+    switches: tuple[Id, ...]
+    """The IDs of the switches opened by the contingency."""
+
+    def __post_init__(self) -> None:
+        switches = (self.switches,) if isinstance(self.switches, (str, int)) else tuple(self.switches)
+        if not switches:
+            msg = f"Contingency {self.id!r} must open at least one switch."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_CONTINGENCY)
+        object.__setattr__(self, "switches", switches)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class ContingencyAnalysis:
+    """The results of a contingency analysis.
+
+    It is returned by :meth:`ElectricalNetwork.solve_contingencies()
+    <roseau.load_flow.ElectricalNetwork.solve_contingencies>`. The results are stored in arrays
+    indexed by the contingencies (rows) and the elements (columns) instead of the full load flow
+    results of each contingency. Use :attr:`ranking` to get the contingencies sorted by severity.
+    """
+
+    contingency_ids: list[Id]
+    """The IDs of the contingencies, in the order they were given."""
+
+    status: np.ndarray[tuple[int], np.dtype[np.str_]]
+    """The status of each contingency: ``"solved"``, ``"islanded"`` if the contingency separates
+    elements from the voltage source (its load flow is not solved) or ``"diverged"`` if its load
+    flow did not converge."""
+
+    iterations: IntArray
+    """The number of iterations of the load flow of each contingency, 0 if it is not solved."""
+
+    residuals: FloatArray
+    """The residual error of the load flow of each contingency, NaN if it is not solved."""
+
+    bus_ids: list[Id]
+    """The IDs of the buses, the columns of :attr:`buses_violated`."""
+
+    line_ids: list[Id]
+    """The IDs of the lines, the columns of :attr:`lines_violated`."""
+
+    transformer_ids: list[Id]
+    """The IDs of the transformers, the columns of :attr:`transformers_violated`."""
+
+    buses_violated: BoolMatrix
+    """Whether the voltage limits of each bus are violated in each contingency."""
+
+    lines_violated: BoolMatrix
+    """Whether the loading of each line exceeds its maximal loading in each contingency."""
+
+    transformers_violated: BoolMatrix
+    """Whether the loading of each transformer exceeds its maximal loading in each contingency."""
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{s}={np.count_nonzero(self.status == s)}" for s in reversed(_STATUSES))
+        return f"<{type(self).__name__}: {len(self.contingency_ids)} contingencies, {counts}>"
+
+    @property
+    def ranking(self) -> pd.DataFrame:
+        """The contingencies sorted from the most severe to the least severe.
+
+        The islanded contingencies come first, then the diverged ones, then the solved ones sorted
+        by decreasing number of violated elements. The columns are the status of the contingency,
+        the numbers of violated buses, lines and transformers, their total and the number of
+        iterations of the load flow.
+        """
+        n_buses = self.buses_violated.sum(axis=1)
+        n_lines = self.lines_violated.sum(axis=1)
+        n_transformers = self.transformers_violated.sum(axis=1)
+        n_violations = n_buses + n_lines + n_transformers
+        status_rank = np.array([_STATUSES.index(s) for s in self.status], dtype=np.int32)
+        order = np.lexsort((-n_violations, status_rank))
+        return pd.DataFrame(
+            {
+                "status": pd.Categorical(self.status[order], categories=_STATUSES),
+                "buses_violated": n_buses[order],
+                "lines_violated": n_lines[order],
+                "transformers_violated": n_transformers[order],
+                "violations": n_violations[order],
+                "iterations": self.iterations[order],
+            },
+            index=pd.Index(self.contingency_ids, name="contingency_id")[order],
+        )
+
+    def get_violations(self, contingency_id: Id) -> dict[str, list[Id]]:
+        """Get the IDs of the elements whose limits are violated in a contingency.
+
+        Args:
+            contingency_id:
+                The ID of the contingency.
+
+        Returns:
+            The IDs of the violated elements indexed by their type: ``"buses"``, ``"lines"`` and
+            ``"transformers"``.
+        """
+        try:
+            i = self.contingency_ids.index(contingency_id)
+        except ValueError:
+            msg = f"Contingency {contingency_id!r} is not part of the analysis."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_CONTINGENCY) from None
+        return {
+            "buses": [self.bus_ids[j] for j in np.flatnonzero(self.buses_violated[i])],
+            "lines": [self.line_ids[j] for j in np.flatnonzero(self.lines_violated[i])],
+            "transformers": [self.transformer_ids[j] for j in np.flatnonzero(self.transformers_violated[i])],
+        }
+
+
+class _ContingencySolver:
+    """Solve contingencies on a private copy of a network that has the results of the base case."""
+
+    def __init__(self, network: "AbstractNetwork", load_flow_kwargs: JsonDict) -> None:
+        self.network = network
+        self.load_flow_kwargs = load_flow_kwargs
+        self.elements = {et: list(network._elements_by_type[et].values()) for et in _VIOLATION_TYPES}
+        # The load flows of the contingencies start from the solution of the base case
+        for bus in self.elements["bus"]:
+            bus._warm_start()
+
+        # The buses connected by the branches that propagate the voltages, see `_propagate_voltages`
+        bus_index = {bus_id: i for i, bus_id in enumerate(network._elements_by_type["bus"])}
+        self.adjacency: list[list[tuple[int, Id | None]]] = [[] for _ in bus_index]
+        for et in ("line", "transformer", "switch", "regulator"):
+            for branch in network._elements_by_type[et].values():
+                if et == "switch" and not branch.closed:  # type: ignore
+                    continue
+                i, j = bus_index[branch.bus1.id], bus_index[branch.bus2.id]  # type: ignore
+                switch_id = branch.id if et == "switch" else None
+                self.adjacency[i].append((j, switch_id))
+                self.adjacency[j].append((i, switch_id))
+        self.starting_bus = bus_index[network._get_starting_bus_id()]
+
+    def is_islanded(self, switches: Sequence[Id]) -> bool:
+        """Whether opening the switches separates buses from the starting voltage source.
+
+        Such contingencies are rejected by the connectivity check of the network: they are detected
+        on the graph of the buses, before the engine network is built.
+        """
+        opened = set(switches)
+        visited = {self.starting_bus}
+        stack = [self.starting_bus]
+        while stack:
+            for j, switch_id in self.adjacency[stack.pop()]:
+                if j not in visited and switch_id not in opened:
+                    visited.add(j)
+                    stack.append(j)
+        return len(visited) < len(self.adjacency)
+
+    def solve(self, contingencies: Sequence[Sequence[Id]]) -> tuple[Any, ...]:
+        """Solve the contingencies, given by the IDs of the switches they open."""
+        n = len(contingencies)
+        status = np.full(n, "solved", dtype="<U8")
+        iterations = np.zeros(n, dtype=np.int32)
+        residuals = np.full(n, np.nan, dtype=np.float64)
+        violated = {et: np.zeros((n, len(elements)), dtype=np.bool_) for et, elements in self.elements.items()}
+        switches = self.network._elements_by_type["switch"]
+        for i, switch_ids in enumerate(contingencies):
+            if self.is_islanded(switch_ids):
+                status[i] = "islanded"
+                continue
+            opened = [switches[switch_id] for switch_id in switch_ids if switches[switch_id].closed]  # type: ignore
+            for switch in opened:
+                switch.open()  # type: ignore
+            try:
+                iterations[i], residuals[i] = self.network.solve_load_flow(**self.load_flow_kwargs)
+            except RoseauLoadFlowException as e:
+                if e.code not in DIVERGENCE_CODES:
+                    raise
+                status[i] = "diverged"
+            else:
+                for et, elements in self.elements.items():
+                    violated[et][i] = [_is_violated(e.res_violated) for e in elements]
+            finally:
+                for switch in opened:
+                    switch.close()  # type: ignore
+        return status, iterations, residuals, violated["bus"], violated["line"], violated["transformer"]
+
+
+def _is_violated(value: BoolArray | bool | None) -> bool:
+    return value is not None and bool(np.any(value))
+
+
+def solve_contingencies(
+    network: "AbstractNetwork",
+    contingencies: Iterable[Contingency] | None,
+    *,
+    n_jobs: int | None,
+    chunk_size: int | None,
+    load_flow_kwargs: JsonDict,
+) -> ContingencyAnalysis:
+    """Solve a contingency analysis, see `ElectricalNetwork.solve_contingencies`."""
+    switches = network._elements_by_type["switch"]
+    if contingencies is None:
+        contingencies = [Contingency(switch.id, (switch.id,)) for switch in switches.values() if switch.closed]  # type: ignore
+    else:
+        contingencies = list(contingencies)
+    seen: set[Id] = set()
+    for contingency in contingencies:
+        if contingency.id in seen:
+            msg = f"Contingency {contingency.id!r} is defined several times."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_CONTINGENCY)
+        seen.add(contingency.id)
+        for switch_id in contingency.switches:
+            if switch_id not in switches:
+                msg = f"Switch {switch_id!r} of contingency {contingency.id!r} is not part of the network."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SWITCH_ID)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        msg = f"The number of jobs must be positive, got {n_jobs!r}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_CONTINGENCY)
+
+    # The base case, used to warm start the load flows of the contingencies
+    network.solve_load_flow(**load_flow_kwargs)
+    load_flow_kwargs = load_flow_kwargs | {"warm_start": True}
+
+    cases = [contingency.switches for contingency in contingencies]
+    n_jobs = min(n_jobs, len(cases))
+    if n_jobs <= 1:
+        # Solved on a copy, the network keeps the results of the base case
+        solver = _ContingencySolver(network.copy(include_results=True), load_flow_kwargs)
+        parts = [solver.solve(cases)]
+    else:
+        if chunk_size is None:
+            chunk_size = math.ceil(len(cases) / (4 * n_jobs))
+        chunks = [cases[i : i + chunk_size] for i in range(0, len(cases), chunk_size)]
+        with worker_pool(n_jobs, _ContingencySolver, network, load_flow_kwargs) as executor:
+            parts = list(executor.map(solve_in_worker, chunks))
+
+    status, iterations, residuals, buses_violated, lines_violated, transformers_violated = (
+        np.concatenate(arrays) for arrays in zip(*parts, strict=True)
+    )
+    return ContingencyAnalysis(
+        contingency_ids=[contingency.id for contingency in contingencies],
+        status=status,
+        iterations=iterations,
+        residuals=residuals,
+        bus_ids=list(network._elements_by_type["bus"]),
+        line_ids=list(network._elements_by_type["line"]),
+        transformer_ids=list(network._elements_by_type["transformer"]),
+        buses_violated=buses_violated,
+        lines_violated=lines_violated,
+        transformers_violated=transformers_violated,
+    )
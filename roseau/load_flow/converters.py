@@ -8,6 +8,7 @@ Available functions:
 """
 
 import logging
+from functools import cache
 
 import numpy as np
 
@@ -91,6 +92,29 @@ _VOLTAGE_PHASES_CACHE = {
 _PHASE_SIZES = {ph: len(ph_list) for ph, ph_list in _VOLTAGE_PHASES_CACHE.items()}
 
 
+# The phases of the elements take a few values, the results of the string operations on them are
+# memoized to speed up the creation of many elements.
+@cache
+def _common_phases(phases1: str, phases2: str) -> str:
+    """The phases common to two elements, in the usual order (``"abcn"``, ``"can"``, etc.)."""
+    return "".join(sorted(set(phases1) & set(phases2))).replace("ac", "ca")
+
+
+@cache
+def _missing_phases(phases: str, available_phases: str) -> tuple[str, ...]:
+    """The sorted phases of `phases` that are not in `available_phases`."""
+    return tuple(sorted(set(phases) - set(available_phases)))
+
+
+@cache
+def _phases_connections(phases: str, bus_phases: str) -> list[tuple[int, int]]:
+    """The indices of the phases of an element connected to the same phases of its bus.
+
+    The returned list is shared, it must not be modified.
+    """
+    return [(i, bus_phases.index(phase)) for i, phase in enumerate(phases) if phase in bus_phases]
+
+
 def calculate_voltage_phases(phases: str) -> list[str]:
     """Calculate the composite phases of the voltages given the phases of an element.
 
@@ -0,0 +1,382 @@
+"""
+This module provides the comparison of two networks.
+
+:meth:`ElectricalNetwork.diff() <roseau.load_flow.ElectricalNetwork.diff>` compares the elements,
+the parameters and the load flow results of two networks and returns a :class:`NetworkDiff`
+holding all their differences.
+"""
+
+import dataclasses
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import BoolArray, FloatArray, Id, JsonDict
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+# The types of elements compared, in the order of the report. Only the types with a `*_frame`
+# property in the network are compared.
+_ELEMENT_TYPES: Final = (
+    "buses",
+    "lines",
+    "transformers",
+    "regulators",
+    "switches",
+    "loads",
+    "sources",
+    "grounds",
+    "potential_refs",
+    "ground_connections",
+)
+
+# The types of elements with parameters, their parameters are compared as `<type>_params`
+_PARAMETERS_TYPES: Final = ("lines", "transformers", "regulators")
+
+# The fields of the parameters that are not compared
+_IGNORED_FIELDS: Final = ("id",)
+
+# The prefixes of the complex columns of the `res_*` properties computed by the solver, the other
+# columns (powers, losses, loading, etc.) are computed from them. The `tap` column is compared too.
+_SOLVER_RESULTS: Final = ("current", "potential", "voltage", "flexible_power")
+
+_DIFFERENCES_COLUMNS: Final = ["element_type", "element_id", "field", "value", "other_value", "max_difference"]
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class NetworkDiff:
+    """The differences between two networks.
+
+    It is returned by :meth:`ElectricalNetwork.diff() <roseau.load_flow.ElectricalNetwork.diff>`.
+    The element types are the names of the elements in the network, for example ``"buses"`` or
+    ``"loads"``, and the names of their parameters, for example ``"lines_params"``.
+    """
+
+    only_in_network: dict[str, list[Id]]
+    """The IDs of the elements of the network missing from the other network, by element type."""
+
+    only_in_other: dict[str, list[Id]]
+    """The IDs of the elements of the other network missing from the network, by element type."""
+
+    differences: pd.DataFrame
+    """The values of the elements present in both networks that differ.
+
+    It is indexed by ``element_type``, ``element_id`` and ``field``. The fields of the elements are
+    the columns of the ``*_frame`` properties of the network (and a few fields missing from them,
+    such as ``connect_neutral``). The fields of the parameters are the keys of their dictionaries.
+    The fields of the results are the currents, potentials, voltages and taps columns of the
+    ``res_*`` properties prefixed with ``results.``. The ``value`` and ``other_value`` columns hold the values of the fields, the
+    values of all the phases of an element for the results of multi-phase networks. The
+    ``max_difference`` column holds the largest absolute difference of numerical values and NaN
+    for the other values. Geometries are compared with the absolute tolerance only.
+    """
+
+    def __repr__(self) -> str:
+        n_missing = sum(len(ids) for ids in self.only_in_network.values())
+        n_added = sum(len(ids) for ids in self.only_in_other.values())
+        return (
+            f"<{type(self).__name__}: only_in_network={n_missing}, only_in_other={n_added}, "
+            f"differences={len(self.differences)}>"
+        )
+
+    @property
+    def equal(self) -> bool:
+        """True if the networks have the same elements and all their values are close."""
+        return not (self.only_in_network or self.only_in_other or len(self.differences))
+
+
+def diff_networks(
+    network: "AbstractNetwork", other: "AbstractNetwork", *, rtol: float, atol: float, include_results: bool
+) -> NetworkDiff:
+    """Compare two networks, see `ElectricalNetwork.diff`."""
+    if type(other) is not type(network):
+        raise TypeError(f"Expected a network of type {type(network)}, got {type(other)}.")
+    if include_results and any(not n._no_results and not n._results_valid for n in (network, other)):
+        msg = (
+            "Trying to compare networks with invalid results. Either call `en.solve_load_flow()` "
+            "before comparing or pass `include_results=False`."
+        )
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_FLOW_RESULT)
+    frames = _network_frames(network)
+    other_frames = _network_frames(other)
+    with_results = include_results and not (network._no_results and other._no_results)
+
+    only_in_network: dict[str, list[Id]] = {}
+    only_in_other: dict[str, list[Id]] = {}
+    rows: list[tuple[str, Id, str, Any, Any, float]] = []
+    for element_type, frame in frames.items():
+        other_frame = other_frames[element_type]
+        in_other = frame.index.isin(other_frame.index)
+        if not in_other.all():
+            only_in_network[element_type] = frame.index[~in_other].tolist()
+        in_network = other_frame.index.isin(frame.index)
+        if not in_network.all():
+            only_in_other[element_type] = other_frame.index[~in_network].tolist()
+        if not in_other.any():
+            continue
+
+        # The values of the common elements aligned in columns
+        common = frame.index[in_other]
+        frame, other_frame = frame.loc[common], other_frame.loc[common]
+        columns = list(frame.columns) + [c for c in other_frame.columns if c not in frame.columns]
+        for field in columns:
+            values, other_values = _column(frame, field), _column(other_frame, field)
+            if field == "geometry":
+                different, max_difference = _compare_geometries(values, other_values, atol=atol)
+            else:
+                different, max_difference = _compare_columns(values, other_values, rtol=rtol, atol=atol)
+            for i in np.flatnonzero(different).tolist():
+                rows.append(
+                    (element_type, common[i], field, _item(values[i]), _item(other_values[i]), max_difference[i])
+                )
+
+        if with_results and element_type in _ELEMENT_TYPES:
+            results, other_results = _results_frame(network, element_type), _results_frame(other, element_type)
+            rows.extend(_compare_results(element_type, results, other_results, common, rtol=rtol, atol=atol))
+
+    differences = pd.DataFrame.from_records(rows, columns=_DIFFERENCES_COLUMNS).astype(
+        {"value": object, "other_value": object, "max_difference": np.float64}
+    )
+    differences = differences.set_index(["element_type", "element_id", "field"])
+    return NetworkDiff(only_in_network=only_in_network, only_in_other=only_in_other, differences=differences)
+
+
+#
+# The compared data
+#
+def _network_frames(network: "AbstractNetwork") -> dict[str, pd.DataFrame]:
+    """The fields of the elements and parameters of a network in frames indexed by their IDs."""
+    frames: dict[str, pd.DataFrame] = {}
+    for element_type in _ELEMENT_TYPES:
+        frame = getattr(network, f"{element_type}_frame", None)
+        if frame is None:
+            continue
+        if "id" in frame.columns:  # the grounds frame is not indexed by the IDs
+            frame = frame.set_index("id")
+        for field, values in _extra_fields(network, element_type).items():
+            frame[field] = values
+        frames[element_type] = frame
+    for element_type in _PARAMETERS_TYPES:
+        if element_type in frames:
+            parameters = {e.parameters.id: e.parameters for e in getattr(network, element_type).values()}
+            frames[f"{element_type}_params"] = _records_frame(
+                parameters.keys(), (p.to_dict(include_results=False) for p in parameters.values())
+            )
+    return frames
+
+
+def _extra_fields(network: "AbstractNetwork", element_type: str) -> dict[str, list[Any]]:
+    """The fields of the elements missing from the ``*_frame`` properties."""
+    elements = getattr(network, element_type).values()
+    if network.is_multi_phase:
+        if element_type == "loads":
+            return {
+                "connect_neutral": [load._connect_neutral for load in elements],
+                "flexible_params": [
+                    [fp.to_dict(include_results=False) for fp in load._flexible_params] if load.is_flexible else None
+                    for load in elements
+                ],
+            }
+        elif element_type == "sources":
+            return {"connect_neutral": [source._connect_neutral for source in elements]}
+        elif element_type == "transformers":
+            return {
+                "connect_neutral_hv": [tr._side1._connect_neutral for tr in elements],
+                "connect_neutral_lv": [tr._side2._connect_neutral for tr in elements],
+            }
+        elif element_type == "ground_connections":
+            return {"on_connected": [gc.on_connected for gc in elements]}
+    elif element_type == "loads":
+        flexible = _records_frame(
+            (load.id for load in elements if load.is_flexible),
+            (
+                {"flexible_param": load.flexible_param.to_dict(include_results=False)}
+                for load in elements
+                if load.is_flexible
+            ),
+        )
+        ids = [load.id for load in elements]
+        return {field: flexible[field].reindex(ids).tolist() for field in flexible.columns}
+    return {}
+
+
+def _records_frame(ids: Iterable[Id], records: Iterable[JsonDict]) -> pd.DataFrame:
+    """A frame of the flattened dictionaries of elements indexed by their IDs."""
+    return pd.DataFrame.from_records([_flatten(record) for record in records], index=pd.Index(list(ids)))
+
+
+def _flatten(record: JsonDict, prefix: str = "") -> JsonDict:
+    """Flatten the nested dictionaries of an element, joining their keys with dots."""
+    flat = {}
+    for key, value in record.items():
+        if not prefix and key in _IGNORED_FIELDS:
+            continue
+        if isinstance(value, dict):
+            flat.update(_flatten(value, prefix=f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _column(frame: pd.DataFrame, field: str) -> np.ndarray:
+    """The values of a column of a frame, None if the frame does not have the column."""
+    if field in frame.columns:
+        return frame[field].to_numpy()
+    return np.full(len(frame), None, dtype=object)
+
+
+def _item(value: Any) -> Any:
+    """Convert a numpy scalar to a Python scalar."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _results_frame(network: "AbstractNetwork", element_type: str) -> pd.DataFrame | None:
+    """The results of the elements of a network, None if the network has no results."""
+    if network._no_results:
+        return None
+    frame = getattr(network, f"res_{element_type}")
+    flexible_powers = getattr(network, f"res_{element_type}_flexible_powers", None)
+    if flexible_powers is not None:
+        frame = frame.join(flexible_powers)
+    columns = [c for c, dtype in frame.dtypes.items() if c.startswith(_SOLVER_RESULTS) and dtype.kind == "c"]
+    if "tap" in frame.columns:
+        columns.append("tap")
+    return frame[columns]
+
+
+#
+# The comparisons
+#
+def _compare_columns(
+    values: np.ndarray, other_values: np.ndarray, *, rtol: float, atol: float
+) -> tuple[BoolArray, FloatArray]:
+    """Compare two aligned columns of values.
+
+    Returns:
+        The mask of the different values and the largest absolute difference of each pair of
+        different numerical values (NaN for the other values).
+    """
+    if values.dtype.kind in "iufc" and other_values.dtype.kind in "iufc":
+        # Fast path: the columns hold numbers, compare them at once
+        close = np.isclose(values, other_values, rtol=rtol, atol=atol, equal_nan=True)
+        return ~close, np.where(close, np.nan, np.abs(values - other_values))
+
+    # Slow path: compare the values one by one, the arrays of numbers of the same shape are gathered
+    # to be compared at once
+    n = len(values)
+    different = np.zeros(n, dtype=np.bool_)
+    max_difference = np.full(n, np.nan, dtype=np.float64)
+    indices: list[int] = []
+    arrays: list[np.ndarray] = []
+    other_arrays: list[np.ndarray] = []
+    for i, (value, other_value) in enumerate(zip(values.tolist(), other_values.tolist(), strict=True)):
+        if value is other_value or isinstance(value, str | bool) or isinstance(other_value, str | bool):
+            different[i] = value is not other_value and value != other_value
+            continue
+        array, other_array = _as_numeric(value), _as_numeric(other_value)
+        if array is None or other_array is None:
+            different[i] = not _equal(value, other_value)
+        elif array.shape != other_array.shape:
+            different[i] = True
+        elif array.size:
+            indices.append(i)
+            arrays.append(array.ravel())
+            other_arrays.append(other_array.ravel())
+    if indices:
+        offsets = np.cumsum([0] + [array.size for array in arrays[:-1]])
+        array, other_array = np.concatenate(arrays), np.concatenate(other_arrays)
+        close = np.isclose(array, other_array, rtol=rtol, atol=atol, equal_nan=True)
+        abs_difference = np.where(close, 0.0, np.abs(array - other_array))
+        array_different = np.logical_or.reduceat(~close, offsets)
+        different[indices] = array_different
+        max_difference[indices] = np.where(array_different, np.maximum.reduceat(abs_difference, offsets), np.nan)
+    return different, max_difference
+
+
+def _compare_geometries(values: np.ndarray, other_values: np.ndarray, *, atol: float) -> tuple[BoolArray, FloatArray]:
+    """Compare two aligned columns of geometries."""
+    both_missing = shapely.is_missing(values) & shapely.is_missing(other_values)
+    different = ~(shapely.equals_exact(values, other_values, tolerance=atol) | both_missing)
+    return different, np.full(len(values), np.nan, dtype=np.float64)
+
+
+def _compare_results(
+    element_type: str,
+    results: pd.DataFrame | None,
+    other_results: pd.DataFrame | None,
+    common: pd.Index,
+    *,
+    rtol: float,
+    atol: float,
+) -> list[tuple[str, Id, str, Any, Any, float]]:
+    """Compare the results of the common elements of two networks.
+
+    The results frames are indexed by the IDs of the elements and, for multi-phase networks, by
+    their phases. The results of an element differ if the results of one of its phases differ.
+    """
+    if results is None:
+        assert other_results is not None
+        results = other_results.iloc[:0]
+    elif other_results is None:
+        other_results = results.iloc[:0]
+    results = results[results.index.get_level_values(0).isin(common)]
+    other_results = other_results[other_results.index.get_level_values(0).isin(common)]
+    index = results.index.union(other_results.index, sort=False)
+    results, other_results = results.reindex(index), other_results.reindex(index)
+    element_ids = index.get_level_values(0)
+    is_multi_phase = isinstance(index, pd.MultiIndex)
+
+    rows = []
+    for column in results.columns:
+        values, other_values = results[column].to_numpy(), other_results[column].to_numpy()
+        different, max_difference = _compare_columns(values, other_values, rtol=rtol, atol=atol)
+        if not different.any():
+            continue
+        # Group the phases of the elements
+        compared = pd.DataFrame(
+            {"value": values, "other_value": other_values, "different": different, "max_difference": max_difference},
+            index=element_ids,
+        )
+        compared = compared[compared.index.isin(element_ids[different])]
+        for element_id, group in compared.groupby(level=0, sort=False):
+            if is_multi_phase:
+                value, other_value = group["value"].to_numpy(), group["other_value"].to_numpy()
+            else:
+                value, other_value = _item(group["value"].iloc[0]), _item(group["other_value"].iloc[0])
+            rows.append(
+                (element_type, element_id, f"results.{column}", value, other_value, group["max_difference"].max())
+            )
+    return rows
+
+
+def _as_numeric(value: Any) -> np.ndarray | None:
+    """Convert a value to an array of numbers or return None if it is not made of numbers."""
+    try:
+        array = np.asarray(value)
+    except ValueError:  # ragged values
+        return None
+    return array if array.dtype.kind in "iufc" else None
+
+
+def _is_missing(value: Any) -> bool:
+    """Whether a value is None or NaN."""
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _equal(value: Any, other_value: Any) -> bool:
+    """Whether two values that are not arrays of numbers are equal."""
+    if _is_missing(value) or _is_missing(other_value):
+        return _is_missing(value) and _is_missing(other_value)
+    try:
+        return bool(value == other_value)
+    except ValueError:  # arrays of different values
+        return False
@@ -50,6 +50,7 @@ class RoseauLoadFlowExceptionCode(StrEnum):
     BAD_MATERIALS_SIZE = auto()
     BAD_INSULATORS_VALUE = auto()
     BAD_INSULATORS_SIZE = auto()
+    BAD_LINES_SIZE = auto()
 
     # Transformer
     BAD_TRANSFORMER_ID = auto()
@@ -108,6 +109,14 @@ class RoseauLoadFlowExceptionCode(StrEnum):
     SEVERAL_NETWORKS = auto()
     BAD_JACOBIAN = auto()
     NAN_VALUE = auto()
+    BAD_NETWORK_REDUCTION = auto()
+    BAD_SPATIAL_QUERY = auto()
+    BAD_GRAPH_WEIGHT = auto()
+    BAD_TAP_CHANGER = auto()
+    BAD_CONTINGENCY = auto()
+    BAD_DATA_FRAME = auto()
+    BAD_PROBABILISTIC_LOAD_FLOW = auto()
+    BAD_AGGREGATOR = auto()
 
     # Solver
     BAD_SOLVER_NAME = auto()
@@ -125,6 +134,7 @@ class RoseauLoadFlowExceptionCode(StrEnum):
     # JSON export
     JSON_PREF_INVALID = auto()
     JSON_NO_RESULTS = auto()
+    BAD_BINARY_ARRAYS = auto()
 
     # Catalogue Mixin
     CATALOGUE_MISSING = auto()
@@ -0,0 +1,177 @@
+"""
+This module provides compact representations of the topology of a network for graph analyses.
+
+:meth:`ElectricalNetwork.to_sparse_graph() <roseau.load_flow.ElectricalNetwork.to_sparse_graph>`
+returns the incidence and adjacency matrices of the network as :mod:`scipy.sparse` arrays, and
+:meth:`ElectricalNetwork.to_rustworkx() <roseau.load_flow.ElectricalNetwork.to_rustworkx>` returns
+a :class:`rustworkx.PyGraph`. Both are built in bulk and only contain the structure of the network
+and the weights of its branches, they are much faster to create than the networkx graph of
+:meth:`ElectricalNetwork.to_graph() <roseau.load_flow.ElectricalNetwork.to_graph>` for large
+networks.
+"""
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any, get_args
+
+import numpy as np
+from numpy.typing import NDArray
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import FloatArray, GraphWeight
+from roseau.load_flow.utils import optional_deps
+
+if TYPE_CHECKING:
+    from rustworkx import PyGraph
+    from scipy.sparse import csr_array
+
+    from roseau.load_flow.utils.mixins import AbstractElement, AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+type IntArray = np.ndarray[tuple[int], np.dtype[np.intp]]
+
+_BRANCH_TYPES = ("line", "transformer", "switch", "regulator")
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class SparseGraph:
+    """The topology of a network as sparse matrices.
+
+    The buses are the nodes of the graph and the branches are its edges. Nodes and edges are
+    identified by their position: the bus of index ``i`` has the ID ``bus_ids[i]`` and the branch
+    of index ``j`` has the ID ``branch_ids[j]`` and the type ``branch_types[j]``.
+
+    Use :meth:`ElectricalNetwork.to_sparse_graph()
+    <roseau.load_flow.ElectricalNetwork.to_sparse_graph>` to create a sparse graph.
+    """
+
+    bus_ids: NDArray[np.object_]
+    """The IDs of the buses, indexed by node."""
+
+    branch_ids: NDArray[np.object_]
+    """The IDs of the branches, indexed by edge."""
+
+    branch_types: NDArray[np.str_]
+    """The types of the branches (``"line"``, ``"transformer"``, ``"switch"`` or ``"regulator"``),
+    indexed by edge."""
+
+    edges: NDArray[np.intp]
+    """The ``(n_branches, 2)`` array of the nodes of the first and second buses of the branches."""
+
+    weights: FloatArray
+    """The weights of the branches, indexed by edge. They are all 1 for an unweighted graph."""
+
+    incidence: "csr_array"
+    """The ``(n_buses, n_branches)`` oriented incidence matrix. The column of a branch is 1 at its
+    first bus and -1 at its second bus."""
+
+    adjacency: "csr_array"
+    """The ``(n_buses, n_buses)`` symmetric weighted adjacency matrix. The entries of parallel
+    branches hold their smallest weight. Zero weights are stored explicitly, as expected by the
+    :mod:`scipy.sparse.csgraph` routines."""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: nb_buses={len(self.bus_ids)}, nb_branches={len(self.branch_ids)}>"
+
+    @classmethod
+    def _from_network(
+        cls, network: "AbstractNetwork", *, weight: GraphWeight | None, respect_switches: bool
+    ) -> "SparseGraph":
+        sparse = optional_deps.sparse
+        bus_ids, branch_types, branch_ids, edges, weights = _get_graph_data(
+            network, weight=weight, respect_switches=respect_switches
+        )
+        n_buses, n_branches = len(bus_ids), len(branch_ids)
+        branches = np.arange(n_branches)
+        incidence = sparse.csr_array(
+            (
+                np.repeat(np.array([1.0, -1.0]), n_branches),
+                (edges.T.ravel(), np.tile(branches, 2)),
+            ),
+            shape=(n_buses, n_branches),
+        )
+        # Keep the smallest weight of parallel branches, duplicates would be summed by scipy
+        rows = np.concatenate((edges[:, 0], edges[:, 1]))
+        cols = np.concatenate((edges[:, 1], edges[:, 0]))
+        data = np.concatenate((weights, weights))
+        order = np.lexsort((data, cols, rows))
+        rows, cols, data = rows[order], cols[order], data[order]
+        first = np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])] if len(rows) else np.array([], bool)
+        adjacency = sparse.csr_array((data[first], (rows[first], cols[first])), shape=(n_buses, n_buses))
+        return cls(
+            bus_ids=bus_ids,
+            branch_ids=branch_ids,
+            branch_types=branch_types,
+            edges=edges,
+            weights=weights,
+            incidence=incidence,
+            adjacency=adjacency,
+        )
+
+
+def _to_rustworkx(network: "AbstractNetwork", *, weight: GraphWeight | None, respect_switches: bool) -> "PyGraph":
+    """Create a rustworkx multi-graph of the network, see `ElectricalNetwork.to_rustworkx`."""
+    rx = optional_deps.rustworkx
+    bus_ids, branch_types, branch_ids, edges, weights = _get_graph_data(
+        network, weight=weight, respect_switches=respect_switches
+    )
+    graph = rx.PyGraph(multigraph=True, attrs={"name": network.name})
+    graph.add_nodes_from(bus_ids.tolist())
+    if weight is None:
+        payloads = [{"id": i, "type": t} for i, t in zip(branch_ids.tolist(), branch_types.tolist(), strict=True)]
+    else:
+        payloads = [
+            {"id": i, "type": t, "weight": w}
+            for i, t, w in zip(branch_ids.tolist(), branch_types.tolist(), weights.tolist(), strict=True)
+        ]
+    graph.add_edges_from(list(zip(edges[:, 0].tolist(), edges[:, 1].tolist(), payloads, strict=True)))
+    return graph
+
+
+def _get_graph_data(
+    network: "AbstractNetwork", *, weight: GraphWeight | None, respect_switches: bool
+) -> tuple[NDArray[np.object_], NDArray[np.str_], NDArray[np.object_], NDArray[np.intp], FloatArray]:
+    """Get the buses IDs, the branches types and IDs, the edges and the weights of a network graph."""
+    weights_choices = get_args(GraphWeight.__value__)
+    if weight is not None and weight not in weights_choices:
+        msg = f"Invalid graph weight {weight!r}, expected None or one of {weights_choices}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_GRAPH_WEIGHT)
+    buses = network._elements_by_type["bus"]
+    bus_ids = np.empty(len(buses), dtype=object)
+    bus_ids[:] = list(buses)
+    bus_index = {bus_id: i for i, bus_id in enumerate(buses)}
+    branch_types: list[str] = []
+    branch_ids: list[Any] = []
+    bus1: list[int] = []
+    bus2: list[int] = []
+    weights: list[float] = []
+    for et in _BRANCH_TYPES:
+        for e in network._elements_by_type.get(et, {}).values():
+            if et == "switch" and respect_switches and not e.closed:  # type: ignore
+                continue
+            branch_types.append(et)
+            branch_ids.append(e.id)
+            bus1.append(bus_index[e.bus1.id])  # type: ignore
+            bus2.append(bus_index[e.bus2.id])  # type: ignore
+            weights.append(1.0 if weight is None else _get_branch_weight(e, weight))
+    ids_array = np.empty(len(branch_ids), dtype=object)
+    ids_array[:] = branch_ids
+    edges = np.array([bus1, bus2], dtype=np.intp).T.reshape(-1, 2)
+    return bus_ids, np.array(branch_types, dtype=str), ids_array, edges, np.array(weights, dtype=np.float64)
+
+
+def _get_branch_weight(branch: "AbstractElement", weight: GraphWeight) -> float:
+    """The weight of a branch in a network graph."""
+    et = branch.element_type
+    if et == "switch":
+        return 0.0
+    elif weight == "length":
+        return branch._length if et == "line" else 0.0  # type: ignore
+    elif et == "line":
+        # The mean magnitude of the series impedances of the phases of the line
+        return float(np.abs(np.diagonal(np.atleast_2d(branch._z_line))).mean())  # type: ignore
+    else:
+        # The series impedance of transformers and regulators, seen from their second side
+        return abs(branch.parameters._z2)  # type: ignore
@@ -1,7 +1,7 @@
 import json
 import logging
-from collections.abc import Iterator, Mapping
-from typing import Any, Final, Self, TypedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, Final, Self, TextIO, TypedDict
 
 import numpy as np
 import pandas as pd
@@ -115,28 +115,32 @@ def has_typ_tr2(typ_tr2: pd.DataFrame | None) -> TypeIs[pd.DataFrame]:
         return True
 
 
-def linestring_to_gps_coords(geom: shapely.Geometry | None) -> dict[str, str]:
-    """Convert a LineString geometry to GPS coordinates.
+def linestrings_to_gps_coords(geoms: Sequence[shapely.Geometry | None]) -> list[dict[str, str]]:
+    """Convert LineString geometries to GPS coordinates.
 
     The GPS coordinates are stored in the following format:
         * ``GPScoords:SIZEROW``: Number of rows for attribute 'GPScoords'
         * ``GPScoords:SIZECOL``: Number of columns for attribute 'GPScoords'
         * ``GPScoords``: Geographical Position in deg
+
+    The coordinates of all the geometries are extracted at once.
     """
-    if geom is None:
-        gps_data = {"GPScoords:SIZEROW": "0", "GPScoords:SIZECOL": "0"}
-    elif isinstance(geom, shapely.LineString):
-        gps_coords = geom.coords
-        gps_data = {
-            "GPScoords:SIZEROW": str(len(gps_coords)),
-            "GPScoords:SIZECOL": "2",
-        }
-        for i, (lon, lat) in enumerate(gps_coords):
+    for geom in geoms:
+        if geom is not None and not isinstance(geom, shapely.LineString):
+            raise AssertionError(f"Expected a linestring, got {type(geom).__name__}")
+    coords, index = shapely.get_coordinates(geoms, return_index=True)
+    counts = np.bincount(index, minlength=len(geoms)).tolist()
+    coords = coords.tolist()
+    result: list[dict[str, str]] = []
+    start = 0
+    for geom, count in zip(geoms, counts, strict=True):
+        gps_data = {"GPScoords:SIZEROW": str(count), "GPScoords:SIZECOL": "0" if geom is None else "2"}
+        for i, (lon, lat) in enumerate(coords[start : start + count]):
             gps_data[f"GPScoords:{i}:0"] = str(lat)
             gps_data[f"GPScoords:{i}:1"] = str(lon)
-    else:
-        raise AssertionError(f"Expected a linestring, got {type(geom).__name__}")
-    return gps_data
+        result.append(gps_data)
+        start += count
+    return result
 
 
 def iter_dgs_values(dgs_data: DGSData, field: str) -> Iterator[Any]:
@@ -152,6 +156,28 @@ def get_id_to_fid_map(dgs_data: DGSData) -> dict[Any, str]:
     return {v[id_idx]: v[fid_idx] for v in dgs_data["Values"]}  # type: ignore
 
 
+def write_dgs_tables(tables: Iterable[tuple[str, DGSData]], f: TextIO) -> None:
+    """Write the tables of a DGS export to a JSON file object as they are produced.
+
+    The tables are written one by one so that each table can be released once written. Each row
+    of the ``Values`` of a table is written on its own line, which is equivalent to, but much faster
+    and more compact than, indenting every value with ``json.dump(data, f, indent=2)``.
+    """
+    dumps = json.JSONEncoder().encode  # the C encoder, it is not used when indenting
+    f.write("{")
+    sep = "\n"
+    for name, table in tables:
+        f.write(f'{sep}  {dumps(name)}: {{\n    "Attributes": {dumps(table["Attributes"])},\n    "Values": [')
+        if table["Values"]:
+            f.write("\n      ")
+            f.write(",\n      ".join(map(dumps, table["Values"])))
+            f.write("\n    ]\n  }")
+        else:
+            f.write("]\n  }")
+        sep = ",\n"
+    f.write("\n}\n" if sep != "\n" else "}\n")
+
+
 def gps_coords_to_linestring(elm_lne: pd.DataFrame, lne_idx: str) -> shapely.LineString | None:
     """Convert GPS coordinates from the ElmLne dataframe to a LineString geometry."""
     geometry = None
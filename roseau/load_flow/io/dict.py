@@ -6,9 +6,13 @@ from and to dictionaries, or the methods `ElectricalNetwork.from_json` and `Elec
 to read and write networks from and to JSON files.
 """
 
+import base64
+import binascii
 import logging
+import math
 from collections import defaultdict
-from typing import TYPE_CHECKING, Final
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final
 
 import numpy as np
 from pyproj import CRS
@@ -43,6 +47,44 @@ logger = logging.getLogger(__name__)
 NETWORK_JSON_VERSION: Final = 5
 """The current version of the network JSON file format."""
 
+BINARY_ARRAYS_ENCODING: Final = "base64"
+"""The encoding of the buffer of the network JSON files written with ``binary_arrays=True``."""
+
+# The element types and the keys of their numeric arrays that can be stored as binary buffers
+_BINARY_ARRAYS_ELEMENTS: Final = (
+    "buses",
+    "lines",
+    "transformers",
+    "switches",
+    "loads",
+    "sources",
+    "lines_params",
+)
+_BINARY_ARRAYS_KEYS: Final = frozenset(
+    {
+        # Inputs
+        "initial_potentials",
+        "powers",
+        "currents",
+        "impedances",
+        "voltages",
+        "z_line",
+        "y_shunt",
+        # Results
+        "potentials",
+        "potentials1",
+        "potentials2",
+        "potentials_hv",
+        "potentials_lv",
+        "currents1",
+        "currents2",
+        "currents_hv",
+        "currents_lv",
+        "inner_currents",
+        "flexible_powers",
+    }
+)
+
 
 def network_from_dict(  # noqa: C901
     data: JsonDict, *, include_results: bool = True
@@ -62,6 +104,8 @@ def network_from_dict(  # noqa: C901
         connections to construct the electrical network and a boolean indicating if the network has
         results.
     """
+    if "arrays" in data:
+        data = binary_arrays_converter(data)
     version = data.get("version", 0)
     if version <= 4:
         warn_external(
@@ -334,6 +378,122 @@ def network_to_dict(en: "ElectricalNetwork", *, include_results: bool) -> JsonDi
     return res
 
 
+def _convert_arrays(data: JsonDict, convert: Callable[[Any], Any], array_type: type) -> JsonDict:
+    """Convert the numeric arrays of a network dict, the dicts of the elements are copied."""
+    data = data.copy()
+    for element_type in _BINARY_ARRAYS_ELEMENTS:
+        element_dicts = []
+        for element_data in data[element_type]:
+            element_data = _convert_element_arrays(element_data, convert, array_type)
+            if element_data.get("results"):
+                element_data["results"] = _convert_element_arrays(element_data["results"], convert, array_type)
+            element_dicts.append(element_data)
+        data[element_type] = element_dicts
+    return data
+
+
+def _convert_element_arrays(d: JsonDict, convert: Callable[[Any], Any], array_type: type) -> JsonDict:
+    return {
+        key: convert(value) if key in _BINARY_ARRAYS_KEYS and isinstance(value, array_type) else value
+        for key, value in d.items()
+    }
+
+
+def encode_binary_arrays(data: JsonDict) -> JsonDict:
+    """Store the numeric arrays of a network dict in a base64-encoded binary buffer.
+
+    The arrays of complex values, stored as ``[real, imag]`` lists, are concatenated in a single
+    little-endian float64 buffer saved in the ``arrays`` key of the dictionary. Each array is
+    replaced by its offset in the buffer and its shape.
+
+    Args:
+        data:
+            The network data created by :func:`network_to_dict`.
+
+    Returns:
+        The network data with binary arrays.
+    """
+    arrays: list[np.ndarray] = []
+    offset = 0
+
+    def encode(value: list) -> JsonDict:
+        nonlocal offset
+        array = np.asarray(value, dtype="<f8")
+        arrays.append(array.ravel())
+        ref = {"offset": offset, "shape": list(array.shape)}
+        offset += array.size
+        return ref
+
+    data = _convert_arrays(data, encode, list)
+    buffer = np.concatenate(arrays) if arrays else np.empty(0, dtype="<f8")
+    data["arrays"] = {
+        "encoding": BINARY_ARRAYS_ENCODING,
+        "dtype": "<f8",
+        "data": base64.b64encode(buffer.tobytes()).decode("ascii"),
+    }
+    return data
+
+
+def binary_arrays_converter(data: JsonDict) -> JsonDict:
+    """Convert a network dict with binary arrays to a network dict of the same version.
+
+    The arrays are read from the binary buffer as read-only numpy arrays of the same shapes as the
+    ``[real, imag]`` lists they replace. The readers of the elements convert them to complex arrays
+    at once. The input dictionary is not modified.
+
+    Args:
+        data:
+            The network data with binary arrays.
+
+    Returns:
+        The network data with the arrays as numpy arrays.
+    """
+    data = data.copy()
+    arrays = data.pop("arrays")
+    if not isinstance(arrays, dict) or arrays.get("encoding") != BINARY_ARRAYS_ENCODING:
+        encoding = arrays.get("encoding") if isinstance(arrays, dict) else None
+        msg = f"Unsupported binary arrays encoding {encoding!r}, expected {BINARY_ARRAYS_ENCODING!r}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+    if arrays.get("dtype") != "<f8":
+        msg = f"Unsupported binary arrays type {arrays.get('dtype')!r}, expected '<f8'."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+    if not isinstance(arrays.get("data"), str):
+        msg = "The binary arrays have no base64-encoded 'data' string."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+    try:
+        raw = binascii.a2b_base64(arrays["data"], strict_mode=True)
+    except (binascii.Error, ValueError) as e:
+        msg = f"The data of the binary arrays is not valid base64: {e}"
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS) from e
+    if len(raw) % 8 != 0:
+        msg = f"The data of the binary arrays has {len(raw)} bytes, expected a multiple of 8 for float64 values."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+    buffer = np.frombuffer(raw, dtype="<f8")
+
+    def decode(ref: JsonDict) -> np.ndarray:
+        shape, offset = ref.get("shape"), ref.get("offset")
+        if type(offset) is not int or not isinstance(shape, list) or not all(type(n) is int and n >= 0 for n in shape):
+            msg = (
+                f"Invalid binary array reference {ref!r}, expected an integer 'offset' and a 'shape' list of "
+                f"non-negative integers."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+        size = math.prod(shape)
+        if offset < 0 or offset + size > buffer.size:
+            msg = f"The binary array at offset {offset} of shape {shape} is out of the buffer of size {buffer.size}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS)
+        return buffer[offset : offset + size].reshape(shape)
+
+    return _convert_arrays(data, decode, dict)
+
+
 def v0_to_v1_converter(data: JsonDict) -> JsonDict:  # noqa: C901
     """Convert a v0 network dict to a v1 network dict.
 
@@ -0,0 +1,466 @@
+"""
+This module is not for public use.
+
+Use the `ElectricalNetwork.from_frames` method to create networks from data frames.
+
+The frames have the columns of the ``*_frame`` properties of the network and are indexed by the IDs
+of the elements. The columns are checked at once for the whole frame before any element is created.
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from shapely.geometry.base import BaseGeometry
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.io.common import NetworkElements
+from roseau.load_flow.models import (
+    Bus,
+    CurrentLoad,
+    Ground,
+    GroundConnection,
+    ImpedanceLoad,
+    Line,
+    LineParameters,
+    Load,
+    PotentialRef,
+    PowerLoad,
+    Switch,
+    Transformer,
+    TransformerParameters,
+    VoltageSource,
+)
+from roseau.load_flow.typing import CRSLike, Id, MapOrSeq
+from roseau.load_flow.utils import SIDE_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_FRAME = pd.DataFrame(index=pd.Index([], name="id"))
+
+
+def network_from_frames(
+    *,
+    name: str,
+    buses: pd.DataFrame,
+    lines: pd.DataFrame | None,
+    transformers: pd.DataFrame | None,
+    switches: pd.DataFrame | None,
+    loads: pd.DataFrame | None,
+    sources: pd.DataFrame | None,
+    grounds: pd.DataFrame | None,
+    potential_refs: pd.DataFrame | None,
+    ground_connections: pd.DataFrame | None,
+    lines_params: MapOrSeq[LineParameters],
+    transformers_params: MapOrSeq[TransformerParameters],
+    crs: CRSLike | None,
+) -> NetworkElements:
+    """Create the electrical network elements from data frames.
+
+    Returns:
+        The buses, lines, transformers, switches, loads, sources, grounds, potential refs and ground
+        connections to construct the electrical network.
+    """
+    if crs is None:
+        crs = getattr(buses, "crs", None)
+    lines_params_dict = _parameters_as_dict(lines_params)
+    transformers_params_dict = _parameters_as_dict(transformers_params)
+
+    # Grounds
+    frame = _EMPTY_FRAME if grounds is None else grounds
+    grounds_dict: dict[Id, Ground] = {
+        ground_id: Ground(id=ground_id)
+        for ground_id in _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_GROUND_ID)
+    }
+
+    # Buses
+    frame, frame_name = buses, "buses"
+    _check_columns(frame, frame_name, ["phases"])
+    buses_dict: dict[Id, Bus] = {}
+    for bus_id, phases, nominal_voltage, min_voltage_level, max_voltage_level, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _objects(frame, frame_name, "phases"),
+        _floats(frame, frame_name, "nominal_voltage", default=None, optional=True),
+        _floats(frame, frame_name, "min_voltage_level", default=None, optional=True),
+        _floats(frame, frame_name, "max_voltage_level", default=None, optional=True),
+        _geometries(frame),
+        strict=True,
+    ):
+        buses_dict[bus_id] = Bus(
+            id=bus_id,
+            phases=phases,
+            nominal_voltage=nominal_voltage,
+            min_voltage_level=min_voltage_level,
+            max_voltage_level=max_voltage_level,
+            geometry=geometry,
+        )
+
+    # Lines
+    frame, frame_name = _EMPTY_FRAME if lines is None else lines, "lines"
+    _check_columns(frame, frame_name, ["bus1_id", "bus2_id", "parameters_id", "length"])
+    line_ids = _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_LINE_ID)
+    lengths = _floats(frame, frame_name, "length", default=None)
+    _check_lengths(lengths)
+    lines_dict: dict[Id, Line] = {}
+    for line_id, bus1, bus2, parameters, length, phases, ground, max_loading, geometry in zip(
+        line_ids,
+        _lookup(frame, frame_name, "bus1_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus2_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(
+            frame, frame_name, "parameters_id", lines_params_dict, code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
+        ),
+        lengths,
+        _objects(frame, frame_name, "phases", optional=True),
+        _lookup(
+            frame, frame_name, "ground_id", grounds_dict, code=RoseauLoadFlowExceptionCode.BAD_GROUND_ID, optional=True
+        ),
+        _floats(frame, frame_name, "max_loading", default=1.0),
+        _geometries(frame),
+        strict=True,
+    ):
+        lines_dict[line_id] = Line(
+            id=line_id,
+            bus1=bus1,
+            bus2=bus2,
+            parameters=parameters,
+            length=length,
+            phases=phases,
+            ground=ground,
+            max_loading=max_loading,
+            geometry=geometry,
+        )
+
+    # Transformers
+    frame, frame_name = _EMPTY_FRAME if transformers is None else transformers, "transformers"
+    _check_columns(frame, frame_name, ["bus_hv_id", "bus_lv_id", "parameters_id"])
+    transformers_dict: dict[Id, Transformer] = {}
+    for transformer_id, bus_hv, bus_lv, parameters, tap, phases_hv, phases_lv, max_loading, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_TRANSFORMER_ID),
+        _lookup(frame, frame_name, "bus_hv_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus_lv_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(
+            frame,
+            frame_name,
+            "parameters_id",
+            transformers_params_dict,
+            code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID,
+        ),
+        _floats(frame, frame_name, "tap", default=1.0),
+        _objects(frame, frame_name, "phases_hv", optional=True),
+        _objects(frame, frame_name, "phases_lv", optional=True),
+        _floats(frame, frame_name, "max_loading", default=1.0),
+        _geometries(frame),
+        strict=True,
+    ):
+        transformers_dict[transformer_id] = Transformer(
+            id=transformer_id,
+            bus_hv=bus_hv,
+            bus_lv=bus_lv,
+            parameters=parameters,
+            tap=tap,
+            phases_hv=phases_hv,
+            phases_lv=phases_lv,
+            max_loading=max_loading,
+            geometry=geometry,
+        )
+
+    # Switches
+    frame, frame_name = _EMPTY_FRAME if switches is None else switches, "switches"
+    _check_columns(frame, frame_name, ["bus1_id", "bus2_id"])
+    switches_dict: dict[Id, Switch] = {}
+    for switch_id, bus1, bus2, phases, closed, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_SWITCH_ID),
+        _lookup(frame, frame_name, "bus1_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus2_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _objects(frame, frame_name, "phases", optional=True),
+        _bools(frame, frame_name, "closed", default=True),
+        _geometries(frame),
+        strict=True,
+    ):
+        switches_dict[switch_id] = Switch(
+            id=switch_id, bus1=bus1, bus2=bus2, phases=phases, closed=closed, geometry=geometry
+        )
+
+    # Loads
+    frame, frame_name = _EMPTY_FRAME if loads is None else loads, "loads"
+    _check_columns(frame, frame_name, ["type", "bus_id"])
+    _check_not_flexible(frame, frame_name)
+    load_ids = _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_LOAD_ID)
+    load_values = _load_values(
+        frame, frame_name, load_ids, {"power": "powers", "current": "currents", "impedance": "impedances"}
+    )
+    loads_dict: dict[Id, Load] = {}
+    for load_id, load_type, bus, phases, value in zip(
+        load_ids,
+        _objects(frame, frame_name, "type"),
+        _lookup(frame, frame_name, "bus_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _objects(frame, frame_name, "phases", optional=True),
+        load_values,
+        strict=True,
+    ):
+        if load_type == "power":
+            load = PowerLoad(id=load_id, bus=bus, powers=value, phases=phases)
+        elif load_type == "current":
+            load = CurrentLoad(id=load_id, bus=bus, currents=value, phases=phases)
+        else:
+            load = ImpedanceLoad(id=load_id, bus=bus, impedances=value, phases=phases)
+        loads_dict[load_id] = load
+
+    # Sources
+    frame, frame_name = _EMPTY_FRAME if sources is None else sources, "sources"
+    _check_columns(frame, frame_name, ["bus_id", "voltages"])
+    sources_dict: dict[Id, VoltageSource] = {}
+    for source_id, bus, phases, voltages in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_SOURCE_ID),
+        _lookup(frame, frame_name, "bus_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _objects(frame, frame_name, "phases", optional=True),
+        _objects(frame, frame_name, "voltages"),
+        strict=True,
+    ):
+        sources_dict[source_id] = VoltageSource(id=source_id, bus=bus, voltages=voltages, phases=phases)
+
+    # Potential refs
+    frame, frame_name = _EMPTY_FRAME if potential_refs is None else potential_refs, "potential_refs"
+    _check_columns(frame, frame_name, ["element_id", "element_type"])
+    elements_by_type: dict[str, Mapping[Id, Any]] = {"bus": buses_dict, "ground": grounds_dict}
+    potential_refs_dict: dict[Id, PotentialRef] = {}
+    for pref_id, element, phases in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_POTENTIAL_REF_ID),
+        _lookup_typed(frame, frame_name, elements_by_type),
+        _objects(frame, frame_name, "phases", optional=True),
+        strict=True,
+    ):
+        potential_refs_dict[pref_id] = PotentialRef(id=pref_id, element=element, phases=phases)
+
+    # Ground connections
+    frame, frame_name = _EMPTY_FRAME if ground_connections is None else ground_connections, "ground_connections"
+    _check_columns(frame, frame_name, ["ground_id", "element_id", "element_type"])
+    elements_by_type = {
+        "bus": buses_dict,
+        "load": loads_dict,
+        "source": sources_dict,
+        "line": lines_dict,
+        "transformer": transformers_dict,
+        "switch": switches_dict,
+    }
+    ground_connections_dict: dict[Id, GroundConnection] = {}
+    for gc_id, ground, element, side, phase, impedance in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_GROUND_CONNECTION_ID),
+        _lookup(frame, frame_name, "ground_id", grounds_dict, code=RoseauLoadFlowExceptionCode.BAD_GROUND_ID),
+        _lookup_typed(frame, frame_name, elements_by_type),
+        _objects(frame, frame_name, "side", optional=True),
+        _objects(frame, frame_name, "phase", optional=True),
+        _objects(frame, frame_name, "impedance", optional=True),
+        strict=True,
+    ):
+        if side is not None:
+            element = getattr(element, f"side{SIDE_SUFFIX[side]}")
+        ground_connections_dict[gc_id] = GroundConnection(
+            id=gc_id,
+            ground=ground,
+            element=element,
+            phase="n" if phase is None else phase,
+            impedance=0j if impedance is None else impedance,
+        )
+
+    return {
+        "name": name,
+        "buses": buses_dict,
+        "lines": lines_dict,
+        "transformers": transformers_dict,
+        "switches": switches_dict,
+        "loads": loads_dict,
+        "sources": sources_dict,
+        "grounds": grounds_dict,
+        "potential_refs": potential_refs_dict,
+        "ground_connections": ground_connections_dict,
+        "crs": crs,
+    }
+
+
+#
+# Helpers shared with the single-phase networks
+#
+def _parameters_as_dict[P](parameters: MapOrSeq[P]) -> dict[Id, P]:
+    """Convert a sequence or a mapping of parameters to a dictionary with their IDs as keys."""
+    if isinstance(parameters, Mapping):
+        return dict(parameters)
+    return {p.id: p for p in parameters}  # type: ignore[attr-defined]
+
+
+def _frame_ids(frame: pd.DataFrame, *, code: RoseauLoadFlowExceptionCode) -> list[Id]:
+    """The IDs of the elements of a frame: its ``id`` column if it exists, otherwise its index."""
+    ids = pd.Index(frame["id"]) if "id" in frame.columns else frame.index
+    if ids.has_duplicates:
+        typ = code.name.removeprefix("BAD_").removesuffix("_ID").replace("_", " ").lower()
+        msg = f"Duplicate {typ} ID {ids[ids.duplicated()][0]!r} in the network."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=code)
+    return ids.tolist()
+
+
+def _check_columns(frame: pd.DataFrame, frame_name: str, columns: list[str]) -> None:
+    """Check that the required columns are in a non-empty frame."""
+    if frame.empty:
+        return
+    if missing := [column for column in columns if column not in frame.columns]:
+        msg = f"The {frame_name} frame is missing the required columns {missing}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME)
+
+
+def _missing_values_error(frame_name: str, column: str) -> RoseauLoadFlowException:
+    msg = f"The column {column!r} of the {frame_name} frame has missing values."
+    logger.error(msg)
+    return RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME)
+
+
+def _objects(frame: pd.DataFrame, frame_name: str, column: str, *, optional: bool = False) -> list[Any]:
+    """The values of a column of a frame, the missing values are replaced by None if the column is optional."""
+    if column not in frame.columns:
+        return [None] * len(frame)
+    values = frame[column]
+    missing = values.isna().to_numpy()
+    if not missing.any():
+        return values.tolist()
+    if not optional:
+        raise _missing_values_error(frame_name, column)
+    return values.astype(object).where(~missing, None).tolist()
+
+
+def _floats(
+    frame: pd.DataFrame, frame_name: str, column: str, *, default: float | None, optional: bool = False
+) -> list[Any]:
+    """The values of a numerical column of a frame, as floats.
+
+    The default value is used if the column is missing. If the column is optional, the missing values
+    are replaced by None.
+    """
+    if column not in frame.columns:
+        return [default] * len(frame)
+    try:
+        values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    except (TypeError, ValueError):
+        msg = f"The column {column!r} of the {frame_name} frame must contain numbers."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME) from None
+    missing = np.isnan(values)
+    result = values.tolist()
+    if missing.any():
+        if not optional:
+            raise _missing_values_error(frame_name, column)
+        for i in np.flatnonzero(missing).tolist():
+            result[i] = None
+    return result
+
+
+def _bools(frame: pd.DataFrame, frame_name: str, column: str, *, default: bool) -> list[bool]:
+    """The values of a boolean column of a frame. The default value is used if the column is missing."""
+    if column not in frame.columns:
+        return [default] * len(frame)
+    values = frame[column]
+    if values.isna().any():
+        raise _missing_values_error(frame_name, column)
+    return values.astype(bool).tolist()
+
+
+def _geometries(frame: pd.DataFrame) -> list[BaseGeometry | None]:
+    """The geometries of the elements of a frame, if any."""
+    if "geometry" not in frame.columns:
+        return [None] * len(frame)
+    return [geometry if isinstance(geometry, BaseGeometry) else None for geometry in frame["geometry"].tolist()]
+
+
+def _lookup[T](
+    frame: pd.DataFrame,
+    frame_name: str,
+    column: str,
+    elements: Mapping[Id, T],
+    *,
+    code: RoseauLoadFlowExceptionCode,
+    optional: bool = False,
+) -> list[T | None]:
+    """Get the elements referenced by their IDs in a column of a frame."""
+    keys = _objects(frame, frame_name, column, optional=optional)
+    known = pd.Series(keys, dtype=object).isin(list(elements)).to_numpy()
+    if optional:
+        known = known | np.array([key is None for key in keys], dtype=np.bool_)
+    if not known.all():
+        unknown = keys[int(np.flatnonzero(~known)[0])]
+        msg = f"The column {column!r} of the {frame_name} frame references the unknown ID {unknown!r}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=code)
+    return [None if key is None else elements[key] for key in keys]
+
+
+def _lookup_typed(frame: pd.DataFrame, frame_name: str, elements_by_type: Mapping[str, Mapping[Id, Any]]) -> list[Any]:
+    """Get the elements referenced by the ``element_id`` and ``element_type`` columns of a frame."""
+    element_ids = _objects(frame, frame_name, "element_id")
+    element_types = pd.Series(_objects(frame, frame_name, "element_type"), dtype=object)
+    unknown_types = ~element_types.isin(list(elements_by_type))
+    if unknown_types.any():
+        msg = (
+            f"The column 'element_type' of the {frame_name} frame has the invalid value "
+            f"{element_types[unknown_types].iloc[0]!r}, expected one of {list(elements_by_type)}."
+        )
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME)
+    result: list[Any] = [None] * len(element_ids)
+    for element_type, elements in elements_by_type.items():
+        indices = np.flatnonzero((element_types == element_type).to_numpy())
+        if indices.size == 0:
+            continue
+        keys = [element_ids[i] for i in indices.tolist()]
+        known = pd.Series(keys, dtype=object).isin(list(elements)).to_numpy()
+        if not known.all():
+            unknown = keys[int(np.flatnonzero(~known)[0])]
+            msg = f"The {frame_name} frame references the unknown {element_type} {unknown!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME)
+        for i, key in zip(indices.tolist(), keys, strict=True):
+            result[i] = elements[key]
+    return result
+
+
+def _check_lengths(lengths: list[float]) -> None:
+    """Check that the lengths of the lines are positive."""
+    invalid = np.flatnonzero(np.asarray(lengths, dtype=np.float64) <= 0)
+    if invalid.size > 0:
+        msg = f"A line length must be greater than 0. {lengths[invalid[0]]:.2f} km provided."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE)
+
+
+def _check_not_flexible(frame: pd.DataFrame, frame_name: str) -> None:
+    """Check that the loads of a frame are not flexible, flexible parameters cannot be stored in frames."""
+    if "flexible" in frame.columns and frame["flexible"].fillna(False).astype(bool).any():
+        msg = f"Flexible loads cannot be created from the {frame_name} frame, create them with their constructor."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_DATA_FRAME)
+
+
+def _load_values(
+    frame: pd.DataFrame, frame_name: str, load_ids: list[Id], value_columns: Mapping[str, str]
+) -> list[Any]:
+    """The values of the loads of a frame, taken from the column of the type of each load."""
+    load_types = pd.Series(_objects(frame, frame_name, "type"), dtype=object)
+    unknown_types = ~load_types.isin(list(value_columns))
+    if unknown_types.any():
+        i = int(np.flatnonzero(unknown_types.to_numpy())[0])
+        msg = f"Unknown load type {load_types.iloc[i]!r} for load {load_ids[i]!r}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE)
+    result: list[Any] = [None] * len(frame)
+    for load_type, column in value_columns.items():
+        indices = np.flatnonzero((load_types == load_type).to_numpy())
+        if indices.size == 0:
+            continue
+        _check_columns(frame, frame_name, [column])
+        values = frame[column].iloc[indices]
+        if values.isna().any():
+            raise _missing_values_error(frame_name, column)
+        for i, value in zip(indices.tolist(), values.tolist(), strict=True):
+            result[i] = value
+    return result
@@ -9,8 +9,10 @@ import pytest
 from pyproj import CRS
 from shapely import LineString, Point
 
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.io.dict import (
     NETWORK_JSON_VERSION,
+    binary_arrays_converter,
     v0_to_v1_converter,
     v1_to_v2_converter,
     v2_to_v3_converter,
@@ -188,6 +190,93 @@ def test_to_dict():
     assert "geometry" in res["transformers"][1]
 
 
+def test_binary_arrays(test_networks_path, tmp_path):
+    en = ElectricalNetwork.from_json(test_networks_path / "all_elements_network.json")
+    expected_dict = en.to_dict()
+    en_dict = en.to_dict(binary_arrays=True)
+    assert en_dict["arrays"]["encoding"] == "base64"
+    assert en_dict["arrays"]["dtype"] == "<f8"
+    bus_data = en_dict["buses"][0]
+    assert bus_data["initial_potentials"] == {"offset": 0, "shape": [3, 2]}
+    assert bus_data["results"]["potentials"] == {"offset": 6, "shape": [3, 2]}
+    assert isinstance(en_dict["lines_params"][0]["z_line"], dict)
+    assert isinstance(en_dict["grounds"][0]["results"]["potential"], list)  # scalars are not encoded
+
+    # The arrays are decoded to numpy arrays of the shapes of the lists, the input is not modified
+    original_dict = copy.deepcopy(en_dict)
+    decoded = binary_arrays_converter(en_dict)
+    assert en_dict == original_dict
+    assert "arrays" not in decoded
+    assert isinstance(decoded["buses"][0]["initial_potentials"], np.ndarray)
+    assert decoded["buses"][0]["initial_potentials"].tolist() == expected_dict["buses"][0]["initial_potentials"]
+    assert decoded["lines_params"][0]["z_line"].tolist() == expected_dict["lines_params"][0]["z_line"]
+
+    # Invalid buffers
+    for key, value, msg in (
+        ("encoding", "base85", "Unsupported binary arrays encoding 'base85', expected 'base64'."),
+        ("dtype", "<f4", "Unsupported binary arrays type '<f4', expected '<f8'."),
+    ):
+        bad_dict = copy.deepcopy(en_dict)
+        bad_dict["arrays"][key] = value
+        with pytest.raises(RoseauLoadFlowException) as e:
+            binary_arrays_converter(bad_dict)
+        assert e.value.msg == msg
+        assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS
+    bad_dict = copy.deepcopy(en_dict)
+    bad_dict["buses"][0]["initial_potentials"]["offset"] = 10**9
+    with pytest.raises(RoseauLoadFlowException) as e:
+        binary_arrays_converter(bad_dict)
+    assert e.value.msg.startswith("The binary array at offset 1000000000 of shape [3, 2] is out of the buffer")
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS
+
+    # Malformed buffers and array references
+    for arrays, msg in (
+        ("base64", "Unsupported binary arrays encoding None, expected 'base64'."),
+        ({"encoding": "base64", "dtype": "<f8"}, "The binary arrays have no base64-encoded 'data' string."),
+        (
+            {"encoding": "base64", "dtype": "<f8", "data": "AAAA*AAA"},
+            "The data of the binary arrays is not valid base64: Only base64 data is allowed",
+        ),
+        (
+            {"encoding": "base64", "dtype": "<f8", "data": "AAAAAAAAAAAA"},
+            "The data of the binary arrays has 9 bytes, expected a multiple of 8 for float64 values.",
+        ),
+        (
+            {"encoding": "base64", "dtype": "<f8", "data": "AAAA"},
+            "The data of the binary arrays has 3 bytes, expected a multiple of 8 for float64 values.",
+        ),
+    ):
+        bad_dict = copy.deepcopy(en_dict)
+        bad_dict["arrays"] = arrays
+        with pytest.raises(RoseauLoadFlowException) as e:
+            binary_arrays_converter(bad_dict)
+        assert e.value.msg.startswith(msg)
+        assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS
+    for ref in ({"shape": [3, 2]}, {"offset": 0}, {"offset": "0", "shape": [3, 2]}, {"offset": 0, "shape": [3, -2]}):
+        bad_dict = copy.deepcopy(en_dict)
+        bad_dict["buses"][0]["initial_potentials"] = ref
+        with pytest.raises(RoseauLoadFlowException) as e:
+            binary_arrays_converter(bad_dict)
+        assert e.value.msg == (
+            f"Invalid binary array reference {ref!r}, expected an integer 'offset' and a 'shape' list of "
+            f"non-negative integers."
+        )
+        assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BINARY_ARRAYS
+
+    # Read the network, the same dictionary can be read several times
+    en2 = ElectricalNetwork.from_dict(en_dict)
+    assert en2.to_dict() == expected_dict
+    assert en_dict == original_dict
+    assert ElectricalNetwork.from_dict(en_dict).to_dict() == expected_dict
+    np.testing.assert_array_equal(en2.res_buses["potential"], en.res_buses["potential"])
+
+    # Read and write files
+    path = en.to_json(tmp_path / "network.json", binary_arrays=True)
+    assert path.stat().st_size < en.to_json(tmp_path / "network_lists.json").stat().st_size
+    en3 = ElectricalNetwork.from_json(path)
+    assert en3.to_dict() == expected_dict
+
+
 def test_all_converters():
     from roseau.load_flow.io.tests.data.network_json_v0 import en
 
@@ -1,12 +1,12 @@
 import logging
 import math
 from abc import abstractmethod
-from functools import cached_property
 from typing import Generic, Self
 
 from shapely.geometry.base import BaseGeometry
 from typing_extensions import TypeVar
 
+from roseau.load_flow.converters import _common_phases, _missing_phases
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.models.buses import Bus
 from roseau.load_flow.models.connectables import AbstractConnectable
@@ -16,6 +16,7 @@ from roseau.load_flow.models.transformer_parameters import TransformerParameters
 from roseau.load_flow.typing import ComplexArray, Id, JsonDict, Side
 from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import one_or_more_repr, warn_external
+from roseau.load_flow.utils.mixins import AbstractElement
 from roseau.load_flow_engine.cy_engine import CyBranch
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ _Side_co = TypeVar("_Side_co", bound="AbstractBranchSide", default="AbstractBran
 class AbstractBranchSide(AbstractConnectable[_CyB_co]):
     """Accessor class to a branch side."""
 
+    __slots__ = ("_branch",)
+
     def __init__(
         self,
         *,
@@ -76,6 +79,10 @@ class AbstractBranchSide(AbstractConnectable[_CyB_co]):
         # Connections are done in the branch
         pass
 
+    def _create_cy_element(self) -> None:
+        # The Cython element is created by the branch
+        pass
+
     def _refresh_results(self) -> None:
         # Results are stored in the branch
         return self._branch._refresh_results()
@@ -90,6 +97,8 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         :doc:`Switch model documentation </models/Switch>`
     """
 
+    __slots__ = ("_geometry", "_side1", "_side2")
+
     @abstractmethod
     def __init__(
         self, id: Id, bus1: Bus, bus2: Bus, *, phases1: str, phases2: str, geometry: BaseGeometry | None
@@ -127,6 +136,16 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
             f"phases{s1}={self.phases1!r}, phases{s2}={self.phases2!r}>"
         )
 
+    @property
+    def geometry(self) -> BaseGeometry | None:
+        """The geometry of the branch."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: BaseGeometry | None) -> None:
+        self._geometry = self._check_geometry(value)
+        self._invalidate_network_spatial_index()
+
     @property
     def side1(self) -> _Side_co:
         """The first side of the branch."""
@@ -147,7 +166,7 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         """The phases of the branch at the second bus."""
         return self._side2._phases
 
-    @cached_property
+    @property
     def _all_phases(self) -> str:
         return "".join(sorted(set(self.phases1) | set(self.phases2)))
 
@@ -166,6 +185,16 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         self._side1._network = value
         self._side2._network = value
 
+    def _copy_new(self, memo: dict[int, AbstractElement]) -> Self:
+        self._side1._copy_new(memo)
+        self._side2._copy_new(memo)
+        return super()._copy_new(memo)
+
+    def _copy_to(self, new: Self, memo: dict[int, AbstractElement], include_results: bool) -> None:
+        super()._copy_to(new, memo, include_results)
+        self._side1._copy_to(memo[id(self._side1)], memo, include_results)
+        self._side2._copy_to(memo[id(self._side2)], memo, include_results)
+
     def _cy_connect(self) -> None:
         """Connect the Cython elements of the buses and the branch"""
         self._side1._cy_element = self._cy_element
@@ -177,16 +206,16 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         """Check the common phases between the buses and the branch (for lines and switches)."""
         self._check_compatible_phase_tech(bus1, id=id)
         self._check_compatible_phase_tech(bus2, id=id)
-        buses_phases = set(bus1.phases) & set(bus2.phases)
+        common_phases = _common_phases(bus1._phases, bus2._phases)
         if phases is None:
-            phases = "".join(sorted(buses_phases)).replace("ac", "ca")
+            phases = common_phases
         else:
             # Also check they are in the intersection of buses phases
             self._check_phases(id, phases=phases)
-            phases_not_in_buses = set(phases) - buses_phases
+            phases_not_in_buses = _missing_phases(phases, common_phases)
             if phases_not_in_buses:
-                ph, be = one_or_more_repr(sorted(phases_not_in_buses), "Phase")
-                ph_common = "".join(sorted(buses_phases)).replace("ac", "ca")
+                ph, be = one_or_more_repr(phases_not_in_buses, "Phase")
+                ph_common = common_phases
                 msg = (
                     f"{ph} of {self.element_type} {id!r} {be} not in the common phases {ph_common!r} "
                     f"of its buses {bus1.id!r} and {bus2.id!r}."
@@ -209,8 +238,8 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
     def _update_network_parameters(self, old_parameters: _Parameters | None, new_parameters: _Parameters) -> None:
         if old_parameters is not None and old_parameters is not new_parameters:
             old_parameters._elements.discard(self)
-            if not old_parameters._elements and self._network is not None:
-                # This was the only element using the old parameters, remove them from the network
+            if self._network is not None and not any(e._network is self._network for e in old_parameters._elements):
+                # This was the only element of the network using the old parameters, remove them from it
                 self._network._remove_parameters(self.element_type, old_parameters.id)
         if self not in new_parameters._elements:
             new_parameters._elements.add(self)
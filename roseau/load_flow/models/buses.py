@@ -14,6 +14,7 @@ from roseau.load_flow.models.terminals import AbstractTerminal
 from roseau.load_flow.typing import BoolArray, ComplexArray, ComplexArrayLike1D, FloatArray, Id, JsonDict, ResultState
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow.utils import warn_external
+from roseau.load_flow.utils.mixins import _complex_values
 from roseau.load_flow_engine.cy_engine import CyBus
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,17 @@ if TYPE_CHECKING:
 class Bus(AbstractTerminal["CyBus"]):
     """A multi-phase electrical bus."""
 
+    __slots__ = (
+        "_geometry",
+        "_initial_potentials",
+        "_nominal_voltage",
+        "_min_voltage_level",
+        "_max_voltage_level",
+        "_short_circuits",
+        "_initialized",
+        "_initialized_by_the_user",
+    )
+
     element_type: Final = "bus"
 
     def __init__(
@@ -98,11 +110,21 @@ class Bus(AbstractTerminal["CyBus"]):
 
         self._initialized = initialized
         self._initialized_by_the_user = initialized  # only used for serialization
-        self._cy_element = CyBus(n=self._n, potentials=self._initial_potentials)
+        self._create_cy_element()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id!r}, phases={self.phases!r})"
 
+    @property
+    def geometry(self) -> BaseGeometry | None:
+        """The geometry of the bus."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: BaseGeometry | None) -> None:
+        self._geometry = self._check_geometry(value)
+        self._invalidate_network_spatial_index()
+
     @property
     def initial_potentials(self) -> Q_[ComplexArray]:
         """An array of initial potentials of the bus (V)."""
@@ -122,6 +144,16 @@ class Bus(AbstractTerminal["CyBus"]):
         if self._cy_initialized:
             self._cy_element.initialize_potentials(self._initial_potentials)
 
+    def _warm_start(self) -> None:
+        """Initialize the potentials of the bus with the results of the last load flow.
+
+        Unlike the ``initial_potentials`` setter, the potentials are not serialized.
+        """
+        self._initial_potentials = self._res_potentials_getter(warning=False).copy()
+        self._initialized = True
+        if self._cy_initialized:
+            self._cy_element.initialize_potentials(self._initial_potentials)
+
     @property
     def nominal_voltage(self) -> Q_[float] | None:
         """The phase-to-phase nominal voltage of the bus (V) if it is set."""
@@ -280,6 +312,19 @@ class Bus(AbstractTerminal["CyBus"]):
             self._connect(ground)
             self._cy_element.connect(ground._cy_element, [(phases_index[0], 0)])
 
+    def _create_cy_element(self) -> None:
+        self._cy_element = CyBus(n=self._n, potentials=self._initial_potentials)
+        for short_circuit in self._short_circuits:
+            phases_index = np.array([self.phases.index(p) for p in short_circuit["phases"]], dtype=np.int32)
+            self._cy_element.connect_ports(phases_index)
+            if short_circuit["ground"] is not None:
+                ground = next(
+                    e
+                    for e in self._connected_elements
+                    if e.element_type == "ground" and e.id == short_circuit["ground"]
+                )
+                self._cy_element.connect(ground._cy_element, [(phases_index[0], 0)])
+
     def propagate_limits(self, force: bool = False) -> None:
         """Propagate the voltage limits to galvanically connected buses.
 
@@ -388,41 +433,38 @@ class Bus(AbstractTerminal["CyBus"]):
     # Results
     #
     def _res_voltage_levels_getter(self, warning: bool) -> FloatArray | None:
-        if self._nominal_voltage is None:
+        if (un := self._nominal_voltage) is None:
             return None
-        voltages_abs = abs(self._res_voltages_getter(warning=warning))
-        if "n" in self.phases:
-            return SQRT3 * voltages_abs / self._nominal_voltage
-        else:
-            return voltages_abs / self._nominal_voltage
+        voltages = self._res_voltages_getter(warning=warning)
+        factor = SQRT3 if "n" in self._phases else 1.0
+        return self._res_memo("voltage_levels", lambda: factor * abs(voltages) / un, un)
 
     def _res_voltage_levels_pp_getter(self, warning: bool) -> FloatArray | None:
-        if self._nominal_voltage is None:
+        if (un := self._nominal_voltage) is None:
             return None
-        voltages_abs = abs(self._res_voltages_pp_getter(warning=warning))
-        return voltages_abs / self._nominal_voltage
+        voltages = self._res_voltages_pp_getter(warning=warning)
+        return self._res_memo("voltage_levels_pp", lambda: abs(voltages) / un, un)
 
     def _res_voltage_levels_pn_getter(self, warning: bool) -> FloatArray | None:
-        if self._nominal_voltage is None:
+        if (un := self._nominal_voltage) is None:
             return None
-        voltages_abs = abs(self._res_voltages_pn_getter(warning=warning))
-        return SQRT3 * voltages_abs / self._nominal_voltage
+        voltages = self._res_voltages_pn_getter(warning=warning)
+        return self._res_memo("voltage_levels_pn", lambda: SQRT3 * abs(voltages) / un, un)
 
     def _res_agg_powers_getter(self, warning: bool) -> list[complex]:
         """Get the aggregated proper powers of the bus (VA) per phase."""
-        powers = dict.fromkeys(self.phases, 0j)
-        for e in self._connected_elements:
-            if e.element_type == "load":
-                sign = 1
-            elif e.element_type == "source":
-                sign = -1
-            else:
-                continue
-            for phase, power in zip(e.phases, e._res_powers_getter(warning=warning).tolist(), strict=True):  # type: ignore
+        _ = self._res_potentials_getter(warning=warning)  # check the results of the bus
+        elements = [e for e in self._connected_elements if e.element_type in {"load", "source"}]
+        return self._res_memo("agg_powers", lambda: self._compute_agg_powers(elements), *elements)
+
+    def _compute_agg_powers(self, elements: list[Element]) -> list[complex]:
+        powers = dict.fromkeys(self._phases, 0j)
+        for e in elements:
+            sign = 1 if e.element_type == "load" else -1
+            for phase, power in zip(e.phases, e._res_powers_getter(warning=False).tolist(), strict=True):  # type: ignore
                 if phase not in powers:
                     continue
                 powers[phase] += sign * power
-            warning = False  # warn only once
         return list(powers.values())
 
     def _res_state_getter(self) -> ResultState:
@@ -505,6 +547,12 @@ class Bus(AbstractTerminal["CyBus"]):
         voltage_levels = self._res_voltage_levels_getter(warning=True)
         if voltage_levels is None:
             return None
+        return self._res_memo(
+            "violated", lambda: self._compute_violated(voltage_levels, u_min, u_max), voltage_levels, u_min, u_max
+        )
+
+    @staticmethod
+    def _compute_violated(voltage_levels: FloatArray, u_min: float | None, u_max: float | None) -> BoolArray:
         violated = np.full_like(voltage_levels, fill_value=False, dtype=np.bool_)
         if u_min is not None:
             violated |= voltage_levels < u_min
@@ -518,7 +566,7 @@ class Bus(AbstractTerminal["CyBus"]):
     @classmethod
     def _from_dict(cls, data: JsonDict, *, include_results: bool = True) -> Self:
         if (initial_potentials := data.get("initial_potentials")) is not None:
-            initial_potentials = [complex(*v) for v in initial_potentials]
+            initial_potentials = _complex_values(initial_potentials)
         self = cls(
             id=data["id"],
             phases=data["phases"],
@@ -1,11 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
-from functools import cached_property
 from typing import ClassVar
 
-import numpy as np
-
-from roseau.load_flow.converters import _calculate_voltages
+from roseau.load_flow.converters import _calculate_voltages, _missing_phases, _phases_connections
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.models.buses import Bus
 from roseau.load_flow.models.core import _CyE_co
@@ -14,6 +11,7 @@ from roseau.load_flow.sym import phasor_to_sym
 from roseau.load_flow.typing import ComplexArray, Id, JsonDict, Side
 from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import SIDE_DESC, abstractattrs, ensure_startsupper, one_or_more_repr, warn_external
+from roseau.load_flow.utils.mixins import _RawComplexArray
 from roseau.load_flow_engine.cy_engine import CyBranch
 
 logger = logging.getLogger(__name__)
@@ -22,6 +20,8 @@ logger = logging.getLogger(__name__)
 class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
     """A base class for elements connected to a bus."""
 
+    __slots__ = ("_bus", "_connect_neutral", "_res_currents")
+
     @abstractmethod
     def __init__(
         self,
@@ -87,7 +87,7 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
         """The bus of the element."""
         return self._bus
 
-    @cached_property
+    @property
     def has_floating_neutral(self) -> bool:
         """Does this element have a floating neutral?"""
         if "n" not in self._phases:
@@ -101,26 +101,25 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
     def _check_bus_phases(
         self, bus: Bus, id: Id, phases: str, connect_neutral: bool | None, side: Side | None
     ) -> bool | None:
-        side_desc = SIDE_DESC[side]
         if connect_neutral is not None:
             connect_neutral = bool(connect_neutral)  # to allow np.bool
         if connect_neutral and "n" not in phases:
             warn_external(
                 message=(
-                    f"{ensure_startsupper(f'{side_desc}neutral')} connection requested for "
+                    f"{ensure_startsupper(f'{SIDE_DESC[side]}neutral')} connection requested for "
                     f"{self.element_type} {id!r} with no neutral phase."
                 ),
                 category=UserWarning,
             )
             connect_neutral = None
         # Also check they are in the bus phases
-        phases_not_in_bus = set(phases) - set(bus.phases)
+        phases_not_in_bus = _missing_phases(phases, bus._phases)
         # "n" is allowed to be absent from the bus only if the element has more than 2 phases
-        missing_ok = phases_not_in_bus == {"n"} and len(phases) > 2 and not connect_neutral
+        missing_ok = phases_not_in_bus == ("n",) and len(phases) > 2 and not connect_neutral
         if phases_not_in_bus and not missing_ok:
-            ph, be = one_or_more_repr(sorted(phases_not_in_bus), "phase")
+            ph, be = one_or_more_repr(phases_not_in_bus, "phase")
             msg = (
-                f"{ensure_startsupper(f'{side_desc}{ph}')} of {self.element_type} {id!r} {be} not "
+                f"{ensure_startsupper(f'{SIDE_DESC[side]}{ph}')} of {self.element_type} {id!r} {be} not "
                 f"in phases {bus.phases!r} of its bus {bus.id!r}."
             )
             logger.error(msg)
@@ -128,8 +127,8 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
         return connect_neutral
 
     def _cy_connect(self) -> None:
-        bus_phases = self.bus.phases.removesuffix("n") if self.has_floating_neutral else self.bus.phases
-        connections = [(i, bus_phases.index(phase)) for i, phase in enumerate(self.phases) if phase in bus_phases]
+        bus_phases = self._bus._phases.removesuffix("n") if self.has_floating_neutral else self._bus._phases
+        connections = _phases_connections(self._phases, bus_phases)
         if isinstance(self._cy_element, CyBranch):
             self._cy_element.connect_side(self.bus._cy_element, connections, beginning=self._side_index == 0)
         else:
@@ -150,7 +149,7 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
     def _res_powers_getter(self, warning: bool) -> ComplexArray:
         currents = self._res_currents_getter(warning=warning)
         potentials = self._res_potentials_getter(warning=False)  # warn only once
-        return potentials * currents.conjugate()
+        return self._res_memo("powers", lambda: potentials * currents.conjugate())
 
     @property
     def res_currents(self) -> Q_[ComplexArray]:
@@ -192,9 +191,7 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
     def _parse_results_from_dict(self, data: JsonDict, include_results: bool) -> None:
         if include_results and "results" in data:
             super()._parse_results_from_dict(data, include_results=include_results)
-            self._res_currents = np.array(
-                [complex(*i) for i in data["results"][f"currents{self._side_suffix}"]], dtype=np.complex128
-            )
+            self._res_currents = _RawComplexArray(data["results"][f"currents{self._side_suffix}"])  # type: ignore
 
     def _to_dict(self, include_results: bool) -> JsonDict:
         data = {
@@ -233,6 +230,8 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
 class AbstractDisconnectable(AbstractConnectable[_CyE_co], ABC):
     """A base class for disconnectable elements in the network (loads, sources, etc.)."""
 
+    __slots__ = ()
+
     type: ClassVar[str]
 
     def __repr__(self) -> str:
@@ -248,7 +247,7 @@ class AbstractDisconnectable(AbstractConnectable[_CyE_co], ABC):
 
     def disconnect(self) -> None:
         """Disconnect this element from the network. It cannot be used afterwards."""
-        for element in self._connected_elements:
+        for element in list(self._connected_elements):  # the ground connections remove themselves
             if element.element_type == "ground connection":
                 element._disconnect()
         self._disconnect()
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 @abstractattrs("allowed_phases")
 class Element(AbstractElement["ElectricalNetwork", _CyE_co]):
+    __slots__ = ()
+
     is_multi_phase: Final = True
 
     allowed_phases: ClassVar[frozenset[str]]  # frozenset for immutability and uniqueness
@@ -24,7 +26,7 @@ class Element(AbstractElement["ElectricalNetwork", _CyE_co]):
     important. For a full list of supported phases, use ``print(<Element class>.allowed_phases)``.
     """
 
-    _connected_elements: list["Element"]
+    _connected_elements: dict["Element", None]
 
     @classmethod
     def _check_phases(cls, id: Id, allowed_phases: frozenset[str] | None = None, **kwargs: str) -> None:
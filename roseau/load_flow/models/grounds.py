@@ -36,6 +36,8 @@ class Ground(Element["CyGround"]):
        impedance) or impedant (non-zero impedance).
     """
 
+    __slots__ = ("_connections", "_res_potential")
+
     element_type: Final = "ground"
     allowed_phases: Final = frozenset({"a", "b", "c", "n"})
 
@@ -49,7 +51,7 @@ class Ground(Element["CyGround"]):
         super().__init__(id)
         self._connections: list[GroundConnection] = []
         self._res_potential: complex | None = None
-        self._cy_element = CyGround()
+        self._create_cy_element()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id!r})"
@@ -82,6 +84,9 @@ class Ground(Element["CyGround"]):
             raise RoseauLoadFlowException(msg, RoseauLoadFlowExceptionCode.BAD_BUS_ID)
         GroundConnection(ground=self, element=bus, phase=phase)
 
+    def _create_cy_element(self) -> None:
+        self._cy_element = CyGround()
+
     #
     # Results
     #
@@ -128,6 +133,8 @@ class Ground(Element["CyGround"]):
 class GroundConnection(Element["CySimplifiedLine | CySwitch"]):
     """An ideal or impedant connection to the ground."""
 
+    __slots__ = ("_ground", "_element", "_phase", "on_connected", "_impedance", "_res_current")
+
     element_type: Final = "ground connection"
     allowed_phases: Final = frozenset({"a", "b", "c", "n"})
 
@@ -198,7 +205,12 @@ class GroundConnection(Element["CySimplifiedLine | CySwitch"]):
             raise RoseauLoadFlowException(msg, RoseauLoadFlowExceptionCode.BAD_PHASE)
 
         # Check if the element is already connected to this ground
-        connected_phases = [gc._phase for gc in ground._connections if gc._element is element]
+        # The connections of the element are fewer than the connections of the ground
+        connected_phases = [
+            gc._phase
+            for gc in element_to_connect._connected_elements
+            if isinstance(gc, GroundConnection) and gc._ground is ground and gc._element is element
+        ]
         if connected_phases:
             if phase in connected_phases:
                 msg = (
@@ -269,8 +281,7 @@ class GroundConnection(Element["CySimplifiedLine | CySwitch"]):
                     self._cy_element.disconnect()
                 if self._network is not None:
                     self._network._valid = False
-                self._cy_element = CySwitch(n=1)
-                self._cy_connect()
+                self._create_cy_element()
             else:
                 pass  # do nothing, switch has no parameters
         else:
@@ -280,8 +291,7 @@ class GroundConnection(Element["CySimplifiedLine | CySwitch"]):
                     self._cy_element.disconnect()
                 if self._network is not None:
                     self._network._valid = False
-                self._cy_element = CySimplifiedLine(n=1, z_line=z_line)
-                self._cy_connect()
+                self._create_cy_element()
             else:
                 self._cy_element.update_line_parameters(z_line=z_line)
 
@@ -295,6 +305,13 @@ class GroundConnection(Element["CySimplifiedLine | CySwitch"]):
         """The element connected to the ground."""
         return self._element
 
+    def _create_cy_element(self) -> None:
+        if cmath.isclose(self._impedance, 0, abs_tol=1e-8):
+            self._cy_element = CySwitch(n=1)
+        else:
+            self._cy_element = CySimplifiedLine(n=1, z_line=np.array([self._impedance], dtype=np.complex128))
+        self._cy_connect()
+
     def _cy_connect(self) -> None:
         # Connect the phase of the element to the first side of the ground connection.
         i = self._element.phases.index(self._phase)
@@ -3,6 +3,7 @@ import logging
 import math
 import re
 import warnings
+import weakref
 from collections.abc import Sequence
 from enum import StrEnum
 from importlib import resources
@@ -20,8 +21,10 @@ from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowE
 from roseau.load_flow.sym import A_INV, A
 from roseau.load_flow.types import Insulator, LineType, Material
 from roseau.load_flow.typing import (
+    ComplexArray,
     ComplexArrayLike2D,
     ComplexMatrix,
+    ComplexScalarOrArrayLike1D,
     Float,
     FloatArray,
     FloatScalarOrArrayLike1D,
@@ -126,6 +129,8 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
             self._with_shunt = not np.allclose(y_shunt, 0)
             self._y_shunt = np.asarray(y_shunt, dtype=np.complex128)
         self._size = self._z_line.shape[0]
+        self._z_line_inv: ComplexMatrix | None = None
+        self._yg: ComplexArray = self._y_shunt.sum(axis=1)
         self._ampacities = None
         self.ampacities = ampacities
         self._line_type = None if pd.isna(line_type) else LineType(line_type)
@@ -137,7 +142,8 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
         self.sections = sections
         self._check_matrix()
 
-        self._elements = set()  # Set of elements using this line parameters object
+        # Set of elements using this line parameters object, they may belong to several networks
+        self._elements: weakref.WeakSet = weakref.WeakSet()
 
     def __repr__(self) -> str:
         s = f"<{type(self).__name__}: id={self.id!r}"
@@ -166,6 +172,12 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
     def with_shunt(self) -> bool:
         return self._with_shunt
 
+    def _get_z_line_inv(self) -> ComplexMatrix:
+        """The inverse of the impedance matrix (S.km). It is computed once and shared by the lines."""
+        if self._z_line_inv is None:
+            self._z_line_inv = np.linalg.inv(self._z_line)
+        return self._z_line_inv
+
     @property
     def ampacities(self) -> Q_[FloatArray] | None:
         """The ampacities of the line (A) if it is set."""
@@ -300,6 +312,93 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
         z_line, y_shunt = cls._sym_to_zy(id=id, z0=z0, z1=z1, y0=y0, y1=y1, zn=zn, zpn=zpn, bn=bn, bpn=bpn)
         return cls(id=id, z_line=z_line, y_shunt=y_shunt, ampacities=ampacities)
 
+    @classmethod
+    @ureg_wraps(None, (None, None, "ohm/km", "ohm/km", "S/km", "S/km", "ohm/km", "ohm/km", "S/km", "S/km", "A"))
+    def from_sym_many(
+        cls,
+        ids: Sequence[Id],
+        z0: ComplexScalarOrArrayLike1D,
+        z1: ComplexScalarOrArrayLike1D,
+        y0: ComplexScalarOrArrayLike1D,
+        y1: ComplexScalarOrArrayLike1D,
+        zn: ComplexScalarOrArrayLike1D | None = None,
+        xpn: FloatScalarOrArrayLike1D | None = None,
+        bn: FloatScalarOrArrayLike1D | None = None,
+        bpn: FloatScalarOrArrayLike1D | None = None,
+        ampacities: FloatScalarOrArrayLike1D | None = None,
+    ) -> list[Self]:
+        """Create several line parameters from symmetric models.
+
+        This is equivalent to calling :meth:`from_sym` for each line parameters but the impedance
+        and admittance matrices of all the line parameters are computed at once. Each argument,
+        other than ``ids``, is either a single value used for all the line parameters or a sequence
+        of values with the same length as ``ids``. Line parameters with missing (``None`` or NaN)
+        neutral data are modelled as 3-wire lines. See :meth:`from_sym` for the description of the
+        arguments.
+
+        Args:
+            ids:
+                The ids of the line parameters.
+
+            z0:
+                The zero sequence impedances (ohms/km).
+
+            z1:
+                The direct sequence impedances (ohms/km).
+
+            y0:
+                The zero sequence admittances (Siemens/km).
+
+            y1:
+                The direct sequence admittances (Siemens/km).
+
+            zn:
+                The neutral impedances (ohms/km).
+
+            xpn:
+                The phase-to-neutral reactances (ohms/km).
+
+            bn:
+                The neutral susceptances (siemens/km).
+
+            bpn:
+                The phase-to-neutral susceptances (siemens/km).
+
+            ampacities:
+                The optional ampacities of the lines (A). They are not used in the load flow.
+
+        Returns:
+            The created line parameters, in the order of ``ids``.
+        """
+        ids = list(ids)
+        size = len(ids)
+        if size == 0:
+            return []
+        z_lines, y_shunts, has_neutral = cls._sym_to_zy_many(
+            ids=ids,
+            z0=_broadcast_many_complexes(z0, size, "z0"),
+            z1=_broadcast_many_complexes(z1, size, "z1"),
+            y0=_broadcast_many_complexes(y0, size, "y0"),
+            y1=_broadcast_many_complexes(y1, size, "y1"),
+            zn=_broadcast_many_complexes(zn, size, "zn"),
+            zpn=1j * _broadcast_many_floats(xpn, size, "xpn"),
+            bn=_broadcast_many_floats(bn, size, "bn"),
+            bpn=_broadcast_many_floats(bpn, size, "bpn"),
+        )
+        ampacities_ = _broadcast_many_floats(ampacities, size, "ampacities").tolist()
+        result = []
+        for i, id in enumerate(ids):
+            n = 4 if has_neutral[i] else 3
+            result.append(
+                cls(
+                    id=id,
+                    z_line=z_lines[i, :n, :n].copy(),
+                    y_shunt=y_shunts[i, :n, :n].copy(),
+                    ampacities=None if math.isnan(ampacities_[i]) else ampacities_[i],
+                )
+            )
+        return result
+
     @classmethod
     def _sym_to_zy(
         cls,
@@ -402,6 +501,81 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
 
         return z_line, y_shunt
 
+    @classmethod
+    def _sym_to_zy_many(
+        cls,
+        ids: Sequence[Id],
+        z0: ComplexArray,
+        z1: ComplexArray,
+        y0: ComplexArray,
+        y1: ComplexArray,
+        zn: ComplexArray,
+        zpn: ComplexArray,
+        bn: FloatArray,
+        bpn: FloatArray,
+    ) -> tuple[NDArray[np.complex128], NDArray[np.complex128], NDArray[np.bool_]]:
+        """Create the impedance and admittance matrices of several symmetrical models at once.
+
+        This is the vectorized version of :meth:`_sym_to_zy`, the arguments are arrays of length
+        ``K`` where missing neutral data are NaN.
+
+        Returns:
+            The ``(K, 4, 4)`` impedance and admittance matrices and the ``K`` booleans telling if
+            the lines have a neutral. The fourth row and column of the matrices of the lines without
+            neutral must be ignored.
+        """
+        has_neutral = ~(np.isnan(zpn) | np.isnan(bn) | np.isnan(bpn) | np.isnan(zn))
+        no_neutral_elements = has_neutral & (np.abs(zpn) <= 1e-8) & (np.abs(zn) <= 1e-8)
+        for i in np.flatnonzero(no_neutral_elements).tolist():
+            warn_external(
+                f"The line model {ids[i]!r} does not have neutral elements. It will be modelled as a 3 wires line "
+                f"instead.",
+                category=UserWarning,
+            )
+        has_neutral &= ~no_neutral_elements
+
+        def sym_to_zy(z0, z1, y0, y1):
+            z = np.empty((len(ids), 4, 4), dtype=np.complex128)
+            y = np.empty((len(ids), 4, 4), dtype=np.complex128)
+            z[:, :3, :3] = ((z0 - z1) / 3)[:, None, None]
+            y[:, :3, :3] = ((y0 - y1) / 3)[:, None, None]
+            diag = np.arange(3)
+            z[:, diag, diag] = ((z0 + 2 * z1) / 3)[:, None]
+            y[:, diag, diag] = ((y0 + 2 * y1) / 3)[:, None]
+            z[:, 3, :3] = z[:, :3, 3] = zpn[:, None]
+            y[:, 3, :3] = y[:, :3, 3] = (bpn * 1j)[:, None]  # Phase-to-neutral shunt admittance (Siemens/km)
+            z[:, 3, 3] = zn
+            y[:, 3, 3] = bn * 1j  # Neutral shunt admittance (Siemens/km)
+            z[~has_neutral, 3, :] = z[~has_neutral, :, 3] = 0.0
+            z[~has_neutral, 3, 3] = 1.0  # the determinant of the 3x3 block
+            y[~has_neutral, 3, :] = y[~has_neutral, :, 3] = 0.0
+            return z, y
+
+        # Two possible choices. The first one is the best but sometimes PwF data forces us to choose the second one
+        # We trust the manual !!! can give singular matrix !!!
+        z_line, y_shunt = sym_to_zy(z0, z1, y0, y1)
+        singular = np.isclose(np.abs(nplin.det(z_line)), 0, rtol=0, atol=1e-8)
+        if singular.any():
+            for i in np.flatnonzero(singular).tolist():
+                logger.warning(
+                    f"The symmetric model data provided for line type {ids[i]!r} produces invalid "
+                    f"line impedance matrix... It is often the case with line models coming from "
+                    f"PowerFactory. Trying to handle the data in a 'degraded' line model."
+                )
+            # Do not read the manual, it is useless: in pwf we trust
+            # No mutual components (z0=z1 and y0=y1)
+            z_degraded, y_degraded = sym_to_zy(z1, z1, y1, y1)
+            z_line[singular], y_shunt[singular] = z_degraded[singular], y_degraded[singular]
+            still_singular = singular & np.isclose(np.abs(nplin.det(z_line)), 0, rtol=0, atol=1e-8)
+            if still_singular.any():
+                msg = (
+                    f"The symmetric model data provided for line type {ids[np.flatnonzero(still_singular)[0]]!r} "
+                    f"produces invalid line impedance matrix."
+                )
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Z_LINE_VALUE)
+        return z_line, y_shunt, has_neutral
+
     def _zy_to_sym(
         self, operation: str, exc_code: RoseauLoadFlowExceptionCode, kron: bool
     ) -> tuple[tuple[complex, complex], tuple[complex, complex]]:
@@ -561,6 +735,111 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
             sections=sections,
         )
 
+    @classmethod
+    @ureg_wraps(None, (None, None, None, None, None, None, None, "mm**2", "mm**2", "m", "m", "A", "A"))
+    def from_geometry_many(
+        cls,
+        ids: Sequence[Id],
+        *,
+        line_types: LineType | str | Sequence[LineType | str],
+        materials: Material | str | Sequence[Material | str | None] | None = None,
+        materials_neutral: Material | str | Sequence[Material | str | None] | None = None,
+        insulators: Insulator | str | Sequence[Insulator | str | None] | None = None,
+        insulators_neutral: Insulator | str | Sequence[Insulator | str | None] | None = None,
+        sections: FloatScalarOrArrayLike1D,
+        sections_neutral: FloatScalarOrArrayLike1D | None = None,
+        heights: FloatScalarOrArrayLike1D,
+        external_diameters: FloatScalarOrArrayLike1D,
+        ampacities: FloatScalarOrArrayLike1D | None = None,
+        ampacities_neutral: FloatScalarOrArrayLike1D | None = None,
+    ) -> list[Self]:
+        """Create several line parameters from their geometries.
+
+        This is equivalent to calling :meth:`from_geometry` for each line parameters but the
+        impedance and admittance matrices of all the line parameters are computed at once. Each
+        argument, other than ``ids``, is either a single value used for all the line parameters or a
+        sequence of values with the same length as ``ids``. See :meth:`from_geometry` for the
+        description of the arguments.
+
+        Args:
+            ids:
+                The ids of the line parameters types.
+
+            line_types:
+                The types of the lines (overhead, underground, twisted).
+
+            materials:
+                The materials of the phases. ``None`` values are replaced by the default material of
+                the line type.
+
+            materials_neutral:
+                The materials of the neutrals. ``None`` values are replaced by the materials of the
+                phases.
+
+            insulators:
+                The insulators of the phases. ``None`` values are replaced by the default insulator
+                of the line type.
+
+            insulators_neutral:
+                The insulators of the neutrals. ``None`` values are replaced by the insulators of the
+                phases.
+
+            sections:
+                The cross-section surface areas of the phases (mm²).
+
+            sections_neutral:
+                The cross-section surface areas of the neutrals (mm²). ``None`` or NaN values are
+                replaced by the sections of the phases.
+
+            heights:
+                The heights of the lines (m).
+
+            external_diameters:
+                The external diameters of the cables (m).
+
+            ampacities:
+                The optional ampacities of the phases (A).
+
+            ampacities_neutral:
+                The optional ampacities of the neutrals (A). ``None`` or NaN values are replaced by
+                the ampacities of the phases.
+
+        Returns:
+            The created line parameters, in the order of ``ids``.
+        """
+        ids = list(ids)
+        size = len(ids)
+        if size == 0:
+            return []
+        z_lines, y_shunts, line_types_, materials_, insulators_, sections_ = cls._from_geometry_many(
+            ids=ids,
+            line_types=_broadcast_many(line_types, size, "line_types"),
+            materials=_broadcast_many(materials, size, "materials"),
+            materials_neutral=_broadcast_many(materials_neutral, size, "materials_neutral"),
+            insulators=_broadcast_many(insulators, size, "insulators"),
+            insulators_neutral=_broadcast_many(insulators_neutral, size, "insulators_neutral"),
+            sections=_broadcast_many_floats(sections, size, "sections"),
+            sections_neutral=_broadcast_many_floats(sections_neutral, size, "sections_neutral"),
+            heights=_broadcast_many_floats(heights, size, "heights"),
+            external_diameters=_broadcast_many_floats(external_diameters, size, "external_diameters"),
+        )
+        ampacities_ = _broadcast_many_floats(ampacities, size, "ampacities")
+        ampacities_neutral_ = _broadcast_many_floats(ampacities_neutral, size, "ampacities_neutral")
+        ampacities_neutral_ = np.where(np.isnan(ampacities_neutral_), ampacities_, ampacities_neutral_)
+        return [
+            cls(
+                id=id,
+                z_line=z_lines[i],
+                y_shunt=y_shunts[i],
+                ampacities=None if np.isnan(ampacities_[i]) else [*[ampacities_[i]] * 3, ampacities_neutral_[i]],
+                line_type=line_types_[i],
+                materials=materials_[i],
+                insulators=insulators_[i],
+                sections=sections_[i],
+            )
+            for i, id in enumerate(ids)
+        ]
+
     @classmethod
     def _from_geometry(
         cls,
@@ -619,176 +898,262 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
             The impedance matrix, the admittance matrix, the materials array, the insulators array and
             the sections array.
         """
+        z_lines, y_shunts, line_types, materials, insulators, sections = cls._from_geometry_many(
+            ids=[id],
+            line_types=[line_type],
+            materials=[material],
+            materials_neutral=[material_neutral],
+            insulators=[insulator],
+            insulators_neutral=[insulator_neutral],
+            sections=np.array([section], dtype=np.float64),
+            sections_neutral=np.array([section_neutral], dtype=np.float64),
+            heights=np.array([height], dtype=np.float64),
+            external_diameters=np.array([external_diameter], dtype=np.float64),
+        )
+        return z_lines[0], y_shunts[0], line_types[0], materials[0], insulators[0], sections[0]
+
+    @classmethod
+    def _from_geometry_many(
+        cls,
+        ids: Sequence[Id],
+        line_types: Sequence[LineType | str],
+        materials: Sequence[Material | str | None],
+        materials_neutral: Sequence[Material | str | None],
+        insulators: Sequence[Insulator | str | None],
+        insulators_neutral: Sequence[Insulator | str | None],
+        sections: FloatArray,
+        sections_neutral: FloatArray,
+        heights: FloatArray,
+        external_diameters: FloatArray,
+    ) -> tuple[
+        NDArray[np.complex128], NDArray[np.complex128], list[LineType], MaterialArray, InsulatorArray, FloatArray
+    ]:
+        """Create the impedance and admittance matrices of several lines using a geometric model.
+
+        The matrices of the ``K`` lines are computed at once on ``(K, 4, 4)`` stacks. The arguments
+        are sequences of length ``K`` of the arguments of :meth:`_from_geometry`, missing neutral
+        sections are NaN.
+
+        Returns:
+            The ``(K, 4, 4)`` impedance and admittance matrices, the line types, and the ``(K, 4)``
+            materials, insulators and sections arrays.
+        """
         # dpp = data["dpp"]  # Distance phase-to-phase (m)
         # dpn = data["dpn"]  # Distance phase-to-neutral (m)
         # dsh = data["dsh"]  # Diameter of the sheath (mm)
 
         # Normalize enumerations and fill optional values
-        line_type = LineType(line_type)
-        material = _DEFAULT_MATERIAL[line_type] if material is None else Material(material)
-        insulator = _DEFAULT_INSULATOR[line_type] if insulator is None else Insulator(insulator)
-        material_neutral = material if material_neutral is None else Material(material_neutral)
-        insulator_neutral = insulator if insulator_neutral is None else Insulator(insulator_neutral)
-        if section_neutral is None:
-            section_neutral = section
+        line_types = [LineType(x) for x in line_types]
+        material = [
+            _DEFAULT_MATERIAL[lt] if pd.isna(x) else Material(x) for lt, x in zip(line_types, materials, strict=True)
+        ]
+        insulator = [
+            _DEFAULT_INSULATOR[lt] if pd.isna(x) else Insulator(x) for lt, x in zip(line_types, insulators, strict=True)
+        ]
+        material_neutral = [m if pd.isna(x) else Material(x) for m, x in zip(material, materials_neutral, strict=True)]
+        insulator_neutral = [
+            i if pd.isna(x) else Insulator(x) for i, x in zip(insulator, insulators_neutral, strict=True)
+        ]
+        sections_neutral = np.where(np.isnan(sections_neutral), sections, sections_neutral)
 
         # Geometric configuration
         coord, coord_prim, epsilon, epsilon_neutral = cls._get_geometric_configuration(
-            line_type=line_type,
-            insulator=insulator,
-            insulator_neutral=insulator_neutral,
-            height=height,
-            external_diameter=external_diameter,
+            line_types=line_types,
+            insulators=insulator,
+            insulators_neutral=insulator_neutral,
+            heights=heights,
+            external_diameters=external_diameters,
         )
 
         # Distance computation
-        sections_mm2 = np.array([section, section, section, section_neutral], dtype=np.float64)
+        sections_mm2 = np.stack([sections, sections, sections, sections_neutral], axis=-1)
         sections_m2 = sections_mm2 * 1e-6  # surfaces (m2)
         radius = np.sqrt(sections_m2 / PI)  # radius (m)
-        phase_radius, neutral_radius = radius[0], radius[3]
-        if line_type == LineType.TWISTED:
-            max_radii = external_diameter / 4
-            if phase_radius + neutral_radius > max_radii:
-                msg = (
-                    f"Conductors too big for 'twisted' line parameter of id {id!r}. Inequality "
-                    f"`neutral_radius + phase_radius <= external_diameter / 4` is not satisfied."
-                )
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-        elif line_type == LineType.UNDERGROUND:
-            max_radii = external_diameter / 4 * np.sqrt(2)
-            if phase_radius + neutral_radius > max_radii:
-                msg = (
-                    f"Conductors too big for 'underground' line parameter of id {id!r}. Inequality "
-                    f"`neutral_radius + phase_radius <= external_diameter * sqrt(2) / 4` is not satisfied."
-                )
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-            if phase_radius * 2 > max_radii:
-                msg = (
-                    f"Conductors too big for 'underground' line parameter of id {id!r}. Inequality "
-                    f"`phase_radius*2 <= external_diameter * sqrt(2) / 4` is not satisfied."
-                )
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-        else:
-            pass  # TODO Overhead lines check
+        cls._check_geometric_radius(
+            ids=ids, line_types=line_types, radius=radius, external_diameters=external_diameters
+        )
         gmr = radius * np.exp(-0.25)  # geometric mean radius (m)
         # distance between two wires (m)
-        coord_new_dim = coord[:, None, :]
-        diff = coord_new_dim - coord
-        distance = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        coord_new_dim = coord[:, :, None, :]
+        diff = coord_new_dim - coord[:, None, :, :]
+        distance = np.sqrt(np.einsum("kijl,kijl->kij", diff, diff))
         # distance between a wire and the image of another wire (m)
-        diff = coord_new_dim - coord_prim
-        distance_prim = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        diff = coord_new_dim - coord_prim[:, None, :, :]
+        distance_prim = np.sqrt(np.einsum("kijl,kijl->kij", diff, diff))
 
         # Useful matrices
+        diag = np.arange(4)
         minus = -np.ones((4, 4), dtype=np.float64)
         np.fill_diagonal(minus, 1)
 
         # Electrical parameters
-        materials = np.array([material, material, material, material_neutral], dtype=np.object_)
-        rho = np.array([RHO[x].m for x in materials], dtype=np.float64)
-        r = rho / sections_m2 * np.eye(4, dtype=np.float64) * 1e3  # resistance (ohm/km)
-        np.fill_diagonal(distance, gmr)
+        materials_ = np.array(
+            [[m, m, m, mn] for m, mn in zip(material, material_neutral, strict=True)], dtype=np.object_
+        )
+        rho_by_material = {m: RHO[m].m for m in set(material) | set(material_neutral)}
+        rho = np.array([[rho_by_material[x] for x in row] for row in materials_], dtype=np.float64)
+        r = (rho / sections_m2)[:, None, :] * np.eye(4, dtype=np.float64) * 1e3  # resistance (ohm/km)
+        distance[:, diag, diag] = gmr
         inductance = MU_0.m / (2 * PI) * np.log(1 / distance) * 1e3  # H/m->H/km
-        np.fill_diagonal(distance, radius)
-        epsilons = np.array([epsilon, epsilon, epsilon, epsilon_neutral], dtype=np.float64)
-        lambdas = 1 / (2 * PI * epsilons) * np.log(distance_prim / distance)  # m/F
+        distance[:, diag, diag] = radius
+        epsilons = np.stack([epsilon, epsilon, epsilon, epsilon_neutral], axis=-1)
+        lambdas = (1 / (2 * PI * epsilons))[:, None, :] * np.log(distance_prim / distance)  # m/F
 
         # Extract the conductivity and the capacities from the lambda (potential coefficients)
         lambda_inv = nplin.inv(lambdas) * 1e3  # capacities (F/km)
-        c = -lambda_inv.copy()  # capacities (F/km)
-        np.fill_diagonal(c, np.einsum("ij,ij->i", lambda_inv, minus))
-        g = np.zeros((4, 4), dtype=np.float64)  # conductance (S/km)
+        c = -lambda_inv  # capacities (F/km)
+        c[:, diag, diag] = np.einsum("kij,ij->ki", lambda_inv, minus)
+        g = np.zeros_like(c)  # conductance (S/km)
         omega = OMEGA.m
-        insulators = np.array([insulator, insulator, insulator, insulator_neutral], dtype=np.object_)
-        tan_d = np.array([TAN_D[x].m for x in insulators], dtype=np.float64)
-        np.fill_diagonal(g, tan_d * np.einsum("ii->i", c) * omega)
+        insulators_ = np.array(
+            [[i, i, i, i_n] for i, i_n in zip(insulator, insulator_neutral, strict=True)], dtype=np.object_
+        )
+        tan_d_by_insulator = {i: TAN_D[i].m for i in set(insulator) | set(insulator_neutral)}
+        tan_d = np.array([[tan_d_by_insulator[x] for x in row] for row in insulators_], dtype=np.float64)
+        g[:, diag, diag] = tan_d * np.einsum("kii->ki", c) * omega
 
         # Build the impedance and admittance matrices
         z_line = r + inductance * omega * 1j
         y = g + c * omega * 1j
 
         # Compute the shunt admittance matrix from the admittance matrix
-        y_shunt = -(y.copy())
-        np.fill_diagonal(y_shunt, np.einsum("ij->i", y))
+        y_shunt = -y
+        y_shunt[:, diag, diag] = np.einsum("kij->ki", y)
 
-        return z_line, y_shunt, line_type, materials, insulators, sections_mm2
+        return z_line, y_shunt, line_types, materials_, insulators_, sections_mm2
+
+    @staticmethod
+    def _check_geometric_radius(
+        ids: Sequence[Id], line_types: Sequence[LineType], radius: FloatArray, external_diameters: FloatArray
+    ) -> None:
+        """Check that the conductors of the lines fit in their cables."""
+        phase_radius, neutral_radius = radius[:, 0], radius[:, 3]
+        line_types_ = np.array(line_types, dtype=np.object_)
+        is_twisted = line_types_ == LineType.TWISTED
+        is_underground = line_types_ == LineType.UNDERGROUND
+        max_radii = np.where(is_twisted, external_diameters / 4, external_diameters / 4 * np.sqrt(2))
+        too_big = phase_radius + neutral_radius > max_radii
+        if (idx := np.flatnonzero(is_twisted & too_big)).size:
+            msg = (
+                f"Conductors too big for 'twisted' line parameter of id {ids[idx[0]]!r}. Inequality "
+                f"`neutral_radius + phase_radius <= external_diameter / 4` is not satisfied."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
+        if (idx := np.flatnonzero(is_underground & too_big)).size:
+            msg = (
+                f"Conductors too big for 'underground' line parameter of id {ids[idx[0]]!r}. Inequality "
+                f"`neutral_radius + phase_radius <= external_diameter * sqrt(2) / 4` is not satisfied."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
+        if (idx := np.flatnonzero(is_underground & (phase_radius * 2 > max_radii))).size:
+            msg = (
+                f"Conductors too big for 'underground' line parameter of id {ids[idx[0]]!r}. Inequality "
+                f"`phase_radius*2 <= external_diameter * sqrt(2) / 4` is not satisfied."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
+        # TODO Overhead lines check
 
     @staticmethod
     def _get_geometric_configuration(
-        line_type: LineType,
-        insulator: Insulator,
-        insulator_neutral: Insulator,
-        height: float,
-        external_diameter: float,
-    ) -> tuple[FloatArray, FloatArray, float, float]:
+        line_types: Sequence[LineType],
+        insulators: Sequence[Insulator],
+        insulators_neutral: Sequence[Insulator],
+        heights: FloatArray,
+        external_diameters: FloatArray,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
         """A utility function to retrieve the geometric configurations of the lines for the `from_geometry` method.
 
         Args:
-            line_type:
-                Overhead, twisted overhead, or underground.
+            line_types:
+                Overhead, twisted overhead, or underground for each line.
 
-            insulator:
-                Type of insulator for the phases.
+            insulators:
+                Type of insulator for the phases of each line.
 
-            insulator_neutral:
-                Type of insulator for the neutral. If ``None`` it will be the same as the insulator of the other phases.
+            insulators_neutral:
+                Type of insulator for the neutral of each line.
 
-            height:
-                Height of the line (m). Positive for overhead lines and negative for underground
+            heights:
+                Height of each line (m). Positive for overhead lines and negative for underground
                 lines.
 
-            external_diameter:
-                External diameter of the wire (m).
+            external_diameters:
+                External diameter of the wire of each line (m).
 
         Returns:
             Four elements in a tuple:
-                * the coordinates of the centers of the conductors (4x2 array)
-                * the coordinates of the images of the centers of the conductors (4x2 array)
-                * the permittivity for the phase insulator (F/m).
-                * the permittivity for the neutral insulator (F/m).
+                * the coordinates of the centers of the conductors (Kx4x2 array)
+                * the coordinates of the images of the centers of the conductors (Kx4x2 array)
+                * the permittivity for the phase insulator (F/m) of each line.
+                * the permittivity for the neutral insulator (F/m) of each line.
         """
-        if line_type in (LineType.OVERHEAD, LineType.TWISTED):
+        line_types_ = np.array(line_types, dtype=np.object_)
+        is_underground = line_types_ == LineType.UNDERGROUND
+        for lt in (LineType.OVERHEAD, LineType.TWISTED):
             # TODO This configuration is for twisted lines... Create a overhead configuration.
-            if height <= 0:
-                msg = f"The height of '{line_type}' line must be a positive number."
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-            x = SQRT3 * external_diameter / 8
-            coord = np.array(
-                [
-                    [-x, height + external_diameter / 8],
-                    [x, height + external_diameter / 8],
-                    [0, height - external_diameter / 4],
-                    [0, height],
-                ]
-            )  # m
-            coord_prim = np.array(
-                [
-                    [-x, -height - external_diameter / 8],
-                    [x, -height - external_diameter / 8],
-                    [0, -height + external_diameter / 4],
-                    [0, -height],
-                ]
-            )  # m
-            epsilon = EPSILON_0.m
-            epsilon_neutral = EPSILON_0.m  # TODO assume no insulator. Maybe valid for overhead but not for twisted...
-        elif line_type == LineType.UNDERGROUND:
-            if height >= 0:
-                msg = f"The height of '{line_type}' line must be a negative number."
+            if ((line_types_ == lt) & (heights <= 0)).any():
+                msg = f"The height of '{lt}' line must be a positive number."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-            x = np.sqrt(2) * external_diameter / 8
-            coord = np.array([[-x, height - x], [x, height - x], [x, height + x], [-x, height + x]])  # m
-            xp = x * 3
-            coord_prim = np.array([[-xp, height - xp], [xp, height - xp], [xp, height + xp], [-xp, height + xp]])  # m
-            epsilon = (EPSILON_0 * EPSILON_R[insulator]).m
-            epsilon_neutral = (EPSILON_0 * EPSILON_R[insulator_neutral]).m
-        else:
-            raise NotImplementedError(line_type)  # unreachable
-
+        if (is_underground & (heights >= 0)).any():
+            msg = f"The height of '{LineType.UNDERGROUND}' line must be a negative number."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
+
+        h, d = heights[:, None], external_diameters[:, None]
+        zero = np.zeros_like(h)
+
+        # Overhead and twisted lines
+        x = SQRT3 * d / 8
+        coord_overhead = np.stack(
+            [
+                np.hstack([-x, h + d / 8]),
+                np.hstack([x, h + d / 8]),
+                np.hstack([zero, h - d / 4]),
+                np.hstack([zero, h]),
+            ],
+            axis=1,
+        )  # m
+        coord_prim_overhead = np.stack(
+            [
+                np.hstack([-x, -h - d / 8]),
+                np.hstack([x, -h - d / 8]),
+                np.hstack([zero, -h + d / 4]),
+                np.hstack([zero, -h]),
+            ],
+            axis=1,
+        )  # m
+
+        # Underground lines
+        x = np.sqrt(2) * d / 8
+        coord_underground = np.stack(
+            [np.hstack([-x, h - x]), np.hstack([x, h - x]), np.hstack([x, h + x]), np.hstack([-x, h + x])], axis=1
+        )  # m
+        xp = x * 3
+        coord_prim_underground = np.stack(
+            [np.hstack([-xp, h - xp]), np.hstack([xp, h - xp]), np.hstack([xp, h + xp]), np.hstack([-xp, h + xp])],
+            axis=1,
+        )  # m
+
+        mask = is_underground[:, None, None]
+        coord = np.where(mask, coord_underground, coord_overhead)
+        coord_prim = np.where(mask, coord_prim_underground, coord_prim_overhead)
+        # TODO assume no insulator for overhead lines. Maybe valid for overhead but not for twisted...
+        epsilon_by_insulator = {i: (EPSILON_0 * EPSILON_R[i]).m for i in {*insulators, *insulators_neutral}}
+        epsilon = np.array(
+            [epsilon_by_insulator[i] if u else EPSILON_0.m for u, i in zip(is_underground, insulators, strict=True)],
+            dtype=np.float64,
+        )
+        epsilon_neutral = np.array(
+            [
+                epsilon_by_insulator[i] if u else EPSILON_0.m
+                for u, i in zip(is_underground, insulators_neutral, strict=True)
+            ],
+            dtype=np.float64,
+        )
         return coord, coord_prim, epsilon, epsilon_neutral
 
     @classmethod
@@ -1788,3 +2153,25 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode[f"BAD_{name.upper()}_VALUE"])
 
             return values
+
+
+def _broadcast_many(value: Any, size: int, name: str) -> list[Any]:
+    """Broadcast an argument of the ``*_many`` constructors to a list of ``size`` values."""
+    if value is None or isinstance(value, str) or np.ndim(value) == 0:
+        return [value] * size
+    values = list(value)
+    if len(values) != size:
+        msg = f"Incorrect number of {name}: {len(values)} instead of {size}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_SIZE)
+    return values
+
+
+def _broadcast_many_floats(value: Any, size: int, name: str) -> FloatArray:
+    """Broadcast a float argument of the ``*_many`` constructors, missing values are NaN."""
+    return np.array([np.nan if pd.isna(v) else v for v in _broadcast_many(value, size, name)], dtype=np.float64)
+
+
+def _broadcast_many_complexes(value: Any, size: int, name: str) -> ComplexArray:
+    """Broadcast a complex argument of the ``*_many`` constructors, missing values are NaN."""
+    return np.array([np.nan if pd.isna(v) else v for v in _broadcast_many(value, size, name)], dtype=np.complex128)
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from typing import Final, Self, final
 
 import numpy as np
@@ -9,9 +10,19 @@ from roseau.load_flow.models.branches import AbstractBranch, AbstractBranchSide
 from roseau.load_flow.models.buses import Bus
 from roseau.load_flow.models.grounds import Ground
 from roseau.load_flow.models.line_parameters import LineParameters
-from roseau.load_flow.typing import BoolArray, ComplexArray, ComplexMatrix, FloatArray, Id, JsonDict, ResultState
+from roseau.load_flow.typing import (
+    BoolArray,
+    ComplexArray,
+    ComplexMatrix,
+    FloatArray,
+    FloatArrayLike1D,
+    Id,
+    JsonDict,
+    ResultState,
+)
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow.utils import warn_external
+from roseau.load_flow.utils.helpers import _check_line_arrays
 from roseau.load_flow_engine.cy_engine import CyShuntLine, CySimplifiedLine
 
 logger = logging.getLogger(__name__)
@@ -22,6 +33,16 @@ logger = logging.getLogger(__name__)
 class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
     """An electrical line PI model with series impedance and optional shunt admittance."""
 
+    __slots__ = (
+        "ground",
+        "_initialized",
+        "_n",
+        "_length",
+        "_parameters",
+        "_max_loading",
+        "_res_ground_potential",
+    )
+
     element_type: Final = "line"
     allowed_phases: Final = frozenset(Bus.allowed_phases | {"a", "b", "c", "n"})
     """The allowed phases for a line are:
@@ -84,15 +105,25 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
         """
         phases = self._check_phases_common(id, bus1=bus1, bus2=bus2, phases=phases)
         self._initialized = False
-        super().__init__(id=id, bus1=bus1, bus2=bus2, phases1=phases, phases2=phases, geometry=geometry)
-        self._side1 = LineSide(branch=self, side=1, bus=bus1, phases=phases, connect_neutral=None)
-        self._side2 = LineSide(branch=self, side=2, bus=bus2, phases=phases, connect_neutral=None)
-        self._n = self._side1._n + self._side2._n + (1 if parameters.with_shunt else 0)
-        self.ground = ground
+        self._init_sides(id, bus1, bus2, phases=phases, ground=ground, geometry=geometry)
         self.length = length
         self.parameters = parameters
         self.max_loading = max_loading
         self._initialized = True
+        self._init_model()
+
+    def _init_sides(
+        self, id: Id, bus1: Bus, bus2: Bus, *, phases: str, ground: Ground | None, geometry: BaseGeometry | None
+    ) -> None:
+        """Initialize the branch and its sides, the phases must have been checked."""
+        super().__init__(id=id, bus1=bus1, bus2=bus2, phases1=phases, phases2=phases, geometry=geometry)
+        self._side1 = LineSide(branch=self, side=1, bus=bus1, phases=phases, connect_neutral=None)
+        self._side2 = LineSide(branch=self, side=2, bus=bus2, phases=phases, connect_neutral=None)
+        self.ground = ground
+
+    def _init_model(self) -> None:
+        """Finish the initialization of the line once its length and parameters are set."""
+        self._n = self._side1._n + self._side2._n + (1 if self._parameters.with_shunt else 0)
         self._check_same_voltage_level()
 
         # Handle the ground
@@ -109,20 +140,8 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
             # Connect the ground
             self._connect(self.ground)
 
-        # Cache values used in results calculations
-        self._z_line = parameters._z_line * self._length
-        self._y_shunt = parameters._y_shunt * self._length
-        self._z_line_inv = np.linalg.inv(self._z_line)
-        self._yg = self._y_shunt.sum(axis=1)  # y_ig = Y_ia + Y_ib + Y_ic + Y_in for i in {a, b, c, n}
-
-        if parameters.with_shunt:
-            self._cy_element = CyShuntLine(n=self._side1._n, y_shunt=self._y_shunt.ravel(), z_line=self._z_line.ravel())
-        else:
-            self._cy_element = CySimplifiedLine(n=self._side1._n, z_line=self._z_line.ravel())
-        self._cy_connect()
-        self._connect(bus1, bus2)
-        if parameters.with_shunt:
-            ground._cy_element.connect(self._cy_element, [(0, self._n - 1)])
+        self._create_cy_element()
+        self._connect(self.bus1, self.bus2)
 
         # Results
         self._res_ground_potential: complex | None = None
@@ -136,24 +155,129 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
         s += ">"
         return s
 
+    @classmethod
+    @ureg_wraps(None, (None, None, None, None, None, "km", None, None, "", None))
+    def from_arrays(
+        cls,
+        ids: Sequence[Id],
+        buses1: Sequence[Bus],
+        buses2: Sequence[Bus],
+        *,
+        parameters: LineParameters,
+        lengths: FloatArrayLike1D,
+        phases: str | None = None,
+        ground: Ground | None = None,
+        max_loading: float | Q_[float] = 1,
+        geometries: Sequence[BaseGeometry | None] | None = None,
+    ) -> list[Self]:
+        """Create many lines sharing the same parameters.
+
+        All the arguments are checked before any line is created: the lengths and the maximum
+        loading are converted and checked at once and the parameters are checked once per number
+        of phases. The impedance matrices of the lines are derived from the matrices of the shared
+        parameters, whose inverse is computed only once.
+
+        Args:
+            ids:
+                The unique IDs of the lines.
+
+            buses1:
+                The first bus of each line.
+
+            buses2:
+                The second bus of each line.
+
+            parameters:
+                The parameters of the lines.
+
+            lengths:
+                The lengths of the lines (in km).
+
+            phases:
+                The phases of the lines, see :class:`Line`. By default, the phases common to the
+                buses of each line are used.
+
+            ground:
+                The ground element attached to the lines if they have shunt admittance.
+
+            max_loading:
+                The maximum loading of the lines (unitless).
+
+            geometries:
+                The geometries of the lines. By default, the lines have no geometry.
+
+        Returns:
+            The created lines, in the order of the IDs.
+        """
+        lengths_list, max_loading, geometries = _check_line_arrays(
+            ids, buses1, buses2, lengths=lengths, max_loading=max_loading, geometries=geometries
+        )
+        # Check the phases of all the lines and the parameters once per number of phases before
+        # creating any line
+        lines = [cls.__new__(cls) for _ in range(len(ids))]
+        lines_phases = [
+            line._check_phases_common(line_id, bus1=bus1, bus2=bus2, phases=phases)
+            for line, line_id, bus1, bus2 in zip(lines, ids, buses1, buses2, strict=True)
+        ]
+        checked_sizes: set[int] = set()
+        for line, line_id, line_phases in zip(lines, ids, lines_phases, strict=True):
+            if len(line_phases) not in checked_sizes:
+                line._check_parameters(parameters, id=line_id, n=len(line_phases), ground=ground)
+                checked_sizes.add(len(line_phases))
+
+        for line, line_id, bus1, bus2, line_phases, length, geometry in zip(
+            lines, ids, buses1, buses2, lines_phases, lengths_list, geometries, strict=True
+        ):
+            line._initialized = False
+            line._init_sides(line_id, bus1, bus2, phases=line_phases, ground=ground, geometry=geometry)
+            line._length = length
+            line._update_network_parameters(old_parameters=None, new_parameters=parameters)
+            line._parameters = parameters
+            line._max_loading = max_loading
+            line._initialized = True
+            line._init_model()
+        return lines
+
     @property
     def phases(self) -> str:
         """The phases of the line. This is an alias for :attr:`phases1` and :attr:`phases2`."""
         return self._side1.phases
 
+    # The matrices of the line are derived on demand from the per-km matrices of its parameters,
+    # which are shared by all the lines using them: inv(Z.L) = inv(Z)/L
+    @property
+    def _z_line(self) -> ComplexMatrix:
+        return self._parameters._z_line * self._length
+
+    @property
+    def _y_shunt(self) -> ComplexMatrix:
+        return self._parameters._y_shunt * self._length
+
+    @property
+    def _z_line_inv(self) -> ComplexMatrix:
+        return self._parameters._get_z_line_inv() / self._length
+
+    @property
+    def _yg(self) -> ComplexArray:
+        return self._parameters._yg * self._length  # y_ig = Y_ia + Y_ib + Y_ic + Y_in for i in {a, b, c, n}
+
     def _update_internal_parameters(self) -> None:
         """Update the internal parameters of the line."""
-        self._z_line = self._parameters._z_line * self._length
-        self._y_shunt = self._parameters._y_shunt * self._length
-        self._z_line_inv = np.linalg.inv(self._z_line)
-        self._yg = self._y_shunt.sum(axis=1)
-
         if self._cy_initialized:
             if self._parameters.with_shunt:
                 self._cy_element.update_line_parameters(y_shunt=self._y_shunt.ravel(), z_line=self._z_line.ravel())
             else:
                 self._cy_element.update_line_parameters(z_line=self._z_line.ravel())
 
+    def _create_cy_element(self) -> None:
+        if self._parameters.with_shunt:
+            self._cy_element = CyShuntLine(n=self._side1._n, y_shunt=self._y_shunt.ravel(), z_line=self._z_line.ravel())
+        else:
+            self._cy_element = CySimplifiedLine(n=self._side1._n, z_line=self._z_line.ravel())
+        self._cy_connect()
+        if self._parameters.with_shunt:
+            self.ground._cy_element.connect(self._cy_element, [(0, self._n - 1)])
+
     @property
     def length(self) -> Q_[float]:
         """The length of the line (in km)."""
@@ -167,6 +291,7 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE)
         self._invalidate_network_results()
+        self._invalidate_network_topology()
         self._length = float(value)
         if self._initialized:
             self._update_internal_parameters()
@@ -178,38 +303,42 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
 
     @parameters.setter
     def parameters(self, value: LineParameters) -> None:
-        self._check_compatible_phase_tech(value)
-        old_parameters = self._parameters if self._initialized else None
-        shape = (self._side1._n, self._side2._n)
-        if value._z_line.shape != shape:
-            msg = f"Incorrect z_line dimensions for line {self.id!r}: {value._z_line.shape} instead of {shape}"
-            logger.error(msg)
-            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Z_LINE_SHAPE)
-
         if value.with_shunt:
             if self._initialized and not self.with_shunt:
                 msg = "Cannot set line parameters with a shunt to a line that does not have shunt components."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
-            if value._y_shunt.shape != shape:
-                msg = f"Incorrect y_shunt dimensions for line {self.id!r}: {value._y_shunt.shape} instead of {shape}"
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Y_SHUNT_SHAPE)
-            if self.ground is None:
-                msg = f"The ground element must be provided for line {self.id!r} with shunt admittance."
-                logger.error(msg)
-                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_TYPE)
         else:
             if self._initialized and self.with_shunt:
                 msg = "Cannot set line parameters without a shunt to a line that has shunt components."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_MODEL)
+        self._check_parameters(value, id=self.id, n=self._side1._n, ground=self.ground)
+        old_parameters = self._parameters if self._initialized else None
         self._update_network_parameters(old_parameters=old_parameters, new_parameters=value)
         self._invalidate_network_results()
         self._parameters = value
         if self._initialized:
             self._update_internal_parameters()
 
+    def _check_parameters(self, value: LineParameters, *, id: Id, n: int, ground: Ground | None) -> None:
+        """Check that the parameters can be used by a line with ``n`` phases."""
+        self._check_compatible_phase_tech(value, id=id)
+        shape = (n, n)
+        if value._z_line.shape != shape:
+            msg = f"Incorrect z_line dimensions for line {id!r}: {value._z_line.shape} instead of {shape}"
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Z_LINE_SHAPE)
+        if value.with_shunt:
+            if value._y_shunt.shape != shape:
+                msg = f"Incorrect y_shunt dimensions for line {id!r}: {value._y_shunt.shape} instead of {shape}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Y_SHUNT_SHAPE)
+            if ground is None:
+                msg = f"The ground element must be provided for line {id!r} with shunt admittance."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINE_TYPE)
+
     @property
     def z_line(self) -> Q_[ComplexMatrix]:
         """Impedance of the line (in Ohm)."""
@@ -275,8 +404,19 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
     def _res_series_values_getter(self, warning: bool) -> tuple[ComplexArray, ComplexArray]:
         pot1 = self._side1._res_potentials_getter(warning)
         pot2 = self._side2._res_potentials_getter(warning=False)  # # warn only once
+        return self._res_memo(
+            "series_values",
+            lambda: self._compute_series_values(pot1, pot2, self._z_line_inv),
+            self._parameters,
+            self._length,
+        )
+
+    @staticmethod
+    def _compute_series_values(
+        pot1: ComplexArray, pot2: ComplexArray, z_line_inv: ComplexMatrix
+    ) -> tuple[ComplexArray, ComplexArray]:
         du_line = pot1 - pot2
-        i_line = self._z_line_inv @ du_line  # Zₗ x Iₗ = ΔU -> I = Zₗ⁻¹ x ΔU
+        i_line = z_line_inv @ du_line  # Zₗ x Iₗ = ΔU -> I = Zₗ⁻¹ x ΔU
         return du_line, i_line
 
     def _res_series_currents_getter(self, warning: bool) -> ComplexArray:
@@ -285,20 +425,26 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
 
     def _res_series_power_losses_getter(self, warning: bool) -> ComplexArray:
         du_line, i_line = self._res_series_values_getter(warning)
-        return du_line * i_line.conjugate()  # Sₗ = ΔU.Iₗ*
+        return self._res_memo("series_power_losses", lambda: du_line * i_line.conjugate(), i_line)  # Sₗ = ΔU.Iₗ*
 
     def _res_power_losses_getter(self, warning: bool) -> ComplexArray:
         series_losses = self._res_series_power_losses_getter(warning)
         shunt_losses1 = self._side1._res_shunt_losses_getter(warning=False)  # warn only once
         shunt_losses2 = self._side2._res_shunt_losses_getter(warning=False)  # warn only once
-        return series_losses + shunt_losses1 + shunt_losses2
+        return self._res_memo(
+            "power_losses",
+            lambda: series_losses + shunt_losses1 + shunt_losses2,
+            series_losses,
+            shunt_losses1,
+            shunt_losses2,
+        )
 
     def _res_loading_getter(self, warning: bool) -> FloatArray | None:
         if (amp := self._parameters._ampacities) is None:
             return None
         currents1 = self._side1._res_currents_getter(warning)
         currents2 = self._side2._res_currents_getter(warning=False)  # warn only once
-        return np.maximum(abs(currents1), abs(currents2)) / amp
+        return self._res_memo("loading", lambda: np.maximum(abs(currents1), abs(currents2)) / amp, amp)
 
     def _res_state_getter(self) -> ResultState:
         """Get the state of the line based on its loading."""
@@ -419,6 +565,8 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
 
 @final
 class LineSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "line"
     allowed_phases = Line.allowed_phases  # type: ignore
     _branch: Line
@@ -427,9 +575,13 @@ class LineSide(AbstractBranchSide):
         assert self._branch.with_shunt, "This method only works when there is a shunt"
         potentials = self._res_potentials_getter(warning)
         vg = self._branch._res_ground_potential_getter(warning=False)
-        ig = self._branch._yg * vg
-        shunt_currents = (self._branch._y_shunt @ potentials - ig) / 2
-        return potentials, shunt_currents
+        branch = self._branch
+        return self._res_memo(
+            "shunt_values",
+            lambda: (potentials, (branch._y_shunt @ potentials - branch._yg * vg) / 2),
+            branch._parameters,
+            branch._length,
+        )
 
     def _res_shunt_currents_getter(self, warning: bool) -> ComplexArray:
         if not self._branch.with_shunt:
@@ -440,7 +592,7 @@ class LineSide(AbstractBranchSide):
         if not self._branch.with_shunt:
             return np.zeros(self._n, dtype=np.complex128)
         potentials, currents = self._res_shunt_values_getter(warning)
-        return potentials * currents.conjugate()
+        return self._res_memo("shunt_losses", lambda: potentials * currents.conjugate(), currents)
 
     @property
     def res_shunt_currents(self) -> Q_[ComplexArray]:
@@ -12,6 +12,7 @@ from roseau.load_flow.models.connectables import AbstractDisconnectable
 from roseau.load_flow.models.flexible_parameters import FlexibleParameter
 from roseau.load_flow.typing import ComplexArray, ComplexScalarOrArrayLike1D, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.utils.mixins import _complex_values, _RawComplexArray
 from roseau.load_flow_engine.cy_engine import (
     CyAdmittanceLoad,
     CyCurrentLoad,
@@ -37,6 +38,8 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
         * delta-connected loads using a `phases` constructor argument not containing `"n"`
     """
 
+    __slots__ = ("_symbol", "_res_inner_currents", "_res_flexible_powers")
+
     element_type: Final = "load"
 
     @abstractmethod
@@ -86,7 +89,7 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
     def _res_inner_powers_getter(self, warning: bool) -> ComplexArray:
         currents = self._res_inner_currents_getter(warning=warning)
         voltages = self._res_voltages_getter(warning=False)  # warn only once
-        return voltages * currents.conjugate()
+        return self._res_memo("inner_powers", lambda: voltages * currents.conjugate())
 
     @property
     def res_inner_currents(self) -> Q_[ComplexArray]:
@@ -110,7 +113,7 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode[f"BAD_{self._symbol}_SIZE"])
         # A load cannot have any zero impedance
-        if self.type == "impedance" and np.isclose(values, 0).any():
+        if self.type == "impedance" and (np.abs(values) <= 1e-8).any():  # same as np.isclose(values, 0), faster
             msg = f"An impedance of the load {self.id!r} is null"
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Z_VALUE)
@@ -123,14 +126,10 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
         if include_results and "results" in data:
             super()._parse_results_from_dict(data, include_results=include_results)
             if "inner_currents" in data["results"]:
-                self._res_inner_currents = np.array(
-                    [complex(*i) for i in data["results"]["inner_currents"]], dtype=np.complex128
-                )
+                self._res_inner_currents = _RawComplexArray(data["results"]["inner_currents"])  # type: ignore
             if "flexible_powers" in data["results"]:
                 assert isinstance(self, PowerLoad), "Only PowerLoad can be flexible"
-                self._res_flexible_powers = np.array(
-                    [complex(*p) for p in data["results"]["flexible_powers"]], dtype=np.complex128
-                )
+                self._res_flexible_powers = _RawComplexArray(data["results"]["flexible_powers"])  # type: ignore
 
     @classmethod
     def _from_dict(cls, data: JsonDict, *, include_results: bool = True) -> "Load":
@@ -146,7 +145,7 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
             self = PowerLoad(
                 id=data["id"],
                 bus=data["bus"],
-                powers=[complex(*s) for s in data["powers"]],
+                powers=_complex_values(data["powers"]),
                 phases=data["phases"],
                 flexible_params=fp,
                 connect_neutral=data["connect_neutral"],
@@ -155,14 +154,14 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
             self = CurrentLoad(
                 id=data["id"],
                 bus=data["bus"],
-                currents=[complex(*i) for i in data["currents"]],
+                currents=_complex_values(data["currents"]),
                 phases=data["phases"],
             )
         elif load_type == "impedance":
             self = ImpedanceLoad(
                 id=data["id"],
                 bus=data["bus"],
-                impedances=[complex(*z) for z in data["impedances"]],
+                impedances=_complex_values(data["impedances"]),
                 phases=data["phases"],
                 connect_neutral=data["connect_neutral"],
             )
@@ -208,6 +207,8 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
 class PowerLoad(AbstractLoad["CyPowerLoad | CyDeltaPowerLoad | CyFlexibleLoad | CyDeltaFlexibleLoad"]):
     """A constant power load."""
 
+    __slots__ = ("_flexible_params", "_powers")
+
     type: Final = "power"
 
     def __init__(
@@ -285,8 +286,11 @@ class PowerLoad(AbstractLoad["CyPowerLoad | CyDeltaPowerLoad | CyFlexibleLoad |
         self.powers = powers
         self._res_flexible_powers: ComplexArray | None = None
 
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         if self.is_flexible:
-            cy_parameters = np.array([p._cy_fp for p in flexible_params])  # type: ignore
+            cy_parameters = np.array([p._cy_fp for p in self._flexible_params])  # type: ignore
             if self.phases == "abc":
                 self._cy_element = CyDeltaFlexibleLoad(n=self._n, powers=self._powers, parameters=cy_parameters)
             else:
@@ -385,6 +389,8 @@ class PowerLoad(AbstractLoad["CyPowerLoad | CyDeltaPowerLoad | CyFlexibleLoad |
 class CurrentLoad(AbstractLoad["CyCurrentLoad | CyDeltaCurrentLoad"]):
     """A constant current load."""
 
+    __slots__ = ("_currents",)
+
     type: Final = "current"
 
     def __init__(self, id: Id, bus: Bus, *, currents: ComplexScalarOrArrayLike1D, phases: str | None = None) -> None:
@@ -432,6 +438,9 @@ class CurrentLoad(AbstractLoad["CyCurrentLoad | CyDeltaCurrentLoad"]):
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PHASE)
 
         self.currents = currents  # handles size checks and unit conversion
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         if self.phases == "abc":
             self._cy_element = CyDeltaCurrentLoad(n=self._n, currents=self._currents)
         else:
@@ -460,6 +469,8 @@ class CurrentLoad(AbstractLoad["CyCurrentLoad | CyDeltaCurrentLoad"]):
 class ImpedanceLoad(AbstractLoad["CyAdmittanceLoad | CyDeltaAdmittanceLoad"]):
     """A constant impedance load."""
 
+    __slots__ = ("_impedances",)
+
     type: Final = "impedance"
 
     def __init__(
@@ -505,6 +516,9 @@ class ImpedanceLoad(AbstractLoad["CyAdmittanceLoad | CyDeltaAdmittanceLoad"]):
         """
         super().__init__(id=id, phases=phases, bus=bus, connect_neutral=connect_neutral)
         self.impedances = impedances
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         if self.phases == "abc":
             self._cy_element = CyDeltaAdmittanceLoad(n=self._n, admittances=1.0 / self._impedances)
         else:
@@ -27,6 +27,8 @@ class PotentialRef(Element["CyPotentialRef | CyDeltaPotentialRef"]):
     bus, the sum of the potentials of the specified phases is set to 0V.
     """
 
+    __slots__ = ("_original_phases", "_phases", "element", "_res_current")
+
     element_type: Final = "potential ref"
     allowed_phases: Final = frozenset({"a", "b", "c", "n"} | Bus.allowed_phases)
 
@@ -82,20 +84,7 @@ class PotentialRef(Element["CyPotentialRef | CyDeltaPotentialRef"]):
         self.element = element
         self._connect(element)
         self._res_current: complex | None = None
-        if isinstance(element, Bus):
-            assert phases is not None, "Phases should be set for a bus"
-            n = len(phases)
-            if n == 1:
-                self._cy_element = CyPotentialRef()
-                p = element.phases.index(phases)
-                element._cy_element.connect(self._cy_element, [(p, 0)])
-            else:
-                self._cy_element = CyDeltaPotentialRef(n)
-                indices = (element.phases.index(p) for p in phases)
-                element._cy_element.connect(self._cy_element, [(p, i) for i, p in enumerate(indices)])
-        else:
-            self._cy_element = CyPotentialRef()
-            element._cy_element.connect(self._cy_element, [(0, 0)])
+        self._create_cy_element()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id!r}, element={self.element!r}, phases={self.phases!r})"
@@ -108,6 +97,22 @@ class PotentialRef(Element["CyPotentialRef | CyDeltaPotentialRef"]):
         """
         return self._phases
 
+    def _create_cy_element(self) -> None:
+        if isinstance(self.element, Bus):
+            assert self._phases is not None, "Phases should be set for a bus"
+            n = len(self._phases)
+            if n == 1:
+                self._cy_element = CyPotentialRef()
+                p = self.element.phases.index(self._phases)
+                self.element._cy_element.connect(self._cy_element, [(p, 0)])
+            else:
+                self._cy_element = CyDeltaPotentialRef(n)
+                indices = (self.element.phases.index(p) for p in self._phases)
+                self.element._cy_element.connect(self._cy_element, [(p, i) for i, p in enumerate(indices)])
+        else:
+            self._cy_element = CyPotentialRef()
+            self.element._cy_element.connect(self._cy_element, [(0, 0)])
+
     #
     # Results
     #
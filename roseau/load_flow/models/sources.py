@@ -9,6 +9,7 @@ from roseau.load_flow.models.connectables import AbstractDisconnectable
 from roseau.load_flow.sym import PositiveSequence
 from roseau.load_flow.typing import ComplexArray, ComplexScalarOrArrayLike1D, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.utils.mixins import _complex_values
 from roseau.load_flow_engine.cy_engine import CyDeltaVoltageSource, CyVoltageSource
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,8 @@ class VoltageSource(AbstractDisconnectable["CyVoltageSource | CyDeltaVoltageSour
         The :ref:`Voltage source documentation page <models-voltage-source-usage>` for example usage.
     """
 
+    __slots__ = ("_voltages",)
+
     element_type: Final = "source"
     type: Final = "voltage"
 
@@ -78,6 +81,9 @@ class VoltageSource(AbstractDisconnectable["CyVoltageSource | CyDeltaVoltageSour
         """
         super().__init__(id, bus, phases=phases, connect_neutral=connect_neutral)
         self.voltages = voltages
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         if self.phases == "abc":
             self._cy_element = CyDeltaVoltageSource(n=self._n, voltages=self._voltages)
         else:
@@ -132,7 +138,7 @@ class VoltageSource(AbstractDisconnectable["CyVoltageSource | CyDeltaVoltageSour
         self = cls(
             id=data["id"],
             bus=data["bus"],
-            voltages=[complex(*v) for v in data["voltages"]],
+            voltages=_complex_values(data["voltages"]),
             phases=data["phases"],
             connect_neutral=data["connect_neutral"],
         )
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
     """A general purpose switch branch."""
 
+    __slots__ = ("_closed",)
+
     element_type: Final = "switch"
     allowed_phases: Final = frozenset(Bus.allowed_phases | {"a", "b", "c", "n"})
     """The allowed phases for a switch are:
@@ -75,8 +77,7 @@ class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
         if closed:
             self._check_loop(operation="connecting")
         self._check_same_voltage_level()
-        self._cy_element = CySwitch(self._side1._n) if closed else CyOpenSwitch(self._side1._n)
-        self._cy_connect()
+        self._create_cy_element()
         self._connect(bus1, bus2)
 
     def __repr__(self) -> str:
@@ -96,6 +97,9 @@ class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
 
     def _check_loop(self, operation: Literal["connecting", "closing"]) -> None:
         """Check that there are no switch loop, raise an exception if it is the case."""
+        if not self._buses_connected_by_switches():
+            return
+        # Error path: find all the switches of the loop for the message
         visited_1: set[Element] = set()
         elements: list[Element] = [self.bus1]
         while elements:
@@ -139,6 +143,33 @@ class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.SWITCHES_LOOP)
 
+    def _buses_connected_by_switches(self) -> bool:
+        """Whether the buses of the switch are connected by other closed switches.
+
+        The components of the two buses are explored in turn and the search stops as soon as one of
+        them is exhausted: connecting a long chain of switches one by one is not quadratic.
+        """
+        if self.bus1 is self.bus2:
+            return True
+        visited: tuple[set[Element], set[Element]] = ({self.bus1}, {self.bus2})
+        to_visit: tuple[list[Element], list[Element]] = ([self.bus1], [self.bus2])
+        while True:
+            for side in (0, 1):
+                if not to_visit[side]:
+                    return False
+                element = to_visit[side].pop()
+                for e in element._connected_elements:
+                    if (
+                        e is self
+                        or e in visited[side]
+                        or not ((isinstance(e, Switch) and e.closed) or isinstance(e, Bus))
+                    ):
+                        continue
+                    if e in visited[1 - side]:
+                        return True
+                    visited[side].add(e)
+                    to_visit[side].append(e)
+
     def _check_elements(self) -> None:
         """Check that we can connect both elements."""
         if any(isinstance(e, VoltageSource) for e in self.bus1._connected_elements) and any(
@@ -160,24 +191,28 @@ class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
         """Open the switch."""
         if self.closed:
             self._invalidate_network_results()
+            self._invalidate_network_topology()
             if self._network is not None:
                 self._network._valid = False
             self._cy_element.disconnect()
-            self._cy_element = CyOpenSwitch(self._side1._n)
-            self._cy_connect()
-        self._closed = False
+            self._closed = False
+            self._create_cy_element()
 
     def close(self) -> None:
         """Close the switch."""
         if not self.closed:
             self._check_loop(operation="closing")
             self._invalidate_network_results()
+            self._invalidate_network_topology()
             if self._network is not None:
                 self._network._valid = False
             self._cy_element.disconnect()
-            self._cy_element = CySwitch(self._side1._n)
-            self._cy_connect()
-        self._closed = True
+            self._closed = True
+            self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
+        self._cy_element = CySwitch(self._side1._n) if self._closed else CyOpenSwitch(self._side1._n)
+        self._cy_connect()
 
     #
     # Json Mixin interface
@@ -190,6 +225,8 @@ class Switch(AbstractBranch["SwitchSide", "CySwitch | CyOpenSwitch"]):
 
 @final
 class SwitchSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "switch"
     allowed_phases = Switch.allowed_phases  # type: ignore
     _branch: Switch
@@ -1,10 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
-from functools import cached_property
 from typing import Final, Literal
 
-import numpy as np
-
 from roseau.load_flow.converters import _PHASE_SIZES, _calculate_voltages, calculate_voltage_phases
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.models.core import Element, _CyE_co
@@ -12,6 +9,7 @@ from roseau.load_flow.sym import phasor_to_sym
 from roseau.load_flow.typing import ComplexArray, Id, JsonDict, Side
 from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import SIDE_DESC, SIDE_INDEX, SIDE_SUFFIX
+from roseau.load_flow.utils.mixins import _RawComplexArray
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +17,17 @@ logger = logging.getLogger(__name__)
 class AbstractTerminal(Element[_CyE_co], ABC):
     """A base class for all the terminals (buses, load, sources, etc.) of the network."""
 
+    __slots__ = (
+        "_phases",
+        "_n",
+        "_size",
+        "_side_value",
+        "_side_index",
+        "_side_suffix",
+        "_side_desc",
+        "_res_potentials",
+    )
+
     allowed_phases: Final = frozenset({"ab", "bc", "ca", "an", "bn", "cn", "abn", "bcn", "can", "abc", "abcn"})
     """The allowed phases for a terminal element are:
 
@@ -61,12 +70,12 @@ class AbstractTerminal(Element[_CyE_co], ABC):
         """The phases of the element."""
         return self._phases
 
-    @cached_property
+    @property
     def voltage_phases(self) -> list[str]:
         """The phases of the voltages of the element."""
         return calculate_voltage_phases(self._phases)
 
-    @cached_property
+    @property
     def voltage_phases_pp(self) -> list[str]:
         """The phases of the phase-to-phase voltages of the element."""
         phases = self._phases.removesuffix("n")
@@ -76,7 +85,7 @@ class AbstractTerminal(Element[_CyE_co], ABC):
             raise RoseauLoadFlowException(msg, code=RoseauLoadFlowExceptionCode.BAD_PHASE)
         return calculate_voltage_phases(phases)
 
-    @cached_property
+    @property
     def voltage_phases_pn(self) -> list[str]:
         """The phases of the phase-to-neutral voltages of the element."""
         if "n" not in self._phases:
@@ -95,18 +104,18 @@ class AbstractTerminal(Element[_CyE_co], ABC):
 
     def _res_voltages_getter(self, warning: bool) -> ComplexArray:
         potentials = self._res_potentials_getter(warning=warning)
-        return _calculate_voltages(potentials, self.phases)
+        return self._res_memo("voltages", lambda: _calculate_voltages(potentials, self._phases))
 
     def _res_voltages_pp_getter(self, warning: bool) -> ComplexArray:
         _ = self.voltage_phases_pp  # raises if not enough phases
-        phases = self.phases.removesuffix("n")
+        phases = self._phases.removesuffix("n")
         potentials = self._res_potentials_getter(warning=warning)
-        return _calculate_voltages(potentials[: len(phases)], phases)
+        return self._res_memo("voltages_pp", lambda: _calculate_voltages(potentials[: len(phases)], phases))
 
     def _res_voltages_pn_getter(self, warning: bool) -> ComplexArray:
         _ = self.voltage_phases_pn  # raises if no neutral
         potentials = self._res_potentials_getter(warning=warning)
-        return _calculate_voltages(potentials, self.phases)
+        return self._res_memo("voltages_pn", lambda: _calculate_voltages(potentials, self._phases))
 
     @property
     def res_potentials(self) -> Q_[ComplexArray]:
@@ -225,9 +234,7 @@ class AbstractTerminal(Element[_CyE_co], ABC):
     #
     def _parse_results_from_dict(self, data: JsonDict, include_results: bool) -> None:
         if include_results and "results" in data:
-            self._res_potentials = np.array(
-                [complex(*v) for v in data["results"][f"potentials{self._side_suffix}"]], dtype=np.complex128
-            )
+            self._res_potentials = _RawComplexArray(data["results"][f"potentials{self._side_suffix}"])  # type: ignore
             self._fetch_results = False
             self._no_results = False
 
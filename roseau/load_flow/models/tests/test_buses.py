@@ -288,6 +288,46 @@ def test_res_violated():
     assert (bus.res_violated == [True, False, True]).all()
 
 
+def test_res_memoization():
+    bus = Bus(id="bus", phases="abc", nominal_voltage=400, min_voltage_level=0.9)
+    load = PowerLoad(id="load", bus=bus, powers=[100, 100, 100])
+    VoltageSource(id="source", bus=bus, voltages=400)
+    PotentialRef(id="pref", element=bus)
+    en = ElectricalNetwork.from_element(bus)
+    en._results_valid = True
+    bus._res_potentials = (230 + 0j) * PositiveSequence
+    load._res_potentials = bus._res_potentials
+    load._res_currents = np.array([1, 1, 1], dtype=np.complex128)
+
+    # The derived results are computed once per load flow run
+    voltages = bus._res_voltages_getter(warning=True)
+    assert bus._res_voltages_getter(warning=True) is voltages
+    assert not voltages.flags.writeable
+    voltage_levels = bus._res_voltage_levels_getter(warning=True)
+    assert bus._res_voltage_levels_getter(warning=True) is voltage_levels
+    violated = bus.res_violated
+    assert bus.res_violated is violated
+    powers = load._res_powers_getter(warning=True)
+    assert load._res_powers_getter(warning=True) is powers
+
+    # They are recomputed when the inputs they depend on change
+    bus.nominal_voltage = 230 * np.sqrt(3)
+    new_voltage_levels = bus._res_voltage_levels_getter(warning=True)
+    assert new_voltage_levels is not voltage_levels
+    np.testing.assert_allclose(new_voltage_levels, 1.0)
+    bus.min_voltage_level = 1.1
+    assert bus.res_violated is not violated
+    assert bus.res_violated.all()
+    assert bus._res_voltages_getter(warning=True) is voltages  # the voltages do not depend on these inputs
+
+    # And when new results are available
+    bus._res_potentials = (240 + 0j) * PositiveSequence
+    en._results_generation += 1  # done by `solve_load_flow`
+    new_voltages = bus._res_voltages_getter(warning=True)
+    assert new_voltages is not voltages
+    np.testing.assert_allclose(abs(new_voltages), 240 * np.sqrt(3))
+
+
 def test_res_state():
     bus = Bus(id="bus", phases="abc")
     bus._res_potentials = 230 * PositiveSequence
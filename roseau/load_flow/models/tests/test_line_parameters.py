@@ -1,4 +1,5 @@
 import re
+import warnings
 
 import numpy as np
 import numpy.linalg as nplin
@@ -421,6 +422,80 @@ def test_from_geometry_checks():
     assert lp.sections.m.tolist() == [150, 150, 150, 150]
 
 
+def test_from_geometry_many():
+    kwargs = [
+        {"line_type": "O", "material": "AL", "section": 150, "height": 10, "external_diameter": 0.04},
+        {"line_type": "T", "section": 70, "section_neutral": 50, "height": 10, "external_diameter": 0.04},
+        {
+            "line_type": "U",
+            "material": "CU",
+            "material_neutral": "AL",
+            "insulator": "XLPE",
+            "insulator_neutral": "PVC",
+            "section": 240,
+            "section_neutral": 95,
+            "height": -1.5,
+            "external_diameter": 0.1,
+            "ampacity": 450,
+            "ampacity_neutral": 300,
+        },
+    ]
+    lps = LineParameters.from_geometry_many(
+        ["lp1", "lp2", "lp3"],
+        line_types=["O", "T", "U"],
+        materials=["AL", None, "CU"],
+        materials_neutral=[None, None, "AL"],
+        insulators=[None, None, "XLPE"],
+        insulators_neutral=[None, None, "PVC"],
+        sections=Q_([150, 70, 240], "mm²"),
+        sections_neutral=[None, 50, 95],
+        heights=[10, 10, -1.5],
+        external_diameters=[0.04, 0.04, 0.1],
+        ampacities=[None, None, 450],
+        ampacities_neutral=[None, None, 300],
+    )
+    assert [lp.id for lp in lps] == ["lp1", "lp2", "lp3"]
+    for lp, kw in zip(lps, kwargs, strict=True):
+        expected = LineParameters.from_geometry(lp.id, **kw)
+        npt.assert_array_equal(lp._z_line, expected._z_line)
+        npt.assert_array_equal(lp._y_shunt, expected._y_shunt)
+        assert lp.to_dict() == expected.to_dict()
+
+    # Scalar values are broadcast
+    lps = LineParameters.from_geometry_many(
+        ["lp1", "lp2"], line_types="U", sections=[150, 240], heights=-1.5, external_diameters=0.1, ampacities=300
+    )
+    expected = LineParameters.from_geometry(
+        "lp2", line_type="U", section=240, height=-1.5, external_diameter=0.1, ampacity=300
+    )
+    assert lps[1].to_dict() == expected.to_dict()
+    assert lps[0].ampacities.m.tolist() == [300, 300, 300, 300]
+    assert LineParameters.from_geometry_many([], line_types="U", sections=150, heights=-1, external_diameters=1) == []
+
+    # Errors
+    with pytest.raises(RoseauLoadFlowException) as e:
+        LineParameters.from_geometry_many(
+            ["lp1", "lp2"], line_types="U", sections=[150, 240, 95], heights=-1.5, external_diameters=0.1
+        )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_SIZE
+    assert e.value.msg == "Incorrect number of sections: 3 instead of 2."
+    with pytest.raises(RoseauLoadFlowException) as e:
+        LineParameters.from_geometry_many(
+            ["lp1", "lp2"], line_types=["U", "O"], sections=150, heights=[-1.5, -1.5], external_diameters=0.1
+        )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINE_MODEL
+    assert e.value.msg == "The height of 'overhead' line must be a positive number."
+    with pytest.raises(RoseauLoadFlowException) as e:
+        LineParameters.from_geometry_many(
+            ["lp1", "lp2"], line_types="U", sections=150, heights=-1.5, external_diameters=[0.1, 0.02]
+        )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINE_MODEL
+    assert e.value.msg == (
+        "Conductors too big for 'underground' line parameter of id 'lp2'. Inequality "
+        "`neutral_radius + phase_radius <= external_diameter * sqrt(2) / 4` is not satisfied."
+    )
+
+
 def test_sym():
     # With the bad model of PwF
     # line_data = {"id": "NKBA NOR  25.00 kV", "un": 25000.0, "in": 277.0000100135803}
@@ -533,6 +608,56 @@ def test_sym():
     npt.assert_allclose(sym["y1"], y1)
 
 
+def test_from_sym_many():
+    z0 = [0.188 + 0.8224j, 0.5 + 1.5j, 0.3 + 0.9j]
+    z1 = [0.188 + 0.0812j, 0.2 + 0.1j, 0.3 + 0.9j]  # the last model is degraded
+    y0 = [0.000010462 * 1j, 0.00001j, 0.00002j]
+    y1 = [0.000063134 * 1j, 0.00005j, 0.00002j]
+    zn = [0.4029 + 0.3522j, None, 0.1 + 0.2j]
+    xpn = [0.2471, None, 0.1]
+    bn = [0.000010462, None, 0.00001]
+    bpn = [-0.000000298, None, -0.000001]
+    with pytest.warns(UserWarning, match=r"off-diagonal elements with a non-zero real part"):
+        lps = LineParameters.from_sym_many(
+            ["lp1", "lp2", "lp3"], z0, z1, y0, y1, zn=zn, xpn=xpn, bn=bn, bpn=bpn, ampacities=[100, None, 200]
+        )
+    assert [lp.id for lp in lps] == ["lp1", "lp2", "lp3"]
+    assert [lp._z_line.shape for lp in lps] == [(4, 4), (3, 3), (4, 4)]
+    for i, lp in enumerate(lps):
+        with warnings.catch_warnings(action="ignore", category=UserWarning):
+            expected = LineParameters.from_sym(
+                lp.id,
+                z0[i],
+                z1[i],
+                y0[i],
+                y1[i],
+                zn=zn[i],
+                xpn=xpn[i],
+                bn=bn[i],
+                bpn=bpn[i],
+                ampacities=[100, None, 200][i],
+            )
+        npt.assert_allclose(lp._z_line, expected._z_line, rtol=1e-15)
+        npt.assert_allclose(lp._y_shunt, expected._y_shunt, rtol=1e-15)
+        assert lp.with_shunt == expected.with_shunt
+        npt.assert_array_equal(lp.ampacities, expected.ampacities)
+
+    # No neutral elements
+    with pytest.warns(UserWarning, match=r"The line model 'lp2' does not have neutral elements"):
+        lps = LineParameters.from_sym_many(
+            ["lp1", "lp2"], z0=0.5 + 1.5j, z1=0.2 + 0.1j, y0=0.00001j, y1=0.00005j, zn=[0.1, 0], xpn=0, bn=0, bpn=0
+        )
+    assert [lp._z_line.shape for lp in lps] == [(4, 4), (3, 3)]
+
+    # Invalid impedance matrix
+    with pytest.raises(RoseauLoadFlowException) as e:
+        LineParameters.from_sym_many(["lp1", "lp2"], z0=0.5 + 1.5j, z1=[0.2 + 0.1j, 0], y0=0, y1=0)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_Z_LINE_VALUE
+    assert (
+        e.value.msg == "The symmetric model data provided for line type 'lp2' produces invalid line impedance matrix."
+    )
+
+
 def test_from_coiffier_model():
     # Invalid names
     with pytest.raises(RoseauLoadFlowException) as e:
@@ -125,6 +125,100 @@ def test_line_ground():
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINE_TYPE
 
 
+def test_line_matrices():
+    bus1 = Bus(id="bus1", phases="abcn")
+    bus2 = Bus(id="bus2", phases="abcn")
+    bus3 = Bus(id="bus3", phases="abcn")
+    z_line = (0.1 + 0.05j) * np.eye(4, dtype=complex) + 0.01j
+    y_shunt = 1e-5j * np.eye(4, dtype=complex)
+    lp = LineParameters(id="lp", z_line=z_line, y_shunt=y_shunt)
+    ground = Ground(id="ground")
+    line1 = Line(id="line1", bus1=bus1, bus2=bus2, parameters=lp, length=2.0, ground=ground)
+    line2 = Line(id="line2", bus1=bus2, bus2=bus3, parameters=lp, length=0.5, ground=ground)
+
+    # The matrices of the lines are derived from the matrices of the parameters
+    np.testing.assert_allclose(line1._z_line, 2.0 * z_line)
+    np.testing.assert_allclose(line1._y_shunt, 2.0 * y_shunt)
+    np.testing.assert_allclose(line1._yg, 2.0 * y_shunt.sum(axis=1))
+    np.testing.assert_allclose(line1._z_line_inv, np.linalg.inv(line1._z_line))
+    np.testing.assert_allclose(line2._z_line_inv, np.linalg.inv(line2._z_line))
+
+    # The inverse of the impedance matrix is computed once for all the lines
+    assert lp._z_line_inv is not None
+    z_line_inv = lp._z_line_inv
+    line1.length = 3.0
+    np.testing.assert_allclose(line1._z_line_inv, np.linalg.inv(3.0 * z_line))
+    assert lp._z_line_inv is z_line_inv
+
+    # Changing the parameters of a line changes its matrices
+    lp2 = LineParameters(id="lp2", z_line=2 * z_line, y_shunt=y_shunt)
+    line1.parameters = lp2
+    np.testing.assert_allclose(line1._z_line, 6.0 * z_line)
+    np.testing.assert_allclose(line1._z_line_inv, np.linalg.inv(6.0 * z_line))
+
+
+def test_from_arrays():
+    buses = [Bus(id=f"bus{i}", phases="abcn") for i in range(4)]
+    lp = LineParameters(id="lp", z_line=np.eye(4, dtype=complex))
+    lines = Line.from_arrays(
+        ["line1", "line2", "line3"], buses[:-1], buses[1:], parameters=lp, lengths=Q_([100, 200, 50], "m")
+    )
+    assert [line.id for line in lines] == ["line1", "line2", "line3"]
+    assert [line.bus2.id for line in lines] == ["bus1", "bus2", "bus3"]
+    assert [line._length for line in lines] == pytest.approx([0.1, 0.2, 0.05])
+    assert all(line.parameters is lp for line in lines)
+    assert all(line.phases == "abcn" and line.geometry is None for line in lines)
+
+    # Phases and ground
+    lp_shunt = LineParameters(id="lp_shunt", z_line=np.eye(3, dtype=complex), y_shunt=1e-5 * np.eye(3, dtype=complex))
+    ground = Ground(id="ground")
+    lines = Line.from_arrays(
+        ["line4", "line5"], buses[:2], buses[2:], parameters=lp_shunt, lengths=[1, 2], phases="abc", ground=ground
+    )
+    assert all(line.phases == "abc" and line.ground is ground for line in lines)
+
+    # Bad lengths
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], buses[:2], buses[2:], parameters=lp, lengths=[1, -2])
+    assert e.value.msg == "A line length must be greater than 0. -2.00 km provided."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], buses[:2], buses[2:], parameters=lp, lengths=[1, 2, 3])
+    assert e.value.msg == "Expected 2 line lengths, got an array of shape (3,)."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINES_SIZE
+    with pytest.raises(DimensionalityError):
+        Line.from_arrays(["line6"], buses[:1], buses[1:2], parameters=lp, lengths=Q_([1], "A"))
+
+    # Bad maximum loading
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], buses[:2], buses[2:], parameters=lp, lengths=[1, 2], max_loading=0)
+    assert e.value.msg == "Maximum loading must be positive: 0 was provided."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_MAX_LOADING_VALUE
+
+    # Mismatching buses and geometries
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], buses[:1], buses[2:], parameters=lp, lengths=[1, 2])
+    assert e.value.msg == "Expected 2 first buses for 2 lines, got 1."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINES_SIZE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], buses[:2], buses[2:], parameters=lp, lengths=[1, 2], geometries=[None])
+    assert e.value.msg == "Expected 2 geometries for 2 lines, got 1."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINES_SIZE
+
+    # Bad parameters for the phases of the last line
+    bus_an = Bus(id="bus_an", phases="an")
+    lp_an = LineParameters(id="lp_an", z_line=np.eye(2, dtype=complex))
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line6", "line7"], [buses[0], buses[1]], [buses[2], bus_an], parameters=lp_an, lengths=[1, 2])
+    assert e.value.msg == "Incorrect z_line dimensions for line 'line6': (2, 2) instead of (4, 4)"
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_Z_LINE_SHAPE
+
+    # No line was created by the failed calls
+    assert not bus_an._connected_elements
+    assert not lp_an._elements
+    assert {e.id for b in buses for e in b._connected_elements} == {f"line{i}" for i in range(1, 6)}
+
+
 def test_max_loading():
     bus1 = Bus(id="bus1", phases="abc")
     bus2 = Bus(id="bus2", phases="abc")
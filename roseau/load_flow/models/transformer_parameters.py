@@ -2,6 +2,7 @@ import cmath
 import logging
 import math
 import re
+import weakref
 from functools import lru_cache
 from importlib import resources
 from pathlib import Path
@@ -203,7 +204,8 @@ class TransformerParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame
         self._wlv: str = wlv
         self._clock: int = clock
 
-        self._elements = set()  # Set of elements using this transformer parameters object
+        # Set of elements using this transformer parameters object, they may belong to several networks
+        self._elements: weakref.WeakSet = weakref.WeakSet()
 
         # Filled using alternative constructor `from_open_and_short_circuit_tests`
         self._p0: float | None = None
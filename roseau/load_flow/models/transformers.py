@@ -1,5 +1,4 @@
 import logging
-from functools import cached_property
 from typing import Final, final
 
 from shapely.geometry.base import BaseGeometry
@@ -24,6 +23,8 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
     The model parameters are defined using the ``parameters`` argument.
     """
 
+    __slots__ = ("_initialized", "_tap", "_parameters", "_max_loading")
+
     element_type: Final = "transformer"
     allowed_phases: Final = Bus.allowed_phases
     """The allowed phases for a transformer are:
@@ -136,11 +137,7 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
         self.max_loading = max_loading
         self._initialized = True
 
-        if parameters.type == "three-phase":
-            self._cy_element = parameters._create_cy_transformer(tap=tap)
-        else:
-            self._cy_element = parameters._create_cy_transformer(tap=parameters.orientation * tap)
-        self._cy_connect()
+        self._create_cy_element()
         self._connect(bus_hv, bus_lv)
 
     def __repr__(self) -> str:
@@ -176,12 +173,12 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
         """The phases of the low voltage side of the transformer."""
         return self._side2.phases
 
-    @cached_property
+    @property
     def has_floating_neutral_hv(self) -> bool:
         """Does this transformer have a floating neutral on the HV side?"""
         return self._side1.has_floating_neutral
 
-    @cached_property
+    @property
     def has_floating_neutral_lv(self) -> bool:
         """Does this transformer have a floating neutral on the LV side?"""
         return self._side2.has_floating_neutral
@@ -197,6 +194,10 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
             logger.warning(f"The provided tap {value:.2f} is higher than 1.1. A good value is between 0.9 and 1.1.")
         if value < 0.9:
             logger.warning(f"The provided tap {value:.2f} is lower than 0.9. A good value is between 0.9 and 1.1.")
+        self._set_tap(value)
+
+    def _set_tap(self, value: float) -> None:
+        """Set the tap without checking it (used by the tap changers)."""
         self._tap = value
         self._invalidate_network_results()
         if self._cy_initialized:
@@ -256,6 +257,13 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
             k *= parameters.orientation
         self._cy_element.update_transformer_parameters(z2, ym, k * tap)
 
+    def _create_cy_element(self) -> None:
+        if self._parameters.type == "three-phase":
+            self._cy_element = self._parameters._create_cy_transformer(tap=self._tap)
+        else:
+            self._cy_element = self._parameters._create_cy_transformer(tap=self._parameters.orientation * self._tap)
+        self._cy_connect()
+
     def _compute_phases_three(
         self,
         id: Id,
@@ -389,7 +397,8 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
     def _res_loading_getter(self, warning: bool) -> float:
         powers_hv = self._side1._res_powers_getter(warning)
         powers_lv = self._side2._res_powers_getter(warning=False)  # warn only once
-        return max(abs(powers_hv.sum()), abs(powers_lv.sum())) / self._parameters._sn
+        sn = self._parameters._sn
+        return self._res_memo("loading", lambda: max(abs(powers_hv.sum()), abs(powers_lv.sum())) / sn, sn)
 
     def _res_state_getter(self) -> ResultState:
         """Get the state of the transformer based on its loading."""
@@ -447,6 +456,8 @@ class Transformer(AbstractBranch["TransformerSide", "CyTransformer"]):
 
 @final
 class TransformerSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "transformer"
     allowed_phases = Transformer.allowed_phases  # type: ignore
     _branch: Transformer
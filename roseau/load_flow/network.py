@@ -6,6 +6,7 @@ import logging
 import re
 from collections.abc import Generator, Iterable, Mapping
 from math import nan
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, Literal, Never, Self, final
 
 import geopandas as gpd
@@ -17,20 +18,38 @@ from roseau.load_flow.constants import ALPHA, ALPHA2, CLOCK_PHASE_SHIFT, SQRT3
 from roseau.load_flow.converters import _calculate_voltages, calculate_voltage_phases
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.io import network_from_dgs, network_from_dict, network_to_dict
+from roseau.load_flow.io.dict import encode_binary_arrays
+from roseau.load_flow.io.frames import network_from_frames
 from roseau.load_flow.models import (
+    AbstractConnectable,
     AbstractTerminal,
     Bus,
+    CurrentLoad,
     Element,
     Ground,
     GroundConnection,
+    ImpedanceLoad,
     Line,
+    LineParameters,
     Load,
     PotentialRef,
+    PowerLoad,
     Switch,
     Transformer,
+    TransformerParameters,
     VoltageSource,
 )
-from roseau.load_flow.typing import ComplexArray, CRSLike, Id, JsonDict, MapOrSeq, StrPath
+from roseau.load_flow.tap_control import TapChanger, TapControlResult, _solve_load_flow_with_tap_changers
+from roseau.load_flow.typing import (
+    ComplexArray,
+    CRSLike,
+    Id,
+    JsonDict,
+    MapOrSeq,
+    ReductionModel,
+    Solver,
+    StrPath,
+)
 from roseau.load_flow.utils import (
     DTYPES,
     AbstractNetwork,
@@ -38,9 +57,11 @@ from roseau.load_flow.utils import (
     SourceTypeDtype,
     VoltagePhaseDtype,
     count_repr,
-    geom_mapping,
     optional_deps,
 )
+from roseau.load_flow.utils.catalogue import get_catalogue_data, get_catalogue_network
+from roseau.load_flow.utils.helpers import _graph_geometries
+from roseau.load_flow.utils.mixins import _concatenate, _json_dump, _ResLimits
 
 if TYPE_CHECKING:
     from networkx import MultiGraph
@@ -271,6 +292,7 @@ class ElectricalNetwork(AbstractNetwork[Element]):
             "bus2_id": [],
             "parameters_id": [],
             "length": [],
+            "ground_id": [],
             "max_loading": [],
             "geometry": [],
         }
@@ -281,6 +303,7 @@ class ElectricalNetwork(AbstractNetwork[Element]):
             data["bus2_id"].append(line.bus2.id)
             data["parameters_id"].append(line.parameters.id)
             data["length"].append(line._length)
+            data["ground_id"].append(line.ground.id if line.ground is not None else None)
             data["max_loading"].append(line._max_loading)
             data["geometry"].append(line.geometry)
         index = pd.Index(index, name="id")
@@ -330,19 +353,41 @@ class ElectricalNetwork(AbstractNetwork[Element]):
 
     @property
     def loads_frame(self) -> pd.DataFrame:
-        """The :attr:`loads` of the network as a dataframe."""
+        """The :attr:`loads` of the network as a dataframe.
+
+        The ``powers`` (VA), ``currents`` (A) and ``impedances`` (Ohm) columns hold the complex
+        arrays of the loads of the matching type and None for the other loads.
+        """
         return pd.DataFrame.from_records(
-            data=[(load.id, load.type, load.phases, load.bus.id, load.is_flexible) for load in self.loads.values()],
-            columns=["id", "type", "phases", "bus_id", "flexible"],
+            data=[
+                (
+                    load.id,
+                    load.type,
+                    load.phases,
+                    load.bus.id,
+                    load.is_flexible,
+                    load._powers if load.type == "power" else None,
+                    load._currents if load.type == "current" else None,
+                    load._impedances if load.type == "impedance" else None,
+                )
+                for load in self.loads.values()
+            ],
+            columns=["id", "type", "phases", "bus_id", "flexible", "powers", "currents", "impedances"],
             index="id",
         )
 
     @property
     def sources_frame(self) -> pd.DataFrame:
-        """The :attr:`sources` of the network as a dataframe."""
+        """The :attr:`sources` of the network as a dataframe.
+
+        The ``voltages`` column holds the complex voltages (V) of the sources.
+        """
         return pd.DataFrame.from_records(
-            data=[(source.id, source.type, source.phases, source.bus.id) for source in self.sources.values()],
-            columns=["id", "type", "phases", "bus_id"],
+            data=[
+                (source.id, source.type, source.phases, source.bus.id, source._voltages)
+                for source in self.sources.values()
+            ],
+            columns=["id", "type", "phases", "bus_id", "voltages"],
             index="id",
         )
 
@@ -356,10 +401,14 @@ class ElectricalNetwork(AbstractNetwork[Element]):
 
     @property
     def potential_refs_frame(self) -> pd.DataFrame:
-        """The :attr:`potential references <potential_refs>` of the network as a dataframe."""
+        """The :attr:`potential references <potential_refs>` of the network as a dataframe.
+
+        The ``phases`` column holds the phases given to the potential references, None when the
+        default phases of the element are used.
+        """
         return pd.DataFrame.from_records(
             data=[
-                (pref.id, pref.phases, pref.element.id, type(pref.element).__name__.lower())
+                (pref.id, pref._original_phases, pref.element.id, type(pref.element).__name__.lower())
                 for pref in self.potential_refs.values()
             ],
             columns=["id", "phases", "element_id", "element_type"],
@@ -390,14 +439,81 @@ class ElectricalNetwork(AbstractNetwork[Element]):
             columns=["bus_id", "phases", "short_circuit", "ground"],
         )
 
+    #
+    # Load flow with tap control
+    #
+    def solve_load_flow_with_tap_changers(
+        self,
+        tap_changers: Iterable[TapChanger],
+        *,
+        max_tap_iterations: int = 20,
+        max_iterations: int = 20,
+        tolerance: float = 1e-6,
+        warm_start: bool = True,
+        solver: Solver | None = None,
+        solver_params: JsonDict | None = None,
+    ) -> TapControlResult:
+        """Solve the load flow while controlling the taps of transformers with on-load tap changers.
+
+        After each load flow, the taps of the transformers whose controlled bus has a voltage level
+        outside the band of its :class:`~roseau.load_flow.tap_control.TapChanger` are moved by whole
+        tap steps and the load flow is solved again. The loop stops when no tap moves or after
+        ``max_tap_iterations`` tap moves. The engine network is built once and each load flow is
+        warm-started from the solution of the previous one. The taps of the transformers are left
+        at their final values.
+
+        Args:
+            tap_changers:
+                The tap changers of the controlled transformers.
+
+            max_tap_iterations:
+                The maximum number of times the taps are moved. At most ``max_tap_iterations + 1``
+                load flows are solved.
+
+            max_iterations:
+                The maximum number of allowed iterations of each load flow.
+
+            tolerance:
+                Tolerance needed for the convergence of each load flow.
+
+            warm_start:
+                If true (the default), the first load flow is initialized with the potentials of
+                the last successful load flow result (if any). The next load flows are always
+                warm-started.
+
+            solver:
+                The name of the solver to use for the load flows. Defaults to the current solver
+                of the network. See :meth:`solve_load_flow` for the options.
+
+            solver_params:
+                A dictionary of parameters used by the solver.
+
+        Returns:
+            The result of the tap control with the trajectory of the taps of the transformers. The
+            load flow results of the network are the ones of the final taps.
+        """
+        return _solve_load_flow_with_tap_changers(
+            self,
+            list(tap_changers),
+            max_tap_iterations=max_tap_iterations,
+            load_flow_kwargs={
+                "max_iterations": max_iterations,
+                "tolerance": tolerance,
+                "warm_start": warm_start,
+                "solver": self._solver.name if solver is None else solver,
+                "solver_params": solver_params,
+            },
+        )
+
     #
     # Helpers to analyze the network
     #
-    def to_graph(self, *, respect_switches: bool = True) -> "MultiGraph":
+    def to_graph(self, *, respect_switches: bool = True, geometry: bool = False) -> "MultiGraph":
         """Create a networkx multi-graph from this electrical network.
 
-        The graph contains the geometries of the buses in the nodes data and the geometries and
-        branch types in the edges data.
+        The graph contains the data of the buses in the nodes data and the data and branch types
+        of the branches in the edges data. The geometries of the elements are added to the data
+        (``geom`` key) only when ``geometry`` is True.
 
         Note:
             This method requires *networkx* to be installed. You can install it with the ``"graph"``
@@ -408,59 +524,84 @@ class ElectricalNetwork(AbstractNetwork[Element]):
                 Respect the switch state. If ``True`` (default), open switches are not included in
                 the graph. If ``False``, all switches are included regardless of their state.
 
+            geometry:
+                If ``True``, the GeoJSON-like mappings of the geometries of the buses and branches
+                are added to the nodes and edges data under the ``geom`` key. Defaults to ``False``
+                as converting the geometries takes most of the time of the conversion of large
+                networks.
+
         Returns:
             A networkx multi-graph representing the electrical network.
         """
         nx = optional_deps.networkx
         graph = nx.MultiGraph(name=self.name)
-        for bus in self.buses.values():
-            graph.add_node(
+        buses = list(self.buses.values())
+        graph.add_nodes_from(
+            (
                 bus.id,
-                nominal_voltage=bus._nominal_voltage,
-                min_voltage_level=bus._min_voltage_level,
-                max_voltage_level=bus._max_voltage_level,
-                geom=geom_mapping(bus.geometry),
+                {
+                    "nominal_voltage": bus._nominal_voltage,
+                    "min_voltage_level": bus._min_voltage_level,
+                    "max_voltage_level": bus._max_voltage_level,
+                    **geom,
+                },
             )
-        for line in self.lines.values():
-            if (ampacities := line.parameters._ampacities) is not None:
-                ampacities = ampacities.tolist()
-            graph.add_edge(
+            for bus, geom in zip(buses, _graph_geometries(buses, geometry), strict=True)
+        )
+        lines = list(self.lines.values())
+        graph.add_edges_from(
+            (
                 line.bus1.id,
                 line.bus2.id,
-                id=line.id,
-                type="line",
-                phases=line.phases,
-                parameters_id=line.parameters.id,
-                length=line._length,
-                max_loading=line._max_loading,
-                ampacities=ampacities,
-                geom=geom_mapping(line.geometry),
+                {
+                    "id": line.id,
+                    "type": "line",
+                    "phases": line.phases,
+                    "parameters_id": line.parameters.id,
+                    "length": line._length,
+                    "max_loading": line._max_loading,
+                    "ampacities": (
+                        line.parameters._ampacities.tolist() if line.parameters._ampacities is not None else None
+                    ),
+                    **geom,
+                },
             )
-        for transformer in self.transformers.values():
-            graph.add_edge(
+            for line, geom in zip(lines, _graph_geometries(lines, geometry), strict=True)
+        )
+        transformers = list(self.transformers.values())
+        graph.add_edges_from(
+            (
                 transformer.bus1.id,
                 transformer.bus2.id,
-                id=transformer.id,
-                type="transformer",
-                phases1=transformer.phases1,
-                phases2=transformer.phases2,
-                parameters_id=transformer.parameters.id,
-                max_loading=transformer._max_loading,
-                sn=transformer.parameters._sn,
-                tap=transformer._tap,
-                geom=geom_mapping(transformer.geometry),
+                {
+                    "id": transformer.id,
+                    "type": "transformer",
+                    "phases1": transformer.phases1,
+                    "phases2": transformer.phases2,
+                    "parameters_id": transformer.parameters.id,
+                    "max_loading": transformer._max_loading,
+                    "sn": transformer.parameters._sn,
+                    "tap": transformer._tap,
+                    **geom,
+                },
             )
-        for switch in self.switches.values():
-            if not respect_switches or switch.closed:
-                graph.add_edge(
-                    switch.bus1.id,
-                    switch.bus2.id,
-                    id=switch.id,
-                    type="switch",
-                    phases=switch.phases,
-                    closed=switch.closed,
-                    geom=geom_mapping(switch.geometry),
-                )
+            for transformer, geom in zip(transformers, _graph_geometries(transformers, geometry), strict=True)
+        )
+        switches = [switch for switch in self.switches.values() if not respect_switches or switch.closed]
+        graph.add_edges_from(
+            (
+                switch.bus1.id,
+                switch.bus2.id,
+                {
+                    "id": switch.id,
+                    "type": "switch",
+                    "phases": switch.phases,
+                    "closed": switch.closed,
+                    **geom,
+                },
+            )
+            for switch, geom in zip(switches, _graph_geometries(switches, geometry), strict=True)
+        )
         return graph
 
     #
@@ -1141,6 +1282,84 @@ class ElectricalNetwork(AbstractNetwork[Element]):
                 return True
         return False
 
+    def _get_res_limits(self) -> dict[str, _ResLimits]:
+        # Buses: the voltages of the buses with the same phases are computed at once
+        buses_by_phases: dict[str, list[tuple[int, Bus]]] = {}
+        bus_ids: list[Id] = []
+        for bus in self.buses.values():
+            if bus._nominal_voltage is not None:
+                buses_by_phases.setdefault(bus.phases, []).append((len(bus_ids), bus))
+                bus_ids.append(bus.id)
+        bus_arrays: dict[str, list[np.ndarray]] = {k: [] for k in ("index", "phases", "values", "min", "max")}
+        for phases, indexed_buses in buses_by_phases.items():
+            indices, buses = zip(*indexed_buses, strict=True)
+            potentials = np.array([bus._res_potentials_getter(warning=False) for bus in buses], dtype=np.complex128)
+            if "n" in phases:
+                voltages = SQRT3 * (potentials[:, :-1] - potentials[:, -1:])  # phase-to-neutral
+            elif len(phases) == 2:
+                voltages = potentials[:, :1] - potentials[:, 1:]  # single phase-to-phase
+            else:
+                voltages = potentials - np.roll(potentials, -1, axis=1)  # ab, bc, ca
+            n_buses, n_voltages = voltages.shape
+            nominal_voltages = np.array([bus._nominal_voltage for bus in buses], dtype=np.float64)
+            min_levels = [nan if bus._min_voltage_level is None else bus._min_voltage_level for bus in buses]
+            max_levels = [nan if bus._max_voltage_level is None else bus._max_voltage_level for bus in buses]
+            bus_arrays["index"].append(np.repeat(np.array(indices, dtype=np.intp), n_voltages))
+            bus_arrays["phases"].append(np.tile(calculate_voltage_phases(phases), n_buses))
+            bus_arrays["values"].append((np.abs(voltages) / nominal_voltages[:, None]).ravel())
+            bus_arrays["min"].append(np.repeat(np.array(min_levels, dtype=np.float64), n_voltages))
+            bus_arrays["max"].append(np.repeat(np.array(max_levels, dtype=np.float64), n_voltages))
+        # Restore the order of the buses in the network
+        bus_index = _concatenate(bus_arrays["index"], np.intp)
+        order = np.argsort(bus_index, kind="stable")
+
+        # Lines: the loadings of the phases of the lines that have ampacities
+        lines = [line for line in self.lines.values() if line._parameters._ampacities is not None]
+        n_phases = np.array([len(line.phases) for line in lines], dtype=np.intp)
+        currents1 = _concatenate([line._side1._res_currents_getter(warning=False) for line in lines], np.complex128)
+        currents2 = _concatenate([line._side2._res_currents_getter(warning=False) for line in lines], np.complex128)
+        ampacities = _concatenate([line._parameters._ampacities for line in lines], np.float64)
+        line_max_loadings = np.array([line._max_loading for line in lines], dtype=np.float64)
+
+        # Transformers: the loadings of the transformers, from the total powers of their sides
+        transformers = list(self.transformers.values())
+        loadings = np.zeros(len(transformers), dtype=np.float64)
+        for side in ("_side1", "_side2"):
+            sides = [getattr(tr, side) for tr in transformers]
+            potentials = _concatenate([s._res_potentials_getter(warning=False) for s in sides], np.complex128)
+            currents = _concatenate([s._res_currents_getter(warning=False) for s in sides], np.complex128)
+            offsets = np.cumsum([0, *(len(s._phases) for s in sides[:-1])], dtype=np.intp)
+            if transformers:
+                loadings = np.maximum(loadings, np.abs(np.add.reduceat(potentials * currents.conj(), offsets)))
+        sn = np.array([tr._parameters._sn for tr in transformers], dtype=np.float64)
+
+        return {
+            "bus": _ResLimits(
+                ids=bus_ids,
+                element_index=bus_index[order],
+                phases=_concatenate(bus_arrays["phases"], np.str_)[order],
+                values=_concatenate(bus_arrays["values"], np.float64)[order],
+                min_limits=_concatenate(bus_arrays["min"], np.float64)[order],
+                max_limits=_concatenate(bus_arrays["max"], np.float64)[order],
+            ),
+            "line": _ResLimits(
+                ids=[line.id for line in lines],
+                element_index=np.repeat(np.arange(len(lines)), n_phases),
+                phases=np.array(list("".join(line.phases for line in lines)), dtype=np.str_),
+                values=np.maximum(np.abs(currents1), np.abs(currents2)) / ampacities,
+                min_limits=np.full(len(ampacities), nan),
+                max_limits=np.repeat(line_max_loadings, n_phases),
+            ),
+            "transformer": _ResLimits(
+                ids=[tr.id for tr in transformers],
+                element_index=np.arange(len(transformers)),
+                phases=None,
+                values=loadings / sn,
+                min_limits=np.full(len(transformers), nan),
+                max_limits=np.array([tr._max_loading for tr in transformers], dtype=np.float64),
+            ),
+        }
+
     def _propagate_voltages(self) -> None:
         all_phases = set()
         for bus in self.buses.values():
@@ -1279,6 +1498,39 @@ class ElectricalNetwork(AbstractNetwork[Element]):
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.SEVERAL_POTENTIAL_REFERENCE)
 
+    def _create_equivalent_load(
+        self, id: Id, bus: Bus, new_bus: Bus, elements: list[AbstractConnectable], model: ReductionModel
+    ) -> Load:
+        # The currents drawn from the bus by the elements of the reduced sub-network
+        bus_phases = bus.phases
+        currents = np.zeros(len(bus_phases), dtype=np.complex128)
+        for element in elements:
+            for phase, current in zip(element.phases, element._res_currents_getter(warning=False), strict=True):
+                if phase in bus_phases:
+                    currents[bus_phases.index(phase)] += current
+        voltages = _calculate_voltages(bus._res_potentials_getter(warning=False), bus_phases)
+        if "n" in bus_phases:
+            currents = currents[:-1]  # star load, the neutral current is the sum of the phase currents
+        elif len(bus_phases) == 3:
+            currents = (currents - np.roll(currents, -1)) / 3  # delta load without circulating current
+        else:
+            currents = currents[:1]
+
+        if model == "power":
+            return PowerLoad(id=id, bus=new_bus, powers=voltages * currents.conj(), phases=bus_phases)
+        elif model == "current":
+            # The currents of the load are defined relative to its voltages
+            return CurrentLoad(id=id, bus=new_bus, currents=currents * abs(voltages) / voltages, phases=bus_phases)
+        elif np.isclose(currents, 0).any():
+            msg = (
+                f"The sub-network connected to bus {bus.id!r} cannot be reduced to an impedance load "
+                f"because it draws no current on some phases."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION)
+        else:
+            return ImpedanceLoad(id=id, bus=new_bus, impedances=voltages / currents, phases=bus_phases)
+
     #
     # Network saving/loading
     #
@@ -1307,6 +1559,178 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     def _to_dict(self, include_results: bool) -> JsonDict:
         return network_to_dict(en=self, include_results=include_results)
 
+    def to_dict(self, *, include_results: bool = True, binary_arrays: bool = False) -> JsonDict:
+        """Convert the network to a dictionary.
+
+        Args:
+            include_results:
+                If True (default), the results of the load flow are included in the dictionary.
+                If no results are available, this option is ignored.
+
+            binary_arrays:
+                If True, the numeric arrays (potentials, currents, powers, impedance matrices, etc.)
+                are stored as base64-encoded little-endian float64 buffers with their shape instead
+                of nested ``[real, imag]`` lists. The dictionary is smaller for arrays of full
+                precision values such as results and its arrays are read as numpy arrays instead
+                of lists. It can still be read with :meth:`from_dict`. `False` by default.
+
+        Returns:
+            A JSON serializable dictionary with the network's data.
+        """
+        res = super().to_dict(include_results=include_results)
+        if binary_arrays:
+            res = encode_binary_arrays(res)
+        return res
+
+    def to_json(
+        self,
+        path: StrPath,
+        *,
+        include_results: bool = True,
+        indent: bool = True,
+        sort_keys: bool = False,
+        binary_arrays: bool = False,
+    ) -> Path:
+        """Save the network to a JSON file.
+
+        .. note::
+            The path is `expanded <https://docs.python.org/3/library/pathlib.html#pathlib.Path.expanduser>`__
+            then `resolved <https://docs.python.org/3/library/pathlib.html#pathlib.Path.resolve>`__
+            before writing the file.
+
+        .. warning::
+            If the file exists, it will be overwritten.
+
+        Args:
+            path:
+                The path to the output file to write the network to.
+
+            include_results:
+                If True (default), the results of the load flow are included in the JSON file.
+                If no results are available, this option is ignored.
+
+            indent:
+                If True (default), the JSON output is pretty-printed with 2-space indentation.
+                Set to False for compact output.
+
+            sort_keys:
+                If True, the keys of the JSON output are sorted alphabetically. `False` by default.
+
+            binary_arrays:
+                If True, the numeric arrays are stored as base64-encoded float64 buffers, see
+                :meth:`to_dict`. The file is smaller for arrays of full precision values such as
+                results and its arrays are read as numpy arrays by :meth:`from_json`. `False` by
+                default.
+
+        Returns:
+            The expanded and resolved path of the written file.
+        """
+        res = self.to_dict(include_results=include_results, binary_arrays=binary_arrays)
+        return _json_dump(res, path=path, indent=indent, sort_keys=sort_keys)
+
+    @classmethod
+    def from_frames(
+        cls,
+        *,
+        name: str = "Network",
+        buses: pd.DataFrame,
+        lines: pd.DataFrame | None = None,
+        transformers: pd.DataFrame | None = None,
+        switches: pd.DataFrame | None = None,
+        loads: pd.DataFrame | None = None,
+        sources: pd.DataFrame | None = None,
+        grounds: pd.DataFrame | None = None,
+        potential_refs: pd.DataFrame | None = None,
+        ground_connections: pd.DataFrame | None = None,
+        lines_params: MapOrSeq[LineParameters] = (),
+        transformers_params: MapOrSeq[TransformerParameters] = (),
+        crs: CRSLike | None = None,
+    ) -> Self:
+        """Construct an electrical network from (geo) data frames.
+
+        This is the inverse of the ``*_frame`` properties of the network: the frames have the same
+        columns and are indexed by the IDs of the elements, and the frames of a network without
+        flexible loads can be passed as they are to rebuild it. The columns of each frame are checked
+        at once before its elements are created. The values are in the units of the ``*_frame``
+        properties (V, km, etc.). The optional columns can be omitted and their missing values
+        take the default values of the constructors of the elements.
+
+        Args:
+            name:
+                The name of the network. Defaults to ``"Network"``.
+
+            buses:
+                The buses with the columns ``phases`` and the optional columns
+                ``nominal_voltage``, ``min_voltage_level``, ``max_voltage_level`` and ``geometry``.
+
+            lines:
+                The lines with the columns ``bus1_id``, ``bus2_id``, ``parameters_id`` and
+                ``length`` and the optional columns ``phases``, ``ground_id`` (required for the
+                lines with shunt admittance), ``max_loading`` and ``geometry``.
+
+            transformers:
+                The transformers with the columns ``bus_hv_id``, ``bus_lv_id`` and
+                ``parameters_id`` and the optional columns ``phases_hv``, ``phases_lv``, ``tap``,
+                ``max_loading`` and ``geometry``.
+
+            switches:
+                The switches with the columns ``bus1_id`` and ``bus2_id`` and the optional columns
+                ``phases``, ``closed`` and ``geometry``.
+
+            loads:
+                The loads with the columns ``type`` (``"power"``, ``"current"`` or
+                ``"impedance"``) and ``bus_id``, the optional column ``phases`` and a column with
+                the values of each type of load: ``powers`` (VA), ``currents`` (A) or
+                ``impedances`` (Ohm). Flexible loads are not supported.
+
+            sources:
+                The voltage sources with the columns ``bus_id`` and ``voltages`` (V) and the
+                optional column ``phases``.
+
+            grounds:
+                The grounds. Only their IDs are used.
+
+            potential_refs:
+                The potential references with the columns ``element_id`` and ``element_type``
+                (``"bus"`` or ``"ground"``) and the optional column ``phases``.
+
+            ground_connections:
+                The ground connections with the columns ``ground_id``, ``element_id`` and
+                ``element_type`` and the optional columns ``side`` (for branches), ``phase`` and
+                ``impedance``.
+
+            lines_params:
+                The parameters referenced by the ``parameters_id`` column of the lines. Either a
+                list of parameters or a dictionary of parameters with their IDs as keys.
+
+            transformers_params:
+                The parameters referenced by the ``parameters_id`` column of the transformers.
+
+            crs:
+                The Coordinate Reference System of the network. Defaults to the CRS of the buses
+                geo data frame, if any.
+
+        Returns:
+            The constructed network.
+        """
+        return cls(
+            **network_from_frames(
+                name=name,
+                buses=buses,
+                lines=lines,
+                transformers=transformers,
+                switches=switches,
+                loads=loads,
+                sources=sources,
+                grounds=grounds,
+                potential_refs=potential_refs,
+                ground_connections=ground_connections,
+                lines_params=lines_params,
+                transformers_params=transformers_params,
+                crs=crs,
+            )
+        )
+
     #
     # Results saving
     #
@@ -1372,6 +1796,10 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     def from_catalogue(cls, name: str | re.Pattern[str], load_point_name: str | re.Pattern[str]) -> Self:
         """Create a network from the catalogue.
 
+        The networks of the catalogue are read once into a bundle of compact JSON data stored in the
+        user cache directory and each process caches the networks it creates. Every call returns a new copy
+        of the cached network that can be modified freely.
+
         Args:
             name:
                 The name of the network to get from the catalogue. It can be a regular expression.
@@ -1383,14 +1811,18 @@ class ElectricalNetwork(AbstractNetwork[Element]):
         Returns:
             The selected network
         """
-        # Get the catalogue data
-        catalogue_data, _ = cls._get_catalogue(name=name, load_point_name=load_point_name, raise_if_not_found=True)
 
-        name = catalogue_data["name"].item()
-        load_point_name = catalogue_data["load_points"].item()[0]
+        def create() -> Self:
+            # Get the catalogue data
+            catalogue_data, _ = cls._get_catalogue(name=name, load_point_name=load_point_name, raise_if_not_found=True)
 
-        # Get the data from the Json file
-        path = cls.catalogue_path() / f"{name}_{load_point_name}.json"
-        network = cls.from_json(path)
-        network.name = f"{name} ({load_point_name})"
-        return network
+            network_name = catalogue_data["name"].item()
+            network_load_point_name = catalogue_data["load_points"].item()[0]
+
+            # Get the data of the Json file from the bundle
+            data = get_catalogue_data(cls.catalogue_path(), f"{network_name}_{network_load_point_name}")
+            network = cls.from_dict(data, copy=False)
+            network.name = f"{network_name} ({network_load_point_name})"
+            return network
+
+        return get_catalogue_network(cls, (name, load_point_name), create)
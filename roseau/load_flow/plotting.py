@@ -6,6 +6,7 @@ import math
 import textwrap
 from collections.abc import Callable, Container, Iterable, Mapping
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Self, TypedDict, assert_never
 
 import geopandas as gpd
@@ -17,8 +18,10 @@ from roseau.load_flow.models import AbstractTerminal, Bus, Line, Switch, Transfo
 from roseau.load_flow.network import ElectricalNetwork
 from roseau.load_flow.sym import NegativeSequence, PositiveSequence, ZeroSequence, phasor_to_sym
 from roseau.load_flow.types import LineType
-from roseau.load_flow.typing import BranchType, ComplexArray, Id, ResultState
+from roseau.load_flow.typing import BranchType, ComplexArray, FloatArray, Id, ResultState, StrPath
 from roseau.load_flow.units import Q_
+from roseau.load_flow.utils.helpers import geom_mappings
+from roseau.load_flow.utils.mixins import _json_dump, _ResLimits, _ShortestPathTree
 
 if TYPE_CHECKING:
     import folium
@@ -755,6 +758,20 @@ def _plot_interactive_map_elements(  # noqa: C901
     return layers
 
 
+def _set_map_location(map_kws: dict[str, Any], geom_union: shp.Geometry) -> None:
+    """Set the center and the zoom level of the map from the geometry of the network if not provided."""
+    if "location" not in map_kws:
+        map_kws["location"] = list(reversed(geom_union.centroid.coords[0]))
+    if "zoom_start" not in map_kws:
+        # Calculate the zoom level based on the bounding box of the network
+        min_x, min_y, max_x, max_y = geom_union.bounds
+        # The bounding box could be a point, a vertical line or a horizontal line. In these
+        # cases, we set a default zoom level of 16.
+        zoom_lon = math.ceil(math.log2(360 * 2.0 / (max_x - min_x))) if max_x > min_x else 16
+        zoom_lat = math.ceil(math.log2(360 * 2.0 / (max_y - min_y))) if max_y > min_y else 16
+        map_kws["zoom_start"] = min(zoom_lon, zoom_lat) - 1
+
+
 def _plot_interactive_map_internal(
     network: "ElectricalNetwork | rlfs.ElectricalNetwork",
     dataframes: dict["MapElementType", gpd.GeoDataFrame],
@@ -776,17 +793,7 @@ def _plot_interactive_map_internal(
 
     # Calculate the center and zoom level of the map if not provided
     if not fit_bounds and ("location" not in map_kws or "zoom_start" not in map_kws):
-        geom_union = dataframes["bus"].union_all().union(dataframes["line"].union_all())
-        if "location" not in map_kws:
-            map_kws["location"] = list(reversed(geom_union.centroid.coords[0]))
-        if "zoom_start" not in map_kws:
-            # Calculate the zoom level based on the bounding box of the network
-            min_x, min_y, max_x, max_y = geom_union.bounds
-            # The bounding box could be a point, a vertical line or a horizontal line. In these
-            # cases, we set a default zoom level of 16.
-            zoom_lon = math.ceil(math.log2(360 * 2.0 / (max_x - min_x))) if max_x > min_x else 16
-            zoom_lat = math.ceil(math.log2(360 * 2.0 / (max_y - min_y))) if max_y > min_y else 16
-            map_kws["zoom_start"] = min(zoom_lon, zoom_lat) - 1
+        _set_map_location(map_kws, dataframes["bus"].union_all().union(dataframes["line"].union_all()))
 
     if "zoom_control" not in map_kws and add_search:
         map_kws["zoom_control"] = "topright"
@@ -967,6 +974,7 @@ def plot_interactive_map(
     add_popups: bool = True,
     add_search: bool = True,
     fit_bounds: bool = True,
+    network_tiles: str | None = None,
 ) -> "folium.Map":
     """Plot an electrical network on an interactive map.
 
@@ -1029,6 +1037,14 @@ def plot_interactive_map(
             ``False``, the initial view is determined by the `location` and `zoom_start` parameters
             in `map_kws`.
 
+        network_tiles:
+            The URL of a directory of map tiles written by :func:`export_map_tiles` and served by a
+            web server, for instance ``"http://localhost:8000/tiles"``. If given, the elements are
+            loaded from the tiles visible on the map instead of being embedded in the map, which
+            allows plotting very large networks. The styles of the elements are those of the tiles:
+            `style_color`, `style_function`, `highlight_function`, `add_popups` and `add_search`
+            are ignored.
+
     Returns:
         The :class:`folium.Map` object with the network plot.
     """
@@ -1037,6 +1053,15 @@ def plot_interactive_map(
         raise TypeError(
             "Only multi-phase networks can be plotted. Did you mean to use rlfs.plotting.plot_interactive_map?"
         )
+    if network_tiles is not None:
+        return _plot_interactive_map_tiles(
+            network=network,
+            network_tiles=network_tiles,
+            highlight_color=highlight_color,
+            map_kws=map_kws,
+            add_tooltips=add_tooltips,
+            fit_bounds=fit_bounds,
+        )
     buses_gdf = _get_buses_data_for_map_plot(network, with_results=False)
     lines_gdf = _get_lines_data_for_map_plot(network, with_results=False)
     transformers_gdf = _get_transformers_data_for_map_plot(network, with_results=False, buses_frame=buses_gdf)
@@ -1087,6 +1112,7 @@ def plot_results_interactive_map(
     add_popups: bool = True,
     add_search: bool = True,
     fit_bounds: bool = True,
+    network_tiles: str | None = None,
 ) -> "folium.Map":
     """Plot an electrical network on an interactive map with the load flow results.
 
@@ -1166,6 +1192,13 @@ def plot_results_interactive_map(
             ``False``, the initial view is determined by the `location` and `zoom_start` parameters
             in `map_kws`.
 
+        network_tiles:
+            The URL of a directory of map tiles written by :func:`export_map_tiles` with
+            ``with_results=True`` and served by a web server. If given, the elements and their
+            results are loaded from the tiles visible on the map instead of being embedded in the
+            map, see :func:`plot_interactive_map`. The network does not need valid results in this
+            case.
+
     Returns:
         The `folium.Map` object with the network plot.
     """
@@ -1174,6 +1207,15 @@ def plot_results_interactive_map(
         raise TypeError(
             "Only multi-phase networks can be plotted. Did you mean to use rlfs.plotting.plot_results_interactive_map?"
         )
+    if network_tiles is not None:
+        return _plot_interactive_map_tiles(
+            network=network,
+            network_tiles=network_tiles,
+            highlight_color=highlight_color,
+            map_kws=map_kws,
+            add_tooltips=add_tooltips,
+            fit_bounds=fit_bounds,
+        )
     network._check_valid_results()
     buses_gdf = _get_buses_data_for_map_plot(network, with_results=True)
     lines_gdf = _get_lines_data_for_map_plot(network, with_results=True)
@@ -1198,9 +1240,458 @@ def plot_results_interactive_map(
     return m
 
 
+#
+# Map tiles
+#
+_TILE_SIZE = 256
+_TILES_METADATA_FILE = "tiles.json"
+_TILE_STYLE_PROPERTIES = ("color", "weight", "radius", "dash_array")
+
+
+def _lon_to_tile_x(lon: "FloatArray", n_tiles: int) -> np.ndarray:
+    x = np.floor((np.asarray(lon) + 180.0) / 360.0 * n_tiles).astype(np.int64)
+    return np.clip(x, 0, n_tiles - 1)
+
+
+def _lat_to_tile_y(lat: "FloatArray", n_tiles: int) -> np.ndarray:
+    lat_rad = np.radians(np.clip(lat, -85.0511, 85.0511))
+    y = np.floor((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * n_tiles).astype(np.int64)
+    return np.clip(y, 0, n_tiles - 1)
+
+
+def _tile_bounds(x: np.ndarray, y: np.ndarray, n_tiles: int) -> tuple["FloatArray", ...]:
+    """The west, south, east and north bounds of web mercator tiles (in degrees)."""
+    west = x / n_tiles * 360.0 - 180.0
+    east = (x + 1) / n_tiles * 360.0 - 180.0
+    north = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * y / n_tiles))))
+    south = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * (y + 1) / n_tiles))))
+    return west, south, east, north
+
+
+def _group_max_min(limits: "_ResLimits") -> tuple[list[Id], "FloatArray", "FloatArray", "FloatArray", "FloatArray"]:
+    """The IDs and the max values, min values, min limits and max limits of each element."""
+    if len(limits.values) == 0:
+        empty = np.array([], dtype=np.float64)
+        return [], empty, empty, empty, empty
+    index = limits.element_index
+    starts = np.flatnonzero(np.diff(index, prepend=-1))
+    ids = [limits.ids[i] for i in index[starts].tolist()]
+    return (
+        ids,
+        np.maximum.reduceat(limits.values, starts),
+        np.minimum.reduceat(limits.values, starts),
+        limits.min_limits[starts],
+        limits.max_limits[starts],
+    )
+
+
+def _get_map_tiles_results(network: ElectricalNetwork) -> dict["MapElementType", dict[Id, tuple[str, dict]]]:
+    """The result states and values of the buses, lines and transformers, computed at once."""
+    res_limits = network._get_res_limits()
+    results: dict[MapElementType, dict[Id, tuple[str, dict]]] = {}
+
+    # Buses: the same states as `Bus._res_state_getter`
+    ids, u_high, u_low, u_min, u_max = _group_max_min(res_limits["bus"])
+    states = np.select(
+        [
+            np.isnan(u_min) & np.isnan(u_max),
+            u_high > u_max,
+            u_high > 0.75 * u_max + 0.25,
+            u_low < u_min,
+            u_low < 0.75 * u_min + 0.25,
+        ],
+        ["unknown", "very-high", "high", "very-low", "low"],
+        "normal",
+    )
+    results["bus"] = {
+        bus_id: (state, {"res_min_voltage_level": low, "res_max_voltage_level": high})
+        for bus_id, state, low, high in zip(
+            ids, states.tolist(), (100 * u_low).tolist(), (100 * u_high).tolist(), strict=True
+        )
+    }
+
+    # Lines and transformers: the same states as `_res_state_getter` of the branches
+    for et in ("line", "transformer"):
+        ids, loadings, _, _, max_loadings = _group_max_min(res_limits[et])
+        states = np.select([loadings > max_loadings, loadings > 0.75 * max_loadings], ["very-high", "high"], "normal")
+        results[et] = {
+            element_id: (state, {"res_loading": loading})
+            for element_id, state, loading in zip(ids, states.tolist(), (100 * loadings).tolist(), strict=True)
+        }
+    return results
+
+
+def _get_map_tiles_features(  # noqa: C901
+    network: ElectricalNetwork, with_results: bool, style_color: "str | StyleColorCallback | None"
+) -> tuple[list[dict[str, Any]], np.ndarray, np.ndarray]:
+    """The properties, geometries and kinds of the features of the map tiles.
+
+    The kind is 0 for the elements shown at all zoom levels, 1 for the LV lines and switches and 2
+    for the buses.
+    """
+    nominal_voltages = network._get_nominal_voltages()
+    source_buses = {src.bus.id for src in network.sources.values()}
+    results = _get_map_tiles_results(network) if with_results else {}
+
+    def default_color(et: "MapElementType", eid: Id) -> str:
+        if et == "switch" or et not in results:
+            return _DEFAULT_MAP_STYLE_COLORS[et]
+        return _RESULT_COLORS[results[et][eid][0] if eid in results[et] else "unknown"]
+
+    color_callback = _make_style_color_callback(style_color, default_color)
+
+    def size(vn: float, lv: float, mv: float, hv: float) -> float:
+        return lv if vn < _LV else mv if vn < _MV else hv
+
+    properties: list[dict[str, Any]] = []
+    geometries: list[Any] = []
+    kinds: list[int] = []
+
+    def add(et: "MapElementType", eid: Id, geometry: Any, kind: int, **style: Any) -> None:
+        props = {"id": eid, "element_type": et, "color": color_callback(et, eid), **style}
+        if et in results:
+            state, values = results[et].get(eid, ("unknown", {}))
+            props["res_state"] = state
+            props.update(values)
+        properties.append(props)
+        geometries.append(geometry)
+        kinds.append(kind)
+
+    # Buses that are not represented by transformers
+    tr_buses = {bus.id for tr in network.transformers.values() for bus in (tr.bus_hv, tr.bus_lv)}
+    for bus in network.buses.values():
+        if bus.geometry is None or bus.id in tr_buses:
+            continue
+        radius = size(nominal_voltages[bus.id], 4, 7, 10) + (3 if bus.id in source_buses else 0)
+        add("bus", bus.id, bus.geometry, 2, radius=radius)
+    for line in network.lines.values():
+        if line.geometry is None:
+            continue
+        dash_array = "5, 5" if line._parameters._line_type == LineType.UNDERGROUND else None
+        vn = nominal_voltages[line.bus1.id]
+        add("line", line.id, line.geometry, int(vn < _LV), weight=size(vn, 1.0, 2.0, 3.0), dash_array=dash_array)
+    for tr in network.transformers.values():
+        if tr.bus_hv.geometry is None:
+            continue
+        add("transformer", tr.id, tr.bus_hv.geometry, 0, radius=size(nominal_voltages[tr.bus_hv.id], 6, 9, 12))
+    for sw in network.switches.values():
+        geom1, geom2 = sw.bus1.geometry, sw.bus2.geometry
+        if geom1 is None or geom2 is None:
+            continue
+        geom1, geom2 = geom1.centroid, geom2.centroid
+        if geom1.equals(geom2):
+            continue
+        add("switch", sw.id, shp.LineString([geom1, geom2]), int(nominal_voltages[sw.bus1.id] < _LV), weight=2)
+
+    geoms = np.empty(len(geometries), dtype=object)
+    geoms[:] = geometries
+    if network.crs is not None:
+        geoms = gpd.GeoSeries(geoms, crs=network.crs).to_crs("EPSG:4326").to_numpy()
+    return properties, geoms, np.array(kinds, dtype=np.int64)
+
+
+def export_map_tiles(
+    network: ElectricalNetwork,
+    path: "StrPath",
+    *,
+    min_zoom: int = 8,
+    max_zoom: int = 16,
+    lv_min_zoom: int = 13,
+    buses_min_zoom: int = 14,
+    with_results: bool = False,
+    style_color: "str | StyleColorCallback | None" = None,
+) -> Path:
+    """Export the network to GeoJSON map tiles with a level of detail that depends on the zoom.
+
+    The elements are written in tiles of the web mercator tiling scheme used by online maps, as
+    GeoJSON files named ``{z}/{x}/{y}.geojson`` in the directory `path`. A ``tiles.json`` file
+    (`TileJSON <https://github.com/mapbox/tilejson-spec>`_) describes the zoom levels and the
+    bounds of the tiles. At each zoom level, the geometries are simplified to the size of a pixel
+    and the lines shorter than a pixel are dropped, so the tiles of the low zoom levels stay small
+    even for very large networks. The style of the elements (color, weight, radius) is computed at
+    once for all the elements and stored in the properties of the features.
+
+    Serve the directory with a web server (for instance ``python -m http.server``) and pass its URL
+    as the `network_tiles` argument of :func:`plot_interactive_map` or
+    :func:`plot_results_interactive_map` to view large networks in a browser.
+
+    Args:
+        network:
+            The electrical network to export. Buses, lines, transformers and switches are exported,
+            like in :func:`plot_interactive_map`.
+
+        path:
+            The directory of the tiles. It is created if it does not exist. The existing files of
+            the tiles are overwritten.
+
+        min_zoom:
+            The smallest zoom level of the tiles. Defaults to 8 (a region).
+
+        max_zoom:
+            The largest zoom level of the tiles. The maps zoomed further use the tiles of this zoom
+            level. Defaults to 16 (a street).
+
+        lv_min_zoom:
+            The smallest zoom level at which the LV lines and switches are exported. The
+            transformers and the other lines and switches are exported at all zoom levels.
+            Defaults to 13 (a town).
+
+        buses_min_zoom:
+            The smallest zoom level at which the buses are exported. Defaults to 14.
+
+        with_results:
+            If ``True``, the colors of the elements depend on their load flow results like in
+            :func:`plot_results_interactive_map` and their voltage levels or loadings are added to
+            their properties. The network must have valid results. Defaults to ``False``.
+
+        style_color:
+            A string to use as the color of all elements, or a callback function in the form
+            ``(el_type, el_id, /) -> str`` returning the color of that specific element. Return
+            ``None`` from the callable to use the default color for that element instead.
+
+    Returns:
+        The expanded and resolved path of the directory of the tiles.
+    """
+    if not network.is_multi_phase:
+        raise TypeError("Only multi-phase networks can be exported to map tiles.")
+    if not 0 <= min_zoom <= max_zoom:
+        raise ValueError(f"Expected 0 <= min_zoom <= max_zoom, got min_zoom={min_zoom} and max_zoom={max_zoom}.")
+    if with_results:
+        network._check_valid_results()
+    path = Path(path).expanduser().resolve()
+    path.mkdir(parents=True, exist_ok=True)
+
+    properties, geoms, kinds = _get_map_tiles_features(network, with_results=with_results, style_color=style_color)
+    is_line = shp.get_type_id(geoms) != shp.GeometryType.POINT
+    kinds_min_zoom = np.array([0, lv_min_zoom, buses_min_zoom])[kinds]
+    for zoom in range(min_zoom, max_zoom + 1):
+        n_tiles = 2**zoom
+        pixel = 360.0 / (_TILE_SIZE * n_tiles)  # The width of a pixel at the equator (in degrees)
+        # Simplify the geometries and round their coordinates to the size of a pixel
+        indices = np.flatnonzero(kinds_min_zoom <= zoom)
+        simplified = shp.simplify(geoms[indices], tolerance=pixel)
+        simplified = shp.set_precision(simplified, grid_size=10.0 ** math.floor(math.log10(pixel / 4)))
+        keep = ~shp.is_empty(simplified) & ~(is_line[indices] & (shp.length(simplified) < pixel))
+        indices, simplified = indices[keep], simplified[keep]
+
+        # The tiles overlapped by the bounding box of each geometry
+        bounds = shp.bounds(simplified)
+        x_min, x_max = _lon_to_tile_x(bounds[:, 0], n_tiles), _lon_to_tile_x(bounds[:, 2], n_tiles)
+        y_min, y_max = _lat_to_tile_y(bounds[:, 3], n_tiles), _lat_to_tile_y(bounds[:, 1], n_tiles)
+        nx = x_max - x_min + 1
+        counts = nx * (y_max - y_min + 1)
+        feature = np.repeat(np.arange(len(indices)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        tile_x = x_min[feature] + offsets % nx[feature]
+        tile_y = y_min[feature] + offsets // nx[feature]
+
+        # Clip the geometries that overlap several tiles
+        tile_geoms = simplified[feature]
+        split = counts[feature] > 1
+        if split.any():
+            west, south, east, north = _tile_bounds(tile_x[split], tile_y[split], n_tiles)
+            margin = 2 * pixel
+            boxes = shp.box(west - margin, south - margin, east + margin, north + margin)
+            tile_geoms[split] = shp.intersection(tile_geoms[split], boxes)
+        valid = ~shp.is_empty(tile_geoms)
+        feature, tile_x, tile_y, tile_geoms = feature[valid], tile_x[valid], tile_y[valid], tile_geoms[valid]
+
+        # Write the features of each tile
+        if len(feature) == 0:
+            continue
+        order = np.lexsort((tile_y, tile_x))
+        tile_keys = np.stack([tile_x[order], tile_y[order]], axis=1)
+        starts = np.flatnonzero(np.any(np.diff(tile_keys, axis=0, prepend=-1) != 0, axis=1))
+        stops = [*starts[1:].tolist(), len(order)]
+        geometries = geom_mappings(tile_geoms[order])
+        feature_properties = [properties[i] for i in indices[feature[order]].tolist()]
+        for start, stop in zip(starts.tolist(), stops, strict=True):
+            x, y = tile_keys[start].tolist()
+            tile_path = path / str(zoom) / str(x)
+            tile_path.mkdir(parents=True, exist_ok=True)
+            collection = {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": geometries[i], "properties": feature_properties[i]}
+                    for i in range(start, stop)
+                ],
+            }
+            _json_dump(collection, path=tile_path / f"{y}.geojson", indent=False, sort_keys=False)
+
+    # The TileJSON metadata
+    west, south, east, north = shp.total_bounds(geoms).tolist() if len(geoms) else (-180.0, -85.0, 180.0, 85.0)
+    metadata = {
+        "tilejson": "3.0.0",
+        "name": network.name,
+        "tiles": ["{z}/{x}/{y}.geojson"],
+        "minzoom": min_zoom,
+        "maxzoom": max_zoom,
+        "bounds": [west, south, east, north],
+        "center": [(west + east) / 2, (south + north) / 2, min_zoom],
+    }
+    _json_dump(metadata, path=path / _TILES_METADATA_FILE, indent=True, sort_keys=False)
+    return path
+
+
+_MAP_TILES_TEMPLATE = """
+{% macro script(this, kwargs) %}
+(function () {
+  var map = {{ this._parent.get_name() }};
+  var url = {{ this.url|tojson }}.replace(/\\/+$/, "");
+  var highlightColor = {{ this.highlight_color|tojson }};
+  var addTooltips = {{ this.add_tooltips|tojson }};
+  var styleProperties = {{ this.style_properties|tojson }};
+  var group = {{ this.group_name }};
+  var tiles = {};
+  var metadata = null;
+
+  function style(feature) {
+    var p = feature.properties;
+    return {
+      color: p.color, fillColor: p.color, fillOpacity: 0.8,
+      weight: p.weight || 2, radius: p.radius || 4, dashArray: p.dash_array || null
+    };
+  }
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+    });
+  }
+  function tooltip(properties) {
+    // The IDs and properties of the elements come from the tiles, they are escaped
+    var rows = [];
+    for (var key in properties) {
+      if (styleProperties.indexOf(key) < 0 && properties[key] !== null) {
+        var value = properties[key];
+        if (typeof value === "number") { value = value.toLocaleString(undefined, {maximumFractionDigits: 2}); }
+        rows.push("<tr><th>" + escapeHtml(key) + "</th><td>" + escapeHtml(value) + "</td></tr>");
+      }
+    }
+    return "<table>" + rows.join("") + "</table>";
+  }
+  function onEachFeature(feature, layer) {
+    if (addTooltips) { layer.bindTooltip(tooltip(feature.properties), {sticky: false}); }
+    layer.on("mouseover", function () { layer.setStyle({color: highlightColor, fillColor: highlightColor}); });
+    layer.on("mouseout", function () { layer.setStyle(style(feature)); });
+  }
+  function tileX(lon, n) { return Math.min(n - 1, Math.max(0, Math.floor((lon + 180) / 360 * n))); }
+  function tileY(lat, n) {
+    var rad = Math.max(-85.0511, Math.min(85.0511, lat)) * Math.PI / 180;
+    return Math.min(n - 1, Math.max(0, Math.floor((1 - Math.asinh(Math.tan(rad)) / Math.PI) / 2 * n)));
+  }
+  function update() {
+    var zoom = Math.max(metadata.minzoom, Math.min(metadata.maxzoom, map.getZoom()));
+    var n = Math.pow(2, zoom), bounds = map.getBounds(), wanted = {};
+    for (var x = tileX(bounds.getWest(), n); x <= tileX(bounds.getEast(), n); x++) {
+      for (var y = tileY(bounds.getNorth(), n); y <= tileY(bounds.getSouth(), n); y++) {
+        wanted[zoom + "/" + x + "/" + y] = true;
+      }
+    }
+    Object.keys(tiles).forEach(function (key) {
+      if (!wanted[key]) {
+        if (tiles[key] !== null) { group.removeLayer(tiles[key]); }
+        delete tiles[key];
+      }
+    });
+    Object.keys(wanted).forEach(function (key) {
+      if (key in tiles) { return; }
+      tiles[key] = null;
+      fetch(url + "/" + key + ".geojson")
+        .then(function (response) { return response.ok ? response.json() : null; })
+        .then(function (data) {
+          if (data === null || !(key in tiles) || tiles[key] !== null) { return; }
+          tiles[key] = L.geoJSON(data, {
+            style: style,
+            pointToLayer: function (feature, latlng) { return L.circleMarker(latlng, style(feature)); },
+            onEachFeature: onEachFeature
+          }).addTo(group);
+        });
+    });
+  }
+  fetch(url + "/{{ this.metadata_file }}")
+    .then(function (response) { return response.json(); })
+    .then(function (data) {
+      metadata = data;
+      {% if this.fit_bounds %}
+      var b = metadata.bounds;
+      map.fitBounds([[b[1], b[0]], [b[3], b[2]]], {padding: [30, 30]});
+      {% endif %}
+      map.on("moveend", update);
+      update();
+    });
+})();
+{% endmacro %}
+"""
+
+
+def _plot_interactive_map_tiles(
+    network: "ElectricalNetwork | rlfs.ElectricalNetwork",
+    network_tiles: str,
+    highlight_color: str,
+    map_kws: Mapping[str, Any] | None,
+    add_tooltips: bool,
+    fit_bounds: bool,
+) -> "folium.Map":
+    import folium
+    from branca.element import MacroElement
+    from jinja2 import Template
+
+    map_kws = dict(map_kws) if map_kws is not None else {}
+    if not fit_bounds and ("location" not in map_kws or "zoom_start" not in map_kws):
+        geoms = [bus.geometry for bus in network.buses.values() if bus.geometry is not None]
+        _set_map_location(map_kws, shp.box(*shp.total_bounds(geoms)))
+    map_kws.setdefault("tiles", "CartoDB Positron")
+
+    m = folium.Map(**map_kws)
+    network_layer = folium.FeatureGroup(name=network.name).add_to(m)
+    tiles_layer = MacroElement()
+    tiles_layer._template = Template(_MAP_TILES_TEMPLATE)
+    tiles_layer.url = network_tiles
+    tiles_layer.highlight_color = highlight_color
+    tiles_layer.add_tooltips = add_tooltips
+    tiles_layer.style_properties = [*_TILE_STYLE_PROPERTIES, "element_type"]
+    tiles_layer.group_name = network_layer.get_name()
+    tiles_layer.metadata_file = _TILES_METADATA_FILE
+    tiles_layer.fit_bounds = fit_bounds
+    tiles_layer.add_to(m)
+    folium.LayerControl(collapsed=False, draggable=True, position="bottomright").add_to(m)
+    return m
+
+
 #
 # Voltage profile plotting functions
 #
+def _get_voltage_profile_tree(
+    network: "ElectricalNetwork | rlfs.ElectricalNetwork",
+    *,
+    starting_bus_id: Id | None,
+    traverse_transformers: bool,
+    switch_length: float | None,
+    distance_unit: str,
+) -> tuple[Id, float, float, "_ShortestPathTree"]:
+    """The starting bus, the switch length, the distance factor and the shortest paths of a profile."""
+    if starting_bus_id is None:
+        starting_bus_id = network._get_starting_bus_id()
+    elif starting_bus_id not in network.buses:
+        raise ValueError(f"Bus {starting_bus_id!r} not found in the network.")
+
+    try:
+        distance_factor = Q_(1.0, units="km").m_as(distance_unit)
+    except PintError as e:
+        raise ValueError(f"Invalid distance unit: {distance_unit}") from e
+
+    if switch_length is None:
+        min_line_length = min((line._length for line in network.lines.values()), default=math.inf)
+        switch_length = min(2e-3, min_line_length)
+    elif switch_length < 0:
+        raise ValueError("switch_length must be non-negative.")
+
+    tree = network._get_shortest_path_tree(
+        starting_bus_id, traverse_transformers=traverse_transformers, switch_length=switch_length
+    )
+    return starting_bus_id, switch_length, distance_factor, tree
+
+
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class _VoltageProfile[NetT: ElectricalNetwork | rlfs.ElectricalNetwork, ModeT: Literal["min", "max", ""]]:
     network: NetT
@@ -1228,36 +1719,12 @@ class _VoltageProfile[NetT: ElectricalNetwork | rlfs.ElectricalNetwork, ModeT: L
         distance_unit: str = "km",
     ) -> Self:
         network._check_valid_results()
-
-        if starting_bus_id is None:
-            starting_bus_id = network._get_starting_bus_id()
-        elif starting_bus_id not in network.buses:
-            raise ValueError(f"Bus {starting_bus_id!r} not found in the network.")
-
-        try:
-            distance_factor = Q_(1.0, units="km").m_as(distance_unit)
-        except PintError as e:
-            raise ValueError(f"Invalid distance unit: {distance_unit}") from e
-
-        if switch_length is None:
-            min_line_length = min((line._length for line in network.lines.values()), default=math.inf)
-            switch_length = min(2e-3, min_line_length)
-        elif switch_length < 0:
-            raise ValueError("switch_length must be non-negative.")
-
-        distances = network._shortest_paths(
-            starting_bus_id,
-            weight=lambda et, eid: (
-                network.lines[eid]._length
-                if et == "line"
-                else (0.0 if traverse_transformers else None)
-                if et == "transformer"
-                else 0.0
-                if et == "regulator"
-                else (switch_length if network.switches[eid].closed else None)
-                if et == "switch"
-                else assert_never(et)
-            ),
+        starting_bus_id, switch_length, distance_factor, tree = _get_voltage_profile_tree(
+            network,
+            starting_bus_id=starting_bus_id,
+            traverse_transformers=traverse_transformers,
+            switch_length=switch_length,
+            distance_unit=distance_unit,
         )
 
         buses: dict[Id, VoltageProfileNode] = {}
@@ -1265,25 +1732,25 @@ class _VoltageProfile[NetT: ElectricalNetwork | rlfs.ElectricalNetwork, ModeT: L
         transformers: dict[Id, VoltageProfileEdge] = {}
         regulators: dict[Id, VoltageProfileEdge] = {}
         switches: dict[Id, VoltageProfileEdge] = {}
-        for bus_id, distance in distances.items():
-            buses[bus_id] = cls._handle_bus(network.buses[bus_id], distance=distance * distance_factor, mode=mode)
-        for line in network.lines.values():
-            if not traverse_transformers and line.bus1.id not in distances:
-                continue
-            lines[line.id] = cls._handle_line(line)
-        if traverse_transformers:
-            for tr in network.transformers.values():
-                transformers[tr.id] = cls._handle_transformer(tr)
+        for bus_id, distance in zip(tree.bus_ids, (tree.distances * distance_factor).tolist(), strict=True):
+            buses[bus_id] = cls._handle_bus(network.buses[bus_id], distance=distance, mode=mode)
+        for et, eid in zip(tree.edge_types, tree.edge_ids, strict=True):
+            if et == "line":
+                lines[eid] = cls._handle_line(network.lines[eid])
+            elif et == "transformer":
+                tr = network.transformers[eid]
+                transformers[eid] = cls._handle_transformer(tr)
                 buses[tr.bus_hv.id]["is_tr_bus"] = True
                 buses[tr.bus_lv.id]["is_tr_bus"] = True
-        for switch in network.switches.values():
-            if not switch.closed or (not traverse_transformers and switch.bus1.id not in distances):
-                continue
-            switches[switch.id] = cls._handle_switch(switch)
-        for reg in network.regulators.values():
-            regulators[reg.id] = cls._handle_regulator(reg)
-            buses[reg.bus1.id]["is_reg_bus"] = True
-            buses[reg.bus2.id]["is_reg_bus"] = True
+            elif et == "switch":
+                switches[eid] = cls._handle_switch(network.switches[eid])
+            elif et == "regulator":
+                reg = network.regulators[eid]
+                regulators[eid] = cls._handle_regulator(reg)
+                buses[reg.bus1.id]["is_reg_bus"] = True
+                buses[reg.bus2.id]["is_reg_bus"] = True
+            else:
+                assert_never(et)
 
         return cls(
             network=network,
@@ -1890,6 +2357,188 @@ class _VoltageProfile[NetT: ElectricalNetwork | rlfs.ElectricalNetwork, ModeT: L
         )
 
 
+class VoltageProfileData:
+    """The voltage profile of a network as arrays, refreshed from the load flow results.
+
+    The shortest paths from the starting bus are computed once and cached by the network until its
+    topology changes (lines lengths, switches states, new elements). :meth:`refresh` reads the
+    results of the network again without traversing it: dashboards showing the profiles of several
+    feeders over many time steps create one object per feeder and refresh them after each load
+    flow. Use :func:`voltage_profile` to plot a profile.
+
+    The voltages are the voltage levels in % of the nominal voltages of the buses, their minimum and
+    maximum over the phases for multi-phase networks. The loadings are in % and are ``nan`` for the
+    switches and for the lines without ampacities.
+
+    Attributes:
+        bus_ids (list[Id]):
+            The IDs of the buses, by increasing distance from the starting bus.
+
+        distances (numpy.ndarray[float]):
+            The distances of the buses from the starting bus, in ``distance_unit``.
+
+        predecessors (numpy.ndarray[int]):
+            The position in ``bus_ids`` of the predecessor of each bus on its shortest path from the
+            starting bus, -1 for the starting bus.
+
+        voltages_min, voltages_max (numpy.ndarray[float]):
+            The minimal and maximal voltage levels (%) of the phases of the buses.
+
+        min_voltage_levels, max_voltage_levels (numpy.ndarray[float]):
+            The voltage level limits (%) of the buses, ``nan`` if not set.
+
+        edge_types (list[BranchType]), edge_ids (list[Id]):
+            The types and IDs of the branches (lines, transformers, switches and regulators).
+
+        edge_from, edge_to (numpy.ndarray[int]):
+            The positions in ``bus_ids`` of the first and second buses of the branches.
+
+        loadings (numpy.ndarray[float]):
+            The loadings (%) of the branches, the maximum over the phases for multi-phase networks.
+    """
+
+    def __init__(
+        self,
+        network: "ElectricalNetwork | rlfs.ElectricalNetwork",
+        *,
+        starting_bus_id: Id | None = None,
+        traverse_transformers: bool = False,
+        switch_length: float | None = None,
+        distance_unit: str = "km",
+    ) -> None:
+        """VoltageProfileData constructor.
+
+        Args:
+            network:
+                The electrical network, with valid load flow results.
+
+            starting_bus_id:
+                The ID of the bus to start the profile from. If None, the bus of the source with the
+                highest voltage is used.
+
+            traverse_transformers:
+                If True, the entire network is traversed including transformers. If False,
+                transformers are not traversed.
+
+            switch_length:
+                The length in km to assign to switches when calculating distances. If None, it is
+                set to the minimum of 2 meters and the shortest line in the network.
+
+            distance_unit:
+                The unit of the distances. Defaults to "km".
+        """
+        self.network = network
+        self.starting_bus_id, self.switch_length, self._distance_factor, self._tree = _get_voltage_profile_tree(
+            network,
+            starting_bus_id=starting_bus_id,
+            traverse_transformers=traverse_transformers,
+            switch_length=switch_length,
+            distance_unit=distance_unit,
+        )
+        self.traverse_transformers = traverse_transformers
+        self.distance_unit = distance_unit
+        self._positions: dict[str, tuple[list[Id], np.ndarray]] = {}
+        self._set_topology()
+        self.refresh()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}: starting_bus_id={self.starting_bus_id!r}, {len(self.bus_ids)} buses, "
+            f"{len(self.edge_ids)} edges>"
+        )
+
+    def _set_topology(self) -> None:
+        tree = self._tree
+        for bus_id in tree.bus_ids:
+            if self.network.buses[bus_id]._nominal_voltage is None:
+                raise ValueError(
+                    f"The voltage profile requires buses to have their nominal voltage defined. "
+                    f"Bus {bus_id!r} has no nominal voltage."
+                )
+        self.bus_ids: list[Id] = tree.bus_ids
+        self.distances: FloatArray = tree.distances * self._distance_factor
+        self.predecessors = tree.predecessors
+        self.edge_types: list[BranchType] = tree.edge_types
+        self.edge_ids: list[Id] = tree.edge_ids
+        self.edge_from = tree.edge_from
+        self.edge_to = tree.edge_to
+        self._edge_masks = {
+            et: np.array([t == et for t in tree.edge_types], dtype=bool)
+            for et in ("line", "transformer", "switch", "regulator")
+        }
+        self._positions = {}
+
+    def _get_positions(self, key: str, ids: list[Id], wanted: list[Id]) -> np.ndarray:
+        """The positions of `wanted` in `ids`, -1 if missing, cached while `ids` does not change."""
+        cached = self._positions.get(key)
+        if cached is None or cached[0] != ids:
+            lookup = {eid: i for i, eid in enumerate(ids)}
+            cached = (ids, np.array([lookup.get(eid, -1) for eid in wanted], dtype=np.intp))
+            self._positions[key] = cached
+        return cached[1]
+
+    def refresh(self) -> None:
+        """Read the voltages and the loadings from the current load flow results of the network.
+
+        The shortest paths are computed again only if the topology of the network has changed.
+        """
+        network = self.network
+        network._check_valid_results()
+        tree = network._get_shortest_path_tree(
+            self.starting_bus_id, traverse_transformers=self.traverse_transformers, switch_length=self.switch_length
+        )
+        if tree is not self._tree:
+            self._tree = tree
+            self._set_topology()
+
+        res_limits = network._get_res_limits()
+        ids, u_high, u_low, u_min, u_max = _group_max_min(res_limits["bus"])
+        pos = self._get_positions("bus", ids, self.bus_ids)
+        self.voltages_min: FloatArray = 100 * u_low[pos]
+        self.voltages_max: FloatArray = 100 * u_high[pos]
+        self.min_voltage_levels: FloatArray = 100 * u_min[pos]
+        self.max_voltage_levels: FloatArray = 100 * u_max[pos]
+
+        loadings = np.full(len(self.edge_ids), np.nan)
+        for et in ("line", "transformer"):
+            mask = self._edge_masks[et]
+            if not mask.any():
+                continue
+            ids, values, _, _, _ = _group_max_min(res_limits[et])
+            pos = self._get_positions(et, ids, [eid for eid, m in zip(self.edge_ids, mask, strict=True) if m])
+            if len(values) > 0:  # the lines without ampacities have no loadings
+                loadings[mask] = np.where(pos >= 0, 100 * values[pos], np.nan)
+        mask = self._edge_masks["regulator"]
+        if mask.any():
+            loadings[mask] = [
+                100 * network.regulators[eid]._res_loading_getter(warning=False)  # type: ignore
+                for eid, m in zip(self.edge_ids, mask, strict=True)
+                if m
+            ]
+        self.loadings: FloatArray = loadings
+
+    def segments(self, mode: Literal["min", "max"] = "min") -> FloatArray:
+        """The segments of the branches in the (distance, voltage) plane.
+
+        Args:
+            mode:
+                The voltages of the buses to use, ``"min"`` or ``"max"`` over their phases.
+
+        Returns:
+            An array of shape ``(n_edges, 2, 2)`` where ``segments[i] = [[d1, v1], [d2, v2]]`` are
+            the coordinates of the buses of the branch ``i``, usable with a matplotlib
+            ``LineCollection`` for example.
+        """
+        if mode == "min":
+            voltages = self.voltages_min
+        elif mode == "max":
+            voltages = self.voltages_max
+        else:
+            raise ValueError(f"Invalid mode {mode!r}, expected 'min' or 'max'.")
+        points = np.stack([self.distances, voltages], axis=-1)
+        return np.stack([points[self.edge_from], points[self.edge_to]], axis=1)
+
+
 def voltage_profile(
     network: ElectricalNetwork,
     *,
@@ -1946,3 +2595,53 @@ def voltage_profile(
         switch_length=switch_length,
         distance_unit=distance_unit,
     )
+
+
+def voltage_profile_data(
+    network: ElectricalNetwork,
+    *,
+    starting_bus_id: Id | None = None,
+    traverse_transformers: bool = False,
+    switch_length: float | None = None,
+    distance_unit: str = "km",
+) -> VoltageProfileData:
+    """Get the data of the voltage profile of the network as arrays.
+
+    Unlike :func:`voltage_profile`, the returned object does not plot the profile, it holds the
+    distances and voltages of the buses and the loadings of the branches as numpy arrays. Call its
+    :meth:`~VoltageProfileData.refresh` method after each load flow to update the results without
+    traversing the network again.
+
+    Args:
+        network:
+            The electrical network to create the voltage profile for.
+
+        starting_bus_id:
+            The ID of the bus to start the profile from. If None, the bus of the source with the
+            highest voltage is used.
+
+        traverse_transformers:
+            If True, the entire network is traversed including transformers. If False, transformers
+            are not traversed.
+
+        switch_length:
+            The length in km to assign to switches when calculating distances. If None, it is set to
+            the minimum of 2 meters and the shortest line in the network. Must be non-negative.
+
+        distance_unit:
+            The unit to use for distances in the profile. Defaults to "km".
+
+    Returns:
+        The arrays of the voltage profile.
+    """
+    if not network.is_multi_phase:
+        raise TypeError(
+            "Only multi-phase networks are supported. Did you mean to use rlfs.plotting.voltage_profile_data?"
+        )
+    return VoltageProfileData(
+        network,
+        starting_bus_id=starting_bus_id,
+        traverse_transformers=traverse_transformers,
+        switch_length=switch_length,
+        distance_unit=distance_unit,
+    )
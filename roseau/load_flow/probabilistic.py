@@ -0,0 +1,482 @@
+"""
+This module provides the probabilistic (Monte Carlo) load flow of networks.
+
+A :class:`PowerDistribution` gives the probability distribution of the powers of power loads, of
+consumption or of generation. :meth:`ElectricalNetwork.solve_probabilistic_load_flow()
+<roseau.load_flow.ElectricalNetwork.solve_probabilistic_load_flow>` draws batches of samples of the
+powers of the loads, solves the load flow of each sample starting from the solution of the previous
+one and stops when the quantiles of the voltage levels and of the loadings of the elements do not
+change anymore. It returns a :class:`ProbabilisticAnalysis` holding the results of every sample.
+"""
+
+import contextlib
+import dataclasses
+import logging
+import math
+import os
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from roseau.load_flow._parallel import DIVERGENCE_CODES, BoolMatrix, IntArray, solve_in_worker, worker_pool
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import ComplexArray, FloatArray, Id, JsonDict
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+type FloatMatrix = np.ndarray[tuple[int, int], np.dtype[np.float64]]
+type ComplexMatrix = np.ndarray[tuple[int, int], np.dtype[np.complex128]]
+type Sampler = Callable[[np.random.Generator, tuple[int, int]], Any]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PowerDistribution:
+    """The probability distribution of the powers of power loads.
+
+    The samples are the total powers of the loads: complex powers (VA) or active powers (W) which
+    are given the reactive powers of the power factor. The power of a multi-phase load is split
+    equally between its phases. Use negative powers for generation.
+    """
+
+    loads: tuple[Id, ...] | None
+    """The IDs of the power loads, ``None`` for all the power loads of the network that are not
+    part of another distribution."""
+
+    distribution: FloatArray | ComplexArray | Sampler | Any
+    """The distribution of the powers. It is either:
+
+    - an array of empirical samples of the powers, drawn with replacement;
+    - an object with a ``rvs(size=..., random_state=...)`` method such as the frozen
+      distributions of :mod:`scipy.stats`;
+    - a function ``f(rng, size)`` that draws an array of the given size with the
+      :class:`numpy.random.Generator` ``rng``.
+
+    The distribution must be picklable to be used by several worker processes.
+    """
+
+    _: dataclasses.KW_ONLY
+
+    independent: bool = True
+    """If ``True`` (default), the powers of the loads are drawn independently. Otherwise, all the
+    loads have the same power in each sample, for example the production of nearby photovoltaic
+    panels."""
+
+    power_factor: float = 1.0
+    """The power factor of the loads when the samples are active powers."""
+
+    def __post_init__(self) -> None:
+        if self.loads is not None:
+            loads = (self.loads,) if isinstance(self.loads, (str, int)) else tuple(self.loads)
+            object.__setattr__(self, "loads", loads)
+        if not (0.0 < self.power_factor <= 1.0):
+            msg = f"The power factor must be in the interval (0, 1], got {self.power_factor!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+        if not (callable(self.distribution) or hasattr(self.distribution, "rvs")):
+            samples = np.asarray(self.distribution)
+            if samples.ndim != 1 or samples.size == 0 or samples.dtype.kind not in "iufc":
+                msg = (
+                    f"The empirical samples of a power distribution must be a non-empty 1D array of "
+                    f"numbers, got an array of shape {samples.shape} and type {samples.dtype}."
+                )
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+            object.__setattr__(self, "distribution", samples)
+
+    def _draw(self, rng: np.random.Generator, n_samples: int, n_loads: int) -> ComplexMatrix:
+        """Draw the powers of the loads (columns) of each sample (rows)."""
+        size = (n_samples, n_loads if self.independent else 1)
+        if isinstance(self.distribution, np.ndarray):
+            values = rng.choice(self.distribution, size=size)
+        elif hasattr(self.distribution, "rvs"):
+            values = self.distribution.rvs(size=size, random_state=rng)
+        else:
+            values = self.distribution(rng, size)
+        values = np.asarray(values)
+        if values.dtype.kind != "c":
+            values = values * complex(1.0, math.tan(math.acos(self.power_factor)))
+        return np.broadcast_to(values.astype(np.complex128, copy=False), (n_samples, n_loads))
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class ProbabilisticAnalysis:
+    """The results of a probabilistic load flow.
+
+    It is returned by :meth:`ElectricalNetwork.solve_probabilistic_load_flow()
+    <roseau.load_flow.ElectricalNetwork.solve_probabilistic_load_flow>`. The results are stored in
+    arrays indexed by the samples (rows) and the elements (columns). The voltage levels of the buses
+    and the loadings of the branches are reduced over their phases. The results of the samples whose
+    load flow did not converge are NaN.
+    """
+
+    converged: bool
+    """Whether the quantiles of the results converged before the maximal number of samples."""
+
+    status: np.ndarray[tuple[int], np.dtype[np.str_]]
+    """The status of each sample: ``"solved"`` or ``"diverged"`` if its load flow did not converge."""
+
+    iterations: IntArray
+    """The number of iterations of the load flow of each sample."""
+
+    residuals: FloatArray
+    """The residual error of the load flow of each sample, NaN if it did not converge."""
+
+    load_ids: list[Id]
+    """The IDs of the loads whose powers are drawn, the columns of :attr:`powers`."""
+
+    powers: ComplexMatrix
+    """The total power of each load in each sample (VA)."""
+
+    bus_ids: list[Id]
+    """The IDs of the buses that have a nominal voltage, the columns of the bus results."""
+
+    line_ids: list[Id]
+    """The IDs of the lines that have ampacities, the columns of the line results."""
+
+    transformer_ids: list[Id]
+    """The IDs of the transformers, the columns of the transformer results."""
+
+    buses_min_voltage_levels: FloatMatrix
+    """The minimal voltage level of the phases of each bus in each sample."""
+
+    buses_max_voltage_levels: FloatMatrix
+    """The maximal voltage level of the phases of each bus in each sample."""
+
+    lines_loadings: FloatMatrix
+    """The maximal loading of the phases of each line in each sample."""
+
+    transformers_loadings: FloatMatrix
+    """The loading of each transformer in each sample."""
+
+    buses_violated: BoolMatrix
+    """Whether the voltage limits of each bus are violated in each sample."""
+
+    lines_violated: BoolMatrix
+    """Whether the loading of each line exceeds its maximal loading in each sample."""
+
+    transformers_violated: BoolMatrix
+    """Whether the loading of each transformer exceeds its maximal loading in each sample."""
+
+    convergence: pd.DataFrame
+    """The largest change of the monitored quantiles after each batch of samples.
+
+    It is indexed by the number of samples solved so far. The change of the first batch is NaN.
+    """
+
+    def __repr__(self) -> str:
+        n_solved = np.count_nonzero(self.status == "solved")
+        return (
+            f"<{type(self).__name__}: {self.n_samples} samples, solved={n_solved}, "
+            f"diverged={self.n_samples - n_solved}, converged={self.converged}>"
+        )
+
+    @property
+    def n_samples(self) -> int:
+        """The number of samples."""
+        return len(self.status)
+
+    @property
+    def violation_probabilities(self) -> pd.Series:
+        """The probability that the limits of each element are violated.
+
+        It is the fraction of the solved samples where the limits are violated, indexed by the type
+        and the ID of the elements.
+        """
+        solved = self.status == "solved"
+        n_solved = max(np.count_nonzero(solved), 1)
+        index, values = _elements_index(self), []
+        for violated in (self.buses_violated, self.lines_violated, self.transformers_violated):
+            values.append(np.count_nonzero(violated[solved], axis=0) / n_solved)
+        return pd.Series(np.concatenate(values, dtype=np.float64), index=index, name="probability")
+
+    def get_quantiles(self, q: float) -> pd.DataFrame:
+        """Get the quantiles of the results of the elements over the solved samples.
+
+        Args:
+            q:
+                The probability of the quantile, between 0 and 1. For example, use ``0.95`` to get
+                the voltage levels and loadings exceeded by 5% of the samples.
+
+        Returns:
+            A dataframe indexed by the type and the ID of the elements, with the quantiles of the
+            ``min_voltage_level`` and of the ``max_voltage_level`` of the buses and of the
+            ``loading`` of the lines and transformers. The values that do not apply to the element
+            are NaN.
+        """
+        if not (0.0 <= q <= 1.0):
+            msg = f"The probability of the quantile must be between 0 and 1, got {q!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+        solved = self.status == "solved"
+        n_buses, n_branches = len(self.bus_ids), len(self.line_ids) + len(self.transformer_ids)
+        nan_buses, nan_branches = np.full(n_buses, np.nan), np.full(n_branches, np.nan)
+        loadings = np.concatenate([self.lines_loadings, self.transformers_loadings], axis=1)
+        return pd.DataFrame(
+            {
+                "min_voltage_level": np.concatenate(
+                    [_quantile(self.buses_min_voltage_levels[solved], q), nan_branches]
+                ),
+                "max_voltage_level": np.concatenate(
+                    [_quantile(self.buses_max_voltage_levels[solved], q), nan_branches]
+                ),
+                "loading": np.concatenate([nan_buses, _quantile(loadings[solved], q)]),
+            },
+            index=_elements_index(self),
+        )
+
+
+def _elements_index(analysis: ProbabilisticAnalysis) -> pd.MultiIndex:
+    ids = (("bus", analysis.bus_ids), ("line", analysis.line_ids), ("transformer", analysis.transformer_ids))
+    return pd.MultiIndex.from_tuples(
+        [(element_type, element_id) for element_type, element_ids in ids for element_id in element_ids],
+        names=["element_type", "element_id"],
+    )
+
+
+def _quantile(values: FloatMatrix, q: float | Sequence[float]) -> FloatArray:
+    """The quantiles of the columns of the values, NaN if there are no values."""
+    if len(values) == 0:
+        return np.full(np.shape(q) + values.shape[1:], np.nan)
+    return np.quantile(values, q, axis=0)
+
+
+class _ProbabilisticSolver:
+    """Solve the samples on a private copy of a network that has the results of the base case."""
+
+    def __init__(self, network: "AbstractNetwork", load_ids: Sequence[Id], load_flow_kwargs: JsonDict) -> None:
+        self.network = network
+        self.load_flow_kwargs = load_flow_kwargs
+        loads = network._elements_by_type["load"]
+        self.loads = [loads[load_id] for load_id in load_ids]
+        # The load flows of the samples start from the solution of the base case
+        for bus in network._elements_by_type["bus"].values():
+            bus._warm_start()
+        self.sizes = {et: len(limits.ids) for et, limits in network._get_res_limits().items()}
+
+    def set_powers(self, powers: ComplexArray) -> None:
+        """Set the total powers of the loads."""
+        # The powers are written directly, the checks of the setters of the loads are only needed
+        # for the flexible loads
+        multi_phase = self.network.is_multi_phase
+        for load, power in zip(self.loads, powers.tolist(), strict=True):
+            if load.is_flexible:
+                if multi_phase:
+                    load.powers = np.full(load._size, power / load._size, dtype=np.complex128)
+                else:
+                    load.power = power
+            elif multi_phase:
+                load._powers = np.full(load._size, power / load._size, dtype=np.complex128)
+                if load._cy_initialized:
+                    load._cy_element.update_powers(load._powers)
+            else:
+                load._power = power
+                if load._cy_initialized:
+                    load._cy_element.update_power(power / 3.0)
+        self.network._results_valid = False
+
+    def solve(self, powers: ComplexMatrix) -> tuple[Any, ...]:
+        """Solve the samples, given by the total powers of the loads (columns) of each sample (rows)."""
+        n = len(powers)
+        status = np.full(n, "solved", dtype="<U8")
+        iterations = np.zeros(n, dtype=np.int32)
+        residuals = np.full(n, np.nan, dtype=np.float64)
+        minima = {et: np.full((n, size), np.nan) for et, size in self.sizes.items()}
+        maxima = {et: np.full((n, size), np.nan) for et, size in self.sizes.items()}
+        violated = {et: np.zeros((n, size), dtype=np.bool_) for et, size in self.sizes.items()}
+        for i in range(n):
+            self.set_powers(powers[i])
+            try:
+                iterations[i], residuals[i] = self.network.solve_load_flow(**self.load_flow_kwargs)
+            except RoseauLoadFlowException as e:
+                if e.code not in DIVERGENCE_CODES:
+                    raise
+                status[i] = "diverged"
+                continue
+            for et, limits in self.network._get_res_limits().items():
+                # Reduce the values of the phases of each element
+                minimum, maximum = np.full(self.sizes[et], np.inf), np.full(self.sizes[et], -np.inf)
+                np.minimum.at(minimum, limits.element_index, limits.values)
+                np.maximum.at(maximum, limits.element_index, limits.values)
+                minima[et][i], maxima[et][i] = minimum, maximum
+                np.logical_or.at(violated[et][i], limits.element_index, limits.violated)
+        return (
+            status,
+            iterations,
+            residuals,
+            minima["bus"],
+            maxima["bus"],
+            maxima["line"],
+            maxima["transformer"],
+            violated["bus"],
+            violated["line"],
+            violated["transformer"],
+        )
+
+
+def _resolve_loads(
+    network: "AbstractNetwork", distributions: Sequence[PowerDistribution]
+) -> tuple[list[Id], list[slice]]:
+    """Get the IDs of the loads of the distributions and the columns of each distribution."""
+    loads = network._elements_by_type["load"]
+    assigned: dict[Id, PowerDistribution] = {}
+    for distribution in distributions:
+        for load_id in distribution.loads or ():
+            if load_id not in loads:
+                msg = f"Load {load_id!r} of a power distribution is not part of the network."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_ID)
+            if loads[load_id].type != "power":  # type: ignore
+                load_type = loads[load_id].type  # type: ignore
+                msg = f"Load {load_id!r} of a power distribution must be a power load, not a {load_type} load."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE)
+            if load_id in assigned:
+                msg = f"Load {load_id!r} is part of several power distributions."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+            assigned[load_id] = distribution
+    load_ids: list[Id] = []
+    columns: list[slice] = []
+    for distribution in distributions:
+        if distribution.loads is None:
+            ids = [load_id for load_id, load in loads.items() if load.type == "power" and load_id not in assigned]  # type: ignore
+        else:
+            ids = list(distribution.loads)
+        columns.append(slice(len(load_ids), len(load_ids) + len(ids)))
+        load_ids.extend(ids)
+    if len(set(load_ids)) != len(load_ids):
+        msg = "Only one power distribution can apply to all the power loads of the network."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+    return load_ids, columns
+
+
+def solve_probabilistic_load_flow(
+    network: "AbstractNetwork",
+    distributions: Iterable[PowerDistribution],
+    *,
+    seed: int | None,
+    batch_size: int,
+    min_samples: int,
+    max_samples: int,
+    quantiles: Sequence[float],
+    quantiles_tolerance: float,
+    n_jobs: int | None,
+    load_flow_kwargs: JsonDict,
+) -> ProbabilisticAnalysis:
+    """Solve a probabilistic load flow, see `ElectricalNetwork.solve_probabilistic_load_flow`."""
+    distributions = list(distributions)
+    load_ids, columns = _resolve_loads(network, distributions)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    for name, value in (("batch size", batch_size), ("number of jobs", n_jobs), ("maximal samples", max_samples)):
+        if value < 1:
+            msg = f"The {name} must be positive, got {value!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+    if min_samples > max_samples:
+        msg = f"The minimal number of samples ({min_samples}) is greater than the maximal one ({max_samples})."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+    if not all(0.0 <= q <= 1.0 for q in quantiles):
+        msg = f"The probabilities of the quantiles must be between 0 and 1, got {list(quantiles)}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW)
+
+    # The base case, used to warm start the load flows of the samples
+    network.solve_load_flow(**load_flow_kwargs)
+    load_flow_kwargs = load_flow_kwargs | {"warm_start": True}
+
+    # The samples are drawn in this process: the same seed gives the same samples whatever the
+    # number of worker processes
+    rng = np.random.default_rng(seed)
+    n_jobs = min(n_jobs, batch_size)
+    parts: list[tuple[Any, ...]] = []
+    powers_parts: list[ComplexMatrix] = []
+    convergence: list[tuple[int, float]] = []
+    previous: FloatArray | None = None
+    converged = False
+    n_samples = 0
+    with contextlib.ExitStack() as stack:
+        if n_jobs <= 1:
+            # Solved on a copy, the network keeps the results of the base case
+            solver = _ProbabilisticSolver(network.copy(include_results=True), load_ids, load_flow_kwargs)
+            solve = solver.solve
+        else:
+            executor = stack.enter_context(
+                worker_pool(n_jobs, _ProbabilisticSolver, network, load_ids, load_flow_kwargs)
+            )
+
+            def solve(powers: ComplexMatrix) -> tuple[Any, ...]:
+                chunk_size = math.ceil(len(powers) / n_jobs)
+                chunks = [powers[i : i + chunk_size] for i in range(0, len(powers), chunk_size)]
+                # The results are merged in the order of the samples
+                return tuple(
+                    np.concatenate(arrays) for arrays in zip(*executor.map(solve_in_worker, chunks), strict=True)
+                )
+
+        while n_samples < max_samples:
+            size = min(batch_size, max_samples - n_samples)
+            powers = np.empty((size, len(load_ids)), dtype=np.complex128)
+            for distribution, cols in zip(distributions, columns, strict=True):
+                powers[:, cols] = distribution._draw(rng, size, cols.stop - cols.start)
+            powers_parts.append(powers)
+            parts.append(solve(powers))
+            n_samples += size
+
+            # The monitored statistics: the quantiles of the results of the solved samples
+            status, _, _, *values = (np.concatenate(arrays) for arrays in zip(*parts, strict=True))
+            solved = status == "solved"
+            statistics = np.concatenate([_quantile(v[solved], quantiles).ravel() for v in values[:4]])
+            if previous is None or np.isnan(statistics).any():
+                change = np.nan
+            else:
+                change = float(np.max(np.abs(statistics - previous), initial=0.0))
+            convergence.append((n_samples, change))
+            previous = statistics
+            if n_samples >= min_samples and change <= quantiles_tolerance:
+                converged = True
+                break
+
+    if not converged:
+        logger.warning(f"The quantiles of the probabilistic load flow did not converge after {n_samples} samples.")
+    (
+        status,
+        iterations,
+        residuals,
+        buses_min_voltage_levels,
+        buses_max_voltage_levels,
+        lines_loadings,
+        transformers_loadings,
+        buses_violated,
+        lines_violated,
+        transformers_violated,
+    ) = (np.concatenate(arrays) for arrays in zip(*parts, strict=True))
+    limits = network._get_res_limits()
+    return ProbabilisticAnalysis(
+        converged=converged,
+        status=status,
+        iterations=iterations,
+        residuals=residuals,
+        load_ids=load_ids,
+        powers=np.concatenate(powers_parts),
+        bus_ids=list(limits["bus"].ids),
+        line_ids=list(limits["line"].ids),
+        transformer_ids=list(limits["transformer"].ids),
+        buses_min_voltage_levels=buses_min_voltage_levels,
+        buses_max_voltage_levels=buses_max_voltage_levels,
+        lines_loadings=lines_loadings,
+        transformers_loadings=transformers_loadings,
+        buses_violated=buses_violated,
+        lines_violated=lines_violated,
+        transformers_violated=transformers_violated,
+        convergence=pd.DataFrame(
+            {"max_change": np.array([change for _, change in convergence], dtype=np.float64)},
+            index=pd.Index([n for n, _ in convergence], name="n_samples"),
+        ),
+    )
@@ -0,0 +1,263 @@
+"""
+This module provides the reduction of sub-networks to equivalent loads.
+
+A sub-network, for instance a LV network supplied by a MV/LV transformer, can be replaced by an
+equivalent load computed from the solved state of the network. This reduces the size of the
+network for studies that focus on another part of it (e.g. the MV network). The reduced sub-network
+can be restored later with :meth:`NetworkReduction.expand`.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Generic, get_args
+
+from typing_extensions import TypeVar
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import Id, ReductionModel
+from roseau.load_flow.utils.helpers import one_or_more_repr
+from roseau.load_flow.utils.mixins import AbstractElement, AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+_N = TypeVar("_N", bound=AbstractNetwork, default=AbstractNetwork)
+
+_BRANCH_TYPES = frozenset(("line", "switch", "transformer", "regulator"))
+_BUS_LIKE_TYPES = _BRANCH_TYPES | {"bus", "ground"}
+
+
+class NetworkReduction(Generic[_N]):
+    """The reduction of a sub-network to an equivalent load.
+
+    The buses of the sub-network and the elements connected only to them are removed from the
+    network. The sub-network must be connected to the rest of the network through a single bus,
+    called the boundary bus, which is kept. The elements of the sub-network that are connected to
+    the boundary bus (loads, sources and branches to the removed buses) are replaced by a load
+    connected to the boundary bus. This load draws the currents that the sub-network drew in the
+    last load flow, modelled as constant powers, constant currents or constant impedances.
+
+    The equivalent is exact at the operating point of the last load flow only. Currents flowing
+    through the ground connections of the removed buses are not represented.
+
+    Use :meth:`ElectricalNetwork.reduce() <roseau.load_flow.ElectricalNetwork.reduce>` to create a
+    reduction.
+    """
+
+    def __init__(
+        self, network: _N, buses: Iterable[Id], *, model: ReductionModel = "power", load_id: Id | None = None
+    ) -> None:
+        """NetworkReduction constructor.
+
+        Args:
+            network:
+                The network with load flow results to reduce. It is not modified.
+
+            buses:
+                The IDs of the buses of the sub-network to reduce, including the boundary bus.
+
+            model:
+                The model of the equivalent load: ``"power"`` (the default), ``"current"`` or
+                ``"impedance"``.
+
+            load_id:
+                The ID of the equivalent load. Defaults to ``"<boundary bus ID>_equivalent"``.
+        """
+        models = get_args(ReductionModel.__value__)
+        if model not in models:
+            msg = f"Invalid model {model!r} for the network reduction, expected one of {models}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION)
+        network._check_valid_results()
+
+        sub_buses, boundary_bus = _get_sub_buses(network, buses)
+        removed = _get_removed_elements(network, sub_buses, boundary_bus)
+        moved_potential_ref = _get_moved_potential_ref(network, removed, boundary_bus)
+
+        # Snapshot the removed elements so that they can be restored by `expand()`
+        memo: dict[int, AbstractElement] = {}
+        removed_elements = [
+            e for elements in network._elements_by_type.values() for e in elements.values() if e in removed
+        ]
+        snapshot = [e._copy_new(memo) for e in removed_elements]
+        for e in removed_elements:
+            for connected_element in e._connected_elements:
+                if connected_element not in removed:
+                    memo[id(connected_element)] = connected_element
+        for e, new_e in zip(removed_elements, snapshot, strict=True):
+            e._copy_to(new_e, memo, include_results=False)
+
+        # Create the reduced network with the equivalent load connected to its boundary bus
+        kept = [e for elements in network._elements_by_type.values() for e in elements.values() if e not in removed]
+        new_elements = network._copy_elements(kept, include_results=False)
+        new_boundary_bus = new_elements[kept.index(boundary_bus)]
+        internal_elements = []
+        for e in boundary_bus._connected_elements:
+            if e not in removed:
+                continue
+            elif e.element_type in _BRANCH_TYPES:
+                internal_elements.extend(side for side in (e._side1, e._side2) if side.bus is boundary_bus)  # type: ignore
+            elif e.element_type in ("load", "source"):
+                internal_elements.append(e)
+        self.load_id: Id = f"{boundary_bus.id}_equivalent" if load_id is None else load_id
+        new_elements.append(
+            network._create_equivalent_load(
+                id=self.load_id, bus=boundary_bus, new_bus=new_boundary_bus, elements=internal_elements, model=model
+            )
+        )
+        added: dict[str, set[Id]] = {"load": {self.load_id}}
+        if moved_potential_ref is not None:
+            new_elements.append(type(moved_potential_ref)(id=moved_potential_ref.id, element=new_boundary_bus))
+            added["potential ref"] = {moved_potential_ref.id}
+        reduced = network._from_copied_elements(new_elements)
+
+        self.network: _N = reduced
+        """The reduced network."""
+        self.bus_id: Id = boundary_bus.id
+        """The ID of the boundary bus the equivalent load is connected to."""
+        self.model: ReductionModel = model
+        """The model of the equivalent load."""
+        self._snapshot = snapshot
+        self._added = added
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}: bus_id={self.bus_id!r}, load_id={self.load_id!r}, model={self.model!r}, "
+            f"nb_removed_elements={len(self._snapshot)}>"
+        )
+
+    @property
+    def removed_elements_ids(self) -> dict[str, list[Id]]:
+        """The IDs of the elements removed by the reduction, indexed by element type."""
+        result: dict[str, list[Id]] = {}
+        for e in self._snapshot:
+            result.setdefault(e.element_type, []).append(e.id)
+        return result
+
+    def expand(self, network: _N | None = None) -> _N:
+        """Restore the reduced sub-network.
+
+        Args:
+            network:
+                The reduced network to expand. It may have been modified since the reduction as
+                long as its boundary bus and the elements the sub-network was connected to (e.g. the
+                grounds) still exist. Defaults to :attr:`network`.
+
+        Returns:
+            A new network made of the elements of ``network``, without the equivalent load, and of
+            the elements of the sub-network as they were when it was reduced. It has no results.
+        """
+        if network is None:
+            network = self.network
+        snapshot_ids = {id(e) for e in self._snapshot}
+        elements = [
+            e
+            for element_type, elements in network._elements_by_type.items()
+            for e in elements.values()
+            if e.id not in self._added.get(element_type, ())
+        ]
+        aliases: dict[AbstractElement, AbstractElement] = {}
+        for e in self._snapshot:
+            for connected_element in e._connected_elements:
+                if id(connected_element) in snapshot_ids or connected_element in aliases:
+                    continue
+                try:
+                    aliases[connected_element] = network._elements_by_type[connected_element.element_type][
+                        connected_element.id
+                    ]
+                except KeyError:
+                    msg = (
+                        f"Cannot expand the reduced sub-network: the {connected_element._element_info} it "
+                        f"was connected to is not part of the network."
+                    )
+                    logger.error(msg)
+                    raise RoseauLoadFlowException(
+                        msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+                    ) from None
+        new_elements = network._copy_elements([*elements, *self._snapshot], include_results=False, aliases=aliases)
+        return network._from_copied_elements(new_elements)
+
+
+def _get_sub_buses(network: AbstractNetwork, buses: Iterable[Id]) -> tuple[set[AbstractElement], AbstractElement]:
+    """Get the buses of the sub-network to reduce and its boundary bus."""
+    network_buses = network._elements_by_type["bus"]
+    bus_ids = set(buses)
+    if not bus_ids:
+        msg = "Cannot reduce an empty sub-network, at least one bus is expected."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION)
+    unknown_ids = bus_ids - network_buses.keys()
+    if unknown_ids:
+        buses_repr, be = one_or_more_repr(sorted(unknown_ids, key=str), "Bus", "Buses")
+        msg = f"{buses_repr} {be} not part of the network."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID)
+    sub_buses = {network_buses[bus_id] for bus_id in bus_ids}
+
+    # The boundary bus is connected to the rest of the network by branches
+    boundary_buses = [
+        bus
+        for bus in sub_buses
+        if any(
+            e.element_type in _BRANCH_TYPES and (e.bus1 not in sub_buses or e.bus2 not in sub_buses)  # type: ignore
+            for e in bus._connected_elements
+        )
+    ]
+    if len(boundary_buses) != 1:
+        if boundary_buses:
+            boundary_ids = sorted(repr(bus.id) for bus in boundary_buses)
+            reason = f"through the buses {', '.join(boundary_ids)}"
+        else:
+            reason = "at all"
+        msg = (
+            f"The sub-network to reduce must be connected to the rest of the network through a "
+            f"single bus, it is connected {reason}."
+        )
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION)
+    return sub_buses, boundary_buses[0]
+
+
+def _get_removed_elements(
+    network: AbstractNetwork, sub_buses: set[AbstractElement], boundary_bus: AbstractElement
+) -> set[AbstractElement]:
+    """Get the elements removed by the reduction.
+
+    These are the buses other than the boundary bus, the branches between the buses of the
+    sub-network, the loads and sources of the sub-network and the elements connected only to those.
+    """
+    removed = sub_buses - {boundary_bus}
+    for bus in sub_buses:
+        for e in bus._connected_elements:
+            if e.element_type in _BRANCH_TYPES:
+                if e.bus1 in sub_buses and e.bus2 in sub_buses:  # type: ignore
+                    removed.add(e)
+            elif e.element_type in ("load", "source"):
+                removed.add(e)
+    for e in list(removed):
+        for connected_element in e._connected_elements:
+            if connected_element.element_type not in _BUS_LIKE_TYPES:
+                removed.add(connected_element)  # ground connections and potential refs
+    for ground in network._elements_by_type.get("ground", {}).values():
+        if any(e in removed for e in ground._connected_elements) and all(
+            e in removed or e.element_type == "potential ref" for e in ground._connected_elements
+        ):
+            removed.add(ground)
+            removed.update(ground._connected_elements)
+    return removed
+
+
+def _get_moved_potential_ref(
+    network: AbstractNetwork, removed: set[AbstractElement], boundary_bus: AbstractElement
+) -> AbstractElement | None:
+    """Get the removed potential reference of the section of the boundary bus, if any."""
+    section_ids = set(boundary_bus.get_connected_buses())  # type: ignore
+    for p_ref in network._elements_by_type.get("potential ref", {}).values():
+        if p_ref not in removed:
+            continue
+        element = p_ref.element  # type: ignore
+        if element.element_type == "bus":
+            if element.id in section_ids:
+                return p_ref
+        elif any(gc.element.id in section_ids for gc in element.connections):
+            return p_ref
+    return None
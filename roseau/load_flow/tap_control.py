@@ -0,0 +1,237 @@
+"""
+This module provides the discrete tap control of transformers with on-load tap changers (OLTC).
+
+A :class:`TapChanger` describes the tap changer of a transformer: its tap range, its tap step and
+the voltage band it maintains at a controlled bus.
+:meth:`ElectricalNetwork.solve_load_flow_with_tap_changers()
+<roseau.load_flow.ElectricalNetwork.solve_load_flow_with_tap_changers>` runs load flows in an outer
+loop that moves the taps until the voltages of the controlled buses are within their bands.
+"""
+
+import dataclasses
+import logging
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import Id
+
+if TYPE_CHECKING:
+    from roseau.load_flow.models import Bus, Transformer
+    from roseau.load_flow.network import ElectricalNetwork
+
+logger = logging.getLogger(__name__)
+
+# The tolerance used to compare the taps and the voltage levels with their limits
+_EPSILON = 1e-9
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class TapChanger:
+    """The on-load tap changer of a transformer.
+
+    The tap changer moves the tap of the transformer by multiples of ``tap_step`` within
+    ``[tap_min, tap_max]`` to keep the voltage levels of all the phases of the controlled bus
+    within ``[u_min, u_max]``. Increasing the tap increases the voltages of the LV side.
+    """
+
+    transformer_id: Id
+    """The ID of the transformer."""
+
+    bus_id: Id | None = None
+    """The ID of the controlled bus. It must have a nominal voltage. Defaults to the LV bus of the
+    transformer."""
+
+    u_min: float = 0.95
+    """The minimum voltage level of the controlled bus (p.u.)."""
+
+    u_max: float = 1.05
+    """The maximum voltage level of the controlled bus (p.u.)."""
+
+    tap_min: float = 0.9
+    """The minimum tap of the transformer."""
+
+    tap_max: float = 1.1
+    """The maximum tap of the transformer."""
+
+    tap_step: float = 0.0125
+    """The change of the tap of the transformer per tap position."""
+
+    def __post_init__(self) -> None:
+        if not 0 < self.u_min < self.u_max:
+            msg = (
+                f"Invalid voltage band of the tap changer of transformer {self.transformer_id!r}: "
+                f"expected 0 < u_min < u_max, got u_min={self.u_min!r} and u_max={self.u_max!r}."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+        if not 0 < self.tap_min <= self.tap_max:
+            msg = (
+                f"Invalid tap range of the tap changer of transformer {self.transformer_id!r}: "
+                f"expected 0 < tap_min <= tap_max, got tap_min={self.tap_min!r} and tap_max={self.tap_max!r}."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+        if not self.tap_step > 0:
+            msg = (
+                f"Invalid tap step of the tap changer of transformer {self.transformer_id!r}: "
+                f"expected a positive value, got {self.tap_step!r}."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+
+    def _next_tap(self, tap: float, levels: np.ndarray) -> float:
+        """The tap that brings the voltage levels of the controlled bus within the band.
+
+        The voltages of the LV side are considered proportional to the tap to estimate the number
+        of tap positions to move at once. The tap is not moved if this would push the voltage level
+        of another phase outside the band.
+        """
+        low, high = float(levels.min()), float(levels.max())
+        if low < self.u_min - _EPSILON and high <= self.u_max + _EPSILON:
+            # Raise the tap, as much as needed but without exceeding u_max
+            needed = math.ceil(tap * (self.u_min / low - 1) / self.tap_step - _EPSILON)
+            allowed = math.floor(tap * (self.u_max / high - 1) / self.tap_step + _EPSILON)
+            n = max(min(needed, allowed, math.floor((self.tap_max - tap) / self.tap_step + _EPSILON)), 0)
+        elif high > self.u_max + _EPSILON and low >= self.u_min - _EPSILON:
+            # Lower the tap, as much as needed but without going below u_min
+            needed = math.ceil(tap * (1 - self.u_max / high) / self.tap_step - _EPSILON)
+            allowed = math.floor(tap * (1 - self.u_min / low) / self.tap_step + _EPSILON)
+            n = -max(min(needed, allowed, math.floor((tap - self.tap_min) / self.tap_step + _EPSILON)), 0)
+        else:
+            # Within the band, or the band is narrower than the spread of the voltages of the phases
+            n = 0
+        return round(tap + n * self.tap_step, 12) if n != 0 else tap
+
+    def _in_band(self, levels: np.ndarray) -> bool:
+        return bool(levels.min() >= self.u_min - _EPSILON and levels.max() <= self.u_max + _EPSILON)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class TapControlResult:
+    """The result of a load flow with tap control.
+
+    It is returned by :meth:`ElectricalNetwork.solve_load_flow_with_tap_changers()
+    <roseau.load_flow.ElectricalNetwork.solve_load_flow_with_tap_changers>`.
+    """
+
+    converged: bool
+    """True if the voltages of all the controlled buses are within their bands."""
+
+    iterations: int
+    """The number of load flows solved."""
+
+    load_flow_iterations: int
+    """The total number of iterations of the load flows."""
+
+    residual: float
+    """The residual error of the last load flow."""
+
+    trajectory: pd.DataFrame
+    """The taps of the transformers (columns) used by each load flow (rows). The last row holds the
+    final taps."""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: converged={self.converged}, iterations={self.iterations}>"
+
+    @property
+    def taps(self) -> dict[Id, float]:
+        """The final taps of the transformers."""
+        return self.trajectory.iloc[-1].to_dict()
+
+
+def _solve_load_flow_with_tap_changers(
+    network: "ElectricalNetwork",
+    tap_changers: list[TapChanger],
+    *,
+    max_tap_iterations: int,
+    load_flow_kwargs: dict,
+) -> TapControlResult:
+    """Solve load flows moving the taps, see `ElectricalNetwork.solve_load_flow_with_tap_changers`."""
+    controlled = _get_controlled_elements(network, tap_changers)
+    if max_tap_iterations < 0:
+        msg = f"The maximum number of tap iterations must be positive, got {max_tap_iterations!r}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+
+    taps = [[tr.tap for _, tr, _ in controlled]]
+    lf_iterations, residual = network.solve_load_flow(**load_flow_kwargs)
+    total_iterations, n_solves = lf_iterations, 1
+    for _ in range(max_tap_iterations):
+        moved = False
+        for tap_changer, transformer, bus in controlled:
+            levels = bus._res_voltage_levels_getter(warning=False)
+            new_tap = tap_changer._next_tap(transformer._tap, levels)
+            if new_tap != transformer._tap:
+                transformer._set_tap(new_tap)
+                moved = True
+        if not moved:
+            break
+        taps.append([tr.tap for _, tr, _ in controlled])
+        # The engine network is kept, the load flow is warm-started from the previous solution
+        lf_iterations, residual = network.solve_load_flow(**(load_flow_kwargs | {"warm_start": True}))
+        total_iterations += lf_iterations
+        n_solves += 1
+
+    converged = all(tc._in_band(bus._res_voltage_levels_getter(warning=False)) for tc, _, bus in controlled)
+    if not converged:
+        logger.warning(
+            f"The voltages of the buses controlled by the tap changers are not all within their bands "
+            f"after {n_solves} load flows."
+        )
+    trajectory = pd.DataFrame(
+        taps,
+        index=pd.RangeIndex(len(taps), name="iteration"),
+        columns=pd.Index([tr.id for _, tr, _ in controlled], name="transformer_id"),
+        dtype=np.float64,
+    )
+    return TapControlResult(
+        converged=converged,
+        iterations=n_solves,
+        load_flow_iterations=total_iterations,
+        residual=residual,
+        trajectory=trajectory,
+    )
+
+
+def _get_controlled_elements(
+    network: "ElectricalNetwork", tap_changers: list[TapChanger]
+) -> list[tuple[TapChanger, "Transformer", "Bus"]]:
+    """Get the transformers and the controlled buses of the tap changers."""
+    controlled = []
+    seen: set[Id] = set()
+    for tap_changer in tap_changers:
+        transformer_id = tap_changer.transformer_id
+        if transformer_id in seen:
+            msg = f"Transformer {transformer_id!r} has several tap changers."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+        seen.add(transformer_id)
+        try:
+            transformer = network.transformers[transformer_id]
+        except KeyError:
+            msg = f"Transformer {transformer_id!r} of the tap changer is not part of the network."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TRANSFORMER_ID) from None
+        bus_id = transformer.bus_lv.id if tap_changer.bus_id is None else tap_changer.bus_id
+        try:
+            bus = network.buses[bus_id]
+        except KeyError:
+            msg = (
+                f"Bus {bus_id!r} controlled by the tap changer of transformer {transformer_id!r} is "
+                f"not part of the network."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID) from None
+        if bus._nominal_voltage is None:
+            msg = (
+                f"Bus {bus_id!r} controlled by the tap changer of transformer {transformer_id!r} "
+                f"must have a nominal voltage."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER)
+        controlled.append((tap_changer, transformer, bus))
+    return controlled
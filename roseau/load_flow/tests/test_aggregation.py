@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from roseau.load_flow.aggregation import ResultsAggregator, _P2Quantiles
+from roseau.load_flow.constants import SQRT3
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.models import Bus, Line, LineParameters, PotentialRef, PowerLoad, VoltageSource
+from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.sym import ALPHA, ALPHA2
+
+
+@pytest.fixture
+def network() -> ElectricalNetwork:
+    source_bus = Bus(id="s", phases="abcn", nominal_voltage=400)
+    bus = Bus(id="b", phases="abcn", nominal_voltage=400, min_voltage_level=0.9, max_voltage_level=1.1)
+    other_bus = Bus(id="o", phases="abcn")  # no nominal voltage
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=np.complex128))
+    return ElectricalNetwork(
+        buses=[source_bus, bus, other_bus],
+        lines=[
+            Line(id="l1", bus1=source_bus, bus2=bus, parameters=lp, length=0.1),
+            Line(id="l2", bus1=bus, bus2=other_bus, parameters=lp, length=0.1),
+        ],
+        transformers=[],
+        switches=[],
+        loads=[PowerLoad(id="load", bus=bus, powers=[1000, 1000, 1000])],
+        sources=[VoltageSource(id="source", bus=source_bus, voltages=230)],
+        grounds=[],
+        potential_refs=[PotentialRef(id="pref", element=source_bus)],
+    )
+
+
+@pytest.fixture
+def fake_load_flow(monkeypatch):
+    """Fake load flows: the voltage levels of the phases of the bus `b` are given by `levels`."""
+    levels = [1.0, 1.0, 1.0]
+    original = ElectricalNetwork.solve_load_flow
+
+    def solve_load_flow(self, *args, **kwargs):
+        # Bypass the engine: set the results then run the end of the original method
+        for bus_id, bus in self.buses.items():
+            bus_levels = np.array(levels if bus_id == "b" else [1.0, 1.0, 1.0])
+            potentials = 400 / SQRT3 * bus_levels * np.array([1, ALPHA2, ALPHA])
+            bus._res_potentials = np.array([*potentials, 0], dtype=np.complex128)
+        self._solver.solve_load_flow = lambda max_iterations, tolerance: (1, 1e-8)
+        self._valid = True
+        result = original(self, *args, **kwargs)
+        for bus in self.buses.values():
+            bus._fetch_results = False
+        return result
+
+    monkeypatch.setattr(ElectricalNetwork, "solve_load_flow", solve_load_flow)
+    monkeypatch.setattr(Bus, "_refresh_results", lambda self: None)
+    return levels
+
+
+def test_p2_quantiles():
+    rng = np.random.default_rng(42)
+    values = rng.normal(1.0, 0.02, size=(5000, 3)) * np.array([1.0, 1.05, 0.95])
+    sketch = _P2Quantiles([0.05, 0.5, 0.95], 3)
+    assert np.isnan(sketch.estimate()).all()
+    for i, row in enumerate(values):
+        sketch.update(row)
+        if i == 2:  # less than five values: exact quantiles
+            np.testing.assert_allclose(sketch.estimate(), np.quantile(values[:3], [0.05, 0.5, 0.95], axis=0))
+    assert sketch.estimate().shape == (3, 3)
+    np.testing.assert_allclose(sketch.estimate(), np.quantile(values, [0.05, 0.5, 0.95], axis=0), atol=2e-3)
+
+
+def test_results_aggregator(network, fake_load_flow):
+    levels = fake_load_flow
+    aggregator = ResultsAggregator(quantiles=(0.1, 0.9))
+    assert repr(aggregator) == "<ResultsAggregator: 0 load flows, quantiles=[0.1, 0.9]>"
+    assert aggregator.network is None
+    aggregator.attach(network)
+    assert aggregator.network is network
+
+    samples = [[1.0, 0.95, 0.85], [1.0, 0.97, 0.89], [1.0, 1.0, 0.93], [1.0, 1.12, 0.91]] * 50
+    for sample in samples:
+        levels[:] = sample
+        network.solve_load_flow()
+    assert aggregator.n_results == 200
+
+    buses = aggregator.buses
+    assert buses.index.names == ["bus_id", "phase"]
+    assert buses.index.tolist() == [("s", "an"), ("s", "bn"), ("s", "cn"), ("b", "an"), ("b", "bn"), ("b", "cn")]
+    assert buses.columns.tolist() == ["min", "max", "mean", "std", "q10", "q90", "violations", "violation_ratio"]
+    expected = np.array(samples)
+    np.testing.assert_allclose(buses.loc["b", "min"], expected.min(axis=0))
+    np.testing.assert_allclose(buses.loc["b", "max"], expected.max(axis=0))
+    np.testing.assert_allclose(buses.loc["b", "mean"], expected.mean(axis=0))
+    np.testing.assert_allclose(buses.loc["b", "std"], expected.std(axis=0, ddof=1), atol=1e-12)
+    np.testing.assert_allclose(buses.loc["b", "q90"], np.quantile(expected, 0.9, axis=0), atol=0.02)
+    assert buses.loc["b", "violations"].tolist() == [0, 50, 100]
+    assert buses.loc["b", "violation_ratio"].tolist() == [0.0, 0.25, 0.5]
+    assert buses.loc["s", "violations"].tolist() == [0, 0, 0]  # no limits
+
+    # The lines without ampacities and the transformers have no results
+    assert aggregator.lines.empty
+    assert aggregator.lines.index.names == ["line_id", "phase"]
+    assert aggregator.transformers.empty
+    assert aggregator.transformers.index.name == "transformer_id"
+
+    # The copies of the network are not aggregated
+    network_copy = network.copy()
+    network_copy.solve_load_flow()
+    assert aggregator.n_results == 200
+
+    # Detach and aggregate manually
+    aggregator.detach()
+    assert aggregator.network is None
+    network.solve_load_flow()
+    assert aggregator.n_results == 200
+    aggregator.update(network)
+    assert aggregator.n_results == 201
+
+    # Reset
+    aggregator.reset()
+    assert aggregator.n_results == 0
+    aggregator.update(network)
+    assert aggregator.buses["std"].isna().all()  # a single load flow
+
+
+def test_results_aggregator_errors(network, fake_load_flow):
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ResultsAggregator(quantiles=[0.5, 95])
+    assert e.value.msg == "The probabilities of the quantiles must be strictly between 0 and 1, got [0.5, 95.0]."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_AGGREGATOR
+
+    aggregator = ResultsAggregator()
+    with pytest.raises(RoseauLoadFlowException) as e:
+        _ = aggregator.buses
+    assert e.value.msg == "The results aggregator has no results, solve a load flow of the network first."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_AGGREGATOR
+
+    aggregator.attach(network)
+    with pytest.raises(RoseauLoadFlowException) as e:
+        aggregator.attach(network)
+    assert e.value.msg == "The results aggregator is already attached to the network 'Network'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_AGGREGATOR
+
+    # The elements of the network change
+    network.solve_load_flow()
+    network.buses["o"].nominal_voltage = 400
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow()
+    assert e.value.msg == (
+        "The elements of the network are not those of the aggregated results. Call `reset()` to aggregate "
+        "the results of different elements."
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_AGGREGATOR
+    aggregator.reset()
+    network.solve_load_flow()
+    assert aggregator.buses.index.get_level_values("bus_id").unique().tolist() == ["s", "b", "o"]
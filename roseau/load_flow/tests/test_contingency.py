@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from roseau.load_flow import _parallel
+from roseau.load_flow.contingency import Contingency, ContingencyAnalysis, _ContingencySolver
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.models import Bus, Line, LineParameters, PotentialRef, PowerLoad, Switch, VoltageSource
+from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.sym import ALPHA, ALPHA2
+
+
+@pytest.fixture
+def network() -> ElectricalNetwork:
+    # Two feeders meshed by the lines l1 and l2 and a radial feeder
+    source_bus = Bus(id="s", phases="abcn", nominal_voltage=400)
+    buses = {
+        bus_id: Bus(id=bus_id, phases="abcn", nominal_voltage=400, min_voltage_level=0.95, max_voltage_level=1.05)
+        for bus_id in ("b1", "b2", "b3", "b4")
+    }
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=np.complex128))
+    return ElectricalNetwork(
+        buses=[source_bus, *buses.values()],
+        lines=[
+            Line(id="l1", bus1=buses["b1"], bus2=buses["b2"], parameters=lp, length=0.1),
+            Line(id="l2", bus1=buses["b3"], bus2=buses["b2"], parameters=lp, length=0.1),
+        ],
+        transformers=[],
+        switches=[
+            Switch(id="sw1", bus1=source_bus, bus2=buses["b1"]),
+            Switch(id="sw2", bus1=source_bus, bus2=buses["b3"]),
+            Switch(id="sw3", bus1=source_bus, bus2=buses["b4"]),
+        ],
+        loads=[PowerLoad(id="load", bus=buses["b2"], powers=[1000, 1000, 1000])],
+        sources=[VoltageSource(id="source", bus=source_bus, voltages=230)],
+        grounds=[],
+        potential_refs=[PotentialRef(id="pref", element=source_bus)],
+    )
+
+
+def switch_potentials(open_switches: list[set[str]], diverged: set[str]):
+    """Fake potentials: the voltages of the buses depend on the open switches.
+
+    The open switches of each load flow are appended to `open_switches`, the load flows with an
+    open switch in `diverged` do not converge.
+    """
+    # The voltage levels of the buses when a switch is open
+    levels = {"sw1": {"b1": 0.93, "b2": 0.96}, "sw2": {"b3": 0.94, "b2": 0.94}}
+
+    def potentials(network):
+        opened = {switch_id for switch_id, switch in network.switches.items() if not switch.closed}
+        open_switches.append(opened)
+        if opened & diverged:
+            raise RoseauLoadFlowException(msg="Diverged", code=RoseauLoadFlowExceptionCode.NO_LOAD_FLOW_CONVERGENCE)
+        result = {}
+        for bus_id in network.buses:
+            level = min((levels.get(switch_id, {}).get(bus_id, 1.0) for switch_id in opened), default=1.0)
+            result[bus_id] = [*(230 * level * np.array([1, ALPHA2, ALPHA])), 0]
+        return result
+
+    return potentials
+
+
+def test_contingency():
+    assert Contingency("c1", ["sw1", "sw2"]).switches == ("sw1", "sw2")
+    assert Contingency("c1", "sw1").switches == ("sw1",)
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Contingency("c1", [])
+    assert e.value.msg == "Contingency 'c1' must open at least one switch."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_CONTINGENCY
+
+
+def test_solve_contingencies(network, fake_load_flow):
+    open_switches, diverged = [], set()
+    calls = fake_load_flow(switch_potentials(open_switches, diverged), iterations=3)
+
+    # N-1 analysis of all the closed switches
+    analysis = network.solve_contingencies()
+    assert isinstance(analysis, ContingencyAnalysis)
+    assert repr(analysis) == "<ContingencyAnalysis: 3 contingencies, solved=2, diverged=0, islanded=1>"
+    assert analysis.contingency_ids == ["sw1", "sw2", "sw3"]
+    assert analysis.status.tolist() == ["solved", "solved", "islanded"]
+    assert analysis.iterations.tolist() == [3, 3, 0]
+    np.testing.assert_array_equal(analysis.residuals, [1e-8, 1e-8, np.nan])
+    assert analysis.bus_ids == ["s", "b1", "b2", "b3", "b4"]
+    assert analysis.line_ids == ["l1", "l2"]
+    assert analysis.transformer_ids == []
+    np.testing.assert_array_equal(
+        analysis.buses_violated,
+        [[False, True, False, False, False], [False, False, True, True, False], [False, False, False, False, False]],
+    )
+    assert analysis.lines_violated.shape == (3, 2)
+    assert not analysis.lines_violated.any()  # no ampacities
+    assert analysis.transformers_violated.shape == (3, 0)
+    assert analysis.get_violations("sw2") == {"buses": ["b2", "b3"], "lines": [], "transformers": []}
+
+    # The islanded contingency is not solved, the others are solved on a copy of the network
+    # starting from the base case
+    base_call, *contingency_calls = calls
+    assert base_call["network"] is network
+    assert base_call["warm_start"]
+    assert open_switches == [set(), {"sw1"}, {"sw2"}]
+    assert all(c["network"] is not network and c["warm_start"] for c in contingency_calls)
+    copy = contingency_calls[0]["network"]
+    assert all(switch.closed for switch in copy.switches.values())  # the switches are closed again
+    assert all(bus._initialized and not bus._initialized_by_the_user for bus in copy.buses.values())
+    assert all(switch.closed for switch in network.switches.values())
+    assert network.buses["b1"].res_violated.tolist() == [False, False, False]  # results of the base case
+
+    # The ranking
+    expected_ranking = pd.DataFrame(
+        {
+            "status": pd.Categorical(["islanded", "solved", "solved"], categories=["islanded", "diverged", "solved"]),
+            "buses_violated": [0, 2, 1],
+            "lines_violated": [0, 0, 0],
+            "transformers_violated": [0, 0, 0],
+            "violations": [0, 2, 1],
+            "iterations": np.array([0, 3, 3], dtype=np.int32),
+        },
+        index=pd.Index(["sw3", "sw2", "sw1"], name="contingency_id"),
+    )
+    pd.testing.assert_frame_equal(analysis.ranking, expected_ranking)
+
+    # Contingencies with several switches and load flows that do not converge
+    diverged.add("sw2")
+    analysis = network.solve_contingencies(
+        [Contingency("c1", ["sw1", "sw2"]), Contingency("c2", "sw2"), Contingency("c3", "sw1")]
+    )
+    assert analysis.status.tolist() == ["islanded", "diverged", "solved"]
+    assert analysis.ranking.index.tolist() == ["c1", "c2", "c3"]
+    assert not analysis.buses_violated[:2].any()
+
+    # No contingency
+    analysis = network.solve_contingencies([])
+    assert analysis.contingency_ids == []
+    assert analysis.buses_violated.shape == (0, 5)
+    assert analysis.ranking.empty
+
+
+def test_solve_contingencies_worker(network, fake_load_flow):
+    fake_load_flow(switch_potentials([], set()), iterations=3)
+    # The worker processes create their network from its dictionary with the base case results
+    network.solve_load_flow()
+    data = network.to_dict(include_results=True)
+    _parallel.init_worker(_ContingencySolver, ElectricalNetwork, data, {"warm_start": True})
+    try:
+        status, iterations, _, buses_violated, lines_violated, transformers_violated = _parallel.solve_in_worker(
+            [("sw1",), ("sw3",)]
+        )
+    finally:
+        _parallel._worker_solver = None
+    assert status.tolist() == ["solved", "islanded"]
+    assert iterations.tolist() == [3, 0]
+    assert buses_violated.tolist() == [[False, True, False, False, False], [False] * 5]
+    assert lines_violated.shape == (2, 2)
+    assert transformers_violated.shape == (2, 0)
+
+
+def test_solve_contingencies_errors(network):
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_contingencies([Contingency("c1", "sw1"), Contingency("c1", "sw2")])
+    assert e.value.msg == "Contingency 'c1' is defined several times."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_CONTINGENCY
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_contingencies([Contingency("c1", ["sw1", "unknown"])])
+    assert e.value.msg == "Switch 'unknown' of contingency 'c1' is not part of the network."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SWITCH_ID
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_contingencies(n_jobs=0)
+    assert e.value.msg == "The number of jobs must be positive, got 0."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_CONTINGENCY
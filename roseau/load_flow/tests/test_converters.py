@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from roseau.load_flow.converters import calculate_voltages, kron_reduction
+from roseau.load_flow.converters import (
+    _common_phases,
+    _missing_phases,
+    _phases_connections,
+    calculate_voltages,
+    kron_reduction,
+)
 from roseau.load_flow.units import Q_, ureg
 
 
@@ -55,3 +61,16 @@ def test_kron_reduction():
 
     with pytest.raises(ValueError, match=r"Matrix must be square, got shape \(3, 4\)."):
         kron_reduction(nxn[:3, :4])
+
+
+def test_phases_tables():
+    assert _common_phases("abcn", "can") == "can"
+    assert _common_phases("abn", "bcn") == "bn"
+    assert _common_phases("ab", "cn") == ""
+    assert _missing_phases("abcn", "abn") == ("c",)
+    assert _missing_phases("cn", "abcn") == ()
+    assert _phases_connections("bn", "abcn") == [(0, 1), (1, 3)]
+    assert _phases_connections("can", "abcn") == [(0, 2), (1, 0), (2, 3)]
+    assert _phases_connections("an", "a") == [(0, 0)]
+    # The tables are memoized
+    assert _phases_connections("bn", "abcn") is _phases_connections("bn", "abcn")
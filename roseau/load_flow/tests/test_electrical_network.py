@@ -1,8 +1,11 @@
 import cmath
+import copy
 import itertools as it
 import json
 import re
 import warnings
+import weakref
+from gc import collect as gc_collect
 
 import geopandas as gpd
 import networkx as nx
@@ -11,6 +14,7 @@ import numpy.testing as npt
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
+from shapely import LineString, Point, Polygon
 
 from roseau.load_flow.converters import calculate_voltages
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
@@ -31,9 +35,10 @@ from roseau.load_flow.models import (
     VoltageSource,
 )
 from roseau.load_flow.network import ElectricalNetwork
-from roseau.load_flow.sym import PositiveSequence
+from roseau.load_flow.sym import ALPHA, ALPHA2, PositiveSequence
 from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import LoadTypeDtype, PhaseDtype, SourceTypeDtype, VoltagePhaseDtype
+from roseau.load_flow.utils.mixins import _RawComplexArray
 from roseau.load_flow.utils.testing import (
     access_elements_results,
     check_result_warning,
@@ -244,46 +249,46 @@ def test_recursive_connect_disconnect():
         parameters=lp,
         length=0.5,
     )
-    assert load_bus._connected_elements == [gc, load, line, new_line]
+    assert list(load_bus._connected_elements) == [gc, load, line, new_line]
     assert new_bus.network == en
-    assert new_bus._connected_elements == [new_load, new_line2, new_line]
+    assert list(new_bus._connected_elements) == [new_load, new_line2, new_line]
     assert new_bus.id in en.buses
     assert new_line.network == en
-    assert new_line._connected_elements == [new_bus, load_bus]
+    assert list(new_line._connected_elements) == [new_bus, load_bus]
     assert new_line.id in en.lines
     assert new_load.network == en
-    assert new_load._connected_elements == [new_bus]
+    assert list(new_load._connected_elements) == [new_bus]
     assert new_load.id in en.loads
     assert new_bus2.network == en
-    assert new_bus2._connected_elements == [new_load2, new_line2]
+    assert list(new_bus2._connected_elements) == [new_load2, new_line2]
     assert new_bus2.id in en.buses
     assert new_line2.network == en
-    assert new_line2._connected_elements == [new_bus2, new_bus]
+    assert list(new_line2._connected_elements) == [new_bus2, new_bus]
     assert new_line2.id in en.lines
     assert new_load2.network == en
-    assert new_load2._connected_elements == [new_bus2]
+    assert list(new_load2._connected_elements) == [new_bus2]
     assert new_load2.id in en.loads
 
     # Disconnect a load
     new_load.disconnect()
-    assert load_bus._connected_elements == [gc, load, line, new_line]
+    assert list(load_bus._connected_elements) == [gc, load, line, new_line]
     assert new_bus.network == en
-    assert new_bus._connected_elements == [new_line2, new_line]
+    assert list(new_bus._connected_elements) == [new_line2, new_line]
     assert new_bus.id in en.buses
     assert new_line.network == en
-    assert new_line._connected_elements == [new_bus, load_bus]
+    assert list(new_line._connected_elements) == [new_bus, load_bus]
     assert new_line.id in en.lines
     assert new_load.network is None
-    assert new_load._connected_elements == []
+    assert list(new_load._connected_elements) == []
     assert new_load.id not in en.loads
     assert new_bus2.network == en
-    assert new_bus2._connected_elements == [new_load2, new_line2]
+    assert list(new_bus2._connected_elements) == [new_load2, new_line2]
     assert new_bus2.id in en.buses
     assert new_line2.network == en
-    assert new_line2._connected_elements == [new_bus2, new_bus]
+    assert list(new_line2._connected_elements) == [new_bus2, new_bus]
     assert new_line2.id in en.lines
     assert new_load2.network == en
-    assert new_load2._connected_elements == [new_bus2]
+    assert list(new_load2._connected_elements) == [new_bus2]
     assert new_load2.id in en.loads
 
 
@@ -573,13 +578,14 @@ def test_frames(small_network: ElectricalNetwork):
     # Lines
     lines_gdf = small_network.lines_frame
     assert isinstance(lines_gdf, gpd.GeoDataFrame)
-    assert lines_gdf.shape == (1, 7)
+    assert lines_gdf.shape == (1, 8)
     assert lines_gdf.columns.tolist() == [
         "phases",
         "bus1_id",
         "bus2_id",
         "parameters_id",
         "length",
+        "ground_id",
         "max_loading",
         "geometry",
     ]
@@ -611,15 +617,15 @@ def test_frames(small_network: ElectricalNetwork):
     # Loads
     loads_df = small_network.loads_frame
     assert isinstance(loads_df, pd.DataFrame)
-    assert loads_df.shape == (1, 4)
-    assert loads_df.columns.tolist() == ["type", "phases", "bus_id", "flexible"]
+    assert loads_df.shape == (1, 7)
+    assert loads_df.columns.tolist() == ["type", "phases", "bus_id", "flexible", "powers", "currents", "impedances"]
     assert loads_df.index.name == "id"
 
     # Sources
     sources_df = small_network.sources_frame
     assert isinstance(sources_df, pd.DataFrame)
-    assert sources_df.shape == (1, 3)
-    assert sources_df.columns.tolist() == ["type", "phases", "bus_id"]
+    assert sources_df.shape == (1, 4)
+    assert sources_df.columns.tolist() == ["type", "phases", "bus_id", "voltages"]
     assert sources_df.index.name == "id"
 
     # Grounds
@@ -778,6 +784,342 @@ def test_to_from_dict_roundtrip(small_network: ElectricalNetwork):
     assert new_net.tool_data.to_dict() == small_network.tool_data.to_dict()
 
 
+def test_from_dict_copy(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+    en.tool_data.add("some-tool", {"version": "1.0"})
+    data = en.to_dict()
+    original = copy.deepcopy(data)
+
+    # The input dictionary is not modified by default
+    new_net = ElectricalNetwork.from_dict(data)
+    assert data == original
+    assert new_net.to_dict() == original
+    new_net.tool_data.add("other-tool", {"version": "2.0"})
+    assert data == original
+
+
+def test_copy(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+    en.tool_data.add("some-tool", {"version": "1.0"})
+
+    # Without results
+    new_net = en.copy()
+    assert new_net.to_dict(include_results=False) == en.to_dict(include_results=False)
+    assert new_net.tool_data.to_dict() == en.tool_data.to_dict()
+    assert new_net.tool_data is not en.tool_data
+    with pytest.raises(RoseauLoadFlowException, match=r"The load flow results are not available") as e:
+        _ = new_net.res_buses
+    assert e.value.code == RoseauLoadFlowExceptionCode.LOAD_FLOW_NOT_RUN
+
+    # The elements are new objects attached to the new network
+    for element_type, elements in en._elements_by_type.items():
+        new_elements = new_net._elements_by_type[element_type]
+        assert new_elements.keys() == elements.keys()
+        for element_id, element in elements.items():
+            new_element = new_elements[element_id]
+            assert new_element is not element
+            assert new_element.network is new_net
+            assert all(ce._network is new_net for ce in new_element._connected_elements)
+
+    # The parameters are shared, the arrays are not
+    line_id, line = next(iter(en.lines.items()))
+    new_line = new_net.lines[line_id]
+    assert new_line.parameters is line.parameters
+    assert line.parameters._elements >= {line, new_line}
+    assert new_net._parameters["line"] == en._parameters["line"]
+    assert new_line._z_line is not line._z_line
+    bus_id, bus = next(iter(en.buses.items()))
+    new_bus = new_net.buses[bus_id]
+    assert new_bus._initial_potentials is not bus._initial_potentials
+    npt.assert_array_equal(new_bus._initial_potentials, bus._initial_potentials)
+
+    # Modifying the copy does not modify the original network
+    load_id, load = next((k, v) for k, v in en.loads.items() if isinstance(v, PowerLoad))
+    original_powers = load.powers.m.copy()
+    new_net.loads[load_id].powers = original_powers * 2
+    npt.assert_array_equal(load.powers.m, original_powers)
+    new_line.length = line.length.m * 2
+    assert line.length.m != new_line.length.m
+
+    # The parameters can also be copied
+    new_net = en.copy(copy_parameters=True)
+    assert new_net.to_dict(include_results=False) == en.to_dict(include_results=False)
+    new_line = new_net.lines[line_id]
+    assert new_line.parameters is not line.parameters
+    assert set(new_line.parameters._elements) == {new_line}
+    assert new_line.parameters._z_line is not line.parameters._z_line
+    assert new_net._parameters["line"][line.parameters.id] is new_line.parameters
+
+    # With results
+    new_net = en.copy(include_results=True)
+    assert new_net.to_dict(include_results=True) == en.to_dict(include_results=True)
+    with warnings.catch_warnings(action="error"):
+        assert_frame_equal(new_net.res_buses, en.res_buses)
+        assert_frame_equal(new_net.res_lines, en.res_lines)
+
+
+def test_copy_shared_parameters(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+    line_id, line = next(iter(en.lines.items()))
+    lp = line.parameters
+    n_elements = len(lp._elements)
+
+    # The copies sharing the parameters can be garbage collected
+    refs = []
+    for _ in range(5):
+        new_net = en.copy()
+        refs.append(weakref.ref(new_net))
+        del new_net
+    gc_collect()
+    assert all(ref() is None for ref in refs)
+    assert len(lp._elements) == n_elements
+
+    # Changing the parameters of a line of a copy leaves the other networks untouched
+    new_net = en.copy()
+    assert lp.id in new_net._parameters["line"]
+    new_net.lines[line_id].parameters = LineParameters(id="new_lp", z_line=lp.z_line.m, y_shunt=lp.y_shunt.m)
+    assert lp.id not in new_net._parameters["line"]
+    assert new_net._parameters["line"]["new_lp"] is new_net.lines[line_id].parameters
+    assert en._parameters["line"][lp.id] is lp
+    assert line.parameters is lp
+
+
+def _sorted_network_dict(en: ElectricalNetwork) -> dict:
+    data = en.to_dict(include_results=False)
+    for value in data.values():
+        if isinstance(value, list):
+            value.sort(key=lambda d: str(d["id"]) if isinstance(d, dict) and "id" in d else str(d))
+    return data
+
+
+def test_reduce(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+    original_data = en.to_dict(include_results=False)
+    transformer = en.transformers["transformer0"]
+    lv_buses = set(transformer.bus_lv.get_connected_buses())
+    assert lv_buses in en.buses_clusters
+    expected_currents = -transformer.side_lv.res_currents.m[:3]  # the LV network currents
+    voltages = transformer.bus_lv.res_voltages.m
+
+    for model in ("power", "current", "impedance"):
+        reduction = en.reduce(lv_buses, model=model)
+        reduced = reduction.network
+        assert reduction.bus_id == "bus2"
+        assert reduction.load_id == "bus2_equivalent"
+        assert reduction.model == model
+        assert reduced.buses.keys() == {"bus0", "bus1", "bus2"}
+        assert reduced.loads.keys() == {"bus2_equivalent"}
+        assert reduced.sources.keys() == {"source0"}
+        assert reduced.ground_connections.keys() == {"gc0"}  # kept with the boundary bus
+        assert reduction.removed_elements_ids["bus"] == ["bus3", "bus4", "bus5", "bus6"]
+        assert set(reduction.removed_elements_ids["load"]) == set(en.loads)
+        load = reduced.loads["bus2_equivalent"]
+        assert load.phases == "abcn"
+        if model == "power":
+            currents = (load.powers.m / voltages).conj()
+        elif model == "current":
+            currents = load.currents.m * voltages / abs(voltages)
+        else:
+            currents = voltages / load.impedances.m
+        npt.assert_allclose(currents, expected_currents)
+
+    # The original network is not modified
+    assert en.to_dict(include_results=False) == original_data
+    assert all(e.network is en for e in en.buses.values())
+
+    # Expand the reduced network
+    expanded = reduction.expand()
+    assert _sorted_network_dict(expanded) == _sorted_network_dict(en)
+    assert all(e.network is expanded for elements in expanded._elements_by_type.values() for e in elements.values())
+
+    # The modifications of the reduced network are kept
+    reduced.sources["source0"].voltages = reduced.sources["source0"].voltages * 1.05
+    expanded = reduction.expand(reduced)
+    npt.assert_allclose(expanded.sources["source0"].voltages.m, reduced.sources["source0"].voltages.m)
+    assert expanded.loads.keys() == en.loads.keys()
+
+
+def test_reduce_potential_ref():
+    # The potential reference of the reduced sub-network is moved to the boundary bus
+    mv_bus = Bus(id="mv", phases="abc")
+    lv_bus = Bus(id="lv", phases="abcn")
+    lv_bus1 = Bus(id="lv1", phases="abcn")
+    source = VoltageSource(id="source", bus=mv_bus, voltages=20e3)
+    PotentialRef(id="pref_mv", element=mv_bus)
+    PotentialRef(id="pref_lv", element=lv_bus1)
+    tp = TransformerParameters.from_catalogue(name="FT 400kVA 15/20kV(20) 400V Dyn11")
+    Transformer(id="tr", bus_hv=mv_bus, bus_lv=lv_bus, parameters=tp)
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=np.complex128))
+    line = Line(id="line", bus1=lv_bus, bus2=lv_bus1, parameters=lp, length=0.1)
+    load = PowerLoad(id="load", bus=lv_bus1, powers=[1000, 1000, 1000])
+    en = ElectricalNetwork.from_element(mv_bus)
+
+    # Fake results of the elements used by the reduction
+    en._no_results = False
+    en._results_valid = True
+    for element in (lv_bus, line, load, source):
+        element._no_results = False
+    lv_bus._res_potentials = np.array([230, 230 * ALPHA2, 230 * ALPHA, 0], dtype=np.complex128)
+    line._side1._res_potentials = lv_bus._res_potentials
+    line._side1._res_currents = np.array([5, 5 * ALPHA2, 5 * ALPHA, 0], dtype=np.complex128)
+
+    reduction = en.reduce(["lv", "lv1"])
+    assert reduction.network.potential_refs.keys() == {"pref_mv", "pref_lv"}
+    assert reduction.network.potential_refs["pref_lv"].element.id == "lv"
+    npt.assert_allclose(reduction.network.loads["lv_equivalent"].powers.m, 1150)
+    expanded = reduction.expand()
+    assert expanded.potential_refs["pref_lv"].element.id == "lv1"
+    assert _sorted_network_dict(expanded) == _sorted_network_dict(en)
+
+    # A sub-network that draws no current on a phase cannot be reduced to an impedance load
+    line._side1._res_currents = np.array([5, 5 * ALPHA2, 0, -5 * ALPHA2 - 5], dtype=np.complex128)
+    with pytest.raises(RoseauLoadFlowException, match=r"draws no current on some phases") as e:
+        en.reduce(["lv", "lv1"], model="impedance")
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+
+
+def test_reduce_errors(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+
+    # Bad model
+    with pytest.raises(RoseauLoadFlowException, match=r"Invalid model 'admittance'") as e:
+        en.reduce(["bus2"], model="admittance")  # type: ignore
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+
+    # Bad buses
+    with pytest.raises(RoseauLoadFlowException, match=r"Cannot reduce an empty sub-network") as e:
+        en.reduce([])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+    with pytest.raises(RoseauLoadFlowException, match=r"Bus 'unknown' is not part of the network\.") as e:
+        en.reduce(["bus2", "unknown"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BUS_ID
+
+    # Several boundary buses
+    with pytest.raises(
+        RoseauLoadFlowException,
+        match=r"must be connected to the rest of the network through a single bus, it is connected through the buses",
+    ) as e:
+        en.reduce(["bus2", "bus3", "bus5"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+    with pytest.raises(RoseauLoadFlowException, match=r"it is connected at all\.") as e:
+        en.reduce(list(en.buses))
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+
+    # No results
+    new_net = en.copy()
+    with pytest.raises(RoseauLoadFlowException, match=r"The load flow results are not available") as e:
+        new_net.reduce(["bus2"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.LOAD_FLOW_NOT_RUN
+
+    # Expanding a network without the boundary bus
+    lv_buses = set(en.buses["bus2"].get_connected_buses())
+    reduction = en.reduce(lv_buses)
+    other_reduction = en.reduce({"bus1"} | lv_buses)
+    with pytest.raises(RoseauLoadFlowException, match=r"the bus 'bus2' it was connected to is not part") as e:
+        reduction.expand(other_reduction.network)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+
+
+def test_spatial_queries():
+    ground = Ground(id="ground")
+    PotentialRef(id="pref", element=ground)
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=complex))
+    buses = [Bus(id=f"bus{i}", phases="abcn", geometry=Point(i, 0)) for i in range(4)]
+    buses.append(Bus(id="bus_no_geom", phases="abcn"))
+    VoltageSource(id="source", bus=buses[0], voltages=230)
+    for i in range(3):
+        Line(
+            id=f"line{i}",
+            bus1=buses[i],
+            bus2=buses[i + 1],
+            parameters=lp,
+            length=0.1,
+            geometry=LineString([(i, 0), (i + 1, 0)]),
+        )
+    Switch(id="switch", bus1=buses[3], bus2=buses[4])
+    GroundConnection(ground=ground, element=buses[0])
+    en = ElectricalNetwork.from_element(buses[0])
+
+    # Nearest buses of one point and of an array of points
+    nearest = en.nearest_buses(Point(0.9, 1))
+    assert nearest.index.name == "point"
+    assert nearest.index.tolist() == [0]
+    assert nearest["bus_id"].tolist() == ["bus1"]
+    npt.assert_allclose(nearest["distance"], np.hypot(0.1, 1))
+    nearest = en.nearest_buses([(0.2, 0), (3.2, 5)], k=2)
+    assert nearest.index.tolist() == [0, 0, 1, 1]
+    assert nearest["bus_id"].tolist() == ["bus0", "bus1", "bus3", "bus2"]
+    npt.assert_allclose(nearest["distance"], [0.2, 0.8, np.hypot(0.2, 5), np.hypot(1.2, 5)])
+    assert en.nearest_buses([Point(-1, 0), Point(-10, 0)], k=10, max_distance=2.5)["bus_id"].tolist() == [
+        "bus0",
+        "bus1",
+    ]
+    assert en.nearest_buses((0.5, 0), k=10)["bus_id"].tolist()[2:] == ["bus2", "bus3"]  # buses with a geometry
+    nearest = en.nearest_lines(np.array([[1.5, 0.5], [2.5, -0.1]]))
+    assert nearest["line_id"].tolist() == ["line1", "line2"]
+    npt.assert_allclose(nearest["distance"], [0.5, 0.1])
+
+    # Elements within a geometry
+    polygon = Polygon([(0.5, -1), (2.5, -1), (2.5, 1), (0.5, 1)])
+    assert en.elements_within(polygon) == {
+        "bus": ["bus1", "bus2"],
+        "line": ["line1"],
+        "transformer": [],
+        "switch": [],
+        "regulator": [],
+    }
+    assert en.elements_within(polygon, element_types=["line"], predicate="intersects") == {
+        "line": ["line0", "line1", "line2"]
+    }
+
+    # The spatial index follows the changes of the geometries and of the elements
+    buses[1].geometry = Point(10, 10)
+    assert en.nearest_buses((0.9, 0))["bus_id"].tolist() == ["bus0"]
+    assert en.elements_within(polygon, element_types=["bus"]) == {"bus": ["bus2"]}
+    new_bus = Bus(id="new_bus", phases="abcn", geometry=Point(1, 0.1))
+    Switch(id="new_switch", bus1=buses[2], bus2=new_bus)
+    assert en.nearest_buses((0.9, 0))["bus_id"].tolist() == ["new_bus"]
+
+    # The geometries are checked
+    with pytest.raises(RoseauLoadFlowException) as e:
+        buses[1].geometry = "POINT (0 0)"
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.lines["line0"].geometry = (0, 0)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+    assert e.value.msg == "The geometry of line 'line0' is not a valid shapely geometry. Got tuple."
+
+    # Bad queries
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.nearest_buses((0, 0), k=0)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY
+    assert e.value.msg == "The number of nearest elements must be a positive integer, got 0."
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.nearest_buses((0, 0), max_distance=-1)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.nearest_buses([(0, 0, 0)])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+    assert e.value.msg == "Expected point coordinates of shape (2,) or (N, 2), got an array of shape (1, 3)."
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.nearest_buses(["bus0"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.elements_within((0, 0))
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+    assert e.value.msg == "Expected a shapely geometry, got tuple."
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.elements_within(polygon, predicate="contains")
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.elements_within(polygon, element_types=["load"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY
+    assert e.value.msg == (
+        "Element type 'load' is not supported by the spatial queries, expected one of "
+        "['bus', 'line', 'transformer', 'switch', 'regulator']."
+    )
+
+
 def test_single_phase_network(single_phase_network: ElectricalNetwork):
     # Test dict conversion
     # ====================
@@ -1663,6 +2005,73 @@ def test_res_buses_voltages(all_elements_network_with_results):
     assert_frame_equal(en.res_buses_voltages_pn, expected_df)
 
 
+def test_res_violations(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    en.buses["bus1"].max_voltage_level = 0.998
+    en.buses["bus5"].min_voltage_level = 1.0
+
+    records = []
+    for bus in en.buses.values():
+        if bus.res_violated is None:
+            continue
+        for phase, level, violated in zip(bus.voltage_phases, bus.res_voltage_levels.m, bus.res_violated, strict=True):
+            if violated:
+                min_level = replace_none(strip_q(bus.min_voltage_level), np.nan)
+                max_level = replace_none(strip_q(bus.max_voltage_level), np.nan)
+                records.append(("bus", bus.id, phase, level, min_level, max_level))
+    for line in en.lines.values():
+        for phase, loading, violated in zip(line.phases, line.res_loading.m, line.res_violated, strict=True):
+            if violated:
+                records.append(("line", line.id, phase, loading, np.nan, line.max_loading.m))
+    for transformer in en.transformers.values():
+        if transformer.res_violated:
+            records.append(
+                ("transformer", transformer.id, None, transformer.res_loading.m, np.nan, transformer.max_loading.m)
+            )
+    expected_df = pd.DataFrame.from_records(
+        records, columns=["element_type", "element_id", "phase", "value", "min_limit", "max_limit"]
+    ).set_index(["element_type", "element_id", "phase"])
+    assert_frame_equal(en.res_violations(), expected_df, check_index_type=False)
+    assert en.res_violations().loc["bus"].index.unique("element_id").tolist() == ["bus1", "bus2", "bus5"]
+
+    # Summary
+    levels = {bus.id: bus.res_voltage_levels.m for bus in en.buses.values() if bus.nominal_voltage is not None}
+    min_bus_id = min(levels, key=lambda bus_id: levels[bus_id].min())
+    max_bus_id = max(levels, key=lambda bus_id: levels[bus_id].max())
+    line_loadings = {line.id: line.res_loading.m.max() for line in en.lines.values()}
+    max_line_id = max(line_loadings, key=line_loadings.__getitem__)
+    assert en.res_summary() == {
+        "min_voltage_level": pytest.approx(levels[min_bus_id].min()),
+        "min_voltage_level_bus_id": min_bus_id,
+        "max_voltage_level": pytest.approx(levels[max_bus_id].max()),
+        "max_voltage_level_bus_id": max_bus_id,
+        "max_line_loading": pytest.approx(line_loadings[max_line_id]),
+        "max_line_loading_line_id": max_line_id,
+        "max_transformer_loading": pytest.approx(en.transformers["transformer0"].res_loading.m),
+        "max_transformer_loading_transformer_id": "transformer0",
+        "nb_violated_buses": 3,
+        "nb_violated_lines": 2,
+        "nb_violated_transformers": 1,
+    }
+
+    # No results
+    en_no_results = ElectricalNetwork.from_dict(en.to_dict(include_results=False))
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en_no_results.res_violations()
+    assert e.value.code == RoseauLoadFlowExceptionCode.LOAD_FLOW_NOT_RUN
+
+    # No elements to check
+    en.lines["line1"].parameters._ampacities = None
+    en.lines["line2"].parameters._ampacities = None
+    for bus in en.buses.values():
+        bus._nominal_voltage = None
+    assert en.res_violations().index.unique("element_type").tolist() == ["transformer"]
+    summary = en.res_summary()
+    assert np.isnan(summary["min_voltage_level"])
+    assert summary["min_voltage_level_bus_id"] is None
+    assert summary["nb_violated_buses"] == 0
+
+
 def test_res_loads_voltages(all_elements_network_with_results):
     en = all_elements_network_with_results
     dtypes = {  # in the expected order
@@ -2059,7 +2468,7 @@ def test_get_catalogue():
 
 
 def test_to_graph(all_elements_network: ElectricalNetwork):
-    g = all_elements_network.to_graph()
+    g = all_elements_network.to_graph(geometry=True)
     assert isinstance(g, nx.MultiGraph)
     assert sorted(g.nodes) == sorted(all_elements_network.buses)
     assert sorted(g.edges) == sorted(
@@ -2119,6 +2528,16 @@ def test_to_graph(all_elements_network: ElectricalNetwork):
             "closed": switch.closed,
         }
 
+    # The geometries are only added when requested
+    g_no_geom = all_elements_network.to_graph()
+    assert dict(g_no_geom.nodes(data=True)) == {
+        node: {name: value for name, value in data.items() if name != "geom"} for node, data in g.nodes(data=True)
+    }
+    assert {(u, v, key): data for u, v, key, data in g_no_geom.edges(keys=True, data=True)} == {
+        (u, v, key): {name: value for name, value in data.items() if name != "geom"}
+        for u, v, key, data in g.edges(keys=True, data=True)
+    }
+
     # Test parallel branches
     bus1 = Bus(id="Bus1", phases="abc")
     bus2 = Bus(id="Bus2", phases="abcn")
@@ -2162,6 +2581,77 @@ def test_to_graph(all_elements_network: ElectricalNetwork):
     json.dumps(json_data, ensure_ascii=False)
 
 
+def test_to_sparse_graph(all_elements_network: ElectricalNetwork):
+    en = all_elements_network
+    branches = [*en.lines.values(), *en.transformers.values(), *en.switches.values()]
+    sg = en.to_sparse_graph()
+    assert sg.bus_ids.tolist() == list(en.buses)
+    assert sg.branch_ids.tolist() == [b.id for b in branches]
+    assert sg.branch_types.tolist() == [b.element_type for b in branches]
+    bus_ids = sg.bus_ids.tolist()
+    assert sg.edges.tolist() == [[bus_ids.index(b.bus1.id), bus_ids.index(b.bus2.id)] for b in branches]
+    npt.assert_array_equal(sg.weights, 1.0)
+    incidence = sg.incidence.toarray()
+    assert incidence.shape == (len(en.buses), len(branches))
+    npt.assert_array_equal(incidence.sum(axis=0), 0)
+    npt.assert_array_equal(np.abs(incidence).sum(axis=0), 2)
+    adjacency = sg.adjacency.toarray()
+    npt.assert_array_equal(adjacency, adjacency.T)
+    g = en.to_graph()
+    npt.assert_array_equal(adjacency != 0, nx.to_numpy_array(g, nodelist=bus_ids) != 0)
+
+    # Weights
+    sg = en.to_sparse_graph(weight="length")
+    npt.assert_allclose(sg.weights, [b.length.m if b.element_type == "line" else 0.0 for b in branches])
+    sg = en.to_sparse_graph(weight="impedance")
+    expected_weights = [
+        np.abs(np.diagonal(b.z_line.m)).mean()
+        if b.element_type == "line"
+        else abs(b.parameters.z2.m)
+        if b.element_type == "transformer"
+        else 0.0
+        for b in branches
+    ]
+    npt.assert_allclose(sg.weights, expected_weights)
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.to_sparse_graph(weight="resistance")
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GRAPH_WEIGHT
+    assert e.value.msg == "Invalid graph weight 'resistance', expected None or one of ('length', 'impedance')."
+
+    # Parallel branches keep the smallest weight, zero weights are stored explicitly
+    bus1 = Bus(id="Bus1", phases="abcn")
+    bus2 = Bus(id="Bus2", phases="abcn")
+    bus3 = Bus(id="Bus3", phases="abcn")
+    lp = LineParameters(id="lp", z_line=np.eye(4, dtype=complex))
+    Line(id="Line1", bus1=bus1, bus2=bus2, parameters=lp, length=2.0)
+    Line(id="Line2", bus1=bus2, bus2=bus1, parameters=lp, length=1.0)
+    sw = Switch(id="Switch", bus1=bus2, bus2=bus3, phases="abcn")
+    VoltageSource(id="Source", bus=bus1, voltages=230)
+    PotentialRef(id="Pref", element=bus1)
+    en = ElectricalNetwork.from_element(bus1)
+    sg = en.to_sparse_graph(weight="length")
+    npt.assert_allclose(sg.adjacency.toarray(), [[0, 1, 0], [1, 0, 0], [0, 0, 0]])
+    assert sg.adjacency.nnz == 4  # the switch
+    assert sg.adjacency[[1], [2]].tolist() == [0.0]
+    sw.open()
+    assert sorted(en.to_sparse_graph().branch_ids) == ["Line1", "Line2"]
+    assert sorted(en.to_sparse_graph(respect_switches=False).branch_ids) == ["Line1", "Line2", "Switch"]
+    assert repr(en.to_sparse_graph()) == "<SparseGraph: nb_buses=3, nb_branches=2>"
+
+
+def test_to_rustworkx(all_elements_network: ElectricalNetwork):
+    en = all_elements_network
+    branches = [*en.lines.values(), *en.transformers.values(), *en.switches.values()]
+    graph = en.to_rustworkx()
+    assert graph.attrs == {"name": en.name}
+    assert graph.nodes() == list(en.buses)
+    assert graph.edges() == [{"id": b.id, "type": b.element_type} for b in branches]
+    bus_ids = list(en.buses)
+    assert list(graph.edge_list()) == [(bus_ids.index(b.bus1.id), bus_ids.index(b.bus2.id)) for b in branches]
+    graph = en.to_rustworkx(weight="length")
+    assert graph.edges()[0] == {"id": branches[0].id, "type": "line", "weight": branches[0].length.m}
+
+
 def test_propagate_nominal_voltages(all_elements_network, small_network):
     en = all_elements_network
     # Test that it works even if some nominal voltages are missing
@@ -2575,6 +3065,30 @@ def test_results_to_json(small_network_with_results, tmp_path):
     assert res_network == res_network_expected
 
 
+def test_results_from_dict_lazy(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    data = en.to_dict(include_results=True)
+    new_en = ElectricalNetwork.from_dict(data, include_results=True)
+
+    # The results are converted on first access
+    bus_id, bus = next(iter(new_en.buses.items()))
+    assert isinstance(bus._res_potentials, _RawComplexArray)
+    potentials = bus.res_potentials.m
+    assert potentials.dtype == np.complex128
+    npt.assert_allclose(potentials, en.buses[bus_id].res_potentials.m)
+    assert bus.res_potentials.m is potentials  # converted only once
+    load_id, load = next(iter(new_en.loads.items()))
+    npt.assert_allclose(load.res_currents.m, en.loads[load_id].res_currents.m)
+
+    # The copies of the network share the raw results but not the converted ones
+    copy_en = new_en.copy(include_results=True)
+    npt.assert_allclose(copy_en.buses[bus_id].res_potentials.m, potentials)
+    assert copy_en.buses[bus_id].res_potentials.m is not potentials
+    assert copy_en.to_dict(include_results=True) == data
+    assert new_en.to_dict(include_results=True) == data
+    assert_frame_equal(new_en.res_buses, en.res_buses)
+
+
 def test_propagate_voltages_step_up_transformers():
     # Source is located at the LV side of the transformer
     bus1 = Bus(id="Bus1", phases="abcn")
@@ -2618,8 +3132,8 @@ def test_duplicate_line_parameters_id():
     lp2 = LineParameters(id="LP", z_line=(0.1 + 0.1j) * np.eye(3))
     ln1 = Line(id="Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
     ln2 = Line(id="Line 2", bus1=bus1, bus2=bus2, parameters=lp2, length=0.1)
-    assert lp1._elements == {ln1}
-    assert lp2._elements == {ln2}
+    assert set(lp1._elements) == {ln1}
+    assert set(lp2._elements) == {ln2}
     with pytest.raises(RoseauLoadFlowException) as e:
         ElectricalNetwork.from_element(bus1)
     assert e.value.msg == (
@@ -2649,7 +3163,7 @@ def test_duplicate_line_parameters_id():
     lp1 = LineParameters(id="LP", z_line=(0.1 + 0.1j) * np.eye(3))
     ln1 = Line(id="Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
     ln2 = Line(id="Line 2", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
-    assert lp1._elements == {ln1, ln2}
+    assert set(lp1._elements) == {ln1, ln2}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["line"] == {lp1.id: lp1}
     lp2 = LineParameters(id="LP", z_line=(0.1 + 0.1j) * np.eye(3))
@@ -2667,13 +3181,13 @@ def test_duplicate_line_parameters_id():
     PotentialRef(id="PRef", element=bus1)
     lp1 = LineParameters(id="LP", z_line=(0.1 + 0.1j) * np.eye(3))
     ln1 = Line(id="Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
-    assert lp1._elements == {ln1}
+    assert set(lp1._elements) == {ln1}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["line"] == {lp1.id: lp1}
     lp2 = LineParameters(id="LP", z_line=(0.1 + 0.1j) * np.eye(3))
     ln1.parameters = lp2
-    assert lp1._elements == set()
-    assert lp2._elements == {ln1}
+    assert set(lp1._elements) == set()
+    assert set(lp2._elements) == {ln1}
     assert en._parameters["line"] == {lp2.id: lp2}
 
 
@@ -2688,8 +3202,8 @@ def test_duplicate_transformer_parameters_id():
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
     tr1 = Transformer(id="Transformer 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
     tr2 = Transformer(id="Transformer 2", bus_hv=bus1, bus_lv=bus2, parameters=tp2)
-    assert tp1._elements == {tr1}
-    assert tp2._elements == {tr2}
+    assert set(tp1._elements) == {tr1}
+    assert set(tp2._elements) == {tr2}
     with pytest.raises(RoseauLoadFlowException) as e:
         ElectricalNetwork.from_element(bus1)
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
@@ -2723,7 +3237,7 @@ def test_duplicate_transformer_parameters_id():
     tp1 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=100e3, z2=0.1, ym=0.1j)
     tr1 = Transformer(id="Transformer 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
     tr2 = Transformer(id="Transformer 2", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
-    assert tp1._elements == {tr1, tr2}
+    assert set(tp1._elements) == {tr1, tr2}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["transformer"] == {tp1.id: tp1}
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
@@ -2742,13 +3256,13 @@ def test_duplicate_transformer_parameters_id():
     PotentialRef(id="PRef 2", element=bus2)
     tp1 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=100e3, z2=0.1, ym=0.1j)
     tr1 = Transformer(id="Transformer 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
-    assert tp1._elements == {tr1}
+    assert set(tp1._elements) == {tr1}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["transformer"] == {tp1.id: tp1}
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
     tr1.parameters = tp2
-    assert tp1._elements == set()
-    assert tp2._elements == {tr1}
+    assert set(tp1._elements) == set()
+    assert set(tp2._elements) == {tr1}
     assert en._parameters["transformer"] == {tp2.id: tp2}
 
 
@@ -2819,3 +3333,239 @@ def test_can_voltage_source():
     np.testing.assert_allclose(bus.initial_potentials.m, [230, -230, 0])
     np.testing.assert_allclose(calculate_voltages(bus.initial_potentials, bus.phases).m, vs.voltages.m)
     assert bus.voltage_phases == vs.voltage_phases == ["cn", "an"]
+
+
+def test_diff(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    other = en.copy(include_results=True)
+    diff = en.diff(other)
+    assert diff.equal
+    assert repr(diff) == "<NetworkDiff: only_in_network=0, only_in_other=0, differences=0>"
+    assert diff.differences.empty
+    assert diff.differences.index.names == ["element_type", "element_id", "field"]
+
+    # Modify the inputs and the results of the other network
+    other.lines["line0"].length = 2.0
+    other.loads["load0"].powers = [100, 110, 100]
+    other.switches["switch0"].open()
+    other.buses["bus1"].geometry = Point(1.0, 2.0)
+    other.buses["bus1"]._res_potentials = en.buses["bus1"].res_potentials.m * 1.01
+    other.buses["bus1"]._fetch_results = False
+    other._results_valid = True
+    diff = en.diff(other, include_results=True)
+    assert not diff.equal
+    differences = diff.differences
+    assert differences.index.tolist() == [
+        ("buses", "bus1", "geometry"),
+        ("buses", "bus1", "results.potential"),
+        ("lines", "line0", "length"),
+        ("switches", "switch0", "closed"),
+        ("loads", "load0", "powers"),
+    ]
+    assert differences.loc[("lines", "line0", "length")].tolist() == [1.5, 2.0, 0.5]
+    assert differences.loc[("loads", "load0", "powers"), "max_difference"] == pytest.approx(abs(100 + 5j - 110))
+    assert differences.loc[("buses", "bus1", "results.potential"), "max_difference"] == pytest.approx(
+        0.01 * abs(en.buses["bus1"].res_potentials.m).max()
+    )
+    npt.assert_allclose(
+        differences.loc[("buses", "bus1", "results.potential"), "other_value"], other.buses["bus1"]._res_potentials
+    )
+    assert differences.loc[("switches", "switch0", "closed")].tolist()[:2] == [True, False]
+    assert np.isnan(differences.loc[("switches", "switch0", "closed"), "max_difference"])
+    assert differences.loc[("buses", "bus1", "geometry"), "value"] is None
+    assert differences.loc[("buses", "bus1", "geometry"), "other_value"] == Point(1.0, 2.0)
+
+    # The tolerances
+    diff = en.diff(other, rtol=0.02, include_results=True)
+    assert ("buses", "bus1", "results.potential") not in diff.differences.index
+    diff = en.diff(other, include_results=False)
+    assert not diff.differences.index.get_level_values("field").str.startswith("results.").any()
+
+    # The parameters and the fields missing from the frames
+    other = en.copy(include_results=True)
+    lp = en.lines["line0"].parameters
+    lp_data = lp.to_dict()
+    lp_data["z_line"][0][0][0] *= 2  # real part of z_aa
+    other.lines["line0"].parameters = LineParameters.from_dict(lp_data)
+    other.loads["load0"]._connect_neutral = False
+    diff = en.diff(other, include_results=False)
+    assert diff.differences.index.tolist() == [
+        ("loads", "load0", "connect_neutral"),
+        ("lines_params", lp.id, "z_line"),
+    ]
+
+    # The results must be valid
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.diff(other)
+    assert e.value.msg == (
+        "Trying to compare networks with invalid results. Either call `en.solve_load_flow()` before comparing or "
+        "pass `include_results=False`."
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LOAD_FLOW_RESULT
+
+    # A network without results
+    other = en.copy(include_results=False)
+    diff = en.diff(other)
+    assert diff.differences.index.get_level_values("field").str.startswith("results.").all()
+    assert np.isnan(diff.differences["max_difference"]).all()
+    assert np.isnan(diff.differences.loc[("buses", "bus1", "results.potential"), "other_value"]).all()
+
+    # Added and removed elements
+    other = en.copy()
+    other.loads["load0"].disconnect()
+    PowerLoad(id="new_load", bus=other.buses["bus4"], powers=[100, 100, 100])
+    diff = en.diff(other, include_results=False)
+    assert diff.only_in_network == {"loads": ["load0"]}
+    assert diff.only_in_other == {"loads": ["new_load"]}
+    assert diff.differences.empty
+    assert repr(diff) == "<NetworkDiff: only_in_network=1, only_in_other=1, differences=0>"
+
+    # The networks must have the same type
+    with pytest.raises(TypeError, match=r"Expected a network of type"):
+        en.diff(en.to_dict())
+
+
+def test_from_frames(all_elements_network):
+    en = all_elements_network
+    loads = en.loads_frame
+    loads = loads[~loads["flexible"]]  # flexible loads are not supported
+    sources = en.sources_frame
+    frames = {
+        "buses": en.buses_frame,
+        "lines": en.lines_frame,
+        "transformers": en.transformers_frame,
+        "switches": en.switches_frame,
+        "loads": loads,
+        "sources": sources,
+        "grounds": en.grounds_frame,
+        "potential_refs": en.potential_refs_frame,
+        "ground_connections": en.ground_connections_frame,
+    }
+    lines_params = [line.parameters for line in en.lines.values()]
+    transformers_params = {tr.parameters.id: tr.parameters for tr in en.transformers.values()}
+    new_en = ElectricalNetwork.from_frames(
+        **frames, lines_params=lines_params, transformers_params=transformers_params, crs=en.crs
+    )
+    diff = en.diff(new_en, include_results=False)
+    assert diff.only_in_network == {"loads": ["load3", "load4", "load5"]}
+    assert diff.only_in_other == {}
+    assert diff.differences.empty
+    assert new_en.lines["line0"].parameters is en.lines["line0"].parameters
+
+    # The optional columns take the default values of the constructors
+    new_en = ElectricalNetwork.from_frames(
+        buses=frames["buses"][["phases"]],
+        lines=frames["lines"][["bus1_id", "bus2_id", "parameters_id", "length", "ground_id"]],
+        transformers=frames["transformers"][["bus_hv_id", "bus_lv_id", "parameters_id"]],
+        switches=frames["switches"][["bus1_id", "bus2_id"]],
+        loads=loads,
+        sources=sources,
+        grounds=frames["grounds"],
+        potential_refs=frames["potential_refs"],
+        ground_connections=frames["ground_connections"],
+        lines_params=lines_params,
+        transformers_params=transformers_params,
+    )
+    assert new_en.buses["bus1"].nominal_voltage is None
+    assert new_en.transformers["transformer0"].tap == 1.0
+    assert all(line.geometry is None for line in new_en.lines.values())
+
+    def from_frames(**kwargs):
+        return ElectricalNetwork.from_frames(
+            **(frames | kwargs), lines_params=lines_params, transformers_params=transformers_params
+        )
+
+    # Missing columns
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(lines=frames["lines"].drop(columns=["length", "bus2_id"]))
+    assert e.value.msg == "The lines frame is missing the required columns ['bus2_id', 'length']."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+
+    # Missing and bad values
+    buses = frames["buses"].copy()
+    buses.loc["bus1", "phases"] = None
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(buses=buses)
+    assert e.value.msg == "The column 'phases' of the buses frame has missing values."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    lines = frames["lines"].copy()
+    lines["length"] = ["1 km", "2 km", "3 km"]
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(lines=lines)
+    assert e.value.msg == "The column 'length' of the lines frame must contain numbers."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    lines["length"] = [1.0, -2.0, 3.0]
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(lines=lines)
+    assert e.value.msg == "A line length must be greater than 0. -2.00 km provided."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE
+
+    # Duplicate IDs
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(switches=pd.concat([frames["switches"], frames["switches"]]))
+    assert e.value.msg == "Duplicate switch ID 'switch0' in the network."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_SWITCH_ID
+
+    # Unknown references
+    lines = frames["lines"].copy()
+    lines.loc["line1", "bus2_id"] = "unknown"
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(lines=lines)
+    assert e.value.msg == "The column 'bus2_id' of the lines frame references the unknown ID 'unknown'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BUS_ID
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ElectricalNetwork.from_frames(**frames, lines_params=lines_params)
+    assert e.value.msg == "The column 'parameters_id' of the transformers frame references the unknown ID 'tp0'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
+    potential_refs = frames["potential_refs"].copy()
+    potential_refs["element_type"] = "line"
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(potential_refs=potential_refs)
+    assert e.value.msg == (
+        "The column 'element_type' of the potential_refs frame has the invalid value 'line', "
+        "expected one of ['bus', 'ground']."
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    ground_connections = frames["ground_connections"].copy()
+    ground_connections["element_id"] = "unknown"
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(ground_connections=ground_connections)
+    assert e.value.msg == "The ground_connections frame references the unknown bus 'unknown'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+
+    # Loads
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(loads=en.loads_frame)
+    assert e.value.msg == "Flexible loads cannot be created from the loads frame, create them with their constructor."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(loads=loads.assign(type="admittance"))
+    assert e.value.msg == "Unknown load type 'admittance' for load 'load0'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        from_frames(loads=loads.drop(columns="currents"))
+    assert e.value.msg == "The loads frame is missing the required columns ['currents']."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+
+
+def test_from_frames_round_trip():
+    # Lines with shunt admittances connected to a ground and potential references with default phases
+    en = ElectricalNetwork.from_catalogue(name="LVFeeder00939", load_point_name="Summer")
+    new_en = ElectricalNetwork.from_frames(
+        buses=en.buses_frame,
+        lines=en.lines_frame,
+        transformers=en.transformers_frame,
+        switches=en.switches_frame,
+        loads=en.loads_frame,
+        sources=en.sources_frame,
+        grounds=en.grounds_frame,
+        potential_refs=en.potential_refs_frame,
+        ground_connections=en.ground_connections_frame,
+        lines_params=[line.parameters for line in en.lines.values()],
+        transformers_params=[tr.parameters for tr in en.transformers.values()],
+        crs=en.crs,
+    )
+    diff = en.diff(new_en, include_results=False)
+    assert diff.only_in_network == {}
+    assert diff.only_in_other == {}
+    assert diff.differences.empty
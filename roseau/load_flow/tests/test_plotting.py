@@ -1,3 +1,7 @@
+import json
+import re
+import shutil
+import subprocess
 from unittest.mock import Mock
 
 import numpy as np
@@ -17,10 +21,14 @@ from roseau.load_flow.models import (
 )
 from roseau.load_flow.network import ElectricalNetwork
 from roseau.load_flow.plotting import (
+    _get_map_tiles_results,
+    export_map_tiles,
     plot_interactive_map,
     plot_results_interactive_map,
     plot_symmetrical_voltages,
     plot_voltage_phasors,
+    voltage_profile,
+    voltage_profile_data,
 )
 from roseau.load_flow.sym import PositiveSequence
 
@@ -200,3 +208,143 @@ def test_plot_interactive_map(test_networks_path):
     en.crs = "EPSG:4326"
     plot_interactive_map(en)
     plot_results_interactive_map(en)
+
+
+def test_export_map_tiles(test_networks_path, tmp_path):
+    en = ElectricalNetwork.from_json(path=test_networks_path / "small_network.json", include_results=True)
+    en.crs = "EPSG:4326"
+    path = export_map_tiles(en, tmp_path / "tiles", min_zoom=10, max_zoom=18, buses_min_zoom=15, with_results=True)
+    assert path == (tmp_path / "tiles").resolve()
+
+    metadata = json.loads((path / "tiles.json").read_text())
+    assert metadata["tiles"] == ["{z}/{x}/{y}.geojson"]
+    assert (metadata["minzoom"], metadata["maxzoom"]) == (10, 18)
+    npt.assert_allclose(metadata["bounds"], [-1.320149, 48.647941, -1.318375, 48.649713], atol=1e-6)
+
+    def read_features(zoom: int) -> list[dict]:
+        return [
+            f for tile in sorted(path.glob(f"{zoom}/*/*.geojson")) for f in json.loads(tile.read_text())["features"]
+        ]
+
+    # The buses are only exported from the zoom level 15
+    features = read_features(14)
+    assert [f["properties"]["id"] for f in features] == ["line"]
+    assert features[0]["properties"]["res_state"] == "unknown"  # no ampacities
+    assert features[0]["properties"]["color"] == "#666666"
+    features = read_features(15)
+    assert {f["properties"]["id"] for f in features} == {"bus0", "bus1", "line"}
+    assert {f["properties"]["element_type"] for f in features} == {"bus", "line"}
+
+    # The line is clipped to the tiles it crosses at high zoom levels
+    assert len(list(path.glob("18/*/*.geojson"))) > 1
+    assert all(f["geometry"]["type"] in ("Point", "LineString") for f in read_features(18))
+
+    # Map with the tiles
+    m = plot_interactive_map(en, network_tiles="http://localhost:8000/tiles")
+    html = m.get_root().render()
+    assert '"http://localhost:8000/tiles"' in html
+    assert "tiles.json" in html
+    m = plot_results_interactive_map(en, network_tiles="http://localhost:8000/tiles", fit_bounds=False)
+    npt.assert_allclose(m.location, [48.648827, -1.319262], atol=1e-6)
+
+    # Errors
+    with pytest.raises(ValueError, match=r"Expected 0 <= min_zoom <= max_zoom"):
+        export_map_tiles(en, tmp_path / "tiles", min_zoom=12, max_zoom=10)
+    rlfs_en = rlfs.ElectricalNetwork.from_json(
+        path=test_networks_path.parent.parent.parent.parent / "load_flow_single/tests/data/networks/small_network.json"
+    )
+    with pytest.raises(TypeError, match=r"Only multi-phase networks can be exported to map tiles"):
+        export_map_tiles(rlfs_en, tmp_path / "tiles")
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is needed to run the script of the map")
+def test_export_map_tiles_escape_markup(test_networks_path, tmp_path):
+    # An element whose ID contains markup
+    script_id = "<script>alert('bus1')</script>"
+
+    def rename(value):
+        if isinstance(value, dict):
+            return {k: rename(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [rename(v) for v in value]
+        return script_id if value == "bus1" else value
+
+    data = rename(json.loads((test_networks_path / "small_network.json").read_text()))
+    en = ElectricalNetwork.from_dict(data)
+    en.crs = "EPSG:4326"
+    path = export_map_tiles(en, tmp_path / "tiles", min_zoom=15, max_zoom=15, with_results=True)
+
+    # The tiles hold the ID as it is, it is data
+    features = [f for tile in path.glob("15/*/*.geojson") for f in json.loads(tile.read_text())["features"]]
+    [properties] = [f["properties"] for f in features if f["properties"]["id"] == script_id]
+    assert properties["element_type"] == "bus"
+
+    # The tooltips of the map escape the markup of the properties of the tiles
+    html = plot_interactive_map(en, network_tiles="http://localhost:8000/tiles").get_root().render()
+    assert script_id not in html
+    match = re.search(r"(var styleProperties = .*?;).*?(function escapeHtml.*?)function onEachFeature", html, re.DOTALL)
+    assert match is not None
+    script = (
+        f'{match[1]}\n{match[2]}\nprocess.stdout.write(tooltip(JSON.parse(require("fs").readFileSync(0, "utf8"))));'
+    )
+    result = subprocess.run(
+        ["node", "-e", script], input=json.dumps(properties), capture_output=True, text=True, check=True
+    )
+    assert "<script>" not in result.stdout
+    assert "<td>&lt;script&gt;alert(&#39;bus1&#39;)&lt;/script&gt;</td>" in result.stdout
+    assert result.stdout.startswith("<table><tr><th>id</th>")
+
+
+def test_map_tiles_results(test_networks_path):
+    en = ElectricalNetwork.from_json(path=test_networks_path / "all_elements_network.json", include_results=True)
+    results = _get_map_tiles_results(en)
+    # The states computed at once are those of the elements
+    for bus_id, (state, values) in results["bus"].items():
+        bus = en.buses[bus_id]
+        assert state == bus._res_state_getter()
+        assert values["res_max_voltage_level"] == pytest.approx(100 * bus.res_voltage_levels.m.max())
+    for line_id, (state, values) in results["line"].items():
+        line = en.lines[line_id]
+        assert state == line._res_state_getter()
+        assert values["res_loading"] == pytest.approx(100 * line.res_loading.m.max())
+    for tr_id, (state, values) in results["transformer"].items():
+        tr = en.transformers[tr_id]
+        assert state == tr._res_state_getter()
+        assert values["res_loading"] == pytest.approx(100 * tr.res_loading.m)
+    assert results["bus"].keys() == {bus.id for bus in en.buses.values() if bus.nominal_voltage is not None}
+
+
+def test_voltage_profile_data(test_networks_path):
+    en = ElectricalNetwork.from_json(path=test_networks_path / "all_elements_network.json", include_results=True)
+    for bus_id, vn in en._get_nominal_voltages().items():
+        en.buses[bus_id].nominal_voltage = vn
+    data = voltage_profile_data(en, traverse_transformers=True, distance_unit="m")
+    assert repr(data) == "<VoltageProfileData: starting_bus_id='bus0', 7 buses, 6 edges>"
+    assert data.edge_types == ["line", "line", "line", "transformer", "switch", "switch"]
+    assert data.predecessors[0] == -1
+
+    # The same values as the voltage profile
+    for mode, voltages in (("min", data.voltages_min), ("max", data.voltages_max)):
+        profile = voltage_profile(en, mode=mode, traverse_transformers=True, distance_unit="m")
+        assert list(profile.buses) == data.bus_ids
+        npt.assert_allclose(data.distances, [bus["distance"] for bus in profile.buses.values()])
+        npt.assert_allclose(voltages, [bus["voltage"] for bus in profile.buses.values()])
+        npt.assert_allclose(data.segments(mode)[:, 1, 1], voltages[data.edge_to])
+    npt.assert_allclose(data.loadings[:3], [line["loading"] for line in profile.lines.values()])
+    npt.assert_allclose(data.loadings[3], profile.transformers["transformer0"]["loading"])
+    assert np.isnan(data.loadings[4:]).all()  # switches
+    assert data.segments().shape == (6, 2, 2)
+
+    # The shortest paths are cached until the topology changes
+    tree = data._tree
+    data.refresh()
+    assert data._tree is tree
+    assert voltage_profile_data(en, traverse_transformers=True)._tree is tree
+    en.lines["line0"].length = 2.0
+    assert en._shortest_path_trees == {}
+
+    # Errors
+    with pytest.raises(ValueError, match=r"Invalid mode 'mean', expected 'min' or 'max'\."):
+        data.segments("mean")  # type: ignore
+    with pytest.raises(TypeError, match=r"Only multi-phase networks are supported"):
+        voltage_profile_data(rlfs.ElectricalNetwork.from_catalogue("MVFeeder004", load_point_name="Summer"))
@@ -0,0 +1,280 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import roseau.load_flow_single as rlfs
+from roseau.load_flow import _parallel
+from roseau.load_flow.constants import SQRT3
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.models import Bus, CurrentLoad, Line, LineParameters, PotentialRef, PowerLoad, VoltageSource
+from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.probabilistic import PowerDistribution, ProbabilisticAnalysis, _ProbabilisticSolver
+from roseau.load_flow.sym import ALPHA, ALPHA2
+
+
+@pytest.fixture
+def network() -> ElectricalNetwork:
+    # A feeder with two houses and a photovoltaic generator
+    source_bus = Bus(id="s", phases="abcn", nominal_voltage=400)
+    buses = {
+        bus_id: Bus(id=bus_id, phases="abcn", nominal_voltage=400, min_voltage_level=0.9, max_voltage_level=1.1)
+        for bus_id in ("b1", "b2")
+    }
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=np.complex128))
+    return ElectricalNetwork(
+        buses=[source_bus, *buses.values()],
+        lines=[
+            Line(id="l1", bus1=source_bus, bus2=buses["b1"], parameters=lp, length=0.1),
+            Line(id="l2", bus1=buses["b1"], bus2=buses["b2"], parameters=lp, length=0.1),
+        ],
+        transformers=[],
+        switches=[],
+        loads=[
+            PowerLoad(id="house1", bus=buses["b1"], powers=[1000, 1000, 1000]),
+            PowerLoad(id="house2", bus=buses["b2"], powers=[1000, 1000, 1000]),
+            PowerLoad(id="pv", bus=buses["b2"], powers=[0, 0, 0]),
+            CurrentLoad(id="light", bus=buses["b2"], currents=[1, ALPHA2, ALPHA]),
+        ],
+        sources=[VoltageSource(id="source", bus=source_bus, voltages=230)],
+        grounds=[],
+        potential_refs=[PotentialRef(id="pref", element=source_bus)],
+    )
+
+
+def power_potentials(powers: list[float]):
+    """Fake potentials: the voltage levels of the buses drop with the total power of the loads.
+
+    The total power of the loads of each load flow is appended to `powers`.
+    """
+
+    def potentials(network):
+        total = sum(load._powers.sum().real for load in network.loads.values() if load.type == "power")
+        powers.append(total)
+        if total > 1e5:
+            raise RoseauLoadFlowException(msg="Diverged", code=RoseauLoadFlowExceptionCode.NO_LOAD_FLOW_CONVERGENCE)
+        return {
+            bus_id: [*(400 / SQRT3 * (1.0 - i * total / 1e5) * np.array([1, ALPHA2, ALPHA])), 0]
+            for i, bus_id in enumerate(network.buses)
+        }
+
+    return potentials
+
+
+def test_power_distribution():
+    assert PowerDistribution("house1", [1000, 2000]).loads == ("house1",)
+    assert PowerDistribution(None, [1000, 2000]).loads is None
+    rng = np.random.default_rng(42)
+
+    # Empirical samples, with the reactive power of the power factor
+    distribution = PowerDistribution(["house1", "house2"], [1000, 2000], power_factor=0.8)
+    powers = distribution._draw(rng, 5, 2)
+    assert powers.shape == (5, 2)
+    assert set(powers.real.ravel().tolist()) <= {1000.0, 2000.0}
+    np.testing.assert_allclose(powers.imag, 0.75 * powers.real)
+
+    # Function of a random number generator and objects with a `rvs` method, fully correlated
+    distribution = PowerDistribution(["house1", "house2"], lambda rng, size: rng.normal(1000, 100, size))
+    powers = distribution._draw(rng, 4, 2)
+    assert np.all(np.isreal(powers))
+    distribution = PowerDistribution(["house1", "house2"], lambda rng, size: rng.normal(1000, 100, size) + 100j)
+    np.testing.assert_allclose(distribution._draw(rng, 4, 2).imag, 100.0)
+
+    class Uniform:
+        def rvs(self, size, random_state):
+            return random_state.uniform(-3000, 0, size)
+
+    powers = PowerDistribution(["pv", "house1"], Uniform(), independent=False)._draw(rng, 6, 2)
+    assert powers.shape == (6, 2)
+    np.testing.assert_array_equal(powers[:, 0], powers[:, 1])
+    assert np.all((powers.real >= -3000) & (powers.real <= 0))
+
+    # Errors
+    with pytest.raises(RoseauLoadFlowException) as e:
+        PowerDistribution("house1", [1000], power_factor=0)
+    assert e.value.msg == "The power factor must be in the interval (0, 1], got 0."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+    with pytest.raises(RoseauLoadFlowException) as e:
+        PowerDistribution("house1", [])
+    assert e.value.msg == (
+        "The empirical samples of a power distribution must be a non-empty 1D array of numbers, got an "
+        "array of shape (0,) and type float64."
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+
+def test_solve_probabilistic_load_flow(network, fake_load_flow):
+    powers = []
+    calls = fake_load_flow(power_potentials(powers))
+    distributions = [
+        PowerDistribution(["house1", "house2"], np.linspace(0, 6000, 61)),
+        PowerDistribution("pv", np.linspace(-3000, 0, 31)),
+    ]
+    analysis = network.solve_probabilistic_load_flow(
+        distributions, seed=42, batch_size=50, min_samples=100, max_samples=5000, quantiles_tolerance=1e-3
+    )
+    assert isinstance(analysis, ProbabilisticAnalysis)
+    assert analysis.converged
+    assert 100 <= analysis.n_samples < 5000
+    assert analysis.n_samples % 50 == 0
+    assert repr(analysis) == (
+        f"<ProbabilisticAnalysis: {analysis.n_samples} samples, solved={analysis.n_samples}, diverged=0, "
+        f"converged=True>"
+    )
+    assert analysis.load_ids == ["house1", "house2", "pv"]
+    assert analysis.powers.shape == (analysis.n_samples, 3)
+    assert analysis.bus_ids == ["s", "b1", "b2"]
+    assert analysis.line_ids == []  # no ampacities
+    assert analysis.transformer_ids == []
+    assert analysis.buses_min_voltage_levels.shape == (analysis.n_samples, 3)
+    assert analysis.lines_loadings.shape == (analysis.n_samples, 0)
+    assert analysis.convergence.index.name == "n_samples"
+    assert analysis.convergence.index.tolist() == list(range(50, analysis.n_samples + 1, 50))
+    assert np.isnan(analysis.convergence["max_change"].iloc[0])
+    assert analysis.convergence["max_change"].iloc[-1] <= 1e-3
+
+    # The voltage levels follow the powers of each sample
+    total_powers = analysis.powers.real.sum(axis=1)
+    np.testing.assert_allclose(analysis.buses_min_voltage_levels[:, 2], 1 - 2 * total_powers / 1e5)
+    np.testing.assert_allclose(analysis.buses_max_voltage_levels[:, 0], 1.0)
+
+    # The base case is solved first then the samples on a copy of the network, warm started
+    base_call, *sample_calls = calls
+    assert base_call["network"] is network
+    assert powers[0] == 6000
+    assert len(sample_calls) == analysis.n_samples
+    assert all(c["network"] is not network and c["warm_start"] for c in sample_calls)
+    np.testing.assert_allclose(powers[1:], total_powers)
+    assert network.loads["house1"].powers.m.tolist() == [1000, 1000, 1000]  # the network is not modified
+
+    # The quantiles and the violation probabilities
+    quantiles = analysis.get_quantiles(0.95)
+    assert quantiles.index.tolist() == [("bus", "s"), ("bus", "b1"), ("bus", "b2")]
+    assert quantiles.columns.tolist() == ["min_voltage_level", "max_voltage_level", "loading"]
+    assert quantiles["loading"].isna().all()
+    np.testing.assert_allclose(
+        quantiles.loc[("bus", "b2"), "min_voltage_level"], np.quantile(1 - 2 * total_powers / 1e5, 0.95)
+    )
+    probabilities = analysis.violation_probabilities
+    assert probabilities.name == "probability"
+    expected = np.mean(1 - 2 * total_powers / 1e5 < 0.9)
+    assert probabilities.loc[("bus", "b2")] == pytest.approx(expected)
+    assert probabilities.loc[("bus", "s")] == 0.0  # no limits
+
+    # The same seed gives the same samples
+    analysis2 = network.solve_probabilistic_load_flow(
+        distributions, seed=42, batch_size=50, min_samples=100, max_samples=5000, quantiles_tolerance=1e-3
+    )
+    np.testing.assert_array_equal(analysis2.powers, analysis.powers)
+
+    # A single distribution for all the power loads, samples that diverge and no convergence
+    analysis = network.solve_probabilistic_load_flow(
+        [PowerDistribution(None, np.linspace(0, 50_000, 101), independent=False)],
+        seed=1,
+        batch_size=10,
+        min_samples=20,
+        max_samples=30,
+        quantiles_tolerance=0.0,
+    )
+    assert analysis.load_ids == ["house1", "house2", "pv"]
+    assert not analysis.converged
+    assert analysis.n_samples == 30
+    diverged = analysis.status == "diverged"
+    np.testing.assert_array_equal(diverged, 3 * analysis.powers[:, 0].real > 1e5)
+    assert diverged.any()
+    assert np.isnan(analysis.buses_min_voltage_levels[diverged]).all()
+    assert not np.isnan(analysis.buses_min_voltage_levels[~diverged]).any()
+
+
+def test_solve_probabilistic_load_flow_worker(network, fake_load_flow):
+    fake_load_flow(power_potentials([]))
+    # The worker processes create their network from its dictionary with the base case results
+    network.solve_load_flow()
+    data = network.to_dict(include_results=True)
+    _parallel.init_worker(_ProbabilisticSolver, ElectricalNetwork, data, ["house1", "pv"], {"warm_start": True})
+    try:
+        status, iterations, _, buses_min, buses_max, *_ = _parallel.solve_in_worker(
+            np.array([[3000, -3000], [6000, 0]], dtype=np.complex128)
+        )
+    finally:
+        _parallel._worker_solver = None
+    assert status.tolist() == ["solved", "solved"]
+    assert iterations.tolist() == [2, 2]
+    np.testing.assert_allclose(buses_min[:, 2], [1 - 2 * 3000 / 1e5, 1 - 2 * 9000 / 1e5])
+
+
+def test_set_powers_single_phase():
+    bus = rlfs.Bus(id="bus", nominal_voltage=400)
+    load = rlfs.PowerLoad(id="load", bus=bus, power=1000)
+    rlfs.VoltageSource(id="source", bus=bus, voltage=400)
+    network = rlfs.ElectricalNetwork.from_element(bus)
+    solver = _ProbabilisticSolver.__new__(_ProbabilisticSolver)
+    solver.network, solver.loads = network, [load]
+    solver.set_powers(np.array([2000 + 500j]))
+    assert load.power.m == 2000 + 500j
+
+
+def test_solve_probabilistic_load_flow_errors(network):
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([PowerDistribution("unknown", [1000])])
+    assert e.value.msg == "Load 'unknown' of a power distribution is not part of the network."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LOAD_ID
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([PowerDistribution("light", [1000])])
+    assert e.value.msg == "Load 'light' of a power distribution must be a power load, not a current load."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow(
+            [PowerDistribution("house1", [1000]), PowerDistribution(["house2", "house1"], [1000])]
+        )
+    assert e.value.msg == "Load 'house1' is part of several power distributions."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([PowerDistribution(None, [1000]), PowerDistribution(None, [1000])])
+    assert e.value.msg == "Only one power distribution can apply to all the power loads of the network."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([], batch_size=0)
+    assert e.value.msg == "The batch size must be positive, got 0."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([], min_samples=100, max_samples=10)
+    assert e.value.msg == "The minimal number of samples (100) is greater than the maximal one (10)."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_probabilistic_load_flow([], quantiles=[0.5, 95])
+    assert e.value.msg == "The probabilities of the quantiles must be between 0 and 1, got [0.5, 95]."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
+
+
+def test_get_quantiles_errors():
+    analysis = ProbabilisticAnalysis(
+        converged=True,
+        status=np.array([], dtype="<U8"),
+        iterations=np.array([], dtype=np.int32),
+        residuals=np.array([], dtype=np.float64),
+        load_ids=[],
+        powers=np.zeros((0, 0), dtype=np.complex128),
+        bus_ids=["b"],
+        line_ids=[],
+        transformer_ids=[],
+        buses_min_voltage_levels=np.zeros((0, 1)),
+        buses_max_voltage_levels=np.zeros((0, 1)),
+        lines_loadings=np.zeros((0, 0)),
+        transformers_loadings=np.zeros((0, 0)),
+        buses_violated=np.zeros((0, 1), dtype=np.bool_),
+        lines_violated=np.zeros((0, 0), dtype=np.bool_),
+        transformers_violated=np.zeros((0, 0), dtype=np.bool_),
+        convergence=pd.DataFrame({"max_change": []}, index=pd.Index([], name="n_samples")),
+    )
+    assert analysis.get_quantiles(0.5)["min_voltage_level"].isna().all()  # no samples
+    assert analysis.violation_probabilities.tolist() == [0.0]
+    with pytest.raises(RoseauLoadFlowException) as e:
+        analysis.get_quantiles(95)
+    assert e.value.msg == "The probability of the quantile must be between 0 and 1, got 95."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PROBABILISTIC_LOAD_FLOW
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.models import (
+    Bus,
+    Line,
+    LineParameters,
+    PotentialRef,
+    PowerLoad,
+    Transformer,
+    TransformerParameters,
+    VoltageSource,
+)
+from roseau.load_flow.network import ElectricalNetwork
+from roseau.load_flow.sym import ALPHA, ALPHA2
+from roseau.load_flow.tap_control import TapChanger, TapControlResult
+
+
+@pytest.fixture
+def network() -> ElectricalNetwork:
+    mv_bus = Bus(id="mv", phases="abc", nominal_voltage=20e3)
+    lv_bus = Bus(id="lv", phases="abcn", nominal_voltage=400)
+    lv_bus1 = Bus(id="lv1", phases="abcn", nominal_voltage=400)
+    VoltageSource(id="source", bus=mv_bus, voltages=20e3)
+    PotentialRef(id="pref_mv", element=mv_bus)
+    PotentialRef(id="pref_lv", element=lv_bus)
+    tp = TransformerParameters.from_catalogue(name="FT 400kVA 15/20kV(20) 400V Dyn11")
+    Transformer(id="tr", bus_hv=mv_bus, bus_lv=lv_bus, parameters=tp)
+    lp = LineParameters(id="lp", z_line=0.1 * np.eye(4, dtype=np.complex128))
+    Line(id="line", bus1=lv_bus, bus2=lv_bus1, parameters=lp, length=0.1)
+    PowerLoad(id="load", bus=lv_bus1, powers=[1000, 1000, 1000])
+    return ElectricalNetwork.from_element(mv_bus)
+
+
+def tap_potentials(levels: dict[str, np.ndarray]):
+    """Fake potentials: the voltages of the LV buses are proportional to the tap of the transformer.
+
+    `levels` holds the voltage levels of the phases of the LV buses at tap 1.
+    """
+
+    def potentials(network):
+        tap = network.transformers["tr"].tap
+        return {bus_id: [*(230 * tap * bus_levels * [1, ALPHA2, ALPHA]), 0] for bus_id, bus_levels in levels.items()}
+
+    return potentials
+
+
+def test_tap_control(network, fake_load_flow):
+    levels = {"lv": np.array([1.0, 1.0, 1.0]), "lv1": np.array([0.9, 0.92, 0.94])}
+    calls = fake_load_flow(tap_potentials(levels))
+    transformer = network.transformers["tr"]
+    network._valid = True  # the engine network is already built
+
+    # The LV bus is within the band: a single load flow is solved
+    result = network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr")], solver="newton")
+    assert isinstance(result, TapControlResult)
+    assert result.converged
+    assert result.iterations == 1
+    assert result.load_flow_iterations == 2
+    assert result.residual == 1e-8
+    assert result.taps == {"tr": 1.0}
+    assert repr(result) == "<TapControlResult: converged=True, iterations=1>"
+    assert transformer.tap == 1.0
+
+    # The end of the feeder is below the band: the tap is raised in one move
+    calls.clear()
+    result = network.solve_load_flow_with_tap_changers(
+        [TapChanger(transformer_id="tr", bus_id="lv1", u_min=0.95, u_max=1.05)], warm_start=False, solver="newton"
+    )
+    assert result.converged
+    assert result.iterations == 2
+    assert result.load_flow_iterations == 4
+    expected = pd.DataFrame(
+        {"tr": [1.0, 1.0625]},
+        index=pd.RangeIndex(2, name="iteration"),
+        columns=pd.Index(["tr"], name="transformer_id"),
+    )
+    assert_frame_equal(result.trajectory, expected)
+    assert transformer.tap == 1.0625
+    levels_lv1 = network.buses["lv1"].res_voltage_levels.m
+    assert levels_lv1.min() >= 0.95
+    assert levels_lv1.max() <= 1.05
+    # Only the first load flow is cold-started and the network is not rebuilt
+    assert [{k: c[k] for k in ("warm_start", "solver", "valid")} for c in calls] == [
+        {"warm_start": False, "solver": "newton", "valid": True},
+        {"warm_start": True, "solver": "newton", "valid": True},
+    ]
+
+    # The voltage of the bus is above the band: the tap is lowered
+    levels["lv"] = np.array([1.04, 1.04, 1.04])
+    result = network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr", u_max=1.05)])
+    assert result.converged
+    assert result.trajectory["tr"].tolist() == [1.0625, 1.0125]
+    assert network.buses["lv"].res_voltage_levels.m.max() <= 1.05
+
+    # The tap is limited by its range
+    transformer.tap = 1.0
+    levels["lv1"] = np.array([0.8, 0.8, 0.8])
+    result = network.solve_load_flow_with_tap_changers(
+        [TapChanger(transformer_id="tr", bus_id="lv1", tap_max=1.05, tap_step=0.025)]
+    )
+    assert not result.converged
+    assert result.trajectory["tr"].tolist() == [1.0, 1.05]
+
+    # The band is narrower than the spread of the voltages of the phases: the tap is not moved
+    transformer.tap = 1.0
+    levels["lv1"] = np.array([0.9, 1.0, 1.1])
+    result = network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr", bus_id="lv1")])
+    assert not result.converged
+    assert result.iterations == 1
+    assert result.taps == {"tr": 1.0}
+
+    # Raising the tap would push another phase above the band: the tap is moved as much as possible
+    levels["lv1"] = np.array([0.9, 0.96, 1.0])
+    result = network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr", bus_id="lv1")])
+    assert not result.converged
+    assert result.trajectory["tr"].tolist() == [1.0, 1.05]
+
+    # The number of tap moves is bounded
+    transformer.tap = 1.0
+    levels["lv1"] = np.array([0.9, 0.9, 0.9])
+    result = network.solve_load_flow_with_tap_changers(
+        [TapChanger(transformer_id="tr", bus_id="lv1")], max_tap_iterations=0
+    )
+    assert not result.converged
+    assert result.iterations == 1
+    assert result.taps == {"tr": 1.0}
+
+
+def test_tap_control_errors(network):
+    # Bad tap changer parameters
+    with pytest.raises(RoseauLoadFlowException, match=r"Invalid voltage band") as e:
+        TapChanger(transformer_id="tr", u_min=1.05, u_max=0.95)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
+    with pytest.raises(RoseauLoadFlowException, match=r"Invalid tap range") as e:
+        TapChanger(transformer_id="tr", tap_min=1.1, tap_max=0.9)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
+    with pytest.raises(RoseauLoadFlowException, match=r"Invalid tap step") as e:
+        TapChanger(transformer_id="tr", tap_step=0)
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
+
+    # Unknown elements
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="unknown")])
+    assert e.value.msg == "Transformer 'unknown' of the tap changer is not part of the network."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TRANSFORMER_ID
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr", bus_id="unknown")])
+    assert e.value.msg == (
+        "Bus 'unknown' controlled by the tap changer of transformer 'tr' is not part of the network."
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BUS_ID
+
+    # Several tap changers for the same transformer
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr"), TapChanger(transformer_id="tr")])
+    assert e.value.msg == "Transformer 'tr' has several tap changers."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
+
+    # The controlled bus must have a nominal voltage
+    network.buses["lv1"].nominal_voltage = None
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr", bus_id="lv1")])
+    assert e.value.msg == "Bus 'lv1' controlled by the tap changer of transformer 'tr' must have a nominal voltage."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
+
+    # Bad number of iterations
+    with pytest.raises(RoseauLoadFlowException) as e:
+        network.solve_load_flow_with_tap_changers([TapChanger(transformer_id="tr")], max_tap_iterations=-1)
+    assert e.value.msg == "The maximum number of tap iterations must be positive, got -1."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_TAP_CHANGER
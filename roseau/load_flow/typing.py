@@ -45,6 +45,24 @@ Roseau Load Flow Literals
 
     The side of a transformer (``"HV"`` or ``"LV"``) or a line/switch (1 or 2).
 
+.. class:: ReductionModel
+
+    The load model of the equivalent of a reduced sub-network (``"power"``, ``"current"`` or
+    ``"impedance"``).
+
+.. class:: SpatialPredicate
+
+    The spatial predicate of the geometric queries of a network (``"within"`` or ``"intersects"``).
+
+.. class:: GraphWeight
+
+    The weight of the branches in the graphs of a network (``"length"`` or ``"impedance"``).
+
+.. class:: ContingencyStatus
+
+    The status of a contingency of a contingency analysis (``"solved"``, ``"islanded"`` or
+    ``"diverged"``).
+
 Union Input Types (Wide)
 ------------------------
 
@@ -141,6 +159,10 @@ type ControlType = Literal["constant", "p_max_u_production", "p_max_u_consumptio
 type ProjectionType = Literal["euclidean", "keep_p", "keep_q"]
 type Solver = Literal["newton", "newton_goldstein", "backward_forward"]
 type Side = Literal[1, 2, "HV", "LV"]
+type ReductionModel = Literal["power", "current", "impedance"]
+type SpatialPredicate = Literal["within", "intersects"]
+type GraphWeight = Literal["length", "impedance"]
+type ContingencyStatus = Literal["solved", "islanded", "diverged"]
 type ResultState = Literal["very-low", "low", "normal", "high", "very-high", "unknown"]
 type BranchType = Literal["line", "transformer", "switch", "regulator"]
 
@@ -193,6 +215,10 @@ __all__ = [
     "ProjectionType",
     "Solver",
     "Side",
+    "ReductionModel",
+    "SpatialPredicate",
+    "GraphWeight",
+    "ContingencyStatus",
     # Wide input types
     "Int",
     "Float",
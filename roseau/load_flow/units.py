@@ -25,7 +25,7 @@ import functools
 from collections.abc import Callable, Iterable, MutableSequence, Sequence
 from decimal import Decimal
 from fractions import Fraction
-from inspect import Parameter, Signature, signature
+from inspect import Parameter, signature
 from itertools import zip_longest
 from types import GenericAlias
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, overload
@@ -37,6 +37,9 @@ from pint.util import UnitsContainer, to_units_container
 
 __all__ = ["ureg", "Q_", "ureg_wraps"]
 
+# The types of the values that are never quantities nor sequences of quantities
+_PLAIN_TYPES = frozenset({int, float, complex, str, bool, type(None), np.ndarray, np.float64, np.complex128})
+
 ureg: UnitRegistry = UnitRegistry(
     preprocessors=[
         lambda s: s.replace("%", " percent "),
@@ -154,46 +157,46 @@ def _parse_wrap_args(args: Iterable[str | Unit | None]) -> Callable:
     args_as_uc = [to_units_container(arg) for arg in args]
 
     # Check for references in args, remove None values
-    unit_args_ndx = {ndx for ndx, arg in enumerate(args_as_uc) if arg is not None}
-
-    def _converter(ureg: "UnitRegistry", sig: "Signature", values: "list[Any]", kw: "dict[str, Any]"):
-        len_initial_values = len(values)
-
-        # pack kwargs
-        for i, param_name in enumerate(sig.parameters):
-            if i >= len_initial_values:
-                values.append(kw[param_name])
-
-        # convert arguments
+    unit_args_ndx = [ndx for ndx, arg in enumerate(args_as_uc) if arg is not None]
+
+    def _convert(ureg: "UnitRegistry", value: Any, ndx: int) -> Any:
+        # Plain numbers and arrays are the most common values, they are returned as is
+        if type(value) in _PLAIN_TYPES:
+            return value
+        if isinstance(value, ureg.Quantity):
+            return ureg.convert(value.magnitude, value.units, args_as_uc[ndx])
+        elif type(value) is list or isinstance(value, MutableSequence):
+            for i, val in enumerate(value):
+                if type(val) not in _PLAIN_TYPES and isinstance(val, ureg.Quantity):
+                    value[i] = ureg.convert(val.magnitude, val.units, args_as_uc[ndx])
+        return value
+
+    def _converter(ureg: "UnitRegistry", param_names: tuple[str, ...], values: "list[Any]", kw: "dict[str, Any]"):
+        # convert arguments, the positional ones in `values` and the others in `kw`
+        n = len(values)
         for ndx in unit_args_ndx:
-            value = values[ndx]
-            if isinstance(value, ureg.Quantity):
-                values[ndx] = ureg.convert(value.magnitude, value.units, args_as_uc[ndx])
-            elif isinstance(value, MutableSequence):
-                for i, val in enumerate(value):
-                    if isinstance(val, ureg.Quantity):
-                        value[i] = ureg.convert(val.magnitude, val.units, args_as_uc[ndx])
-
-        # unpack kwargs
-        for i, param_name in enumerate(sig.parameters):
-            if i >= len_initial_values:
-                kw[param_name] = values[i]
-
-        return values[:len_initial_values], kw
+            if ndx < n:
+                values[ndx] = _convert(ureg, values[ndx], ndx)
+            else:
+                name = param_names[ndx]
+                kw[name] = _convert(ureg, kw[name], ndx)
+        return values, kw
 
     return _converter
 
 
-def _apply_defaults(sig: Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+def _apply_defaults(
+    defaults: tuple[tuple[int, str, Any], ...], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any]]:
     """Apply default keyword arguments.
 
     Named keywords may have been left blank. This function applies the default
     values so that every argument is defined.
     """
     n = len(args)
-    for i, param in enumerate(sig.parameters.values()):
-        if i >= n and param.default is not Parameter.empty and param.name not in kwargs:
-            kwargs[param.name] = param.default
+    for i, name, default in defaults:
+        if i >= n and name not in kwargs:
+            kwargs[name] = default
     return list(args), kwargs
 
 
@@ -251,17 +254,24 @@ def wraps(ureg: UnitRegistry, ret: OptionalUnits, args: OptionalUnits) -> _Ident
         count_params = len(sig.parameters)
         if len(args) != count_params:
             raise TypeError(f"{func.__name__} takes {count_params} parameters, but {len(args)} units were passed")
+        # The signature is inspected once, not at each call
+        param_names = tuple(sig.parameters)
+        defaults = tuple(
+            (i, param.name, param.default)
+            for i, param in enumerate(sig.parameters.values())
+            if param.default is not Parameter.empty
+        )
 
         assigned = tuple(attr for attr in functools.WRAPPER_ASSIGNMENTS if hasattr(func, attr))
         updated = tuple(attr for attr in functools.WRAPPER_UPDATES if hasattr(func, attr))
 
         @functools.wraps(func, assigned=assigned, updated=updated)
         def wrapper(*values, **kw):
-            values, kw = _apply_defaults(sig, values, kw)
+            values, kw = _apply_defaults(defaults, values, kw)
 
             # In principle, the values are used as is
             # When then extract the magnitudes when needed.
-            new_values, new_kw = converter(ureg, sig, values, kw)
+            new_values, new_kw = converter(ureg, param_names, values, kw)
 
             result = func(*new_values, **new_kw)
 
@@ -26,6 +26,7 @@ from roseau.load_flow.utils.helpers import (
     count_repr,
     ensure_startsupper,
     geom_mapping,
+    geom_mappings,
     id_sort_key,
     one_or_more_repr,
     pretty_unit,
@@ -67,6 +68,7 @@ __all__ = [
     "id_sort_key",
     "ensure_startsupper",
     "geom_mapping",
+    "geom_mappings",
     # Enums
     "CaseInsensitiveStrEnum",
     # Decorators
@@ -0,0 +1,207 @@
+"""
+Cache of the networks of the catalogue.
+
+The JSON files of the catalogue of networks are read once into a bundle stored in the user cache
+directory. The bundle is a single file holding the compact JSON data of each network after an index
+of their positions, so that only the requested networks are parsed. It contains only JSON data and
+is never unpickled or executed: a modified bundle can at worst give invalid data, which is rejected
+like any invalid network file. It is rebuilt when the files of the catalogue or the version of
+Roseau Load Flow change.
+
+In addition, each process keeps the networks created from the catalogue and returns copies of them,
+see :meth:`ElectricalNetwork.copy() <roseau.load_flow.ElectricalNetwork.copy>`. The copies do not
+share anything that can be modified with the cached networks or with each other.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from platformdirs import user_cache_dir
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None  # ty:ignore[invalid-assignment]
+
+from roseau.load_flow.typing import JsonDict
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractNetwork
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION = 2
+"""The version of the format of the bundle. Increment it when the format changes."""
+
+_CATALOGUE_KEY = "Catalogue"
+"""The key of the data of ``Catalogue.json`` in the bundle."""
+
+_BUNDLE_MAGIC = b"RLF-CATALOGUE\n"
+"""The first line of the bundle files."""
+
+# The bundles loaded by this process, indexed by the path of the catalogue
+_bundles: dict[Path, dict[str, bytes]] = {}
+
+# The networks created by this process, indexed by their class and the query that created them
+_networks: dict[tuple[type, Hashable], "AbstractNetwork"] = {}
+
+
+def catalogue_cache_dir() -> Path:
+    """The directory of the bundles of the catalogue of networks in the user cache directory."""
+    return Path(user_cache_dir("roseau-load-flow", appauthor=False)) / "catalogue"
+
+
+def clear_catalogue_cache() -> None:
+    """Clear the networks and the bundles cached by this process.
+
+    The bundles stored in the user cache directory are kept.
+    """
+    _bundles.clear()
+    _networks.clear()
+
+
+def get_catalogue_data(catalogue_path: Path, name: str = _CATALOGUE_KEY) -> JsonDict:
+    """Get the data of a file of the catalogue.
+
+    Args:
+        catalogue_path:
+            The directory of the catalogue of networks.
+
+        name:
+            The name of the JSON file without its extension. Defaults to ``"Catalogue"``, the
+            description of the networks of the catalogue.
+
+    Returns:
+        A new dictionary of the data of the file. It can be modified freely.
+    """
+    data = _get_bundle(catalogue_path)[name]
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def get_catalogue_network[N: "AbstractNetwork"](cls: type[N], key: Hashable, create: Callable[[], N]) -> N:
+    """Get a network of the catalogue from the cache of this process.
+
+    Args:
+        cls:
+            The class of the network.
+
+        key:
+            The key of the network in the cache, e.g. the query used to select it.
+
+        create:
+            The function that creates the network when it is not cached yet.
+
+    Returns:
+        A new copy of the cached network. Its parameters are also copied.
+    """
+    network = _networks.get((cls, key))
+    if network is None:
+        network = _networks[cls, key] = create()
+    return network.copy(copy_parameters=True)
+
+
+def _get_bundle(catalogue_path: Path) -> dict[str, bytes]:
+    """Get the bundle of a catalogue, load it or build it if it is not loaded by this process yet."""
+    bundle = _bundles.get(catalogue_path)
+    if bundle is None:
+        fingerprint = _fingerprint(catalogue_path)
+        bundle_path = catalogue_cache_dir() / f"networks-{fingerprint}.bundle"
+        bundle = _read_bundle(bundle_path, fingerprint)
+        if bundle is None:
+            bundle = _build_bundle(catalogue_path)
+            _write_bundle(bundle_path, bundle, fingerprint)
+        _bundles[catalogue_path] = bundle
+    return bundle
+
+
+def _fingerprint(catalogue_path: Path) -> str:
+    """A fingerprint of the files of a catalogue and of the versions the bundles depend on."""
+    h = hashlib.sha256()
+    h.update(f"{BUNDLE_FORMAT_VERSION}:".encode())
+    h.update(importlib.metadata.version("roseau-load-flow").encode())
+    for path in sorted(catalogue_path.glob("*.json")):
+        stat = path.stat()
+        h.update(f":{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+def _build_bundle(catalogue_path: Path) -> dict[str, bytes]:
+    """Read the JSON files of a catalogue into a bundle of compact JSON data."""
+    return {
+        path.stem: json.dumps(json.loads(path.read_bytes()), separators=(",", ":")).encode()
+        for path in sorted(catalogue_path.glob("*.json"))
+    }
+
+
+def _read_bundle(bundle_path: Path, fingerprint: str) -> dict[str, bytes] | None:
+    """Read a bundle from the cache directory, return None if it does not exist or is invalid.
+
+    The file starts with a magic line and a JSON index line ``{"fingerprint": ..., "entries":
+    {name: [offset, size]}}`` followed by the JSON data of the entries.
+    """
+    try:
+        content = bundle_path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Ignoring the unreadable catalogue bundle {bundle_path}: {e}")
+        return None
+    try:
+        if not content.startswith(_BUNDLE_MAGIC):
+            raise ValueError("bad header")
+        index_end = content.index(b"\n", len(_BUNDLE_MAGIC))
+        index = json.loads(content[len(_BUNDLE_MAGIC) : index_end])
+        if index["fingerprint"] != fingerprint:
+            raise ValueError("bad fingerprint")
+        start = index_end + 1
+        bundle = {
+            name: content[start + offset : start + offset + size] for name, (offset, size) in index["entries"].items()
+        }
+        if _CATALOGUE_KEY not in bundle or start + sum(size for _, size in index["entries"].values()) != len(content):
+            raise ValueError("bad entries")
+    except Exception as e:
+        logger.warning(f"Ignoring the invalid catalogue bundle {bundle_path}: {e}")
+        return None
+    return bundle
+
+
+def _write_bundle(bundle_path: Path, bundle: dict[str, bytes], fingerprint: str) -> None:
+    """Write a bundle to the cache directory and remove the outdated bundles.
+
+    The bundle is written to a temporary file first and then renamed so that other processes never
+    read a partially written bundle. Failures are logged, the bundle is then only kept in memory.
+    """
+    entries: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for name, data in bundle.items():
+        entries[name] = (offset, len(data))
+        offset += len(data)
+    index = json.dumps({"fingerprint": fingerprint, "entries": entries}, separators=(",", ":")).encode()
+    try:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=bundle_path.parent, prefix=".networks-", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_BUNDLE_MAGIC)
+                f.write(index)
+                f.write(b"\n")
+                f.writelines(bundle.values())
+            tmp_path.replace(bundle_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        # Also remove the pickled bundles of older versions without reading them
+        for old_path in bundle_path.parent.glob("networks-*"):
+            if old_path != bundle_path:
+                old_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not write the catalogue bundle {bundle_path}: {e}")
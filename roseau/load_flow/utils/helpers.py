@@ -1,14 +1,20 @@
+import logging
 import warnings
 from abc import ABCMeta, abstractmethod, update_abstractmethods
-from collections.abc import Callable, Collection, Sized
+from collections.abc import Callable, Collection, Sequence, Sized
 from enum import StrEnum
 from functools import cache
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
+import numpy as np
+import shapely
 from shapely.geometry.base import BaseGeometry
 
-from roseau.load_flow.typing import Side
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import FloatArrayLike1D, Side
+
+logger = logging.getLogger(__name__)
 
 SIDE_INDEX: Final[dict[Side | None, int]] = {"HV": 0, "LV": 1, 1: 0, 2: 1, None: 0}
 SIDE_SUFFIX: Final[dict[Side | None, str]] = {"HV": "_hv", "LV": "_lv", 1: "1", 2: "2", None: ""}
@@ -66,6 +72,84 @@ def geom_mapping(geom: BaseGeometry | None) -> dict[str, object] | None:
     return geom.__geo_interface__
 
 
+def geom_mappings(geoms: Sequence[BaseGeometry | None]) -> list[dict[str, object] | None]:
+    """Return the GeoJSON-like mappings of geometries, like :func:`geom_mapping` for each geometry.
+
+    The mappings of 2D points and line strings are built from their coordinates fetched at once,
+    which is much faster than the ``__geo_interface__`` of each geometry for large sequences.
+    """
+    result: list[dict[str, object] | None] = [None] * len(geoms)
+    array = np.empty(len(geoms), dtype=object)
+    array[:] = geoms
+    type_ids = shapely.get_type_id(array)
+    simple_types = (type_ids == shapely.GeometryType.POINT) | (type_ids == shapely.GeometryType.LINESTRING)
+    simple = simple_types & ~shapely.has_z(array)
+    coords, index = shapely.get_coordinates(array[simple], return_index=True)
+    positions = np.arange(np.count_nonzero(simple))
+    starts = np.searchsorted(index, positions).tolist()
+    stops = np.searchsorted(index, positions, side="right").tolist()
+    coords_tuples = list(map(tuple, coords.tolist()))
+    for i, start, stop in zip(np.flatnonzero(simple).tolist(), starts, stops, strict=True):
+        if type_ids[i] == shapely.GeometryType.POINT:
+            result[i] = {"type": "Point", "coordinates": coords_tuples[start] if stop > start else ()}
+        else:
+            result[i] = {"type": "LineString", "coordinates": tuple(coords_tuples[start:stop])}
+    for i in np.flatnonzero(~simple & (type_ids >= 0)).tolist():
+        result[i] = geoms[i].__geo_interface__  # type: ignore
+    return result
+
+
+def _graph_geometries(elements: Sequence[Any], geometry: bool) -> list[dict[str, object]]:
+    """Return the ``geom`` data of the graph nodes or edges of the elements.
+
+    The data hold the GeoJSON-like mappings of the geometries of the elements if ``geometry`` is
+    True and are empty otherwise, so that the geometries are only converted when requested.
+    """
+    if not geometry:
+        return [{}] * len(elements)
+    return [{"geom": geom} for geom in geom_mappings([element.geometry for element in elements])]
+
+
+def _check_line_arrays(
+    ids: Sized,
+    buses1: Sized,
+    buses2: Sized,
+    lengths: FloatArrayLike1D,
+    max_loading: float,
+    geometries: Sequence[BaseGeometry | None] | None,
+) -> tuple[list[float], float, Sequence[BaseGeometry | None]]:
+    """Check the arguments of ``Line.from_arrays`` before any line is created.
+
+    Returns:
+        The lengths of the lines (in km), their maximum loading and their geometries.
+    """
+    n = len(ids)
+    sizes = {"first buses": len(buses1), "second buses": len(buses2)}
+    if geometries is not None:
+        sizes["geometries"] = len(geometries)
+    for name, size in sizes.items():
+        if size != n:
+            msg = f"Expected {n} {name} for {n} lines, got {size}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINES_SIZE)
+    lengths_array = np.asarray(lengths, dtype=np.float64)
+    if lengths_array.shape != (n,):
+        msg = f"Expected {n} line lengths, got an array of shape {lengths_array.shape}."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LINES_SIZE)
+    if (invalid := np.flatnonzero(lengths_array <= 0)).size > 0:
+        msg = f"A line length must be greater than 0. {lengths_array[invalid[0]]:.2f} km provided."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE)
+    if max_loading <= 0:
+        msg = f"Maximum loading must be positive: {max_loading} was provided."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_MAX_LOADING_VALUE)
+    if geometries is None:
+        geometries = [None] * n
+    return lengths_array.tolist(), float(max_loading), geometries
+
+
 class CaseInsensitiveStrEnum(StrEnum):
     """A case-insensitive string enumeration with normalization.
 
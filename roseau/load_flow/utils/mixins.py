@@ -1,15 +1,20 @@
 import json
 import logging
+import operator
 import re
 import textwrap
+import weakref
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import cache
 from heapq import heappop, heappush
 from importlib import resources
+from itertools import count
+from math import inf, nan
 from pathlib import Path
-from typing import Any, ClassVar, Generic, NoReturn, Self, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, NamedTuple, NoReturn, Self, overload
 
 try:
     import orjson
@@ -26,17 +31,48 @@ from typing_extensions import TypeVar
 
 from roseau.load_flow._solvers import AbstractSolver
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
-from roseau.load_flow.typing import BranchType, CRSLike, Id, JsonDict, MapOrSeq, Solver, StrPath
-from roseau.load_flow.utils.helpers import abstractattrs, warn_external
+from roseau.load_flow.typing import (
+    BranchType,
+    ComplexArray,
+    CRSLike,
+    FloatArray,
+    GraphWeight,
+    Id,
+    JsonDict,
+    MapOrSeq,
+    ReductionModel,
+    Solver,
+    SpatialPredicate,
+    StrPath,
+)
+from roseau.load_flow.utils.catalogue import get_catalogue_data
+from roseau.load_flow.utils.helpers import abstractattrs, one_or_more_repr, warn_external
+from roseau.load_flow.utils.spatial import SpatialIndex, as_geometries
 from roseau.load_flow.utils.tool_data import ToolData
 from roseau.load_flow_engine.cy_engine import CyElectricalNetwork, CyElement
 
+if TYPE_CHECKING:
+    from rustworkx import PyGraph
+
+    from roseau.load_flow.aggregation import ResultsAggregator
+    from roseau.load_flow.contingency import Contingency, ContingencyAnalysis
+    from roseau.load_flow.diff import NetworkDiff
+    from roseau.load_flow.graph import SparseGraph
+    from roseau.load_flow.probabilistic import PowerDistribution, ProbabilisticAnalysis
+    from roseau.load_flow.reduction import NetworkReduction
+
 logger = logging.getLogger(__name__)
 
+_SPATIAL_ELEMENT_TYPES = ("bus", "line", "transformer", "switch", "regulator")
+
 _E_co = TypeVar("_E_co", bound="AbstractElement", covariant=True)
 _N_co = TypeVar("_N_co", bound="AbstractNetwork", covariant=True)
 _CyE_co = TypeVar("_CyE_co", bound=CyElement, default=CyElement, covariant=True)
 
+# Results generations are unique across networks so that an element moved to another network never
+# hits a stale cache entry
+_results_generations = count()
+
 
 def _json_encoder_default(obj: object) -> object:
     """Numpy compatible JSON serialization hook."""
@@ -75,10 +111,174 @@ def _json_dump(obj: object, /, path: StrPath, indent: bool, sort_keys: bool) ->
     return path
 
 
+def _pairs_to_array(pairs: list[list[float]] | FloatArray) -> ComplexArray:
+    """Convert ``[real, imag]`` pairs to a new complex array."""
+    return np.array(pairs, dtype=np.float64).reshape(-1, 2).view(np.complex128)[:, 0]
+
+
+def _complex_values(pairs: list[list[float]] | FloatArray) -> list[complex] | ComplexArray:
+    """The complex values of the ``[real, imag]`` pairs of a network dictionary.
+
+    The pairs are lists in JSON files and arrays of shape ``(n, 2)`` in files with binary arrays,
+    which are converted at once.
+    """
+    if isinstance(pairs, np.ndarray):
+        return _pairs_to_array(pairs)
+    return [complex(*v) for v in pairs]
+
+
+class _RawComplexArray:
+    """A complex array of load flow results read from a dictionary.
+
+    The ``[real, imag]`` pairs of the dictionary are only converted to an array when the results
+    are accessed: loading a network with its results does not pay for the results never read.
+    """
+
+    __slots__ = ("_array", "_pairs")
+
+    def __init__(self, pairs: list[list[float]] | FloatArray) -> None:
+        self._pairs: list[list[float]] | FloatArray | None = pairs
+        self._array: ComplexArray | None = None
+
+    def to_array(self) -> ComplexArray:
+        if self._array is None:
+            self._array = _pairs_to_array(self._pairs)  # type: ignore[arg-type]
+            self._pairs = None
+        return self._array
+
+    def copy(self) -> "_RawComplexArray":
+        if self._array is None:
+            return _RawComplexArray(self._pairs)  # type: ignore[arg-type]  # the pairs are never modified
+        new = _RawComplexArray([])
+        new._pairs, new._array = None, self._array.copy()
+        return new
+
+
+@cache
+def _get_slots(cls: type) -> tuple[str, ...]:
+    """Get the names of the attribute slots of a class and of all its bases (without ``__weakref__``)."""
+    return tuple(
+        dict.fromkeys(
+            name for c in reversed(cls.__mro__) for name in c.__dict__.get("__slots__", ()) if name != "__weakref__"
+        )
+    )
+
+
+def _copy_value(value: Any, memo: dict[int, "AbstractElement"]) -> Any:
+    """Copy an attribute value of an element, replacing the elements by their copies from the memo."""
+    if isinstance(value, AbstractElement):
+        return memo[id(value)]
+    elif isinstance(value, (np.ndarray, _RawComplexArray)):
+        return value.copy()
+    elif isinstance(value, list):
+        # Elements that are not part of the network (e.g. disconnected ones) are dropped
+        return [_copy_value(v, memo) for v in value if not isinstance(v, AbstractElement) or id(v) in memo]
+    elif isinstance(value, dict):
+        return {
+            _copy_value(k, memo): _copy_value(v, memo)
+            for k, v in value.items()
+            if not isinstance(k, AbstractElement) or id(k) in memo
+        }
+    else:
+        # Immutable values, parameters, flexible parameters and geometries are shared
+        return value
+
+
+_JSON_IMMUTABLES = (str, int, float, bool, type(None))
+
+
+def _copy_json(value: Any) -> Any:
+    """Deep-copy JSON-like data, much faster than :func:`copy.deepcopy` for large networks.
+
+    Dictionaries, lists and tuples are copied recursively, immutable values are shared and any
+    other value (e.g. numpy arrays of the binary format) is deep-copied.
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: v if type(v) in _JSON_IMMUTABLES else _copy_json(v) for k, v in value.items()}
+    elif cls is list:
+        return [v if type(v) in _JSON_IMMUTABLES else _copy_json(v) for v in value]
+    elif cls is tuple:
+        # e.g. complex numbers as (real, imag) pairs, shared when they contain only immutable values
+        return value if all(type(v) in _JSON_IMMUTABLES for v in value) else tuple(_copy_json(v) for v in value)
+    elif cls in _JSON_IMMUTABLES:
+        return value
+    else:
+        return deepcopy(value)
+
+
+def _copy_parameters[T](params: T) -> T:
+    """Copy a parameters object of branches, without the elements that use it."""
+    new = copy(params)
+    new.__dict__.update(
+        {name: value.copy() for name, value in params.__dict__.items() if isinstance(value, np.ndarray)}
+    )
+    new._elements = weakref.WeakSet()  # type: ignore
+    return new
+
+
+class _ResLimits(NamedTuple):
+    """The flat arrays of the results of elements of one type checked against their limits."""
+
+    ids: list[Id]
+    """The IDs of the elements."""
+
+    element_index: np.ndarray[tuple[int], np.dtype[np.intp]]
+    """The position in ``ids`` of the element of each value."""
+
+    phases: np.ndarray[tuple[int], np.dtype[np.str_]] | None
+    """The phase of each value, ``None`` if the values are not per phase."""
+
+    values: FloatArray
+    """The voltage levels or the loadings."""
+
+    min_limits: FloatArray
+    """The minimal values, NaN if not set."""
+
+    max_limits: FloatArray
+    """The maximal values, NaN if not set."""
+
+    @property
+    def violated(self) -> np.ndarray[tuple[int], np.dtype[np.bool_]]:
+        return (self.values < self.min_limits) | (self.values > self.max_limits)
+
+
+class _ShortestPathTree(NamedTuple):
+    """The shortest paths from a bus to the buses it reaches, kept until the topology changes."""
+
+    bus_ids: list[Id]
+    """The IDs of the reached buses, by increasing distance from the source bus."""
+
+    distances: FloatArray
+    """The distance (in km) of each bus from the source bus."""
+
+    predecessors: np.ndarray[tuple[int], np.dtype[np.intp]]
+    """The position in ``bus_ids`` of the predecessor of each bus, -1 for the source bus."""
+
+    edge_types: list[BranchType]
+    """The types of the traversed branches whose two buses are reached."""
+
+    edge_ids: list[Id]
+    """The IDs of the traversed branches."""
+
+    edge_from: np.ndarray[tuple[int], np.dtype[np.intp]]
+    """The position in ``bus_ids`` of the first bus of each branch."""
+
+    edge_to: np.ndarray[tuple[int], np.dtype[np.intp]]
+    """The position in ``bus_ids`` of the second bus of each branch."""
+
+
+def _concatenate(arrays: Sequence[Any], dtype: type[np.generic]) -> np.ndarray:
+    """Concatenate 1D arrays of results, possibly none."""
+    return np.concatenate(arrays, dtype=dtype) if arrays else np.array([], dtype=dtype)
+
+
 @abstractattrs("is_multi_phase")
 class RLFObject(metaclass=ABCMeta):
     """Base class for all objects in the library."""
 
+    __slots__ = ()
+
     is_multi_phase: ClassVar[bool]
     """Is the object multi-phase?"""
 
@@ -86,6 +286,8 @@ class RLFObject(metaclass=ABCMeta):
 class Identifiable(RLFObject, metaclass=ABCMeta):
     """An identifiable object."""
 
+    __slots__ = ("id",)
+
     @abstractmethod  # trick to prevent instantiation of the abstract class
     def __init__(self, id: Id) -> None:
         if not isinstance(id, int | str):
@@ -101,6 +303,8 @@ class Identifiable(RLFObject, metaclass=ABCMeta):
 class ToJsonMixin(metaclass=ABCMeta):
     """Mixin for classes that can be serialized to JSON."""
 
+    __slots__ = ()
+
     _no_results = True
     _results_valid = False
 
@@ -243,6 +447,8 @@ class ToJsonMixin(metaclass=ABCMeta):
 class JsonMixin(ToJsonMixin):
     """Mixin for classes that can be serialized to and from JSON."""
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def _from_dict(cls, data: JsonDict, *, include_results: bool = True) -> Self:
@@ -269,7 +475,7 @@ class JsonMixin(ToJsonMixin):
             The constructed instance.
         """
         if copy:
-            data = deepcopy(data)
+            data = _copy_json(data)
         return cls._from_dict(data=data, include_results=include_results)
 
     @classmethod
@@ -424,6 +630,18 @@ class CatalogueMixin[T](metaclass=ABCMeta):
 class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
     """An abstract class of an element in an Electrical network."""
 
+    __slots__ = (
+        "__weakref__",  # the parameters of the branches reference their elements weakly
+        "_connected_elements",
+        "_network",
+        "_cy_element",
+        "_fetch_results",
+        "_no_results",
+        "_results_valid",
+        "_results_cache",
+        "_is_disconnected",
+    )
+
     element_type: ClassVar[str]
     """The type of the element. It is a string like ``"load"`` or ``"line"`` etc."""
 
@@ -437,15 +655,21 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
                 have the same ID.
         """
         super().__init__(id)
-        self._connected_elements: list[AbstractElement[_N_co, Any]] = []
+        # An insertion-ordered set of the connected elements, high-degree buses may have thousands
+        self._connected_elements: dict[AbstractElement[_N_co, Any], None] = {}
         self._network: _N_co | None = None
         self._cy_element: _CyE_co
         self._fetch_results = False
         self._no_results = True
         self._results_valid = True
-        self._element_info = f"{self.element_type} {id!r}"  # for logging
+        self._results_cache: dict[str, tuple[int, tuple[object, ...], Any]] = {}
         self._is_disconnected = False
 
+    @property
+    def _element_info(self) -> str:
+        # Computed on demand, it is only needed for logging and error messages
+        return f"{self.element_type} {self.id!r}"
+
     @property
     def _cy_initialized(self) -> bool:
         return hasattr(self, "_cy_element")
@@ -473,27 +697,27 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
         if self._network is not None and value is not None and self._network != value:
             self._raise_several_network()
 
-        # Add/remove the element to the dictionaries of elements in the network
+        # In case of disconnection, remove the element from the network and do nothing to
+        # connected elements
         if value is None:
             if self._network is not None:
                 self._network._disconnect_element(element=self)
-        else:
-            value._connect_element(element=self)
-
-        # Assign the new network to self
-        self._set_self_network(value)
-
-        # In case of disconnection, do nothing to connected elements
-        if value is None:
+            self._set_self_network(None)
             return
 
-        # Recursively call this method to the elements connected to self
-        for e in self._connected_elements:
-            if e._network == value:
-                continue
-            else:
-                # Recursive call
-                e._set_network(value)
+        # Add self and the elements connected to it to the network. The connected elements are
+        # visited depth-first with an explicit stack as deep networks exceed the recursion limit
+        stack: list[AbstractElement[_N_co, Any]] = [self]
+        while stack:
+            element = stack.pop()
+            if element is not self:
+                if element._network == value:
+                    continue  # already visited
+                elif element._network is not None:
+                    element._raise_several_network()
+            value._connect_element(element=element)
+            element._set_self_network(value)
+            stack.extend(reversed([e for e in element._connected_elements if e._network != value]))
 
     def _connect(self, *elements: "AbstractElement[_N_co, CyElement]") -> None:
         """Connect this element to another element.
@@ -510,12 +734,10 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
             elif element._network is not None and element._network != network:
                 element._raise_several_network()
 
-        # Modify objects. Append to the connected_elements
+        # Modify objects. Add to the connected_elements (no-op for already connected elements)
         for element in elements:
-            if element not in self._connected_elements:
-                self._connected_elements.append(element)
-            if self not in element._connected_elements:
-                element._connected_elements.append(self)
+            self._connected_elements.setdefault(element)
+            element._connected_elements.setdefault(self)
 
         # Propagate the new network to `self` and other newly connected elements (recursively)`
         if network is not None:
@@ -524,9 +746,9 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
     def _disconnect(self) -> None:
         """Remove all the connections with the other elements."""
         for element in self._connected_elements:
-            element._connected_elements.remove(self)
+            del element._connected_elements[self]
         self._is_disconnected = True
-        self._connected_elements = []
+        self._connected_elements = {}
         self._set_network(None)
         if self._cy_initialized:
             self._cy_element.disconnect()
@@ -570,6 +792,53 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
         if self._network is not None:
             self._network._results_valid = False
 
+    def _invalidate_network_spatial_index(self) -> None:
+        """Invalidate the spatial index of the network after a change of the geometry of the element."""
+        if self._network is not None:
+            self._network._spatial_indexes = {}
+
+    def _invalidate_network_topology(self) -> None:
+        """Invalidate the shortest paths of the network after a change of a branch (length, switch state)."""
+        if self._network is not None:
+            self._network._shortest_path_trees = {}
+
+    def _copy_new(self, memo: dict[int, "AbstractElement"]) -> Self:
+        """Create an empty copy of the element and register it in the memo (used by `network.copy()`)."""
+        new = object.__new__(type(self))
+        memo[id(self)] = new
+        return new
+
+    def _copy_to(self, new: Self, memo: dict[int, "AbstractElement"], include_results: bool) -> None:
+        """Copy the attributes of the element to its empty copy (used by `network.copy()`).
+
+        Args:
+            new:
+                The empty copy created by :meth:`_copy_new`.
+
+            memo:
+                The mapping of the IDs of the original elements to their copies.
+
+            include_results:
+                If True, the results of the element are also copied.
+        """
+        for name in _get_slots(type(self)):
+            if name in ("_cy_element", "_network", "_results_cache") or not hasattr(self, name):
+                continue
+            elif name.startswith("_res_") and not include_results:
+                setattr(new, name, None)
+            else:
+                setattr(new, name, _copy_value(getattr(self, name), memo))
+        new._network = None
+        new._results_cache = {}
+        new._fetch_results = False  # the results are not fetched from the copied Cython element
+        if not include_results:
+            new._no_results = True
+
+    @abstractmethod
+    def _create_cy_element(self) -> None:
+        """Create the Cython element and connect it to the Cython elements of the connected elements."""
+        raise NotImplementedError
+
     @abstractmethod
     def _refresh_results(self) -> None:
         """Refresh the results of the element."""
@@ -604,6 +873,47 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
                 category=UserWarning,
             )
         self._fetch_results = False
+        if type(value) is _RawComplexArray:
+            return value.to_array()  # type: ignore[return-value]
+        return value
+
+    def _res_memo[T](self, key: str, compute: Callable[[], T], *deps: object) -> T:
+        """Memoize a quantity derived from the load flow results of the element.
+
+        The value is computed once per load flow run of the network. It is also recomputed if one
+        of the inputs ``deps`` is not the same object as when it was last computed.
+
+        Args:
+            key:
+                The name of the memoized quantity.
+
+            compute:
+                A function computing the quantity. It is called on a cache miss only. The results
+                it depends on must have already been retrieved with a results getter so that they
+                are refreshed and validated.
+
+            deps:
+                The inputs other than the results that the quantity depends on (nominal voltage,
+                ampacities, etc.). They are compared by identity.
+
+        Returns:
+            The (possibly memoized) value of the quantity.
+        """
+        if self._network is None:
+            return compute()
+        generation = self._network._results_generation
+        entry = self._results_cache.get(key)
+        if (
+            entry is not None
+            and entry[0] == generation
+            and len(entry[1]) == len(deps)
+            and all(map(operator.is_, entry[1], deps))
+        ):
+            return entry[2]
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False  # shared between the callers
+        self._results_cache[key] = (generation, deps, value)
         return value
 
     def _check_geometry(self, geometry: BaseGeometry | None) -> BaseGeometry | None:
@@ -626,6 +936,10 @@ class AbstractElement(Identifiable, ToJsonMixin, Generic[_N_co, _CyE_co]):
             return None
         elif isinstance(geometry, str):
             return shapely.from_wkt(geometry)
+        elif (geom_type := geometry.get("type")) == "Point" and geometry.get("coordinates"):
+            return shapely.points(geometry["coordinates"])  # faster than `shape` for the common types
+        elif geom_type == "LineString" and geometry.get("coordinates"):
+            return shapely.linestrings(geometry["coordinates"])
         else:
             return shape(geometry)
 
@@ -653,8 +967,12 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
         self._elements_by_type: dict[str, dict[Id, _E_co]]
         # Other attributes
         self._elements: list[_E_co] = []
+        self._spatial_indexes: dict[str, SpatialIndex] = {}
+        self._shortest_path_trees: dict[tuple[Id, bool, float], _ShortestPathTree] = {}
+        self._results_aggregators: list[ResultsAggregator] = []
         self._has_loop = False
         self._has_floating_neutral = False
+        self._results_generation = next(_results_generations)
         self._check_validity(constructed=True)
         self._create_network()
         self._valid = True
@@ -701,6 +1019,11 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
             for connected_element in e._connected_elements:
                 if connected_element not in visited_elements and connected_element not in elements:
                     elements.append(connected_element)
+        return cls(**cls._elements_kwargs(elements_by_type), name=name, crs=crs)
+
+    @classmethod
+    def _elements_kwargs(cls, elements_by_type: Mapping[str, MapOrSeq[AbstractElement]]) -> dict[str, Any]:
+        """Map the elements indexed by element type to the arguments of the network constructor."""
         elements_kwargs = {
             "buses": elements_by_type["bus"],
             "lines": elements_by_type["line"],
@@ -715,7 +1038,115 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
             elements_kwargs["ground_connections"] = elements_by_type["ground connection"]
         else:
             elements_kwargs["regulators"] = elements_by_type["regulator"]
-        return cls(**elements_kwargs, name=name, crs=crs)
+        return elements_kwargs
+
+    def copy(self, *, include_results: bool = False, copy_parameters: bool = False) -> Self:
+        """Create a copy of the network.
+
+        The elements are copied directly, without going through the dictionary representation of
+        the network, which is much faster than ``ElectricalNetwork.from_dict(en.to_dict())``. The
+        arrays of the elements are copied while the line, transformer and regulator parameters,
+        the flexible parameters and the geometries are shared with the original network.
+
+        Args:
+            include_results:
+                If True, the results of the last load flow are also copied and the solver of the
+                copy is initialized with them so that its next load flow is warm-started. Defaults
+                to False.
+
+            copy_parameters:
+                If True, the line, transformer and regulator parameters are also copied instead of
+                being shared with the original network. Defaults to False.
+
+        Returns:
+            The new network. Modifying it does not modify the original network.
+        """
+        elements = [e for elements in self._elements_by_type.values() for e in elements.values()]
+        if include_results and not self._no_results:
+            for element in elements:
+                element._refresh_results()  # make sure the results are fetched from the engine
+        new = self._from_copied_elements(
+            self._copy_elements(elements, include_results=include_results, copy_parameters=copy_parameters)
+        )
+        if include_results and not self._no_results:
+            new._no_results = False
+            new._results_valid = self._results_valid
+            if self._valid:
+                new._solver.variables = self._solver.variables  # warm start
+        return new
+
+    def _copy_elements(
+        self,
+        elements: Sequence[AbstractElement],
+        *,
+        include_results: bool,
+        aliases: Mapping[AbstractElement, AbstractElement] | None = None,
+        copy_parameters: bool = False,
+    ) -> list[AbstractElement]:
+        """Copy the given elements, use :meth:`_from_copied_elements` to create a network from them.
+
+        Args:
+            elements:
+                The elements to copy. The connections to elements that are not copied are dropped.
+
+            include_results:
+                If True, the results of the elements are also copied.
+
+            aliases:
+                A mapping of elements that are not copied to elements of ``elements``. The copies
+                of the latter replace the former in the copied connections. This is used to attach
+                detached elements to the elements of this network (see :meth:`reduce`).
+
+            copy_parameters:
+                If True, the parameters of the elements are also copied instead of being shared.
+
+        Returns:
+            The copies of the elements, with their Cython elements.
+        """
+        memo: dict[int, AbstractElement] = {}
+        new_elements = [element._copy_new(memo) for element in elements]
+        if aliases:
+            for element, target in aliases.items():
+                memo[id(element)] = memo[id(target)]
+        for element, new_element in zip(elements, new_elements, strict=True):
+            element._copy_to(new_element, memo, include_results=include_results)
+        if aliases:
+            # The aliased elements must know the elements that were connected to their aliases
+            targets = {id(memo[id(target)]) for target in aliases.values()}
+            for new_element in new_elements:
+                for connected_element in new_element._connected_elements:
+                    if id(connected_element) in targets:
+                        connected_element._connected_elements.setdefault(new_element)
+        if copy_parameters:
+            parameters_memo: dict[int, Any] = {}
+            for new_element in new_elements:
+                if new_element.element_type in self._parameters:
+                    params = new_element._parameters  # type: ignore
+                    new_params = parameters_memo.get(id(params))
+                    if new_params is None:
+                        new_params = parameters_memo[id(params)] = _copy_parameters(params)
+                    new_element._parameters = new_params  # type: ignore
+        for new_element in new_elements:
+            if new_element.element_type in self._parameters:
+                new_element.parameters._elements.add(new_element)  # type: ignore
+
+        # Create the Cython elements, the ones other elements connect to first
+        cy_order = {"ground": 0, "bus": 1, "ground connection": 3}
+        for new_element in sorted(new_elements, key=lambda e: cy_order.get(e.element_type, 2)):
+            new_element._create_cy_element()
+        return new_elements
+
+    def _from_copied_elements(self, new_elements: Iterable[AbstractElement]) -> Self:
+        """Create a network with the settings of this network from copied elements."""
+        new_elements_by_type: defaultdict[str, list[AbstractElement]] = defaultdict(list)
+        for new_element in new_elements:
+            new_elements_by_type[new_element.element_type].append(new_element)
+        # This creates the Cython network once
+        new = type(self)(**self._elements_kwargs(new_elements_by_type), name=self.name, crs=self.crs)
+        if new._solver.to_dict() != self._solver.to_dict():
+            new._solver = AbstractSolver.from_dict(data=self._solver.to_dict(), network=new)
+        new._tool_data = deepcopy(self._tool_data)
+        return new
 
     def solve_load_flow(
         self,
@@ -782,6 +1213,7 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
 
         iterations, residual = self._solver.solve_load_flow(max_iterations=max_iterations, tolerance=tolerance)
         self._no_results = False
+        self._results_generation = next(_results_generations)  # invalidates the memoized results
 
         # Lazily update the results of the elements
         for element in self._elements:
@@ -790,9 +1222,119 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
 
         # The results are now valid
         self._results_valid = True
+        for aggregator in self._results_aggregators:
+            aggregator.update(self)
 
         return iterations, residual
 
+    #
+    # Vectorized checks of the limits
+    #
+    @abstractmethod
+    def _get_res_limits(self) -> dict[str, _ResLimits]:
+        """Get the results of the buses, lines and transformers to check against their limits.
+
+        The keys are ``"bus"`` for the voltage levels of the buses that have a nominal voltage,
+        ``"line"`` for the loadings of the lines that have ampacities and ``"transformer"`` for the
+        loadings of the transformers.
+        """
+        raise NotImplementedError
+
+    def res_violations(self) -> pd.DataFrame:
+        """The violations of the limits of the buses, lines and transformers.
+
+        The voltage levels of the buses are compared to their ``min_voltage_level`` and
+        ``max_voltage_level``, the loadings of the lines (current over ampacity) and of the
+        transformers (power over ``sn``) are compared to their ``max_loading``. All the elements are
+        checked at once, which is much faster than accessing the ``res_violated`` property of each
+        element or filtering the result dataframes.
+
+        The results are returned as a dataframe with only the violated values, with the following
+        index:
+            - `element_type`: The type of the element (``"bus"``, ``"line"`` or ``"transformer"``).
+            - `element_id`: The id of the element.
+            - `phase`: The phase of the voltage level of the bus or of the current of the line.
+              It is missing for transformers whose loading is not per phase. This level of the
+              index does not exist for single-phase networks.
+
+        and the following columns:
+            - `value`: The voltage level of the bus or the loading of the line or transformer.
+            - `min_limit`: The minimal voltage level of the bus, ``nan`` for branches.
+            - `max_limit`: The maximal voltage level of the bus or the maximal loading of the
+              branch.
+
+        See Also:
+            :meth:`res_summary`: The extremes of the voltage levels and loadings of the network.
+        """
+        self._check_valid_results()
+        res_dict: dict[str, list[np.ndarray]] = {
+            "element_type": [],
+            "element_id": [],
+            "phase": [],
+            "value": [],
+            "min_limit": [],
+            "max_limit": [],
+        }
+        for element_type, limits in self._get_res_limits().items():
+            mask = limits.violated
+            n = np.count_nonzero(mask)
+            res_dict["element_type"].append(np.full(n, element_type, dtype=object))
+            res_dict["element_id"].append(np.asarray(limits.ids, dtype=object)[limits.element_index[mask]])
+            res_dict["phase"].append(
+                np.full(n, None, dtype=object) if limits.phases is None else limits.phases[mask].astype(object)
+            )
+            res_dict["value"].append(limits.values[mask])
+            res_dict["min_limit"].append(limits.min_limits[mask])
+            res_dict["max_limit"].append(limits.max_limits[mask])
+        index = ["element_type", "element_id", "phase"] if self.is_multi_phase else ["element_type", "element_id"]
+        if not self.is_multi_phase:
+            del res_dict["phase"]
+        df = pd.DataFrame({c: np.concatenate(arrays) for c, arrays in res_dict.items()})
+        return df.astype(dict.fromkeys(("value", "min_limit", "max_limit"), "float64")).set_index(index)
+
+    def res_summary(self) -> dict[str, Any]:
+        """The extremes of the voltage levels and loadings of the network and the number of violations.
+
+        The values are computed at once for all the elements, see :meth:`res_violations`. This is
+        meant to be called after each load flow of large studies.
+
+        Returns:
+            A dictionary with the following keys:
+                - `min_voltage_level` and `min_voltage_level_bus_id`: The lowest voltage level of
+                  the buses that have a nominal voltage and its bus.
+                - `max_voltage_level` and `max_voltage_level_bus_id`: The highest voltage level of
+                  the buses that have a nominal voltage and its bus.
+                - `max_line_loading` and `max_line_loading_line_id`: The highest loading of the
+                  lines that have ampacities and its line.
+                - `max_transformer_loading` and `max_transformer_loading_transformer_id`: The
+                  highest loading of the transformers and its transformer.
+                - `nb_violated_buses`, `nb_violated_lines` and `nb_violated_transformers`: The
+                  number of elements whose limits are violated.
+
+            The extremes are ``nan`` and their IDs ``None`` if there are no such elements.
+        """
+        self._check_valid_results()
+        res_limits = self._get_res_limits()
+        summary: dict[str, Any] = {}
+        extremes = (
+            ("bus", "min_voltage_level", np.argmin),
+            ("bus", "max_voltage_level", np.argmax),
+            ("line", "max_line_loading", np.argmax),
+            ("transformer", "max_transformer_loading", np.argmax),
+        )
+        for element_type, key, arg_extreme in extremes:
+            limits = res_limits[element_type]
+            if len(limits.values) == 0:
+                summary[key], summary[f"{key}_{element_type}_id"] = nan, None
+            else:
+                i = int(arg_extreme(limits.values))
+                summary[key] = float(limits.values[i])
+                summary[f"{key}_{element_type}_id"] = limits.ids[limits.element_index[i]]
+        for element_type, name in (("bus", "buses"), ("line", "lines"), ("transformer", "transformers")):
+            limits = res_limits[element_type]
+            summary[f"nb_violated_{name}"] = len(np.unique(limits.element_index[limits.violated]))
+        return summary
+
     @property
     def buses_clusters(self) -> list[set[Id]]:
         """Clusters of buses connected by lines and switches.
@@ -816,6 +1358,420 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
             result.append(bus_cluster)
         return result
 
+    def to_sparse_graph(self, *, weight: GraphWeight | None = None, respect_switches: bool = True) -> "SparseGraph":
+        """Create the sparse incidence and adjacency matrices of the network.
+
+        The buses are the nodes of the graph and the branches are its edges. Unlike
+        :meth:`to_graph`, the graph holds no data other than the weights of the branches, which
+        makes it fast to create and small in memory for large networks. The adjacency matrix can be
+        used directly with the :mod:`scipy.sparse.csgraph` routines.
+
+        Note:
+            This method requires *scipy* to be installed. You can install it with the ``"graph"``
+            extra if you are using pip: ``pip install "roseau-load-flow[graph]"``.
+
+        Args:
+            weight:
+                The weight of the branches. ``"length"`` for the length of the lines (km) and zero
+                for the other branches, ``"impedance"`` for the magnitude of the series impedance
+                of the branches (Ohm) and zero for switches, or ``None`` (default) for a weight of
+                one for all branches.
+
+            respect_switches:
+                Respect the switch state. If ``True`` (default), open switches are not included in
+                the graph. If ``False``, all switches are included regardless of their state.
+
+        Returns:
+            The sparse graph of the network with the mappings of its nodes and edges to the IDs of
+            the buses and the branches.
+        """
+        from roseau.load_flow.graph import SparseGraph
+
+        return SparseGraph._from_network(self, weight=weight, respect_switches=respect_switches)
+
+    def to_rustworkx(self, *, weight: GraphWeight | None = None, respect_switches: bool = True) -> "PyGraph":
+        """Create a rustworkx multi-graph from this electrical network.
+
+        The payload of a node is the ID of its bus. The payload of an edge is a dictionary with the
+        ``"id"`` and the ``"type"`` of its branch, and its ``"weight"`` when ``weight`` is given.
+        The index of a node is the position of its bus in :attr:`buses`.
+
+        Note:
+            This method requires *rustworkx* to be installed. You can install it with the
+            ``"graph"`` extra if you are using pip: ``pip install "roseau-load-flow[graph]"``.
+
+        Args:
+            weight:
+                The weight of the branches, see :meth:`to_sparse_graph`.
+
+            respect_switches:
+                Respect the switch state. If ``True`` (default), open switches are not included in
+                the graph. If ``False``, all switches are included regardless of their state.
+
+        Returns:
+            A rustworkx multi-graph representing the electrical network.
+        """
+        from roseau.load_flow.graph import _to_rustworkx
+
+        return _to_rustworkx(self, weight=weight, respect_switches=respect_switches)
+
+    def reduce(
+        self, buses: Iterable[Id], *, model: ReductionModel = "power", load_id: Id | None = None
+    ) -> "NetworkReduction[Self]":
+        """Reduce a sub-network to an equivalent load computed from the load flow results.
+
+        The sub-network must be connected to the rest of the network through a single bus, the
+        boundary bus. Its other buses and the elements connected to them are removed, and its
+        loads, sources and branches connected to the boundary bus are replaced by a load drawing
+        the same currents. For example, the LV network of a MV/LV transformer ``tr`` can be reduced
+        with ``en.reduce(en.transformers["tr"].bus_lv.get_connected_buses())`` or using one of the
+        :attr:`buses_clusters` of the network.
+
+        Args:
+            buses:
+                The IDs of the buses of the sub-network, including the boundary bus.
+
+            model:
+                The model of the equivalent load: ``"power"`` for a constant power load (the
+                default), ``"current"`` for a constant current load or ``"impedance"`` for a
+                constant impedance load.
+
+            load_id:
+                The ID of the equivalent load. Defaults to ``"<boundary bus ID>_equivalent"``.
+
+        Returns:
+            The reduction. Its ``network`` attribute is the reduced network, a new network. This
+            network is not modified. Use :meth:`NetworkReduction.expand()
+            <roseau.load_flow.reduction.NetworkReduction.expand>` to restore the sub-network.
+        """
+        from roseau.load_flow.reduction import NetworkReduction
+
+        return NetworkReduction(self, buses, model=model, load_id=load_id)
+
+    def solve_contingencies(
+        self,
+        contingencies: Iterable["Contingency"] | None = None,
+        *,
+        n_jobs: int | None = 1,
+        chunk_size: int | None = None,
+        max_iterations: int = 20,
+        tolerance: float = 1e-6,
+        solver: Solver = _DEFAULT_SOLVER,
+        solver_params: JsonDict | None = None,
+    ) -> "ContingencyAnalysis":
+        """Solve the load flow of contingencies and collect the violations of the limits of the elements.
+
+        The load flow of the base case is solved first. The load flow of each contingency is then
+        solved starting from the solution of the base case, on a copy of the network: this network
+        keeps the results of the base case. Contingencies that would separate elements from the
+        voltage source are detected on the graph of the buses and are not solved.
+
+        Args:
+            contingencies:
+                The contingencies to solve. If ``None`` (default), every closed switch of the
+                network is opened in turn (N-1 analysis).
+
+            n_jobs:
+                The number of worker processes. ``1`` (default) solves the contingencies in this
+                process. ``None`` uses one process per CPU. Each worker process needs a license, set
+                the ``ROSEAU_LOAD_FLOW_LICENSE_KEY`` environment variable to activate it.
+
+            chunk_size:
+                The number of contingencies sent to a worker process at once. Defaults to a quarter
+                of the contingencies of each process.
+
+            max_iterations:
+                The maximum number of allowed iterations of each load flow.
+
+            tolerance:
+                Tolerance needed for the convergence of each load flow.
+
+            solver:
+                The name of the solver to use for the load flows, see :meth:`solve_load_flow`.
+
+            solver_params:
+                A dictionary of parameters used by the solver.
+
+        Returns:
+            The results of the contingency analysis. Use its :attr:`ContingencyAnalysis.ranking
+            <roseau.load_flow.ContingencyAnalysis.ranking>` to get the contingencies sorted by
+            severity.
+        """
+        from roseau.load_flow.contingency import solve_contingencies
+
+        load_flow_kwargs = {
+            "max_iterations": max_iterations,
+            "tolerance": tolerance,
+            "solver": solver,
+            "solver_params": solver_params,
+        }
+        return solve_contingencies(
+            self, contingencies, n_jobs=n_jobs, chunk_size=chunk_size, load_flow_kwargs=load_flow_kwargs
+        )
+
+    def solve_probabilistic_load_flow(
+        self,
+        distributions: Iterable["PowerDistribution"],
+        *,
+        seed: int | None = None,
+        batch_size: int = 100,
+        min_samples: int = 200,
+        max_samples: int = 10_000,
+        quantiles: Sequence[float] = (0.05, 0.95),
+        quantiles_tolerance: float = 1e-3,
+        n_jobs: int | None = 1,
+        max_iterations: int = 20,
+        tolerance: float = 1e-6,
+        solver: Solver = _DEFAULT_SOLVER,
+        solver_params: JsonDict | None = None,
+    ) -> "ProbabilisticAnalysis":
+        """Solve the load flow of random samples of the powers of loads (Monte Carlo simulation).
+
+        The load flow of the base case is solved first. The powers of the loads are then drawn from
+        their distributions by batches of samples and the load flow of each sample is solved starting
+        from the solution of the previous sample, on a copy of the network: this network keeps the
+        results of the base case. After each batch, the quantiles of the voltage levels of the buses
+        and of the loadings of the lines and transformers are computed over the solved samples. The
+        simulation stops when none of them changed by more than ``quantiles_tolerance``.
+
+        Args:
+            distributions:
+                The distributions of the powers of the power loads. The other loads keep their
+                powers.
+
+            seed:
+                The seed of the random number generator. The samples are drawn in this process: a
+                seed gives the same samples whatever the number of worker processes.
+
+            batch_size:
+                The number of samples solved between two checks of the convergence of the quantiles.
+
+            min_samples:
+                The minimal number of samples, before the convergence of the quantiles is checked.
+
+            max_samples:
+                The maximal number of samples. A warning is logged if the quantiles did not converge.
+
+            quantiles:
+                The probabilities of the monitored quantiles, between 0 and 1.
+
+            quantiles_tolerance:
+                The largest change of the monitored quantiles between two batches for the simulation
+                to stop. The quantiles are voltage levels and loadings, in per-unit.
+
+            n_jobs:
+                The number of worker processes. ``1`` (default) solves the samples in this process.
+                ``None`` uses one process per CPU. Each batch is split between the processes. Each
+                worker process needs a license, set the ``ROSEAU_LOAD_FLOW_LICENSE_KEY`` environment
+                variable to activate it.
+
+            max_iterations:
+                The maximum number of allowed iterations of each load flow.
+
+            tolerance:
+                Tolerance needed for the convergence of each load flow.
+
+            solver:
+                The name of the solver to use for the load flows, see :meth:`solve_load_flow`.
+
+            solver_params:
+                A dictionary of parameters used by the solver.
+
+        Returns:
+            The results of the samples. Use its :meth:`ProbabilisticAnalysis.get_quantiles()
+            <roseau.load_flow.ProbabilisticAnalysis.get_quantiles>` method and its
+            :attr:`ProbabilisticAnalysis.violation_probabilities
+            <roseau.load_flow.ProbabilisticAnalysis.violation_probabilities>` property to analyse
+            them.
+        """
+        from roseau.load_flow.probabilistic import solve_probabilistic_load_flow
+
+        load_flow_kwargs = {
+            "max_iterations": max_iterations,
+            "tolerance": tolerance,
+            "solver": solver,
+            "solver_params": solver_params,
+        }
+        return solve_probabilistic_load_flow(
+            self,
+            distributions,
+            seed=seed,
+            batch_size=batch_size,
+            min_samples=min_samples,
+            max_samples=max_samples,
+            quantiles=quantiles,
+            quantiles_tolerance=quantiles_tolerance,
+            n_jobs=n_jobs,
+            load_flow_kwargs=load_flow_kwargs,
+        )
+
+    #
+    # Comparison
+    #
+    def diff(
+        self, other: Self, *, rtol: float = 1e-7, atol: float = 0.0, include_results: bool = True
+    ) -> "NetworkDiff":
+        """Compare this network with another network.
+
+        The elements of the two networks are matched by their IDs. The values of each field of the
+        matched elements, such as their buses, their parameters or their results, are taken from the
+        ``*_frame`` and ``res_*`` properties, aligned in arrays and compared at once. Unlike :func:`roseau.load_flow.testing.assert_json_close`, all
+        the differences are reported. The initial potentials of the buses are not compared.
+
+        Args:
+            other:
+                The network to compare with. It must be of the same type as this network.
+
+            rtol:
+                The relative tolerance used to compare numerical values. Defaults to 1e-7.
+
+            atol:
+                The absolute tolerance used to compare numerical values. Defaults to 0.
+
+            include_results:
+                If True (default), the load flow results of the networks are compared as well. A
+                network without results is compared without its results and a network with
+                outdated results raises an error.
+
+        Returns:
+            The differences between the two networks. Its :attr:`NetworkDiff.equal
+            <roseau.load_flow.NetworkDiff.equal>` attribute is True if the networks are equal.
+        """
+        from roseau.load_flow.diff import diff_networks
+
+        return diff_networks(self, other, rtol=rtol, atol=atol, include_results=include_results)
+
+    #
+    # Spatial queries
+    #
+    def _get_spatial_index(self, element_type: str) -> SpatialIndex:
+        """Get the spatial index of the elements of a type, it is built on first use."""
+        index = self._spatial_indexes.get(element_type)
+        if index is None:
+            index = SpatialIndex(self._elements_by_type[element_type].values())
+            self._spatial_indexes[element_type] = index
+        return index
+
+    def _nearest_elements(self, element_type: str, points: Any, k: int, max_distance: float | None) -> pd.DataFrame:
+        if isinstance(k, bool) or not isinstance(k, int | np.integer) or k < 1:
+            msg = f"The number of nearest elements must be a positive integer, got {k!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY)
+        if max_distance is not None and not max_distance >= 0:
+            msg = f"The maximum distance must be a non-negative number, got {max_distance!r}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY)
+        index = self._get_spatial_index(element_type)
+        point_idx, tree_idx, distances = index.nearest(as_geometries(points), k=int(k), max_distance=max_distance)
+        return pd.DataFrame(
+            data={f"{element_type}_id": index.ids[tree_idx], "distance": distances},
+            index=pd.Index(point_idx, name="point"),
+        )
+
+    def nearest_buses(self, points: Any, k: int = 1, *, max_distance: float | None = None) -> pd.DataFrame:
+        """Find the buses nearest to points.
+
+        The search uses a spatial index of the geometries of the buses that is built on first use
+        and kept until the buses of the network or their geometries change. Buses without a
+        geometry are ignored. Distances are measured in the units of the coordinates of the
+        geometries (e.g. degrees for longitude/latitude coordinates).
+
+        Args:
+            points:
+                A shapely geometry, a sequence of shapely geometries or an array-like of point
+                coordinates of shape ``(2,)`` or ``(N, 2)``.
+
+            k:
+                The number of nearest buses to find for each point. Defaults to 1.
+
+            max_distance:
+                An optional maximum distance between a point and its nearest buses. Points that
+                have no bus within this distance have no rows in the result.
+
+        Returns:
+            A dataframe with the ID of the nearest buses of each point in the ``bus_id`` column and
+            their distance to the point in the ``distance`` column. The index is the position of
+            the point in ``points``. The rows of a point are sorted by distance.
+        """
+        return self._nearest_elements("bus", points, k=k, max_distance=max_distance)
+
+    def nearest_lines(self, points: Any, k: int = 1, *, max_distance: float | None = None) -> pd.DataFrame:
+        """Find the lines nearest to points.
+
+        This is the same as :meth:`nearest_buses` for the geometries of the lines. The IDs of the
+        lines are in the ``line_id`` column of the result.
+
+        Args:
+            points:
+                A shapely geometry, a sequence of shapely geometries or an array-like of point
+                coordinates of shape ``(2,)`` or ``(N, 2)``.
+
+            k:
+                The number of nearest lines to find for each point. Defaults to 1.
+
+            max_distance:
+                An optional maximum distance between a point and its nearest lines. Points that
+                have no line within this distance have no rows in the result.
+
+        Returns:
+            A dataframe with the ID of the nearest lines of each point in the ``line_id`` column
+            and their distance to the point in the ``distance`` column. The index is the position
+            of the point in ``points``. The rows of a point are sorted by distance.
+        """
+        return self._nearest_elements("line", points, k=k, max_distance=max_distance)
+
+    def elements_within(
+        self,
+        geometry: BaseGeometry,
+        *,
+        element_types: Iterable[str] | None = None,
+        predicate: SpatialPredicate = "within",
+    ) -> dict[str, list[Id]]:
+        """Find the buses and branches located within a geometry.
+
+        The search uses spatial indexes of the geometries of the elements that are built on first
+        use and kept until the elements of the network or their geometries change. Elements
+        without a geometry are ignored.
+
+        Args:
+            geometry:
+                The shapely geometry to search in, usually a polygon.
+
+            element_types:
+                The types of the elements to search. Defaults to all the types of elements with a
+                geometry: buses, lines, transformers, switches and regulators.
+
+            predicate:
+                ``"within"`` (the default) to find the elements entirely within the geometry or
+                ``"intersects"`` to also find the elements that cross its boundary.
+
+        Returns:
+            The IDs of the elements found, indexed by element type.
+        """
+        if not isinstance(geometry, BaseGeometry):
+            msg = f"Expected a shapely geometry, got {type(geometry).__name__}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE)
+        if predicate not in ("within", "intersects"):
+            msg = f"Invalid predicate {predicate!r}, expected 'within' or 'intersects'."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY)
+        available_types = [et for et in _SPATIAL_ELEMENT_TYPES if et in self._elements_by_type]
+        if element_types is None:
+            element_types = available_types
+        else:
+            element_types = list(element_types)
+            if unknown_types := [et for et in element_types if et not in available_types]:
+                types_repr, be = one_or_more_repr(unknown_types, "Element type")
+                msg = f"{types_repr} {be} not supported by the spatial queries, expected one of {available_types}."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SPATIAL_QUERY)
+        result: dict[str, list[Id]] = {}
+        for et in element_types:
+            index = self._get_spatial_index(et)
+            result[et] = index.ids[index.query(geometry, predicate)].tolist()
+        return result
+
     @staticmethod
     def _elements_as_dict[E: AbstractElement](
         elements: MapOrSeq[E], error_code: RoseauLoadFlowExceptionCode
@@ -870,6 +1826,8 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
         self._add_ground_connections(element)
         self._valid = False
         self._results_valid = False
+        self._spatial_indexes = {}
+        self._shortest_path_trees = {}
 
     def _disconnect_element(self, element: _E_co) -> None:  # type: ignore
         """Remove an element of the network.
@@ -1044,6 +2002,30 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
     def _check_ref(cls, elements: Iterable[_E_co]) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def _create_equivalent_load(
+        self, id: Id, bus: Any, new_bus: Any, elements: list[Any], model: ReductionModel
+    ) -> _E_co:
+        """Create the equivalent load of a reduced sub-network.
+
+        Args:
+            id:
+                The ID of the equivalent load.
+
+            bus:
+                The boundary bus of this network, with load flow results.
+
+            new_bus:
+                The boundary bus of the reduced network to connect the load to.
+
+            elements:
+                The loads, sources and branch sides of the sub-network connected to ``bus``.
+
+            model:
+                The model of the equivalent load.
+        """
+        raise NotImplementedError
+
     def _check_valid_results(self) -> bool:
         """Check that the results exist and warn if they are invalid."""
         if self._no_results:
@@ -1198,14 +2180,19 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
         """
         if adj is None:
             adj = {}
+        # The weights of the parallel edges are reduced to their minimum, each edge is weighted once
+        weights: dict[Id, dict[Id, float]] = {}
         for n in self._elements_by_type["bus"]:
             adj.setdefault(n, {})
+            weights[n] = {}
         for et in ("line", "transformer", "switch", "regulator"):
             for e in self._elements_by_type[et].values():
                 u, v = e.bus1.id, e.bus2.id  # type: ignore
                 edge_data = (et, e.id)
                 adj[u].setdefault(v, []).append(edge_data)
                 adj[v].setdefault(u, []).append(edge_data)
+                if (w := weight(et, e.id)) is not None and w < weights[u].get(v, inf):
+                    weights[u][v] = weights[v][u] = w
         if pred is not None:
             pred.setdefault(source, [])
 
@@ -1219,10 +2206,7 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
             if v in distances:
                 continue
             distances[v] = v_dist
-            for u, edges in adj[v].items():
-                cost = min((w for (et, eid) in edges if (w := weight(et, eid)) is not None), default=None)
-                if cost is None:
-                    continue
+            for u, cost in weights[v].items():
                 vu_dist = v_dist + cost
                 if u in distances:
                     u_dist = distances[u]
@@ -1238,6 +2222,63 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
 
         return distances
 
+    def _get_shortest_path_tree(
+        self, source: Id, *, traverse_transformers: bool, switch_length: float
+    ) -> _ShortestPathTree:
+        """Get the shortest paths from a source bus along the lines, switches and regulators.
+
+        The lines are weighted by their length, the closed switches by `switch_length` and the
+        regulators by zero. The transformers are traversed with a zero weight if
+        `traverse_transformers` is True. The paths are cached until the topology of the network
+        changes: the profiles of many results of the same network are computed with one traversal.
+        """
+        key = (source, traverse_transformers, switch_length)
+        tree = self._shortest_path_trees.get(key)
+        if tree is not None:
+            return tree
+
+        def weight(et: BranchType, eid: Id) -> float | None:
+            if et == "line":
+                return self._elements_by_type["line"][eid]._length  # type: ignore
+            elif et == "transformer":
+                return 0.0 if traverse_transformers else None
+            elif et == "switch":
+                return switch_length if self._elements_by_type["switch"][eid].closed else None  # type: ignore
+            else:
+                return 0.0
+
+        pred: dict[Id, list[Id]] = {}
+        distances = self._shortest_paths(source, weight=weight, pred=pred)
+        positions = {bus_id: i for i, bus_id in enumerate(distances)}
+        edge_types: list[BranchType] = []
+        edge_ids: list[Id] = []
+        edge_from: list[int] = []
+        edge_to: list[int] = []
+        for et in ("line", "transformer", "switch", "regulator"):
+            for e in self._elements_by_type[et].values():
+                i, j = positions.get(e.bus1.id), positions.get(e.bus2.id)  # type: ignore
+                if i is None or j is None or weight(et, e.id) is None:
+                    continue
+                edge_types.append(et)
+                edge_ids.append(e.id)
+                edge_from.append(i)
+                edge_to.append(j)
+        tree = _ShortestPathTree(
+            bus_ids=list(distances),
+            distances=np.fromiter(distances.values(), dtype=np.float64, count=len(distances)),
+            predecessors=np.array(
+                [positions[ps[0]] if (ps := pred.get(bus_id)) else -1 for bus_id in distances], dtype=np.intp
+            ),
+            edge_types=edge_types,
+            edge_ids=edge_ids,
+            edge_from=np.array(edge_from, dtype=np.intp),
+            edge_to=np.array(edge_to, dtype=np.intp),
+        )
+        for array in (tree.distances, tree.predecessors, tree.edge_from, tree.edge_to):
+            array.flags.writeable = False  # shared between the profiles
+        self._shortest_path_trees[key] = tree
+        return tree
+
     #
     # DGS interface
     #
@@ -1307,7 +2348,7 @@ class AbstractNetwork(RLFObject, JsonMixin, CatalogueMixin[JsonDict], Generic[_E
 
     @classmethod
     def catalogue_data(cls) -> JsonDict:
-        data = json.loads((cls.catalogue_path() / "Catalogue.json").read_text())
+        data = get_catalogue_data(cls.catalogue_path())
         if not cls.is_multi_phase:
             # Remove the fields that are not relevant for single-phase networks
             for net_data in data.values():
@@ -5,11 +5,13 @@ from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowE
 
 if TYPE_CHECKING:
     import networkx as networkx
+    import rustworkx as rustworkx
     from matplotlib import pyplot as pyplot
+    from scipy import sparse as sparse
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["pyplot", "networkx"]
+__all__ = ["pyplot", "networkx", "rustworkx", "sparse"]
 
 
 def __getattr__(name: str) -> Any:
@@ -35,5 +37,27 @@ def __getattr__(name: str) -> Any:
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.IMPORT_ERROR) from e
         return networkx
+    elif name == "rustworkx":
+        try:
+            import rustworkx
+        except ImportError as e:
+            msg = (
+                'rustworkx is not installed. Install it with the "graph" extra using '
+                '`pip install -U "roseau-load-flow[graph]"`'
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.IMPORT_ERROR) from e
+        return rustworkx
+    elif name == "sparse":
+        try:
+            from scipy import sparse
+        except ImportError as e:
+            msg = (
+                'scipy is not installed. Install it with the "graph" extra using '
+                '`pip install -U "roseau-load-flow[graph]"`'
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.IMPORT_ERROR) from e
+        return sparse
     else:
         raise AttributeError(f"module {__name__} has no attribute {name!r}")
@@ -0,0 +1,161 @@
+"""
+Spatial index of the geometries of the elements of a network.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import shapely
+from numpy.typing import NDArray
+from shapely.geometry.base import BaseGeometry
+
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow.typing import FloatArray, SpatialPredicate
+
+if TYPE_CHECKING:
+    from roseau.load_flow.utils.mixins import AbstractElement
+
+logger = logging.getLogger(__name__)
+
+type IntArray = np.ndarray[tuple[int], np.dtype[np.intp]]
+
+# The predicates of `STRtree.query` are evaluated as `predicate(query_geometry, tree_geometry)`
+_TREE_PREDICATES: dict[SpatialPredicate, str] = {"within": "contains", "intersects": "intersects"}
+
+
+def as_geometries(geometries: Any, /) -> NDArray[np.object_]:
+    """Convert a geometry, a sequence of geometries or an array of coordinates to a 1D array of geometries.
+
+    Args:
+        geometries:
+            A shapely geometry, a sequence of shapely geometries or an array-like of point
+            coordinates of shape ``(2,)`` or ``(N, 2)``.
+
+    Returns:
+        The 1D array of the geometries.
+    """
+    if isinstance(geometries, BaseGeometry):
+        return np.array([geometries], dtype=object)
+    array = np.asarray(geometries)
+    if array.dtype != object and array.size > 0:
+        if array.ndim not in (1, 2) or array.shape[-1] != 2 or not np.issubdtype(array.dtype, np.number):
+            msg = f"Expected point coordinates of shape (2,) or (N, 2), got an array of shape {array.shape}."
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE)
+        return np.atleast_1d(shapely.points(array))
+    array = array.ravel()
+    if not shapely.is_geometry(array).all():
+        msg = "Expected shapely geometries or point coordinates."
+        logger.error(msg)
+        raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE)
+    return array.astype(object, copy=False)
+
+
+class SpatialIndex:
+    """A spatial index of the geometries of elements of the same type.
+
+    It is a :class:`shapely.STRtree` of the non-empty geometries of the elements. The elements
+    without a geometry are not part of the index. The index is immutable, the network creates a
+    new one when its elements or their geometries change.
+    """
+
+    __slots__ = ("ids", "tree")
+
+    def __init__(self, elements: Iterable["AbstractElement"]) -> None:
+        """SpatialIndex constructor.
+
+        Args:
+            elements:
+                The elements to index. They must have a ``geometry`` attribute.
+        """
+        ids, geometries = [], []
+        for e in elements:
+            geometry = e.geometry  # type: ignore
+            if geometry is not None:
+                ids.append(e.id)
+                geometries.append(geometry)
+        geometries = np.array(geometries, dtype=object)
+        non_empty = ~shapely.is_empty(geometries)
+        self.ids = np.array(ids, dtype=object)[non_empty]
+        self.tree = shapely.STRtree(geometries[non_empty])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nearest(
+        self, points: NDArray[np.object_], k: int, max_distance: float | None
+    ) -> tuple[IntArray, IntArray, FloatArray]:
+        """Find the ``k`` nearest indexed geometries of each point.
+
+        Args:
+            points:
+                The 1D array of the query geometries.
+
+            k:
+                The number of nearest geometries to find for each point. Fewer are returned when
+                the index is smaller or when ``max_distance`` is reached.
+
+            max_distance:
+                The maximum distance between a point and the returned geometries, if any.
+
+        Returns:
+            The indices of the points, the indices of their nearest geometries in the index and
+            the distances between them. They are sorted by point and then by distance.
+        """
+        empty = np.array([], dtype=np.intp)
+        if len(points) == 0 or len(self) == 0:
+            return empty, empty.copy(), np.array([], dtype=np.float64)
+        (point_idx, tree_idx), distances = self.tree.query_nearest(
+            points, max_distance=max_distance, return_distance=True, all_matches=False
+        )
+        k = min(k, len(self))
+        if k > 1 and len(point_idx) > 0:
+            # The k nearest geometries of a point are within the smallest circle around it that
+            # contains k geometries. Its radius is found by growing the margin added to the nearest
+            # distance, starting small, until the circle contains k geometries.
+            xmin, ymin, xmax, ymax = shapely.total_bounds(self.tree.geometries)
+            margin = float(np.hypot(xmax - xmin, ymax - ymin)) / len(self) or 1.0
+            found_points, found_geoms = [], []
+            active = point_idx
+            while len(active) > 0:
+                radii = distances + margin
+                if max_distance is not None:
+                    radii = np.minimum(radii, max_distance)
+                p_idx, t_idx = self.tree.query(points[active], predicate="dwithin", distance=radii)
+                done = np.bincount(p_idx, minlength=len(active)) >= k
+                if max_distance is not None:
+                    done |= radii >= max_distance
+                mask = done[p_idx]
+                found_points.append(active[p_idx[mask]])
+                found_geoms.append(t_idx[mask])
+                active, distances = active[~done], distances[~done]
+                margin *= 2
+            point_idx, tree_idx = np.concatenate(found_points), np.concatenate(found_geoms)
+            distances = shapely.distance(points[point_idx], self.tree.geometries[tree_idx])
+        order = np.lexsort((distances, point_idx))
+        point_idx, tree_idx, distances = point_idx[order], tree_idx[order], distances[order]
+        if k > 1:
+            # Keep the first k geometries of each point
+            starts = np.flatnonzero(np.r_[True, point_idx[1:] != point_idx[:-1]])
+            ranks = np.arange(len(point_idx)) - np.repeat(starts, np.diff(np.r_[starts, len(point_idx)]))
+            keep = ranks < k
+            point_idx, tree_idx, distances = point_idx[keep], tree_idx[keep], distances[keep]
+        return point_idx, tree_idx, distances
+
+    def query(self, geometry: BaseGeometry, predicate: SpatialPredicate) -> IntArray:
+        """Find the indexed geometries that are within or intersect a geometry.
+
+        Args:
+            geometry:
+                The query geometry.
+
+            predicate:
+                ``"within"`` for the geometries entirely within ``geometry`` or ``"intersects"``
+                for the geometries that intersect it.
+
+        Returns:
+            The sorted indices of the matching geometries in the index.
+        """
+        return np.sort(self.tree.query(geometry, predicate=_TREE_PREDICATES[predicate]))
@@ -0,0 +1,108 @@
+import json
+import logging
+
+import numpy as np
+import pytest
+
+import roseau.load_flow as rlf
+import roseau.load_flow_single as rlfs
+from roseau.load_flow.utils import catalogue
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "catalogue"
+    monkeypatch.setattr(catalogue, "catalogue_cache_dir", lambda: cache_dir)
+    catalogue.clear_catalogue_cache()
+    yield cache_dir
+    catalogue.clear_catalogue_cache()
+
+
+def test_catalogue_bundle(cache_dir, monkeypatch, caplog):
+    catalogue_path = rlf.ElectricalNetwork.catalogue_path()
+
+    # The bundle is built and written on first use
+    data = catalogue.get_catalogue_data(catalogue_path)
+    expected_data = json.loads((catalogue_path / "Catalogue.json").read_text())
+    assert data == expected_data
+    (bundle_path,) = cache_dir.glob("networks-*.bundle")
+    assert not list(cache_dir.glob(".networks-*"))  # no temporary file left behind
+
+    # The returned dictionaries are new objects
+    data["MVFeeder004"]["nb_buses"] = -1
+    assert catalogue.get_catalogue_data(catalogue_path)["MVFeeder004"]["nb_buses"] != -1
+    network_data = catalogue.get_catalogue_data(catalogue_path, "MVFeeder004_Winter")
+    assert network_data == json.loads((catalogue_path / "MVFeeder004_Winter.json").read_text())
+
+    # Other processes read the bundle instead of parsing the JSON files again
+    catalogue.clear_catalogue_cache()
+    with monkeypatch.context() as m:
+        m.setattr(catalogue, "_build_bundle", lambda catalogue_path: pytest.fail("The bundle was rebuilt"))
+        assert catalogue.get_catalogue_data(catalogue_path) == expected_data
+
+    # An invalid bundle is ignored and rebuilt
+    catalogue.clear_catalogue_cache()
+    bundle_path.write_bytes(b"not a bundle")
+    with caplog.at_level(logging.WARNING, logger=catalogue.logger.name):
+        catalogue.get_catalogue_data(catalogue_path)
+    assert "Ignoring the invalid catalogue bundle" in caplog.text
+    fingerprint = catalogue._fingerprint(catalogue_path)
+    assert catalogue._read_bundle(bundle_path, fingerprint) is not None
+
+    # A bundle of other files is ignored, the bundle contains only JSON data
+    content = bundle_path.read_bytes()
+    assert catalogue._read_bundle(bundle_path, "0" * 16) is None
+    bundle_path.write_bytes(content[:-1])
+    assert catalogue._read_bundle(bundle_path, fingerprint) is None
+    bundle_path.write_bytes(content)
+
+    # Outdated bundles are removed
+    catalogue.clear_catalogue_cache()
+    outdated_path = cache_dir / "networks-0000000000000000.bundle"
+    bundle_path.rename(outdated_path)
+    pickled_path = cache_dir / "networks-0000000000000000.pickle"  # bundles of older versions
+    pickled_path.write_bytes(b"never read")
+    catalogue.get_catalogue_data(catalogue_path)
+    assert list(cache_dir.glob("networks-*")) == [bundle_path]
+
+    # The bundle is kept in memory when it cannot be written
+    catalogue.clear_catalogue_cache()
+    bundle_path.unlink()
+    cache_dir.rmdir()
+    cache_dir.touch()  # a file prevents the creation of the directory
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger=catalogue.logger.name):
+        assert catalogue.get_catalogue_data(catalogue_path) == expected_data
+    assert "Could not write the catalogue bundle" in caplog.text
+
+
+@pytest.mark.parametrize("package", (rlf, rlfs), ids=("rlf", "rlfs"))
+def test_catalogue_network_cache(cache_dir, package, monkeypatch):
+    en1 = package.ElectricalNetwork.from_catalogue(name="MVFeeder004", load_point_name="winter")
+    assert en1.name == "MVFeeder004 (Winter)"
+
+    # The network is created once per process
+    with monkeypatch.context() as m:
+        m.setattr(rlf.ElectricalNetwork, "_get_catalogue", lambda *a, **kw: pytest.fail("The network was recreated"))
+        m.setattr(rlfs.ElectricalNetwork, "from_rlf", lambda *a, **kw: pytest.fail("The network was recreated"))
+        en2 = package.ElectricalNetwork.from_catalogue(name="MVFeeder004", load_point_name="winter")
+    assert en2.to_dict() == en1.to_dict()
+
+    # The networks do not share their elements nor their parameters
+    line_id, line1 = next(iter(en1.lines.items()))
+    line2 = en2.lines[line_id]
+    assert line2 is not line1
+    assert line2.parameters is not line1.parameters
+    assert line2 in line2.parameters._elements
+    assert all(line._network is en2 for line in line2.parameters._elements)
+    assert all(line._network is en1 for line in line1.parameters._elements)
+    for name, value in vars(line1.parameters).items():
+        if isinstance(value, np.ndarray):
+            assert vars(line2.parameters)[name] is not value
+            np.testing.assert_array_equal(vars(line2.parameters)[name], value)
+
+    # Modifying a network does not modify the next ones
+    for bus in list(en2.buses.values())[1:]:
+        bus.nominal_voltage = 1.0
+    en3 = package.ElectricalNetwork.from_catalogue(name="MVFeeder004", load_point_name="winter")
+    assert en3.to_dict() == en1.to_dict()
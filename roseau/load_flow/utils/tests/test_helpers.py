@@ -1,6 +1,7 @@
 import pytest
+import shapely
 
-from roseau.load_flow.utils.helpers import CaseInsensitiveStrEnum, count_repr, one_or_more_repr
+from roseau.load_flow.utils.helpers import CaseInsensitiveStrEnum, count_repr, geom_mappings, one_or_more_repr
 
 
 def test_count_repr():
@@ -16,6 +17,22 @@ def test_one_or_more_repr():
     assert one_or_more_repr(["a", "b"], "Bus", "Buses") == ("Buses ['a', 'b']", "are")
 
 
+def test_geom_mappings():
+    geoms = [
+        shapely.Point(1, 2),
+        None,
+        shapely.LineString([(0, 0), (1, 1), (2, 3)]),
+        shapely.Point(),
+        shapely.LineString(),
+        shapely.Point(1, 2, 3),
+        shapely.Polygon([(0, 0), (1, 0), (1, 1)]),
+        shapely.Point(5, 6),
+    ]
+    assert geom_mappings(geoms) == [g.__geo_interface__ if g is not None else None for g in geoms]
+    assert geom_mappings([]) == []
+    assert geom_mappings([None]) == [None]
+
+
 def test_case_insensitive_str_enum():
     class TestEnum(CaseInsensitiveStrEnum):
         AA = "Aa"
@@ -10,6 +10,10 @@ def test_optional_deps(monkeypatch):
     assert plt.__class__.__name__ == "module"
     networkx = optional_deps.networkx
     assert networkx.__class__.__name__ == "module"
+    rustworkx = optional_deps.rustworkx
+    assert rustworkx.__class__.__name__ == "module"
+    sparse = optional_deps.sparse
+    assert sparse.__class__.__name__ == "module"
 
     # Fail
     with pytest.raises(AttributeError) as e:
@@ -38,3 +42,19 @@ def test_optional_deps(monkeypatch):
             '"roseau-load-flow[graph]"`'
         )
         assert e.value.code == RoseauLoadFlowExceptionCode.IMPORT_ERROR
+
+        with pytest.raises(RoseauLoadFlowException) as e:
+            optional_deps.rustworkx  # noqa: B018
+        assert (
+            e.value.msg == 'rustworkx is not installed. Install it with the "graph" extra using `pip install -U '
+            '"roseau-load-flow[graph]"`'
+        )
+        assert e.value.code == RoseauLoadFlowExceptionCode.IMPORT_ERROR
+
+        with pytest.raises(RoseauLoadFlowException) as e:
+            optional_deps.sparse  # noqa: B018
+        assert (
+            e.value.msg == 'scipy is not installed. Install it with the "graph" extra using `pip install -U '
+            '"roseau-load-flow[graph]"`'
+        )
+        assert e.value.code == RoseauLoadFlowExceptionCode.IMPORT_ERROR
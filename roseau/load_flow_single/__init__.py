@@ -1,11 +1,19 @@
 from roseau.load_flow import (
     SQRT3,
+    Contingency,
+    ContingencyAnalysis,
     Insulator,
     License,
     LineType,
     Material,
+    NetworkDiff,
+    NetworkReduction,
+    PowerDistribution,
+    ProbabilisticAnalysis,
+    ResultsAggregator,
     RoseauLoadFlowException,
     RoseauLoadFlowExceptionCode,
+    SparseGraph,
     TransformerCooling,
     TransformerInsulation,
     __authors__,
@@ -18,11 +26,17 @@ from roseau.load_flow import (
     __url__,
     __version__,
     activate_license,
+    aggregation,
     constants,
+    contingency,
     deactivate_license,
+    diff,
     exceptions,
     get_license,
+    graph,
     license,
+    probabilistic,
+    reduction,
     show_versions,
     testing,
     types,
@@ -98,6 +112,20 @@ __all__ = [
     "Material",
     "TransformerCooling",
     "TransformerInsulation",
+    "NetworkReduction",
+    "reduction",
+    "Contingency",
+    "ContingencyAnalysis",
+    "contingency",
+    "PowerDistribution",
+    "ProbabilisticAnalysis",
+    "probabilistic",
+    "ResultsAggregator",
+    "aggregation",
+    "NetworkDiff",
+    "diff",
+    "SparseGraph",
+    "graph",
     "utils",
     "constants",
     # License
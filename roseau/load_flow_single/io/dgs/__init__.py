@@ -5,7 +5,7 @@ Use the `ElectricalNetwork.from_dgs_file` method to read a network from a dgs fi
 """
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 from roseau.load_flow.io.dgs.utils import (
@@ -172,51 +172,54 @@ def network_from_dgs(data: Mapping[str, Any], /, use_name_as_id: bool = False) -
 
 
 def network_to_dgs(en: "ElectricalNetwork") -> JsonDict:
+    """Convert the network to a dictionary of DGS tables."""
+    return dict(iter_network_dgs(en))
+
+
+def iter_network_dgs(en: "ElectricalNetwork") -> Iterator[tuple[str, DGSData]]:
+    """Iterate over the ``(name, table)`` pairs of the DGS tables of the network, in file order.
+
+    The tables are produced lazily so that they can be written to a file and released one by one.
+    """
     fid_counter = FIDCounter()
-    general: JsonDict = {
-        "Attributes": ["FID", "Descr", "Val"],
-        "Values": [[next(fid_counter), "Version", "7.0"]],
-    }
+    yield "General", {"Attributes": ["FID", "Descr", "Val"], "Values": [[next(fid_counter), "Version", "7.0"]]}
 
     # PowerFactory data
-    int_case = create_study_case(fid_counter)
+    yield "IntCase", create_study_case(fid_counter)
     int_grf_net = create_graphic_net(fid_counter)
     grf_net_fid: str = next(iter_dgs_values(int_grf_net, "FID"))
+    yield "IntGrfnet", int_grf_net
     elm_net = create_grid(fid_counter, grf_net_fid)
     net_fid: str = next(iter_dgs_values(elm_net, "FID"))
+    yield "ElmNet", elm_net
 
     # Buses
     elm_term = buses_to_elm_term(en.buses.values(), fid_counter=fid_counter, fold_id=net_fid)
     term_fid_by_id = get_id_to_fid_map(elm_term)
 
-    # Types
-    ln_params: list[LineParameters] = []
-    ln_params_uns: list[set[float]] = []
-    tr_params: list[TransformerParameters] = []
+    # Types, parameters are shared by identity between the branches
+    ln_params: dict[int, LineParameters] = {}
+    ln_params_uns: dict[int, set[float]] = {}
     for ln in en.lines.values():
-        un = (
-            ln.bus1.nominal_voltage.m_as("kV")
-            if ln.bus1.nominal_voltage is not None
-            else ln.bus2.nominal_voltage.m_as("kV")
-            if ln.bus2.nominal_voltage is not None
-            else None
-        )
-        if ln.parameters in ln_params:
-            if un is not None:
-                idx = ln_params.index(ln.parameters)
-                ln_params_uns[idx].add(un)
-        else:
-            ln_params.append(ln.parameters)
-            uns = {un} if un is not None else set()
-            ln_params_uns.append(uns)
-    for tr in en.transformers.values():
-        if tr.parameters in tr_params:
-            continue
-        tr_params.append(tr.parameters)
-    typ_lne = lp_to_typ_lne(ln_params, ln_params_uns, fid_counter)
-    typ_tr2 = tp_to_typ_tr2(tr_params, fid_counter)
+        lp = ln._parameters
+        uns = ln_params_uns.get(id(lp))
+        if uns is None:
+            ln_params[id(lp)] = lp
+            uns = ln_params_uns[id(lp)] = set()
+        bus1, bus2 = ln.bus1, ln.bus2
+        un = bus1._nominal_voltage if bus1._nominal_voltage is not None else bus2._nominal_voltage
+        if un is not None:
+            uns.add(un * 1e-3)  # kV
+    tr_params = {id(tr._parameters): tr._parameters for tr in en.transformers.values()}
+    typ_lne = lp_to_typ_lne(ln_params.values(), ln_params_uns.values(), fid_counter)
+    typ_tr2 = tp_to_typ_tr2(tr_params.values(), fid_counter)
+    yield "TypLne", typ_lne
+    yield "TypTr2", typ_tr2
+    yield "ElmTerm", elm_term
+    del elm_term
 
-    # Elements and their static cubics (order matters)
+    # Elements and their static cubics (order matters). The cubics reference the FIDs of their
+    # elements so they are only complete once the elements tables are created.
     sta_cubic: DGSData = {"Attributes": STA_CUBIC_ATTRIBUTES[:], "Values": []}
     lne_sta_cubic = {
         ln.id: (
@@ -247,6 +250,7 @@ def network_to_dgs(en: "ElectricalNetwork") -> JsonDict:
         ld.id: add_sta_cubic_value(term_fid_by_id[ld.bus.id], 0, "abc", fid_counter, sta_cubic)
         for ld in en.loads.values()
     }
+    del term_fid_by_id
 
     elm_lne = lines_to_elm_lne(
         en.lines.values(), typ_lne, fid_counter=fid_counter, sta_cubic=lne_sta_cubic, fold_id=net_fid
@@ -259,20 +263,17 @@ def network_to_dgs(en: "ElectricalNetwork") -> JsonDict:
         en.sources.values(), fid_counter=fid_counter, sta_cubic=xnet_sta_cubic, fold_id=net_fid
     )
     elm_lod = loads_to_elm_lod(en.loads.values(), fid_counter=fid_counter, sta_cubic=lod_sta_cubic)
+    del typ_lne, typ_tr2, lne_sta_cubic, tr2_sta_cubic, coup_sta_cubic, xnet_sta_cubic, lod_sta_cubic
 
-    return {
-        "General": general,
-        "IntCase": int_case,
-        "IntGrfnet": int_grf_net,
-        "ElmNet": elm_net,
-        "TypLne": typ_lne,
-        "TypTr2": typ_tr2,
-        "ElmTerm": elm_term,
-        "StaCubic": sta_cubic,
-        "ElmLne": elm_lne,
-        "ElmCoup": elm_coup,
-        "ElmTr2": elm_tr2,
-        "ElmXnet": elm_xnet,
-        "ElmLod": elm_lod,
-        # TODO check if the CRS can be stored in the DGS file
-    }
+    yield "StaCubic", sta_cubic
+    del sta_cubic
+    yield "ElmLne", elm_lne
+    del elm_lne
+    yield "ElmCoup", elm_coup
+    del elm_coup
+    yield "ElmTr2", elm_tr2
+    del elm_tr2
+    yield "ElmXnet", elm_xnet
+    del elm_xnet
+    yield "ElmLod", elm_lod
+    # TODO check if the CRS can be stored in the DGS file
@@ -18,7 +18,7 @@ from roseau.load_flow.io.dgs.utils import (
     clean_id,
     get_id_to_fid_map,
     gps_coords_to_linestring,
-    linestring_to_gps_coords,
+    linestrings_to_gps_coords,
 )
 from roseau.load_flow.typing import Id
 from roseau.load_flow.units import Q_
@@ -357,7 +357,8 @@ def lines_to_elm_lne(
 
     typ_fid_by_id = get_id_to_fid_map(typ_lne)
 
-    for line in lines:
+    lines = list(lines)
+    for line, gps_coords in zip(lines, linestrings_to_gps_coords([line.geometry for line in lines]), strict=True):
         fid = next(fid_counter)
         typ_id = typ_fid_by_id[line.parameters.id]
         laying = LINE_TYPES_REVERSE.get(line.parameters._line_type) if line.parameters._line_type is not None else None
@@ -365,7 +366,6 @@ def lines_to_elm_lne(
         cubic1, cubic2 = sta_cubic[line.id]
         cubic1[STA_CUBIC_OBJ_ID_INDEX] = fid
         cubic2[STA_CUBIC_OBJ_ID_INDEX] = fid
-        gps_coords = linestring_to_gps_coords(line.geometry)
         gps_attributes.update(dict.fromkeys(gps_coords))
 
         values.append(
@@ -381,7 +381,7 @@ def lines_to_elm_lne(
                 cubic2[STA_CUBIC_FID_INDEX],  # bus2
                 line._length,  # dline
                 1,  # nlnum
-                line.max_loading.m_as("percent"),  # maxload
+                line._max_loading * 100,  # maxload
                 *gps_coords.values(),
             ]
         )
@@ -276,7 +276,7 @@ def transformers_to_elm_tr2(
                 cubic_hv[STA_CUBIC_FID_INDEX],  # bushv
                 cubic_lv[STA_CUBIC_FID_INDEX],  # buslv
                 nntap,  # nntap
-                tr.max_loading.m_as("percent"),  # maxload
+                tr._max_loading * 100,  # maxload
                 0,  # cneutcon
                 0,  # cgnd_l
                 0,  # cpeter_l
@@ -0,0 +1,242 @@
+"""
+This module is not for public use.
+
+Use the `ElectricalNetwork.from_frames` method to create networks from data frames.
+
+The frames have the columns of the ``*_frame`` properties of the network and are indexed by the IDs
+of the elements. The columns are checked at once for the whole frame before any element is created.
+"""
+
+import pandas as pd
+
+from roseau.load_flow.exceptions import RoseauLoadFlowExceptionCode
+from roseau.load_flow.io.frames import (
+    _bools,
+    _check_columns,
+    _check_lengths,
+    _check_not_flexible,
+    _floats,
+    _frame_ids,
+    _geometries,
+    _load_values,
+    _lookup,
+    _objects,
+    _parameters_as_dict,
+)
+from roseau.load_flow.typing import CRSLike, Id, MapOrSeq
+from roseau.load_flow_single.io.common import NetworkElements
+from roseau.load_flow_single.models import (
+    Bus,
+    CurrentLoad,
+    ImpedanceLoad,
+    Line,
+    LineParameters,
+    Load,
+    PowerLoad,
+    RegulatorParameters,
+    Switch,
+    Transformer,
+    TransformerParameters,
+    VoltageRegulator,
+    VoltageSource,
+)
+
+_EMPTY_FRAME = pd.DataFrame(index=pd.Index([], name="id"))
+
+
+def network_from_frames(
+    *,
+    name: str,
+    buses: pd.DataFrame,
+    lines: pd.DataFrame | None,
+    transformers: pd.DataFrame | None,
+    switches: pd.DataFrame | None,
+    regulators: pd.DataFrame | None,
+    loads: pd.DataFrame | None,
+    sources: pd.DataFrame | None,
+    lines_params: MapOrSeq[LineParameters],
+    transformers_params: MapOrSeq[TransformerParameters],
+    regulators_params: MapOrSeq[RegulatorParameters],
+    crs: CRSLike | None,
+) -> NetworkElements:
+    """Create the electrical network elements from data frames.
+
+    Returns:
+        The buses, lines, transformers, switches, regulators, loads and sources to construct the
+        electrical network.
+    """
+    if crs is None:
+        crs = getattr(buses, "crs", None)
+    lines_params_dict = _parameters_as_dict(lines_params)
+    transformers_params_dict = _parameters_as_dict(transformers_params)
+    regulators_params_dict = _parameters_as_dict(regulators_params)
+
+    # Buses
+    frame, frame_name = buses, "buses"
+    buses_dict: dict[Id, Bus] = {}
+    for bus_id, nominal_voltage, min_voltage_level, max_voltage_level, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _floats(frame, frame_name, "nominal_voltage", default=None, optional=True),
+        _floats(frame, frame_name, "min_voltage_level", default=None, optional=True),
+        _floats(frame, frame_name, "max_voltage_level", default=None, optional=True),
+        _geometries(frame),
+        strict=True,
+    ):
+        buses_dict[bus_id] = Bus(
+            id=bus_id,
+            nominal_voltage=nominal_voltage,
+            min_voltage_level=min_voltage_level,
+            max_voltage_level=max_voltage_level,
+            geometry=geometry,
+        )
+
+    # Lines
+    frame, frame_name = _EMPTY_FRAME if lines is None else lines, "lines"
+    _check_columns(frame, frame_name, ["bus1_id", "bus2_id", "parameters_id", "length"])
+    line_ids = _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_LINE_ID)
+    lengths = _floats(frame, frame_name, "length", default=None)
+    _check_lengths(lengths)
+    lines_dict: dict[Id, Line] = {}
+    for line_id, bus1, bus2, parameters, length, max_loading, geometry in zip(
+        line_ids,
+        _lookup(frame, frame_name, "bus1_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus2_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(
+            frame, frame_name, "parameters_id", lines_params_dict, code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
+        ),
+        lengths,
+        _floats(frame, frame_name, "max_loading", default=1.0),
+        _geometries(frame),
+        strict=True,
+    ):
+        lines_dict[line_id] = Line(
+            id=line_id,
+            bus1=bus1,
+            bus2=bus2,
+            parameters=parameters,
+            length=length,
+            max_loading=max_loading,
+            geometry=geometry,
+        )
+
+    # Transformers
+    frame, frame_name = _EMPTY_FRAME if transformers is None else transformers, "transformers"
+    _check_columns(frame, frame_name, ["bus_hv_id", "bus_lv_id", "parameters_id"])
+    transformers_dict: dict[Id, Transformer] = {}
+    for transformer_id, bus_hv, bus_lv, parameters, tap, max_loading, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_TRANSFORMER_ID),
+        _lookup(frame, frame_name, "bus_hv_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus_lv_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(
+            frame,
+            frame_name,
+            "parameters_id",
+            transformers_params_dict,
+            code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID,
+        ),
+        _floats(frame, frame_name, "tap", default=1.0),
+        _floats(frame, frame_name, "max_loading", default=1.0),
+        _geometries(frame),
+        strict=True,
+    ):
+        transformers_dict[transformer_id] = Transformer(
+            id=transformer_id,
+            bus_hv=bus_hv,
+            bus_lv=bus_lv,
+            parameters=parameters,
+            tap=tap,
+            max_loading=max_loading,
+            geometry=geometry,
+        )
+
+    # Switches
+    frame, frame_name = _EMPTY_FRAME if switches is None else switches, "switches"
+    _check_columns(frame, frame_name, ["bus1_id", "bus2_id"])
+    switches_dict: dict[Id, Switch] = {}
+    for switch_id, bus1, bus2, closed, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_SWITCH_ID),
+        _lookup(frame, frame_name, "bus1_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus2_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _bools(frame, frame_name, "closed", default=True),
+        _geometries(frame),
+        strict=True,
+    ):
+        switches_dict[switch_id] = Switch(id=switch_id, bus1=bus1, bus2=bus2, closed=closed, geometry=geometry)
+
+    # Voltage regulators
+    frame, frame_name = _EMPTY_FRAME if regulators is None else regulators, "regulators"
+    _check_columns(frame, frame_name, ["bus1_id", "bus2_id", "parameters_id"])
+    regulators_dict: dict[Id, VoltageRegulator] = {}
+    for regulator_id, bus1, bus2, parameters, u_ref, max_loading, geometry in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID),
+        _lookup(frame, frame_name, "bus1_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(frame, frame_name, "bus2_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _lookup(
+            frame,
+            frame_name,
+            "parameters_id",
+            regulators_params_dict,
+            code=RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID,
+        ),
+        _floats(frame, frame_name, "u_ref", default=1.0),
+        _floats(frame, frame_name, "max_loading", default=1.0),
+        _geometries(frame),
+        strict=True,
+    ):
+        regulators_dict[regulator_id] = VoltageRegulator(
+            id=regulator_id,
+            bus1=bus1,
+            bus2=bus2,
+            parameters=parameters,
+            u_ref=u_ref,
+            max_loading=max_loading,
+            geometry=geometry,
+        )
+
+    # Loads
+    frame, frame_name = _EMPTY_FRAME if loads is None else loads, "loads"
+    _check_columns(frame, frame_name, ["type", "bus_id"])
+    _check_not_flexible(frame, frame_name)
+    load_ids = _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_LOAD_ID)
+    load_values = _load_values(
+        frame, frame_name, load_ids, {"power": "power", "current": "current", "impedance": "impedance"}
+    )
+    loads_dict: dict[Id, Load] = {}
+    for load_id, load_type, bus, value in zip(
+        load_ids,
+        _objects(frame, frame_name, "type"),
+        _lookup(frame, frame_name, "bus_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        load_values,
+        strict=True,
+    ):
+        if load_type == "power":
+            load = PowerLoad(id=load_id, bus=bus, power=value)
+        elif load_type == "current":
+            load = CurrentLoad(id=load_id, bus=bus, current=value)
+        else:
+            load = ImpedanceLoad(id=load_id, bus=bus, impedance=value)
+        loads_dict[load_id] = load
+
+    # Sources
+    frame, frame_name = _EMPTY_FRAME if sources is None else sources, "sources"
+    _check_columns(frame, frame_name, ["bus_id", "voltage"])
+    sources_dict: dict[Id, VoltageSource] = {}
+    for source_id, bus, voltage in zip(
+        _frame_ids(frame, code=RoseauLoadFlowExceptionCode.BAD_SOURCE_ID),
+        _lookup(frame, frame_name, "bus_id", buses_dict, code=RoseauLoadFlowExceptionCode.BAD_BUS_ID),
+        _objects(frame, frame_name, "voltage"),
+        strict=True,
+    ):
+        sources_dict[source_id] = VoltageSource(id=source_id, bus=bus, voltage=voltage)
+
+    return {
+        "name": name,
+        "buses": buses_dict,
+        "lines": lines_dict,
+        "transformers": transformers_dict,
+        "switches": switches_dict,
+        "regulators": regulators_dict,
+        "loads": loads_dict,
+        "sources": sources_dict,
+        "crs": crs,
+    }
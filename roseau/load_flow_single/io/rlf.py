@@ -1,11 +1,13 @@
 import cmath
 import logging
-from typing import Literal
+from collections.abc import Iterable
+from typing import Final, Literal
 
 import numpy as np
 
 import roseau.load_flow as rlf
-from roseau.load_flow.typing import ComplexArray, Id, JsonDict
+from roseau.load_flow.sym import A_INV, A
+from roseau.load_flow.typing import BoolArray, ComplexArray, Id, JsonDict
 from roseau.load_flow.utils import warn_external
 from roseau.load_flow_single.io.common import NetworkElements
 from roseau.load_flow_single.models import (
@@ -27,6 +29,9 @@ logger = logging.getLogger(__name__)
 
 type OnIncompatibleType = Literal["ignore", "warn", "raise-critical", "raise"]
 
+# The attributes holding the values of the phases of each type of load
+_LOAD_VALUES: Final = {"power": "_powers", "current": "_currents", "impedance": "_impedances"}
+
 
 def _handle_incompatibility(msg: str, on_incompatible: OnIncompatibleType, critical: bool = True) -> None:
     if on_incompatible == "ignore":
@@ -61,11 +66,9 @@ def _balance_voltages(
 ) -> complex:
     """Calculate and return √3*Van to be used in the single-phase equivalent network."""
     if ph in ("abc", "abcn"):  # "abc" or "abcn" (most common case)
-        v0, v1, v2 = rlf.sym.phasor_to_sym(voltages).tolist()
-        if not ph.endswith("n"):
-            v1 /= 1 - rlf.ALPHA2
-        voltage = v1 * rlf.SQRT3
-        if not np.allclose([v0, v2], 0):
+        voltages_s, balanced = _balance_three_phase_voltages(ph, np.reshape(voltages, (1, -1)))
+        voltage = voltages_s.item()
+        if not balanced.item():
             _handle_incompatibility(msg, on_incompatible=on_incompatible, critical=critical)
     elif ph in ("abn", "bcn", "can"):  # abn, bcn, can
         v1n, v2n = voltages.tolist()
@@ -99,6 +102,88 @@ def _balance_voltages(
     return voltage
 
 
+def _balance_three_phase_voltages(ph: str, voltages: ComplexArray) -> tuple[ComplexArray, BoolArray]:
+    """Calculate √3*Van of the rows of a (n, 3) array of "abc" or "abcn" voltages.
+
+    Returns:
+        The single-phase voltages and the mask of the balanced rows (no zero and negative sequence).
+    """
+    v_012 = voltages @ A_INV.T
+    v1 = v_012[:, 1]
+    if not ph.endswith("n"):
+        v1 = v1 / (1 - rlf.ALPHA2)
+    return v1 * rlf.SQRT3, np.isclose(v_012[:, ::2], 0).all(axis=1)
+
+
+def _buses_initial_voltages(buses_m: Iterable[rlf.Bus]) -> dict[Id, tuple[complex, bool]]:
+    """Compute in bulk the single-phase initial voltages of the three-phase buses initialized by the user.
+
+    Returns:
+        The single-phase initial voltage of each bus and whether its initial potentials are balanced.
+    """
+    groups: dict[str, tuple[list[Id], list[ComplexArray]]] = {}
+    for bus_m in buses_m:
+        init_pot = bus_m._initial_potentials
+        if bus_m.phases in ("abc", "abcn") and bus_m._initialized_by_the_user and init_pot is not None:
+            ids, potentials = groups.setdefault(bus_m.phases, ([], []))
+            ids.append(bus_m.id)
+            potentials.append(init_pot)
+    initial_voltages: dict[Id, tuple[complex, bool]] = {}
+    for ph, (ids, potentials) in groups.items():
+        potentials_array = np.array(potentials, dtype=np.complex128)
+        if ph == "abcn":
+            voltages = potentials_array[:, :3] - potentials_array[:, 3:]
+        else:
+            voltages = potentials_array - np.roll(potentials_array, -1, axis=1)
+        voltages_s, balanced = _balance_three_phase_voltages(ph, voltages)
+        initial_voltages.update(zip(ids, zip(voltages_s.tolist(), balanced.tolist(), strict=True), strict=True))
+    return initial_voltages
+
+
+def _lines_params_sym(params_m: Iterable[rlf.LineParameters]) -> dict[Id, tuple[complex, complex]]:
+    """Compute in bulk the positive-sequence impedance and admittance of three-phase line parameters.
+
+    The neutral of the 4-wire line parameters is eliminated by Kron's reduction. The line parameters
+    that are not three-phase are skipped.
+    """
+    groups: dict[int, list[rlf.LineParameters]] = {}
+    for lp_m in params_m:
+        if (n := lp_m._z_line.shape[0]) in (3, 4):
+            groups.setdefault(n, []).append(lp_m)
+    sym: dict[Id, tuple[complex, complex]] = {}
+    for n, group in groups.items():
+        z_line = np.stack([lp_m._z_line for lp_m in group])
+        if n == 4:
+            z_line = z_line[:, :3, :3] - z_line[:, :3, 3:] @ z_line[:, 3:, :3] / z_line[:, 3:, 3:]
+        y_shunt = np.stack([lp_m._y_shunt[:3, :3] for lp_m in group])
+        z1 = A_INV[1] @ z_line @ A[:, 1]
+        y1 = np.where([lp_m.with_shunt for lp_m in group], A_INV[1] @ y_shunt @ A[:, 1], 0j)
+        sym.update((lp_m.id, (z, y)) for lp_m, z, y in zip(group, z1.tolist(), y1.tolist(), strict=True))
+    return sym
+
+
+def _loads_values(loads_m: Iterable[rlf.AbstractLoad]) -> dict[Id, tuple[complex, bool]]:
+    """Compute in bulk the single-phase value of the loads and whether their phases are balanced.
+
+    The value is the total power of power loads and the mean current or impedance of current and
+    impedance loads.
+    """
+    groups: dict[tuple[str, int], tuple[list[Id], list[ComplexArray]]] = {}
+    for ld_m in loads_m:
+        if (attr := _LOAD_VALUES.get(ld_m.type)) is not None:
+            values = getattr(ld_m, attr)
+            ids, group_values = groups.setdefault((ld_m.type, values.size), ([], []))
+            ids.append(ld_m.id)
+            group_values.append(values)
+    loads_values: dict[Id, tuple[complex, bool]] = {}
+    for (load_type, _), (ids, group_values) in groups.items():
+        values = np.array(group_values, dtype=np.complex128)
+        balanced = (values == values[:, :1]).all(axis=1)
+        single_values = values.sum(axis=1) if load_type == "power" else values.mean(axis=1)
+        loads_values.update(zip(ids, zip(single_values.tolist(), balanced.tolist(), strict=True), strict=True))
+    return loads_values
+
+
 def network_from_rlf(  # noqa: C901
     en_m: rlf.ElectricalNetwork, /, *, on_incompatible: OnIncompatibleType
 ) -> tuple[NetworkElements, dict[str, JsonDict]]:
@@ -149,20 +234,20 @@ def network_from_rlf(  # noqa: C901
 
     # Convert buses
     buses: dict[Id, Bus] = {}
+    initial_voltages = _buses_initial_voltages(en_m.buses.values())
     for bus_m in en_m.buses.values():
         ph = bus_m.phases
         if "abc" not in ph:
             msg = f"Bus {bus_m.id!r} is not three-phase, phases={ph!r}"
             raise rlf.RoseauLoadFlowException(msg, code=rlf.RoseauLoadFlowExceptionCode.INVALID_FOR_SINGLE_PHASE)
-        if bus_m._initialized_by_the_user and (init_pot := bus_m._initial_potentials) is not None:
-            init_voltages = rlf.converters._calculate_voltages(init_pot, ph)
-            v_i = _balance_voltages(
-                ph,
-                init_voltages,
-                f"Bus {bus_m.id!r} has unbalanced initial potentials",
-                on_incompatible,
-                critical=False,
-            )
+        if bus_m.id in initial_voltages:
+            v_i, balanced = initial_voltages[bus_m.id]
+            if not balanced:
+                _handle_incompatibility(
+                    f"Bus {bus_m.id!r} has unbalanced initial potentials",
+                    on_incompatible=on_incompatible,
+                    critical=False,
+                )
         else:
             v_i = None
 
@@ -177,32 +262,32 @@ def network_from_rlf(  # noqa: C901
         buses[bus_s.id] = bus_s
 
     # Convert line and transformer parameters
-    ln_params_m: set[Id] = set()
+    # Each parameters object is converted once, the sequence impedances of the lines are computed in bulk
+    ln_params_m = {ln_m.parameters.id: ln_m.parameters for ln_m in en_m.lines.values()}
+    ln_params_sym = _lines_params_sym(ln_params_m.values())
+
+    def convert_line_parameters(lp_m: rlf.LineParameters, strict: bool) -> LineParameters:
+        if lp_m.id in ln_params_sym:
+            z1, y1 = ln_params_sym[lp_m.id]
+            return LineParameters._from_roseau_load_flow_sym(lp_m, z1=z1, y1=y1, strict=strict)
+        return LineParameters.from_roseau_load_flow(lp_m, strict=strict)  # raises for non three-phase
+
     ln_params_s: dict[Id, LineParameters] = {}
-    for ln_m in en_m.lines.values():
-        lp_m = ln_m.parameters
-        if lp_m.id in ln_params_m:
-            continue
-        ln_params_m.add(lp_m.id)
+    for lp_m in ln_params_m.values():
         try:
-            lp_s = LineParameters.from_roseau_load_flow(lp_m, strict=on_incompatible != "ignore")
+            lp_s = convert_line_parameters(lp_m, strict=on_incompatible != "ignore")
         except rlf.RoseauLoadFlowException as e:
             if on_incompatible == "raise":
                 raise
             else:
                 _handle_incompatibility(e.msg, on_incompatible=on_incompatible, critical=False)
-            lp_s = LineParameters.from_roseau_load_flow(lp_m, strict=False)
+            lp_s = convert_line_parameters(lp_m, strict=False)
         ln_params_s[lp_s.id] = lp_s
 
-    tr_params_m: set[Id] = set()
-    tr_params_s: dict[Id, TransformerParameters] = {}
-    for tr_m in en_m.transformers.values():
-        tp_m = tr_m.parameters
-        if tp_m.id in tr_params_m:
-            continue
-        tr_params_m.add(tp_m.id)
-        tp_s = TransformerParameters.from_roseau_load_flow(tp_m)
-        tr_params_s[tp_s.id] = tp_s
+    tr_params_m = {tr_m.parameters.id: tr_m.parameters for tr_m in en_m.transformers.values()}
+    tr_params_s: dict[Id, TransformerParameters] = {
+        tp_id: TransformerParameters.from_roseau_load_flow(tp_m) for tp_id, tp_m in tr_params_m.items()
+    }
 
     # Convert lines
     lines: dict[Id, Line] = {}
@@ -273,6 +358,7 @@ def network_from_rlf(  # noqa: C901
 
     # Convert loads
     loads: dict[Id, Load] = {}
+    loads_values = _loads_values(en_m.loads.values())
     for ld_m in en_m.loads.values():
         ph = ld_m.phases
         if "abc" not in ph:
@@ -280,7 +366,8 @@ def network_from_rlf(  # noqa: C901
                 f"Load {ld_m.id!r} is not three-phase, phases={ph!r}", on_incompatible=on_incompatible
             )
         if isinstance(ld_m, rlf.PowerLoad):
-            if np.unique_values(ld_m._powers).size != 1:
+            power, balanced = loads_values[ld_m.id]
+            if not balanced:
                 _handle_incompatibility(f"Load {ld_m.id!r} has unbalanced powers", on_incompatible=on_incompatible)
             if ld_m.flexible_params is None:
                 fp_s = None
@@ -290,19 +377,19 @@ def network_from_rlf(  # noqa: C901
                         f"Load {ld_m.id!r} has unbalanced flexible parameters", on_incompatible=on_incompatible
                     )
                 fp_s = FlexibleParameter.from_roseau_load_flow(ld_m.flexible_params[0], phases=ld_m.voltage_phases[0])
-            ld_s = PowerLoad(id=ld_m.id, bus=buses[ld_m.bus.id], power=ld_m._powers.sum(), flexible_param=fp_s)
+            ld_s = PowerLoad(id=ld_m.id, bus=buses[ld_m.bus.id], power=power, flexible_param=fp_s)
         elif isinstance(ld_m, rlf.CurrentLoad):
-            if np.unique_values(ld_m._currents).size != 1:
+            current, balanced = loads_values[ld_m.id]
+            if not balanced:
                 _handle_incompatibility(f"Load {ld_m.id!r} has unbalanced currents", on_incompatible=on_incompatible)
-            current = np.mean(ld_m._currents).item()
             if "n" not in ph:
                 # Ia = Iab - Ica = (Van-Vbn) / Zab - (Vcn-Van) / Zca, etc. --> Il = Ip * √3
                 current *= rlf.SQRT3
             ld_s = CurrentLoad(id=ld_m.id, bus=buses[ld_m.bus.id], current=current)
         elif isinstance(ld_m, rlf.ImpedanceLoad):
-            if np.unique_values(ld_m._impedances).size != 1:
+            impedance, balanced = loads_values[ld_m.id]
+            if not balanced:
                 _handle_incompatibility(f"Load {ld_m.id!r} has unbalanced impedances", on_incompatible=on_incompatible)
-            impedance = np.mean(ld_m._impedances).item()
             if "n" not in ph:
                 # (Δ-Y) transform: Zan = Zab*Zca/(Zab+Zbc+Zca), etc. --> Zpn = Zpp / 3
                 impedance /= 3
@@ -1,3 +1,4 @@
+import json
 import warnings
 
 import numpy as np
@@ -95,3 +96,47 @@ def test_to_from_dgs_roundtrip():
     en = rlfs.ElectricalNetwork.from_element(bus_mv)
     en2 = rlfs.ElectricalNetwork.from_dgs_dict(en.to_dgs_dict(), use_name_as_id=True)
     assert_json_close(en2.to_dict(), en.to_dict())
+
+
+def test_to_dgs_file(tmp_path):
+    # A network without lines to also write empty tables
+    bus_mv = rlfs.Bus("MV Bus", nominal_voltage=20e3)
+    bus_lv = rlfs.Bus("LV Bus", nominal_voltage=400)
+    tp = rlfs.TransformerParameters.from_catalogue(name="FT 400kVA 15/20kV(20) 400V Dyn11")
+    rlfs.Transformer("Transformer", bus_hv=bus_mv, bus_lv=bus_lv, parameters=tp)
+    rlfs.VoltageSource("Source", bus=bus_mv, voltage=20e3)
+    rlfs.PowerLoad("Load", bus=bus_lv, power=10e3 + 1e3j)
+    en = rlfs.ElectricalNetwork.from_element(bus_mv)
+
+    path = en.to_dgs_file(tmp_path / "network.json")
+    text = path.read_text()
+    data = json.loads(text)
+    assert data == json.loads(json.dumps(en.to_dgs_dict()))
+    assert list(data) == [
+        "General",
+        "IntCase",
+        "IntGrfnet",
+        "ElmNet",
+        "TypLne",
+        "TypTr2",
+        "ElmTerm",
+        "StaCubic",
+        "ElmLne",
+        "ElmCoup",
+        "ElmTr2",
+        "ElmXnet",
+        "ElmLod",
+    ]
+    assert data["ElmLne"]["Values"] == []
+    # One row of values per line
+    assert (
+        '  "General": {\n    "Attributes": ["FID", "Descr", "Val"],\n    "Values": [\n      ["1", "Version", "7.0"]\n    ]\n  },'
+        in text
+    )
+    assert '"ElmLne": {\n    "Attributes": [' in text
+
+    en2 = rlfs.ElectricalNetwork.from_dgs_file(path, use_name_as_id=True)
+    assert en2.buses.keys() == en.buses.keys()
+    assert en2.transformers.keys() == en.transformers.keys()
+    assert en2.loads.keys() == en.loads.keys()
+    assert en2.sources.keys() == en.sources.keys()
@@ -8,7 +8,12 @@ from shapely import LineString, Point
 
 import roseau.load_flow as rlf
 import roseau.load_flow_single as rlfs
-from roseau.load_flow_single.io.rlf import _balance_voltages
+from roseau.load_flow_single.io.rlf import (
+    _balance_voltages,
+    _buses_initial_voltages,
+    _lines_params_sym,
+    _loads_values,
+)
 
 
 def test_from_rlf():  # noqa: C901
@@ -490,3 +495,56 @@ def test_source_voltage():
         _balance_voltages("abn", [1, 1.2] * rlf.PositiveSequence[:2], "abn mag", on_incompatible="raise")
     assert e.value.code == rlf.RoseauLoadFlowExceptionCode.INVALID_FOR_SINGLE_PHASE
     assert e.value.msg == "abn mag"
+
+
+def test_bulk_conversions():
+    # Line parameters: same results as the conversion of each parameters object
+    params_m = [
+        rlf.LineParameters.from_catalogue(name="U_AL_240", nb_phases=3),
+        rlf.LineParameters.from_catalogue(name="U_AL_240", nb_phases=4, id="U_AL_240_4"),
+        rlf.LineParameters.from_catalogue(name="O_CU_54", nb_phases=4),
+        rlf.LineParameters(id="no_shunt", z_line=np.diag([1, 1, 1, 2]).astype(np.complex128)),
+        rlf.LineParameters(id="lp_2ph", z_line=np.eye(2, dtype=np.complex128)),
+    ]
+    sym = _lines_params_sym(params_m)
+    assert list(sym) == ["U_AL_240", "U_AL_240_4", "O_CU_54", "no_shunt"]  # not three-phase parameters are skipped
+    for lp_m in params_m[:-1]:
+        _, expected = lp_m._zy_to_sym(operation="", exc_code=rlf.RoseauLoadFlowExceptionCode.BAD_LINE_MODEL, kron=True)
+        npt.assert_allclose(sym[lp_m.id], expected, rtol=1e-12)
+    assert np.isclose(sym["no_shunt"][0], 1)
+    assert sym["no_shunt"][1] == 0j
+
+    # Loads: the total power and the mean current or impedance
+    bus = rlf.Bus(id="bus", phases="abcn")
+    loads_m = [
+        rlf.PowerLoad(id="p_balanced", bus=bus, powers=[100, 100, 100]),
+        rlf.PowerLoad(id="p_unbalanced", bus=bus, powers=[100, 200, 100]),
+        rlf.PowerLoad(id="p_delta", bus=bus, phases="abc", powers=[50, 50, 50]),
+        rlf.CurrentLoad(id="i_unbalanced", bus=bus, currents=[1, 2, 3]),
+        rlf.ImpedanceLoad(id="z_balanced", bus=bus, impedances=[10j, 10j, 10j]),
+        rlf.PowerLoad(id="p_an", bus=bus, phases="an", powers=[20]),
+    ]
+    assert _loads_values(loads_m) == {
+        "p_balanced": (300, True),
+        "p_unbalanced": (400, False),
+        "p_delta": (150, True),
+        "i_unbalanced": (2, False),
+        "z_balanced": (10j, True),
+        "p_an": (20, True),
+    }
+
+    # Buses: only the initial potentials set by the user are converted
+    potentials = 230 * rlf.PositiveSequence
+    buses_m = [
+        rlf.Bus(id="b1", phases="abcn", initial_potentials=[*potentials, 0]),
+        rlf.Bus(id="b2", phases="abc", initial_potentials=potentials),
+        rlf.Bus(id="b3", phases="abc", initial_potentials=230 * rlf.NegativeSequence),
+        rlf.Bus(id="b4", phases="abcn"),
+    ]
+    initial_voltages = _buses_initial_voltages(buses_m)
+    assert list(initial_voltages) == ["b1", "b2", "b3"]
+    for bus_id in ("b1", "b2"):
+        voltage, balanced = initial_voltages[bus_id]
+        assert np.isclose(voltage, 230 * rlf.SQRT3)
+        assert balanced
+    assert not initial_voltages["b3"][1]
@@ -10,6 +10,7 @@ from roseau.load_flow import SQRT3
 from roseau.load_flow.typing import Id, JsonDict, Side
 from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import warn_external
+from roseau.load_flow.utils.mixins import AbstractElement
 from roseau.load_flow_engine.cy_engine import CyBranch
 from roseau.load_flow_single.models.buses import Bus
 from roseau.load_flow_single.models.connectables import AbstractConnectable
@@ -28,6 +29,8 @@ _Side_co = TypeVar("_Side_co", bound="AbstractBranchSide", default="AbstractBran
 class AbstractBranchSide(AbstractConnectable[_CyB_co]):
     """Accessor class to a branch side."""
 
+    __slots__ = ("_branch",)
+
     def __init__(self, *, branch: "AbstractBranch[AbstractBranchSide, _CyB_co]", side: Side, bus: Bus) -> None:
         """AbstractBranchSide constructor.
 
@@ -54,6 +57,10 @@ class AbstractBranchSide(AbstractConnectable[_CyB_co]):
         # Connections are done in the branch
         pass
 
+    def _create_cy_element(self) -> None:
+        # The Cython element is created by the branch
+        pass
+
     def _refresh_results(self) -> None:
         # Results are stored in the branch
         return self._branch._refresh_results()
@@ -68,6 +75,8 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         :doc:`Switch model documentation </models/Switch>`
     """
 
+    __slots__ = ("_n", "_geometry", "_side1", "_side2")
+
     @abstractmethod
     def __init__(self, id: Id, bus1: Bus, bus2: Bus, n: int, *, geometry: BaseGeometry | None = None) -> None:
         """AbstractBranch constructor.
@@ -87,7 +96,7 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         """
         super().__init__(id)
         self._n = n
-        self.geometry = self._check_geometry(geometry)
+        self.geometry = geometry
         self._side1: _Side_co
         self._side2: _Side_co
 
@@ -95,6 +104,16 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         s1, s2 = self._side1._side_suffix, self._side2._side_suffix
         return f"<{type(self).__name__}: id={self.id!r}, bus{s1}={self.bus1.id!r}, bus{s2}={self.bus2.id!r}>"
 
+    @property
+    def geometry(self) -> BaseGeometry | None:
+        """The geometry of the branch."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: BaseGeometry | None) -> None:
+        self._geometry = self._check_geometry(value)
+        self._invalidate_network_spatial_index()
+
     @property
     def side1(self) -> _Side_co:
         """The first side of the branch."""
@@ -120,6 +139,16 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
         self._side1._network = value
         self._side2._network = value
 
+    def _copy_new(self, memo: dict[int, AbstractElement]) -> Self:
+        self._side1._copy_new(memo)
+        self._side2._copy_new(memo)
+        return super()._copy_new(memo)
+
+    def _copy_to(self, new: Self, memo: dict[int, AbstractElement], include_results: bool) -> None:
+        super()._copy_to(new, memo, include_results)
+        self._side1._copy_to(memo[id(self._side1)], memo, include_results)
+        self._side2._copy_to(memo[id(self._side2)], memo, include_results)
+
     def _cy_connect(self) -> None:
         """Connect the Cython elements of the buses and the branch."""
         self._side1._cy_element = self._cy_element
@@ -141,8 +170,8 @@ class AbstractBranch(Element[_CyB_co], Generic[_Side_co, _CyB_co]):
     def _update_network_parameters(self, old_parameters: _Parameters | None, new_parameters: _Parameters) -> None:
         if old_parameters is not None and old_parameters is not new_parameters:
             old_parameters._elements.discard(self)
-            if not old_parameters._elements and self._network is not None:
-                # This was the only element using the old parameters, remove them from the network
+            if self._network is not None and not any(e._network is self._network for e in old_parameters._elements):
+                # This was the only element of the network using the old parameters, remove them from it
                 self._network._remove_parameters(self.element_type, old_parameters.id)
         if self not in new_parameters._elements:
             new_parameters._elements.add(self)
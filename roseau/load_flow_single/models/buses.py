@@ -23,6 +23,17 @@ logger = logging.getLogger(__name__)
 class Bus(AbstractTerminal["CyBus"]):
     """An electrical bus."""
 
+    __slots__ = (
+        "_geometry",
+        "_initial_voltage",
+        "_nominal_voltage",
+        "_min_voltage_level",
+        "_max_voltage_level",
+        "_short_circuit",
+        "_initialized",
+        "_initialized_by_the_user",
+    )
+
     element_type: Final = "bus"
 
     def __init__(
@@ -70,7 +81,7 @@ class Bus(AbstractTerminal["CyBus"]):
         if initial_voltage is None:
             initial_voltage = 0.0
         self.initial_voltage = initial_voltage
-        self.geometry = self._check_geometry(geometry)
+        self.geometry = geometry
 
         self._nominal_voltage: float | None = None
         self._min_voltage_level: float | None = None
@@ -86,13 +97,21 @@ class Bus(AbstractTerminal["CyBus"]):
 
         self._initialized = initialized
         self._initialized_by_the_user = initialized  # only used for serialization
-        self._cy_element = CyBus(
-            n=self._n, potentials=np.array([self._initial_voltage / SQRT3, 0], dtype=np.complex128)
-        )
+        self._create_cy_element()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id!r})"
 
+    @property
+    def geometry(self) -> BaseGeometry | None:
+        """The geometry of the bus."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: BaseGeometry | None) -> None:
+        self._geometry = self._check_geometry(value)
+        self._invalidate_network_spatial_index()
+
     @property
     def initial_voltage(self) -> Q_[complex]:
         """Initial voltage of the bus (V)."""
@@ -108,6 +127,16 @@ class Bus(AbstractTerminal["CyBus"]):
         if self._cy_initialized:
             self._cy_element.initialize_potentials(np.array([self._initial_voltage / SQRT3, 0], dtype=np.complex128))
 
+    def _warm_start(self) -> None:
+        """Initialize the voltage of the bus with the results of the last load flow.
+
+        Unlike the ``initial_voltage`` setter, the voltage is not serialized.
+        """
+        self._initial_voltage = self._res_voltage_getter(warning=False)
+        self._initialized = True
+        if self._cy_initialized:
+            self._cy_element.initialize_potentials(np.array([self._initial_voltage / SQRT3, 0], dtype=np.complex128))
+
     @property
     def nominal_voltage(self) -> Q_[float] | None:
         """The phase-to-phase nominal voltage of the bus (V) if it is set."""
@@ -231,6 +260,13 @@ class Bus(AbstractTerminal["CyBus"]):
         if self.network is not None:
             self.network._valid = False
 
+    def _create_cy_element(self) -> None:
+        self._cy_element = CyBus(
+            n=self._n, potentials=np.array([self._initial_voltage / SQRT3, 0], dtype=np.complex128)
+        )
+        if self._short_circuit:
+            self._cy_element.connect_ports(np.array([0, 1], dtype=np.int32))
+
     def propagate_limits(self, force: bool = False) -> None:
         """Propagate the voltage limits to galvanically connected buses.
 
@@ -346,16 +382,16 @@ class Bus(AbstractTerminal["CyBus"]):
 
     def _res_agg_power_getter(self, warning: bool) -> complex:
         """Get the aggregated proper power of the bus (VA)."""
+        _ = self._res_voltage_getter(warning=warning)  # check the results of the bus
+        elements = [e for e in self._connected_elements if e.element_type in {"load", "source"}]
+        return self._res_memo("agg_power", lambda: self._compute_agg_power(elements), *elements)
+
+    @staticmethod
+    def _compute_agg_power(elements: list[Element]) -> complex:
         power = 0j
-        for e in self._connected_elements:
-            if e.element_type == "load":
-                sign = 1
-            elif e.element_type == "source":
-                sign = -1
-            else:
-                continue
-            power += sign * e._res_power_getter(warning=warning)  # type: ignore
-            warning = False  # warn only once
+        for e in elements:
+            sign = 1 if e.element_type == "load" else -1
+            power += sign * e._res_power_getter(warning=False)  # type: ignore
         return power
 
     def _res_state_getter(self) -> ResultState:
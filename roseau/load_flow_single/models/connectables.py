@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
     """A base class for elements connected to a bus."""
 
+    __slots__ = ("_bus", "_res_current")
+
     @abstractmethod
     def __init__(self, id: Id, bus: Bus, *, n: int, side: Side | None = None) -> None:
         """AbstractConnectable constructor.
@@ -123,6 +125,8 @@ class AbstractConnectable(AbstractTerminal[_CyE_co], ABC):
 class AbstractDisconnectable(AbstractConnectable[_CyE_co], ABC):
     """A base class for disconnectable elements in the network (loads, sources, etc.)."""
 
+    __slots__ = ()
+
     type: ClassVar[str]
 
     def __repr__(self) -> str:
@@ -11,5 +11,7 @@ logger = logging.getLogger(__name__)
 
 
 class Element(AbstractElement["ElectricalNetwork", _CyE_co]):
+    __slots__ = ()
+
     is_multi_phase: Final = False
-    _connected_elements: list["Element"]
+    _connected_elements: dict["Element", None]
@@ -2,6 +2,8 @@ import cmath
 import logging
 import math
 import re
+import weakref
+from collections.abc import Sequence
 from enum import StrEnum
 from pathlib import Path
 from typing import Final, Literal, NoReturn, Self
@@ -12,7 +14,7 @@ import pandas as pd
 from roseau.load_flow import Insulator, LineType, Material, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow import LineParameters as MultiLineParameters
 from roseau.load_flow.constants import F
-from roseau.load_flow.typing import Complex, Float, Id, JsonDict
+from roseau.load_flow.typing import Complex, Float, FloatScalarOrArrayLike1D, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow.utils import CatalogueMixin, Identifiable, JsonMixin
 
@@ -96,7 +98,8 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
         self.insulator = insulator
         self.section = section
 
-        self._elements = set()  # Set of elements using this line parameters object
+        # Set of elements using this line parameters object, they may belong to several networks
+        self._elements: weakref.WeakSet = weakref.WeakSet()
 
     def __repr__(self) -> str:
         s = f"<{type(self).__name__}: id={self.id!r}"
@@ -263,6 +266,52 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
         )
         return cls.from_roseau_load_flow(lp_m)
 
+    @classmethod
+    @ureg_wraps(None, (None, None, None, None, None, None, None, "mm**2", "mm**2", "m", "m", "A"))
+    def from_geometry_many(
+        cls,
+        ids: Sequence[Id],
+        *,
+        line_types: LineType | str | Sequence[LineType | str],
+        materials: Material | str | Sequence[Material | str | None] | None = None,
+        materials_neutral: Material | str | Sequence[Material | str | None] | None = None,
+        insulators: Insulator | str | Sequence[Insulator | str | None] | None = None,
+        insulators_neutral: Insulator | str | Sequence[Insulator | str | None] | None = None,
+        sections: FloatScalarOrArrayLike1D,
+        sections_neutral: FloatScalarOrArrayLike1D | None = None,
+        heights: FloatScalarOrArrayLike1D,
+        external_diameters: FloatScalarOrArrayLike1D,
+        ampacities: FloatScalarOrArrayLike1D | None = None,
+    ) -> list[Self]:
+        """Create several line parameters from their geometries.
+
+        This is equivalent to calling :meth:`from_geometry` for each line parameters but the
+        impedance and admittance matrices of all the line parameters are computed at once. Each
+        argument, other than ``ids``, is either a single value used for all the line parameters or a
+        sequence of values with the same length as ``ids``. See :meth:`from_geometry` for the
+        description of the arguments.
+
+        Returns:
+            The created line parameters, in the order of ``ids``.
+
+        See Also:
+            :meth:`rlf.LineParameters.from_geometry_many() <roseau.load_flow.LineParameters.from_geometry_many>`
+        """
+        lps_m = MultiLineParameters.from_geometry_many(
+            ids,
+            line_types=line_types,
+            materials=materials,
+            materials_neutral=materials_neutral,
+            insulators=insulators,
+            insulators_neutral=insulators_neutral,
+            sections=sections,
+            sections_neutral=sections_neutral,
+            heights=heights,
+            external_diameters=external_diameters,
+            ampacities=ampacities,
+        )
+        return [cls.from_roseau_load_flow(lp_m) for lp_m in lps_m]
+
     @classmethod
     def from_coiffier_model(cls, name: str, id: Id | None = None) -> Self:
         """Get the electrical parameters of a MV line using Alain Coiffier's method (France specific model).
@@ -306,6 +355,14 @@ class LineParameters(Identifiable, JsonMixin, CatalogueMixin[pd.DataFrame]):
             exc_code=RoseauLoadFlowExceptionCode.INVALID_FOR_SINGLE_PHASE,
             kron=True,
         )
+        return cls._from_roseau_load_flow_sym(lp_m, z1=z1, y1=y1, strict=strict)
+
+    @classmethod
+    def _from_roseau_load_flow_sym(
+        cls, lp_m: MultiLineParameters, /, *, z1: complex, y1: complex, strict: bool
+    ) -> Self:
+        """Create an instance from a multi-phase `rlf.LineParameters` object and its positive-sequence
+        impedance and admittance (computed after Kron's reduction of the neutral)."""
         if y1.real < 0:  # might produce a value with a small negative real part
             y1 = 1j * y1.imag
 
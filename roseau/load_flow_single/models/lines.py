@@ -1,12 +1,14 @@
 import logging
-from typing import Final, final
+from collections.abc import Sequence
+from typing import Final, Self, final
 
 import numpy as np
 from shapely.geometry.base import BaseGeometry
 
 from roseau.load_flow import SQRT3, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
-from roseau.load_flow.typing import Float, Id, JsonDict, ResultState
+from roseau.load_flow.typing import Float, FloatArrayLike1D, Id, JsonDict, ResultState
 from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.utils.helpers import _check_line_arrays
 from roseau.load_flow_engine.cy_engine import CyShuntLine, CySimplifiedLine
 from roseau.load_flow_single.models.branches import AbstractBranch, AbstractBranchSide
 from roseau.load_flow_single.models.buses import Bus
@@ -20,6 +22,17 @@ logger = logging.getLogger(__name__)
 class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
     """An electrical line PI model with series impedance and optional shunt admittance."""
 
+    __slots__ = (
+        "_initialized",
+        "_with_shunt",
+        "_length",
+        "_parameters",
+        "_max_loading",
+        "_z_line",
+        "_y_shunt",
+        "_z_line_inv",
+    )
+
     element_type: Final = "line"
 
     def __init__(
@@ -62,31 +75,33 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
                 The geometry of the line i.e. the linestring.
         """
         self._initialized = False
-        self._with_shunt = parameters.with_shunt
-        super().__init__(id=id, bus1=bus1, bus2=bus2, n=1, geometry=geometry)
-        self._side1 = LineSide(branch=self, side=1, bus=bus1)
-        self._side2 = LineSide(branch=self, side=2, bus=bus2)
+        self._init_sides(id, bus1, bus2, parameters=parameters, geometry=geometry)
         self.length = length
         self.parameters = parameters
         self.max_loading = max_loading
         self._initialized = True
+        self._init_model()
+
+    def _init_sides(
+        self, id: Id, bus1: Bus, bus2: Bus, *, parameters: LineParameters, geometry: BaseGeometry | None
+    ) -> None:
+        """Initialize the branch and its sides."""
+        self._with_shunt = parameters.with_shunt
+        super().__init__(id=id, bus1=bus1, bus2=bus2, n=1, geometry=geometry)
+        self._side1 = LineSide(branch=self, side=1, bus=bus1)
+        self._side2 = LineSide(branch=self, side=2, bus=bus2)
+
+    def _init_model(self) -> None:
+        """Finish the initialization of the line once its length and parameters are set."""
         self._check_same_voltage_level()
 
         # Cache values used in results calculations
-        self._z_line = parameters._z_line * self._length
-        self._y_shunt = parameters._y_shunt * self._length
+        self._z_line = self._parameters._z_line * self._length
+        self._y_shunt = self._parameters._y_shunt * self._length
         self._z_line_inv = 1.0 / self._z_line
 
-        if parameters.with_shunt:
-            self._cy_element = CyShuntLine(
-                n=1,
-                y_shunt=np.array([self._y_shunt], dtype=np.complex128),
-                z_line=np.array([self._z_line], dtype=np.complex128),
-            )
-        else:
-            self._cy_element = CySimplifiedLine(n=1, z_line=np.array([self._z_line], dtype=np.complex128))
-        self._cy_connect()
-        self._connect(bus1, bus2)
+        self._create_cy_element()
+        self._connect(self.bus1, self.bus2)
 
     def _update_internal_parameters(self) -> None:
         """Update the internal parameters of the line."""
@@ -101,6 +116,84 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
                 assert isinstance(self._cy_element, CySimplifiedLine)
                 self._cy_element.update_single_line_parameters(z_line=self._z_line)
 
+    def _create_cy_element(self) -> None:
+        if self._parameters.with_shunt:
+            self._cy_element = CyShuntLine(
+                n=1,
+                y_shunt=np.array([self._y_shunt], dtype=np.complex128),
+                z_line=np.array([self._z_line], dtype=np.complex128),
+            )
+        else:
+            self._cy_element = CySimplifiedLine(n=1, z_line=np.array([self._z_line], dtype=np.complex128))
+        self._cy_connect()
+
+    @classmethod
+    @ureg_wraps(None, (None, None, None, None, None, "km", "", None))
+    def from_arrays(
+        cls,
+        ids: Sequence[Id],
+        buses1: Sequence[Bus],
+        buses2: Sequence[Bus],
+        *,
+        parameters: LineParameters,
+        lengths: FloatArrayLike1D,
+        max_loading: Float | Q_[Float] = 1.0,
+        geometries: Sequence[BaseGeometry | None] | None = None,
+    ) -> list[Self]:
+        """Create many lines sharing the same parameters.
+
+        All the arguments are checked before any line is created: the lengths and the maximum
+        loading are converted and checked at once and the parameters are checked once.
+
+        Args:
+            ids:
+                The unique IDs of the lines.
+
+            buses1:
+                The first bus of each line.
+
+            buses2:
+                The second bus of each line.
+
+            parameters:
+                The parameters of the lines.
+
+            lengths:
+                The lengths of the lines (in km).
+
+            max_loading:
+                The maximum loading of the lines (unitless).
+
+            geometries:
+                The geometries of the lines. By default, the lines have no geometry.
+
+        Returns:
+            The created lines, in the order of the IDs.
+        """
+        lengths_list, max_loading, geometries = _check_line_arrays(
+            ids, buses1, buses2, lengths=lengths, max_loading=max_loading, geometries=geometries
+        )
+        # Check the buses of all the lines and the parameters once before creating any line
+        lines = [cls.__new__(cls) for _ in range(len(ids))]
+        for line, line_id, bus1, bus2 in zip(lines, ids, buses1, buses2, strict=True):
+            line._check_compatible_phase_tech(bus1, id=line_id)
+            line._check_compatible_phase_tech(bus2, id=line_id)
+        if lines:
+            lines[0]._check_compatible_phase_tech(parameters, id=ids[0])
+
+        for line, line_id, bus1, bus2, length, geometry in zip(
+            lines, ids, buses1, buses2, lengths_list, geometries, strict=True
+        ):
+            line._initialized = False
+            line._init_sides(line_id, bus1, bus2, parameters=parameters, geometry=geometry)
+            line._length = length
+            line._update_network_parameters(old_parameters=None, new_parameters=parameters)
+            line._parameters = parameters
+            line._max_loading = max_loading
+            line._initialized = True
+            line._init_model()
+        return lines
+
     @property
     def length(self) -> Q_[float]:
         """The length of the line (in km)."""
@@ -114,6 +207,7 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE)
         self._invalidate_network_results()
+        self._invalidate_network_topology()
         self._length = float(value)
         if self._initialized:
             self._update_internal_parameters()
@@ -313,6 +407,8 @@ class Line(AbstractBranch["LineSide", "CyShuntLine | CySimplifiedLine"]):
 
 @final
 class LineSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "line"
     _branch: Line
 
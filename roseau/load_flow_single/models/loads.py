@@ -22,6 +22,8 @@ _CyL_co = TypeVar("_CyL_co", bound=CyLoad, default=CyLoad, covariant=True)
 class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
     """An abstract class of an electric load."""
 
+    __slots__ = ()
+
     element_type: Final = "load"
 
     @abstractmethod
@@ -86,6 +88,8 @@ class AbstractLoad(AbstractDisconnectable[_CyL_co], ABC):
 class PowerLoad(AbstractLoad["CyPowerLoad | CyFlexibleLoad"]):
     """A constant power load."""
 
+    __slots__ = ("_flexible_param", "_power")
+
     type: Final = "power"
 
     def __init__(
@@ -120,12 +124,14 @@ class PowerLoad(AbstractLoad["CyPowerLoad | CyFlexibleLoad"]):
 
         self._flexible_param = flexible_param
         self.power = power
+        self._create_cy_element()
 
+    def _create_cy_element(self) -> None:
         if self.is_flexible:
             self._cy_element = CyFlexibleLoad(
                 n=self._n,
                 powers=np.array([self._power / 3.0], dtype=np.complex128),
-                parameters=np.array([flexible_param._cy_fp]),
+                parameters=np.array([self._flexible_param._cy_fp]),  # type: ignore
             )
         else:
             self._cy_element = CyPowerLoad(n=self._n, powers=np.array([self._power / 3.0], dtype=np.complex128))
@@ -194,6 +200,8 @@ class PowerLoad(AbstractLoad["CyPowerLoad | CyFlexibleLoad"]):
 class CurrentLoad(AbstractLoad["CyCurrentLoad"]):
     """A constant current load."""
 
+    __slots__ = ("_current",)
+
     type: Final = "current"
 
     def __init__(self, id: Id, bus: Bus, *, current: Complex | Q_[Complex]) -> None:
@@ -221,6 +229,9 @@ class CurrentLoad(AbstractLoad["CyCurrentLoad"]):
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_SHORT_CIRCUIT)
 
         self.current = current
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         self._cy_element = CyCurrentLoad(n=self._n, currents=np.array([self._current], dtype=np.complex128))
         self._cy_connect()
 
@@ -246,6 +257,8 @@ class CurrentLoad(AbstractLoad["CyCurrentLoad"]):
 class ImpedanceLoad(AbstractLoad["CyAdmittanceLoad"]):
     """A constant impedance load."""
 
+    __slots__ = ("_impedance",)
+
     type: Final = "impedance"
 
     def __init__(self, id: Id, bus: Bus, *, impedance: Complex | Q_[Complex]) -> None:
@@ -264,6 +277,9 @@ class ImpedanceLoad(AbstractLoad["CyAdmittanceLoad"]):
         """
         super().__init__(id=id, bus=bus)
         self.impedance = impedance
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         self._cy_element = CyAdmittanceLoad(
             n=self._n, admittances=np.array([1.0 / self._impedance], dtype=np.complex128)
         )
@@ -1,4 +1,5 @@
 import logging
+import weakref
 from typing import TYPE_CHECKING, Final, NoReturn, Self
 
 import numpy as np
@@ -81,7 +82,7 @@ class RegulatorParameters(Identifiable, JsonMixin):
         self._ym = complex(ym)
         self._u_range = float(u_range)
         self._alpha = float(alpha)
-        self._elements: set = set()
+        self._elements: weakref.WeakSet = weakref.WeakSet()
 
     def __repr__(self) -> str:
         return (
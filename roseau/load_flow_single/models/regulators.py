@@ -22,6 +22,8 @@ class VoltageRegulator(AbstractBranch["RegulatorSide", "CySingleVoltageRegulator
     The model parameters are defined using the ``parameters`` argument.
     """
 
+    __slots__ = ("_initialized", "_res_tap", "_parameters", "_u_ref", "_max_loading")
+
     element_type: Final = "regulator"
 
     def __init__(
@@ -72,10 +74,13 @@ class VoltageRegulator(AbstractBranch["RegulatorSide", "CySingleVoltageRegulator
         self.max_loading = max_loading
         self._initialized = True
 
-        self._cy_element = parameters._create_cy_element(u_ref=self._u_ref)
-        self._cy_connect()
+        self._create_cy_element()
         self._connect(bus1, bus2)
 
+    def _create_cy_element(self) -> None:
+        self._cy_element = self._parameters._create_cy_element(u_ref=self._u_ref)
+        self._cy_connect()
+
     def _update_parameters(self) -> None:
         """Update the C++ model parameters after a change in u_ref, z2, or ym."""
         if self._cy_initialized:
@@ -251,5 +256,7 @@ class VoltageRegulator(AbstractBranch["RegulatorSide", "CySingleVoltageRegulator
 
 @final
 class RegulatorSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "regulator"
     _branch: VoltageRegulator
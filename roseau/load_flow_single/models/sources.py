@@ -22,6 +22,8 @@ class VoltageSource(AbstractDisconnectable["CyVoltageSource"]):
         The :ref:`Voltage source documentation page <models-voltage-source-usage>` for example usage.
     """
 
+    __slots__ = ("_voltage",)
+
     element_type: Final = "source"
     type: Final = "voltage"
 
@@ -40,6 +42,9 @@ class VoltageSource(AbstractDisconnectable["CyVoltageSource"]):
         """
         super().__init__(id, bus=bus, n=2)
         self.voltage = voltage
+        self._create_cy_element()
+
+    def _create_cy_element(self) -> None:
         self._cy_element = CyVoltageSource(n=self._n, voltages=np.array([self._voltage / SQRT3], dtype=np.complex128))
         self._cy_connect()
 
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class AbstractTerminal(Element[_CyE_co], ABC):
     """A base class for all the terminals (buses, load, sources, etc.) of the network."""
 
+    __slots__ = ("_n", "_side_value", "_side_index", "_side_suffix", "_side_desc", "_res_voltage")
+
     @abstractmethod
     def __init__(self, id: Id, *, n: int, side: Side | None = None) -> None:
         """AbstractTerminal constructor.
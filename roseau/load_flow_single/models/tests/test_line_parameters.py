@@ -164,6 +164,33 @@ def test_from_geometry():
     assert np.isclose(lp.section.m, 150)
 
 
+def test_from_geometry_many():
+    lps = LineParameters.from_geometry_many(
+        ["lp1", "lp2"],
+        line_types=["U", "T"],
+        materials=["AL", None],
+        sections=Q_([150, 70], "mm²"),
+        sections_neutral=[70, None],
+        heights=[-1.5, 10],
+        external_diameters=Q_(49, "mm"),
+        ampacities=[300, None],
+    )
+    expected = [
+        LineParameters.from_geometry(
+            "lp1",
+            line_type="U",
+            material="AL",
+            section=150,
+            section_neutral=70,
+            height=-1.5,
+            external_diameter=0.049,
+            ampacity=300,
+        ),
+        LineParameters.from_geometry("lp2", line_type="T", section=70, height=10, external_diameter=0.049),
+    ]
+    assert [lp.to_dict() for lp in lps] == [lp.to_dict() for lp in expected]
+
+
 def test_sym():
     # There is no rlfs.LineParameters.from_sym method because it is redundant with calling the
     # constructor directly with z1 and y1. This is for two reasons:
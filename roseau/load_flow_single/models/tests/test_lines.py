@@ -97,6 +97,38 @@ def test_line_parameters_shortcut():
     assert np.allclose(line.y_shunt.m_as("S"), 0.05 * y_shunt)
 
 
+def test_from_arrays():
+    buses = [Bus(id=f"bus{i}") for i in range(4)]
+    lp = LineParameters(id="lp", z_line=1.0 + 0.5j)
+    lines = Line.from_arrays(
+        ["line1", "line2", "line3"], buses[:-1], buses[1:], parameters=lp, lengths=Q_([100, 200, 50], "m")
+    )
+    assert [line.id for line in lines] == ["line1", "line2", "line3"]
+    assert [line.bus2.id for line in lines] == ["bus1", "bus2", "bus3"]
+    assert [line._length for line in lines] == pytest.approx([0.1, 0.2, 0.05])
+    assert [line._z_line for line in lines] == pytest.approx([0.1 + 0.05j, 0.2 + 0.1j, 0.05 + 0.025j])
+    assert all(line.parameters is lp and line.geometry is None for line in lines)
+
+    # Bad lengths
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line4", "line5"], buses[:2], buses[2:], parameters=lp, lengths=[1, 0])
+    assert e.value.msg == "A line length must be greater than 0. 0.00 km provided."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line4", "line5"], buses[:2], buses[2:], parameters=lp, lengths=1)
+    assert e.value.msg == "Expected 2 line lengths, got an array of shape ()."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINES_SIZE
+
+    # Mismatching buses
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Line.from_arrays(["line4", "line5"], buses[:2], buses[3:], parameters=lp, lengths=[1, 2])
+    assert e.value.msg == "Expected 2 second buses for 2 lines, got 1."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LINES_SIZE
+
+    # No line was created by the failed calls
+    assert {e.id for b in buses for e in b._connected_elements} == {"line1", "line2", "line3"}
+
+
 def test_max_loading():
     bus1 = Bus(id="bus1")
     bus2 = Bus(id="bus2")
@@ -61,6 +61,23 @@ def test_switch_loop():
     sw8.close()  # OK
 
 
+def test_switch_loop_long_chain():
+    buses = [Bus(id=i) for i in range(500)]
+    switches = [Switch(id=i, bus1=buses[i], bus2=buses[i + 1]) for i in range(499)]
+
+    # A loop closed by the last switch of a long chain is detected
+    with pytest.raises(RoseauLoadFlowException) as e:
+        Switch(id="loop", bus1=buses[-1], bus2=buses[0])
+    assert e.value.msg.startswith(
+        "Connecting switch 'loop' between buses 499 and 0 creates a loop with switches [0, 1, "
+    )
+    assert e.value.code == RoseauLoadFlowExceptionCode.SWITCHES_LOOP
+
+    # No loop when a switch of the chain is open
+    switches[250].open()
+    Switch(id="loop", bus1=buses[-1], bus2=buses[0])
+
+
 def test_switch_connection():
     bus1 = Bus(id="bus1")
     bus2 = Bus(id="bus2")
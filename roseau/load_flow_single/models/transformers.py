@@ -23,6 +23,8 @@ class Transformer(AbstractBranch["TransformerSide", "CySingleTransformer"]):
     The model parameters are defined using the ``parameters`` argument.
     """
 
+    __slots__ = ("_initialized", "_tap", "_parameters", "_max_loading")
+
     element_type: Final = "transformer"
 
     @deprecate_renamed_parameters({"bus1": "bus_hv", "bus2": "bus_lv"}, version="0.12.0", category=DeprecationWarning)
@@ -74,12 +76,7 @@ class Transformer(AbstractBranch["TransformerSide", "CySingleTransformer"]):
         self.parameters = parameters
         self.max_loading = max_loading
         self._initialized = True
-
-        # Equivalent direct-system (positive-sequence) parameters
-        z2, ym, k = parameters.z2d, parameters.ymd, parameters.kd
-
-        self._cy_element = CySingleTransformer(z2=z2, ym=ym, k=k * self._tap)
-        self._cy_connect()
+        self._create_cy_element()
         self._connect(bus_hv, bus_lv)
 
     @property
@@ -154,6 +151,12 @@ class Transformer(AbstractBranch["TransformerSide", "CySingleTransformer"]):
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_MAX_LOADING_VALUE)
         self._max_loading = float(value)
 
+    def _create_cy_element(self) -> None:
+        # Equivalent direct-system (positive-sequence) parameters
+        z2, ym, k = self._parameters.z2d, self._parameters.ymd, self._parameters.kd
+        self._cy_element = CySingleTransformer(z2=z2, ym=ym, k=k * self._tap)
+        self._cy_connect()
+
     @property
     def sn(self) -> Q_[float]:
         """The nominal power of the transformer (VA)."""
@@ -227,5 +230,7 @@ class Transformer(AbstractBranch["TransformerSide", "CySingleTransformer"]):
 
 @final
 class TransformerSide(AbstractBranchSide):
+    __slots__ = ()
+
     element_type = "transformer"
     _branch: Transformer
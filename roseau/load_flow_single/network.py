@@ -2,7 +2,7 @@
 This module defines the electrical network class.
 """
 
-import json
+import cmath
 import logging
 import re
 from collections.abc import Iterable, Mapping
@@ -11,22 +11,42 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, Self, final
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
-from roseau.load_flow import SQRT3, RoseauLoadFlowExceptionCode
+from roseau.load_flow import SQRT3, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow import ElectricalNetwork as MultiElectricalNetwork
-from roseau.load_flow.typing import CRSLike, Id, JsonDict, MapOrSeq, StrPath
-from roseau.load_flow.utils import DTYPES, AbstractNetwork, LoadTypeDtype, count_repr, geom_mapping, optional_deps
+from roseau.load_flow.io.dgs.utils import write_dgs_tables
+from roseau.load_flow.typing import CRSLike, Id, JsonDict, MapOrSeq, ReductionModel, StrPath
+from roseau.load_flow.utils import (
+    DTYPES,
+    AbstractNetwork,
+    LoadTypeDtype,
+    count_repr,
+    optional_deps,
+)
+from roseau.load_flow.utils.catalogue import get_catalogue_network
+from roseau.load_flow.utils.helpers import _graph_geometries
+from roseau.load_flow.utils.mixins import _ResLimits
 from roseau.load_flow_engine.cy_engine import CyGround, CyPotentialRef
 from roseau.load_flow_single.io import network_from_dgs, network_from_dict, network_to_dgs, network_to_dict
+from roseau.load_flow_single.io.dgs import iter_network_dgs
+from roseau.load_flow_single.io.frames import network_from_frames
 from roseau.load_flow_single.io.rlf import OnIncompatibleType, network_from_rlf
 from roseau.load_flow_single.models import (
+    AbstractConnectable,
     Bus,
+    CurrentLoad,
     Element,
+    ImpedanceLoad,
     Line,
+    LineParameters,
     Load,
+    PowerLoad,
+    RegulatorParameters,
     Switch,
     Transformer,
+    TransformerParameters,
     VoltageRegulator,
     VoltageSource,
 )
@@ -153,8 +173,9 @@ class ElectricalNetwork(AbstractNetwork[Element]):
         self._ground = CyGround()
         self._potential_ref = CyPotentialRef()
         self._ground.connect(self._potential_ref, [(0, 0)])
+        # Connect from the ground, connecting each bus to the ground would take quadratic time
         for bus in self.buses.values():
-            bus._cy_element.connect(self._ground, [(1, 0)])
+            self._ground.connect(bus._cy_element, [(0, 1)])
         for line in self.lines.values():
             if line.with_shunt:
                 self._ground.connect(line._cy_element, [(0, 2)])
@@ -259,34 +280,46 @@ class ElectricalNetwork(AbstractNetwork[Element]):
 
     @property
     def loads_frame(self) -> pd.DataFrame:
-        """The :attr:`loads` of the network as a dataframe."""
+        """The :attr:`loads` of the network as a dataframe.
+
+        The ``power`` (VA), ``current`` (A) and ``impedance`` (Ohm) columns hold the complex values
+        of the loads of the matching type and NaN for the other loads.
+        """
         index = []
-        data = {"type": [], "bus_id": [], "flexible": []}
+        data = {"type": [], "bus_id": [], "flexible": [], "power": [], "current": [], "impedance": []}
         for load in self.loads.values():
             index.append(load.id)
             data["type"].append(load.type)
             data["bus_id"].append(load.bus.id)
             data["flexible"].append(load.is_flexible)
+            data["power"].append(load._power if load.type == "power" else nan)
+            data["current"].append(load._current if load.type == "current" else nan)
+            data["impedance"].append(load._impedance if load.type == "impedance" else nan)
         return pd.DataFrame(data=data, index=pd.Index(index, name="id"))
 
     @property
     def sources_frame(self) -> pd.DataFrame:
-        """The :attr:`sources` of the network as a dataframe."""
+        """The :attr:`sources` of the network as a dataframe.
+
+        The ``voltage`` column holds the complex voltages (V) of the sources.
+        """
         index = []
-        data = {"bus_id": []}
+        data = {"bus_id": [], "voltage": []}
         for source in self.sources.values():
             index.append(source.id)
             data["bus_id"].append(source.bus.id)
+            data["voltage"].append(source._voltage)
         return pd.DataFrame(data=data, index=pd.Index(index, name="id"))
 
     #
     # Helpers to analyze the network
     #
-    def to_graph(self, *, respect_switches: bool = True) -> "MultiGraph":
+    def to_graph(self, *, respect_switches: bool = True, geometry: bool = False) -> "MultiGraph":
         """Create a networkx multi-graph from this electrical network.
 
-        The graph contains the geometries of the buses in the nodes data and the geometries and
-        branch types in the edges data.
+        The graph contains the data of the buses in the nodes data and the data and branch types
+        of the branches in the edges data. The geometries of the elements are added to the data
+        (``geom`` key) only when ``geometry`` is True.
 
         Note:
             This method requires *networkx* to be installed. You can install it with the ``"graph"``
@@ -297,66 +330,91 @@ class ElectricalNetwork(AbstractNetwork[Element]):
                 Respect the switch state. If ``True`` (default), open switches are not included in
                 the graph. If ``False``, all switches are included regardless of their state.
 
+            geometry:
+                If ``True``, the GeoJSON-like mappings of the geometries of the buses and branches
+                are added to the nodes and edges data under the ``geom`` key. Defaults to ``False``
+                as converting the geometries takes most of the time of the conversion of large
+                networks.
+
         Returns:
             A networkx multi-graph representing the electrical network.
         """
         nx = optional_deps.networkx
         graph = nx.MultiGraph(name=self.name)
-        for bus in self.buses.values():
-            graph.add_node(
+        buses = list(self.buses.values())
+        graph.add_nodes_from(
+            (
                 bus.id,
-                nominal_voltage=bus._nominal_voltage,
-                min_voltage_level=bus._min_voltage_level,
-                max_voltage_level=bus._max_voltage_level,
-                geom=geom_mapping(bus.geometry),
+                {
+                    "nominal_voltage": bus._nominal_voltage,
+                    "min_voltage_level": bus._min_voltage_level,
+                    "max_voltage_level": bus._max_voltage_level,
+                    **geom,
+                },
             )
-        for line in self.lines.values():
-            graph.add_edge(
+            for bus, geom in zip(buses, _graph_geometries(buses, geometry), strict=True)
+        )
+        lines = list(self.lines.values())
+        graph.add_edges_from(
+            (
                 line.bus1.id,
                 line.bus2.id,
-                id=line.id,
-                type="line",
-                parameters_id=line.parameters.id,
-                length=line._length,
-                max_loading=line._max_loading,
-                ampacity=line.parameters._ampacity,
-                geom=geom_mapping(line.geometry),
+                {
+                    "id": line.id,
+                    "type": "line",
+                    "parameters_id": line.parameters.id,
+                    "length": line._length,
+                    "max_loading": line._max_loading,
+                    "ampacity": line.parameters._ampacity,
+                    **geom,
+                },
             )
-        for transformer in self.transformers.values():
-            graph.add_edge(
+            for line, geom in zip(lines, _graph_geometries(lines, geometry), strict=True)
+        )
+        transformers = list(self.transformers.values())
+        graph.add_edges_from(
+            (
                 transformer.bus1.id,
                 transformer.bus2.id,
-                id=transformer.id,
-                type="transformer",
-                parameters_id=transformer.parameters.id,
-                max_loading=transformer._max_loading,
-                sn=transformer.parameters._sn,
-                tap=transformer._tap,
-                geom=geom_mapping(transformer.geometry),
+                {
+                    "id": transformer.id,
+                    "type": "transformer",
+                    "parameters_id": transformer.parameters.id,
+                    "max_loading": transformer._max_loading,
+                    "sn": transformer.parameters._sn,
+                    "tap": transformer._tap,
+                    **geom,
+                },
             )
-        for regulator in self.regulators.values():
-            graph.add_edge(
+            for transformer, geom in zip(transformers, _graph_geometries(transformers, geometry), strict=True)
+        )
+        regulators = list(self.regulators.values())
+        graph.add_edges_from(
+            (
                 regulator.bus1.id,
                 regulator.bus2.id,
-                id=regulator.id,
-                type="regulator",
-                parameters_id=regulator.parameters.id,
-                sn=regulator.parameters._sn,
-                u_ref=regulator._u_ref,
-                max_loading=regulator._max_loading,
-                u_range=regulator.parameters._u_range,
-                geom=geom_mapping(regulator.geometry),
+                {
+                    "id": regulator.id,
+                    "type": "regulator",
+                    "parameters_id": regulator.parameters.id,
+                    "sn": regulator.parameters._sn,
+                    "u_ref": regulator._u_ref,
+                    "max_loading": regulator._max_loading,
+                    "u_range": regulator.parameters._u_range,
+                    **geom,
+                },
             )
-        for switch in self.switches.values():
-            if not respect_switches or switch.closed:
-                graph.add_edge(
-                    switch.bus1.id,
-                    switch.bus2.id,
-                    id=switch.id,
-                    type="switch",
-                    closed=switch.closed,
-                    geom=geom_mapping(switch.geometry),
-                )
+            for regulator, geom in zip(regulators, _graph_geometries(regulators, geometry), strict=True)
+        )
+        switches = [switch for switch in self.switches.values() if not respect_switches or switch.closed]
+        graph.add_edges_from(
+            (
+                switch.bus1.id,
+                switch.bus2.id,
+                {"id": switch.id, "type": "switch", "closed": switch.closed, **geom},
+            )
+            for switch, geom in zip(switches, _graph_geometries(switches, geometry), strict=True)
+        )
         return graph
 
     #
@@ -723,13 +781,58 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     #
     def _add_ground_connections(self, element: Element) -> None:
         if isinstance(element, Bus):
-            element._cy_element.connect(self._ground, [(1, 0)])
+            self._ground.connect(element._cy_element, [(0, 1)])
         elif isinstance(element, Line) and element.with_shunt:
-            element._cy_element.connect(self._ground, [(2, 0)])
+            self._ground.connect(element._cy_element, [(0, 2)])
 
     def _get_has_floating_neutral(self) -> bool:
         return False  # single-phase networks do not support floating neutral
 
+    def _get_res_limits(self) -> dict[str, _ResLimits]:
+        buses = [bus for bus in self.buses.values() if bus._nominal_voltage is not None]
+        voltages = np.array([bus._res_voltage_getter(warning=False) for bus in buses], dtype=np.complex128)
+        nominal_voltages = np.array([bus._nominal_voltage for bus in buses], dtype=np.float64)
+        lines = [line for line in self.lines.values() if line._parameters._ampacity is not None]
+        currents1 = np.array([line._side1._res_current_getter(warning=False) for line in lines], dtype=np.complex128)
+        currents2 = np.array([line._side2._res_current_getter(warning=False) for line in lines], dtype=np.complex128)
+        ampacities = np.array([line._parameters._ampacity for line in lines], dtype=np.float64)
+        transformers = list(self.transformers.values())
+        powers_hv = np.array([tr._side1._res_power_getter(warning=False) for tr in transformers], dtype=np.complex128)
+        powers_lv = np.array([tr._side2._res_power_getter(warning=False) for tr in transformers], dtype=np.complex128)
+        sn = np.array([tr._parameters._sn for tr in transformers], dtype=np.float64)
+        return {
+            "bus": _ResLimits(
+                ids=[bus.id for bus in buses],
+                element_index=np.arange(len(buses)),
+                phases=None,
+                values=np.abs(voltages) / nominal_voltages,
+                min_limits=np.array(
+                    [nan if bus._min_voltage_level is None else bus._min_voltage_level for bus in buses],
+                    dtype=np.float64,
+                ),
+                max_limits=np.array(
+                    [nan if bus._max_voltage_level is None else bus._max_voltage_level for bus in buses],
+                    dtype=np.float64,
+                ),
+            ),
+            "line": _ResLimits(
+                ids=[line.id for line in lines],
+                element_index=np.arange(len(lines)),
+                phases=None,
+                values=np.maximum(np.abs(currents1), np.abs(currents2)) / ampacities,
+                min_limits=np.full(len(lines), nan),
+                max_limits=np.array([line._max_loading for line in lines], dtype=np.float64),
+            ),
+            "transformer": _ResLimits(
+                ids=[tr.id for tr in transformers],
+                element_index=np.arange(len(transformers)),
+                phases=None,
+                values=np.maximum(np.abs(powers_hv), np.abs(powers_lv)) / sn,
+                min_limits=np.full(len(transformers), nan),
+                max_limits=np.array([tr._max_loading for tr in transformers], dtype=np.float64),
+            ),
+        }
+
     def _propagate_voltages(self) -> None:
         starting_voltage, starting_source = self._get_starting_voltage()
         elements: list[tuple[Element, complex, Element | None]] = [(starting_source, starting_voltage, None)]
@@ -791,6 +894,27 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     def _check_ref(cls, elements: Iterable[Element]) -> None:
         pass  # potential reference is managed internally
 
+    def _create_equivalent_load(
+        self, id: Id, bus: Bus, new_bus: Bus, elements: list[AbstractConnectable], model: ReductionModel
+    ) -> Load:
+        # The current drawn from the bus by the elements of the reduced sub-network
+        current = sum(element._res_current_getter(warning=False) for element in elements)
+        voltage = bus._res_voltage_getter(warning=False)
+        if model == "power":
+            return PowerLoad(id=id, bus=new_bus, power=SQRT3 * voltage * current.conjugate())
+        elif model == "current":
+            # The current of the load is defined relative to its voltage
+            return CurrentLoad(id=id, bus=new_bus, current=current * abs(voltage) / voltage)
+        elif cmath.isclose(current, 0):
+            msg = (
+                f"The sub-network connected to bus {bus.id!r} cannot be reduced to an impedance load "
+                f"because it draws no current."
+            )
+            logger.error(msg)
+            raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION)
+        else:
+            return ImpedanceLoad(id=id, bus=new_bus, impedance=voltage / (SQRT3 * current))
+
     #
     # Results saving
     #
@@ -840,6 +964,101 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     def _to_dict(self, include_results: bool) -> JsonDict:
         return network_to_dict(en=self, include_results=include_results)
 
+    @classmethod
+    def from_frames(
+        cls,
+        *,
+        name: str = "Network",
+        buses: pd.DataFrame,
+        lines: pd.DataFrame | None = None,
+        transformers: pd.DataFrame | None = None,
+        switches: pd.DataFrame | None = None,
+        regulators: pd.DataFrame | None = None,
+        loads: pd.DataFrame | None = None,
+        sources: pd.DataFrame | None = None,
+        lines_params: MapOrSeq[LineParameters] = (),
+        transformers_params: MapOrSeq[TransformerParameters] = (),
+        regulators_params: MapOrSeq[RegulatorParameters] = (),
+        crs: CRSLike | None = None,
+    ) -> Self:
+        """Construct an electrical network from (geo) data frames.
+
+        This is the inverse of the ``*_frame`` properties of the network: the frames have the same
+        columns and are indexed by the IDs of the elements, and the frames of a network without
+        flexible loads can be passed as they are to rebuild it. The columns of each frame are checked
+        at once before its elements are created. The values are in the units of the ``*_frame``
+        properties (V, km, etc.). The optional columns can be omitted and their missing values
+        take the default values of the constructors of the elements.
+
+        Args:
+            name:
+                The name of the network. Defaults to ``"Network"``.
+
+            buses:
+                The buses with the optional columns ``nominal_voltage``, ``min_voltage_level``,
+                ``max_voltage_level`` and ``geometry``.
+
+            lines:
+                The lines with the columns ``bus1_id``, ``bus2_id``, ``parameters_id`` and
+                ``length`` and the optional columns ``max_loading`` and ``geometry``.
+
+            transformers:
+                The transformers with the columns ``bus_hv_id``, ``bus_lv_id`` and
+                ``parameters_id`` and the optional columns ``tap``, ``max_loading`` and
+                ``geometry``.
+
+            switches:
+                The switches with the columns ``bus1_id`` and ``bus2_id`` and the optional columns
+                ``closed`` and ``geometry``.
+
+            regulators:
+                The voltage regulators with the columns ``bus1_id``, ``bus2_id`` and
+                ``parameters_id`` and the optional columns ``u_ref``, ``max_loading`` and
+                ``geometry``.
+
+            loads:
+                The loads with the columns ``type`` (``"power"``, ``"current"`` or
+                ``"impedance"``) and ``bus_id`` and a column with the value of each type of load:
+                ``power`` (VA), ``current`` (A) or ``impedance`` (Ohm). Flexible loads are not
+                supported.
+
+            sources:
+                The voltage sources with the columns ``bus_id`` and ``voltage`` (V).
+
+            lines_params:
+                The parameters referenced by the ``parameters_id`` column of the lines. Either a
+                list of parameters or a dictionary of parameters with their IDs as keys.
+
+            transformers_params:
+                The parameters referenced by the ``parameters_id`` column of the transformers.
+
+            regulators_params:
+                The parameters referenced by the ``parameters_id`` column of the regulators.
+
+            crs:
+                The Coordinate Reference System of the network. Defaults to the CRS of the buses
+                geo data frame, if any.
+
+        Returns:
+            The constructed network.
+        """
+        return cls(
+            **network_from_frames(
+                name=name,
+                buses=buses,
+                lines=lines,
+                transformers=transformers,
+                switches=switches,
+                regulators=regulators,
+                loads=loads,
+                sources=sources,
+                lines_params=lines_params,
+                transformers_params=transformers_params,
+                regulators_params=regulators_params,
+                crs=crs,
+            )
+        )
+
     @classmethod
     def _from_dgs(cls, data: Mapping[str, Any], /, use_name_as_id: bool = False) -> Self:
         return cls(**network_from_dgs(data, use_name_as_id))
@@ -865,10 +1084,9 @@ class ElectricalNetwork(AbstractNetwork[Element]):
             encoding:
                 The encoding of the file to be passed to the `open` function.
         """
-        data = network_to_dgs(self)
         path = Path(path).expanduser().resolve()
         with open(path, "w", encoding=encoding) as f:
-            json.dump(data, f, indent=2)
+            write_dgs_tables(iter_network_dgs(self), f)
         return path
 
     @classmethod
@@ -917,6 +1135,9 @@ class ElectricalNetwork(AbstractNetwork[Element]):
     def from_catalogue(cls, name: str | re.Pattern[str], load_point_name: str | re.Pattern[str]) -> Self:
         """Create a network from the catalogue.
 
+        The networks are converted from the multi-phase networks of the catalogue once per process.
+        Every call returns a new copy of the cached network that can be modified freely.
+
         Args:
             name:
                 The name of the network to get from the catalogue. It can be a regular expression.
@@ -928,5 +1149,9 @@ class ElectricalNetwork(AbstractNetwork[Element]):
         Returns:
             The selected network.
         """
-        en_m = MultiElectricalNetwork.from_catalogue(name=name, load_point_name=load_point_name)
-        return cls.from_rlf(en_m, on_incompatible="ignore")
+
+        def create() -> Self:
+            en_m = MultiElectricalNetwork.from_catalogue(name=name, load_point_name=load_point_name)
+            return cls.from_rlf(en_m, on_incompatible="ignore")
+
+        return get_catalogue_network(cls, (name, load_point_name), create)
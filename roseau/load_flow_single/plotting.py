@@ -7,6 +7,7 @@ import shapely as shp
 
 from roseau.load_flow.plotting import (
     _DEFAULT_MAP_STYLE_COLORS,
+    VoltageProfileData,
     _check_folium,
     _default_map_results_style_color,
     _make_style_color_callback,
@@ -469,3 +470,53 @@ def voltage_profile(
         switch_length=switch_length,
         distance_unit=distance_unit,
     )
+
+
+def voltage_profile_data(
+    network: ElectricalNetwork,
+    *,
+    starting_bus_id: Id | None = None,
+    traverse_transformers: bool = False,
+    switch_length: float | None = None,
+    distance_unit: str = "km",
+) -> VoltageProfileData:
+    """Get the data of the voltage profile of the network as arrays.
+
+    Unlike :func:`voltage_profile`, the returned object does not plot the profile, it holds the
+    distances and voltages of the buses and the loadings of the branches as numpy arrays. Call its
+    :meth:`~roseau.load_flow.plotting.VoltageProfileData.refresh` method after each load flow to update the results without
+    traversing the network again.
+
+    Args:
+        network:
+            The electrical network to create the voltage profile for.
+
+        starting_bus_id:
+            The ID of the bus to start the profile from. If None, the bus of the source with the
+            highest voltage is used.
+
+        traverse_transformers:
+            If True, the entire network is traversed including transformers. If False, transformers
+            are not traversed.
+
+        switch_length:
+            The length in km to assign to switches when calculating distances. If None, it is set to
+            the minimum of 2 meters and the shortest line in the network. Must be non-negative.
+
+        distance_unit:
+            The unit to use for distances in the profile. Defaults to "km".
+
+    Returns:
+        The arrays of the voltage profile.
+    """
+    if network.is_multi_phase:
+        raise TypeError(
+            "Only single-phase networks are supported. Did you mean to use rlf.plotting.voltage_profile_data?"
+        )
+    return VoltageProfileData(
+        network,
+        starting_bus_id=starting_bus_id,
+        traverse_transformers=traverse_transformers,
+        switch_length=switch_length,
+        distance_unit=distance_unit,
+    )
@@ -11,8 +11,9 @@ import numpy.testing as npt
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
+from shapely import LineString, Point, Polygon
 
-from roseau.load_flow import Q_, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
+from roseau.load_flow import Q_, SQRT3, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow import ElectricalNetwork as ElectricalNetworkMulti
 from roseau.load_flow.testing import assert_json_close
 from roseau.load_flow.utils import LoadTypeDtype
@@ -25,6 +26,7 @@ from roseau.load_flow.utils.testing import (
 from roseau.load_flow_single.models import (
     Bus,
     CurrentLoad,
+    FlexibleParameter,
     ImpedanceLoad,
     Line,
     LineParameters,
@@ -161,46 +163,46 @@ def test_recursive_connect_disconnect():
         parameters=lp,
         length=0.5,
     )
-    assert load_bus._connected_elements == [load, line, new_line]
+    assert list(load_bus._connected_elements) == [load, line, new_line]
     assert new_bus.network == en
-    assert new_bus._connected_elements == [new_load, new_line2, new_line]
+    assert list(new_bus._connected_elements) == [new_load, new_line2, new_line]
     assert new_bus.id in en.buses
     assert new_line.network == en
-    assert new_line._connected_elements == [new_bus, load_bus]
+    assert list(new_line._connected_elements) == [new_bus, load_bus]
     assert new_line.id in en.lines
     assert new_load.network == en
-    assert new_load._connected_elements == [new_bus]
+    assert list(new_load._connected_elements) == [new_bus]
     assert new_load.id in en.loads
     assert new_bus2.network == en
-    assert new_bus2._connected_elements == [new_load2, new_line2]
+    assert list(new_bus2._connected_elements) == [new_load2, new_line2]
     assert new_bus2.id in en.buses
     assert new_line2.network == en
-    assert new_line2._connected_elements == [new_bus2, new_bus]
+    assert list(new_line2._connected_elements) == [new_bus2, new_bus]
     assert new_line2.id in en.lines
     assert new_load2.network == en
-    assert new_load2._connected_elements == [new_bus2]
+    assert list(new_load2._connected_elements) == [new_bus2]
     assert new_load2.id in en.loads
 
     # Disconnect a load
     new_load.disconnect()
-    assert load_bus._connected_elements == [load, line, new_line]
+    assert list(load_bus._connected_elements) == [load, line, new_line]
     assert new_bus.network == en
-    assert new_bus._connected_elements == [new_line2, new_line]
+    assert list(new_bus._connected_elements) == [new_line2, new_line]
     assert new_bus.id in en.buses
     assert new_line.network == en
-    assert new_line._connected_elements == [new_bus, load_bus]
+    assert list(new_line._connected_elements) == [new_bus, load_bus]
     assert new_line.id in en.lines
     assert new_load.network is None
-    assert new_load._connected_elements == []
+    assert list(new_load._connected_elements) == []
     assert new_load.id not in en.loads
     assert new_bus2.network == en
-    assert new_bus2._connected_elements == [new_load2, new_line2]
+    assert list(new_bus2._connected_elements) == [new_load2, new_line2]
     assert new_bus2.id in en.buses
     assert new_line2.network == en
-    assert new_line2._connected_elements == [new_bus2, new_bus]
+    assert list(new_line2._connected_elements) == [new_bus2, new_bus]
     assert new_line2.id in en.lines
     assert new_load2.network == en
-    assert new_load2._connected_elements == [new_bus2]
+    assert list(new_load2._connected_elements) == [new_bus2]
     assert new_load2.id in en.loads
 
 
@@ -397,15 +399,15 @@ def test_network_frames(small_network: ElectricalNetwork):
     # Loads
     loads_df = small_network.loads_frame
     assert isinstance(loads_df, pd.DataFrame)
-    assert loads_df.shape == (1, 3)
-    assert loads_df.columns.tolist() == ["type", "bus_id", "flexible"]
+    assert loads_df.shape == (1, 6)
+    assert loads_df.columns.tolist() == ["type", "bus_id", "flexible", "power", "current", "impedance"]
     assert loads_df.index.name == "id"
 
     # Sources
     sources_df = small_network.sources_frame
     assert isinstance(sources_df, pd.DataFrame)
-    assert sources_df.shape == (1, 1)
-    assert sources_df.columns.tolist() == ["bus_id"]
+    assert sources_df.shape == (1, 2)
+    assert sources_df.columns.tolist() == ["bus_id", "voltage"]
     assert sources_df.index.name == "id"
 
 
@@ -439,6 +441,126 @@ def test_to_from_dict_roundtrip(all_elements_network_with_results: ElectricalNet
     assert new_net.tool_data.to_dict() == en.tool_data.to_dict()
 
 
+def test_copy(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+
+    # Without results
+    new_net = en.copy()
+    assert new_net.to_dict(include_results=False) == en.to_dict(include_results=False)
+    with pytest.raises(RoseauLoadFlowException, match=r"The load flow results are not available") as e:
+        _ = new_net.res_buses
+    assert e.value.code == RoseauLoadFlowExceptionCode.LOAD_FLOW_NOT_RUN
+
+    # The elements are new objects attached to the new network
+    for element_type, elements in en._elements_by_type.items():
+        new_elements = new_net._elements_by_type[element_type]
+        assert new_elements.keys() == elements.keys()
+        for element_id, element in elements.items():
+            assert new_elements[element_id] is not element
+            assert new_elements[element_id].network is new_net
+
+    # The parameters are shared
+    line_id, line = next(iter(en.lines.items()))
+    new_line = new_net.lines[line_id]
+    assert new_line.parameters is line.parameters
+    for element_type in ("transformer", "regulator"):
+        for element_id, element in en._elements_by_type[element_type].items():
+            assert new_net._elements_by_type[element_type][element_id].parameters is element.parameters
+
+    # Modifying the copy does not modify the original network
+    new_line.length = line.length.m * 2
+    assert line.length.m != new_line.length.m
+
+    # With results
+    new_net = en.copy(include_results=True)
+    assert new_net.to_dict(include_results=True) == en.to_dict(include_results=True)
+    with warnings.catch_warnings(action="error"):
+        assert_frame_equal(new_net.res_buses, en.res_buses)
+        assert_frame_equal(new_net.res_lines, en.res_lines)
+
+
+def test_reduce(all_elements_network_with_results: ElectricalNetwork):
+    en = all_elements_network_with_results
+    transformer = en.transformers["transformer0"]
+    expected_current = -transformer.side_lv.res_current.m  # the LV network current
+    voltage = transformer.bus_lv.res_voltage.m
+
+    for model in ("power", "current", "impedance"):
+        reduction = en.reduce(["bus2", "bus3", "bus4"], model=model)
+        reduced = reduction.network
+        assert reduced.buses.keys() == {"bus0", "bus1", "bus2", "bus5"}
+        assert reduced.loads.keys() == {"bus2_equivalent"}
+        assert reduction.removed_elements_ids["switch"] == ["switch0"]
+        load = reduced.loads["bus2_equivalent"]
+        if model == "power":
+            current = (load.power.m / (SQRT3 * voltage)).conjugate()
+        elif model == "current":
+            current = load.current.m * voltage / abs(voltage)
+        else:
+            current = voltage / (SQRT3 * load.impedance.m)
+        assert cmath.isclose(current, expected_current)
+
+    # Expand the reduced network
+    expanded = reduction.expand()
+    data = expanded.to_dict(include_results=False)
+    original_data = en.to_dict(include_results=False)
+    assert data.keys() == original_data.keys()
+    for key, value in data.items():
+        if isinstance(value, list):
+            assert sorted(value, key=lambda d: d["id"]) == sorted(original_data[key], key=lambda d: d["id"])
+        else:
+            assert value == original_data[key]
+
+    # The sub-network must have a single boundary bus (bus5 is connected to bus0 by a regulator)
+    with pytest.raises(RoseauLoadFlowException, match=r"connected through the buses 'bus2', 'bus5'\.") as e:
+        en.reduce(["bus2", "bus3", "bus4", "bus5"])
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_NETWORK_REDUCTION
+
+
+def test_spatial_queries():
+    lp = LineParameters(id="lp", z_line=0.1)
+    buses = [Bus(id=f"bus{i}", geometry=Point(i, 0)) for i in range(4)]
+    VoltageSource(id="source", bus=buses[0], voltage=400)
+    for i in range(3):
+        Line(
+            id=f"line{i}",
+            bus1=buses[i],
+            bus2=buses[i + 1],
+            parameters=lp,
+            length=0.1,
+            geometry=LineString([(i, 0), (i + 1, 0)]),
+        )
+    rp = RegulatorParameters(id="rp", un=400, sn=100e3, z2=0.1, ym=0.1j)
+    reg_bus = Bus(id="reg_bus", geometry=Point(3, 1))
+    VoltageRegulator(id="reg", bus1=buses[3], bus2=reg_bus, parameters=rp, geometry=LineString([(3, 0), (3, 1)]))
+    en = ElectricalNetwork.from_element(buses[0])
+
+    nearest = en.nearest_buses([(0.2, 0), (3.2, 0.9)], k=2)
+    assert nearest.index.tolist() == [0, 0, 1, 1]
+    assert nearest["bus_id"].tolist() == ["bus0", "bus1", "reg_bus", "bus3"]
+    npt.assert_allclose(nearest["distance"], [0.2, 0.8, np.hypot(0.2, 0.1), np.hypot(0.2, 0.9)])
+    nearest = en.nearest_lines(Point(1.5, 0.5), max_distance=0.1)
+    assert nearest.empty
+    assert list(nearest.columns) == ["line_id", "distance"]
+
+    polygon = Polygon([(2.5, -1), (4, -1), (4, 2), (2.5, 2)])
+    assert en.elements_within(polygon) == {
+        "bus": ["bus3", "reg_bus"],
+        "line": [],
+        "transformer": [],
+        "switch": [],
+        "regulator": ["reg"],
+    }
+    en.regulators["reg"].geometry = None
+    assert en.elements_within(polygon, element_types=["regulator", "line"], predicate="intersects") == {
+        "regulator": [],
+        "line": ["line2"],
+    }
+    with pytest.raises(RoseauLoadFlowException) as e:
+        en.regulators["reg"].geometry = "POINT (0 0)"
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_GEOMETRY_TYPE
+
+
 def test_network_elements(small_network: ElectricalNetwork):
     # Add a line to the network ("New Bus 1" belongs to the network)
     bus1 = next(iter(small_network.buses.values()))
@@ -1099,7 +1221,7 @@ def test_get_catalogue():
 
 
 def test_to_graph(small_network: ElectricalNetwork):
-    g = small_network.to_graph()
+    g = small_network.to_graph(geometry=True)
     assert isinstance(g, nx.MultiGraph)
     assert sorted(g.nodes) == sorted(small_network.buses)
     assert sorted(g.edges) == sorted(
@@ -1151,6 +1273,16 @@ def test_to_graph(small_network: ElectricalNetwork):
             "closed": switch.closed,
         }
 
+    # The geometries are only added when requested
+    g_no_geom = small_network.to_graph()
+    assert dict(g_no_geom.nodes(data=True)) == {
+        node: {name: value for name, value in data.items() if name != "geom"} for node, data in g.nodes(data=True)
+    }
+    assert {(u, v, key): data for u, v, key, data in g_no_geom.edges(keys=True, data=True)} == {
+        (u, v, key): {name: value for name, value in data.items() if name != "geom"}
+        for u, v, key, data in g.edges(keys=True, data=True)
+    }
+
     # Test parallel branches
     bus1 = Bus(id="Bus1")
     bus2 = Bus(id="Bus2")
@@ -1183,6 +1315,42 @@ def test_to_graph(small_network: ElectricalNetwork):
     json.dumps(json_data, ensure_ascii=False)
 
 
+def test_to_sparse_graph():
+    bus1 = Bus(id="Bus1")
+    bus2 = Bus(id="Bus2")
+    bus3 = Bus(id="Bus3")
+    bus4 = Bus(id="Bus4")
+    source = VoltageSource(id="Source", bus=bus1, voltage=20e3)
+    lp = LineParameters(id="lp", z_line=0.3 + 0.4j)
+    line = Line(id="Line", bus1=bus1, bus2=bus2, parameters=lp, length=2.0)
+    rp = RegulatorParameters(id="RP", un=20e3, sn=160e3, z2=0.01, ym=0.01j)
+    reg = VoltageRegulator(id="Reg", bus1=bus2, bus2=bus3, parameters=rp)
+    sw = Switch(id="Switch", bus1=bus3, bus2=bus4)
+    en = ElectricalNetwork(
+        buses=[bus1, bus2, bus3, bus4],
+        lines=[line],
+        transformers=[],
+        switches=[sw],
+        loads=[],
+        sources=[source],
+        regulators=[reg],
+    )
+    sg = en.to_sparse_graph(weight="impedance")
+    assert sg.bus_ids.tolist() == ["Bus1", "Bus2", "Bus3", "Bus4"]
+    assert sg.branch_ids.tolist() == ["Line", "Switch", "Reg"]
+    assert sg.branch_types.tolist() == ["line", "switch", "regulator"]
+    npt.assert_allclose(sg.weights, [1.0, 0.0, 0.01])
+    npt.assert_array_equal(sg.incidence.toarray(), [[1, 0, 0], [-1, 0, 1], [0, 1, -1], [0, -1, 0]])
+    sw.open()
+    graph = en.to_rustworkx(weight="length")
+    assert graph.nodes() == ["Bus1", "Bus2", "Bus3", "Bus4"]
+    assert graph.edges() == [
+        {"id": "Line", "type": "line", "weight": 2.0},
+        {"id": "Reg", "type": "regulator", "weight": 0.0},
+    ]
+    assert list(graph.edge_list()) == [(0, 1), (1, 2)]
+
+
 def test_serialization(all_elements_network, all_elements_network_with_results):
     def assert_results(en_dict: dict, included: bool):
         for bus_data in en_dict["buses"]:
@@ -1235,6 +1403,45 @@ def test_serialization(all_elements_network, all_elements_network_with_results):
     assert ElectricalNetwork.from_dict(en_dict_without_results).to_dict() == en_dict_without_results
 
 
+def test_res_violations(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    en.buses["bus5"].max_voltage_level = 1.02
+
+    records = []
+    for bus in en.buses.values():
+        if bus.res_violated:
+            min_level = np.nan if bus.min_voltage_level is None else bus.min_voltage_level.m
+            max_level = np.nan if bus.max_voltage_level is None else bus.max_voltage_level.m
+            records.append(("bus", bus.id, bus.res_voltage_level.m, min_level, max_level))
+    for line in en.lines.values():
+        if line.res_violated:
+            records.append(("line", line.id, line.res_loading.m, np.nan, line.max_loading.m))
+    for transformer in en.transformers.values():
+        if transformer.res_violated:
+            records.append(
+                ("transformer", transformer.id, transformer.res_loading.m, np.nan, transformer.max_loading.m)
+            )
+    expected_df = pd.DataFrame.from_records(
+        records, columns=["element_type", "element_id", "value", "min_limit", "max_limit"]
+    ).set_index(["element_type", "element_id"])
+    violations_df = en.res_violations()
+    assert_frame_equal(violations_df, expected_df, check_index_type=False)
+    assert violations_df.index.tolist() == [("bus", "bus5"), ("line", "line1")]
+
+    summary = en.res_summary()
+    levels = {bus.id: bus.res_voltage_level.m for bus in en.buses.values() if bus.nominal_voltage is not None}
+    loadings = {line.id: line.res_loading.m for line in en.lines.values() if line.ampacity is not None}
+    assert summary["min_voltage_level"] == pytest.approx(min(levels.values()))
+    assert summary["min_voltage_level_bus_id"] == min(levels, key=levels.__getitem__)
+    assert summary["max_voltage_level"] == pytest.approx(max(levels.values()))
+    assert summary["max_voltage_level_bus_id"] == max(levels, key=levels.__getitem__)
+    assert summary["max_line_loading"] == pytest.approx(max(loadings.values()))
+    assert summary["max_line_loading_line_id"] == max(loadings, key=loadings.__getitem__)
+    assert summary["nb_violated_buses"] == 1
+    assert summary["nb_violated_lines"] == 1
+    assert summary["nb_violated_transformers"] == 0
+
+
 def test_results_to_dict(all_elements_network_with_results):
     en = all_elements_network_with_results
 
@@ -1507,8 +1714,8 @@ def test_duplicate_line_parameters_id():
     lp2 = LineParameters("LP", z_line=0.1 + 0.1j)
     ln1 = Line("Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
     ln2 = Line("Line 2", bus1=bus1, bus2=bus2, parameters=lp2, length=0.1)
-    assert lp1._elements == {ln1}
-    assert lp2._elements == {ln2}
+    assert set(lp1._elements) == {ln1}
+    assert set(lp2._elements) == {ln2}
     with pytest.raises(RoseauLoadFlowException) as e:
         en = ElectricalNetwork.from_element(bus1)
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
@@ -1537,7 +1744,7 @@ def test_duplicate_line_parameters_id():
     lp1 = LineParameters("LP", z_line=0.1 + 0.1j)
     ln1 = Line("Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
     ln2 = Line("Line 2", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
-    assert lp1._elements == {ln1, ln2}
+    assert set(lp1._elements) == {ln1, ln2}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["line"] == {lp1.id: lp1}
     lp2 = LineParameters("LP", z_line=0.1 + 0.1j)
@@ -1554,13 +1761,13 @@ def test_duplicate_line_parameters_id():
     VoltageSource("Source", bus=bus1, voltage=20e3)
     lp1 = LineParameters("LP", z_line=0.1 + 0.1j)
     ln1 = Line("Line 1", bus1=bus1, bus2=bus2, parameters=lp1, length=0.1)
-    assert lp1._elements == {ln1}
+    assert set(lp1._elements) == {ln1}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["line"] == {lp1.id: lp1}
     lp2 = LineParameters("LP", z_line=0.1 + 0.1j)
     ln1.parameters = lp2
-    assert lp1._elements == set()
-    assert lp2._elements == {ln1}
+    assert set(lp1._elements) == set()
+    assert set(lp2._elements) == {ln1}
     assert en._parameters["line"] == {lp2.id: lp2}
 
 
@@ -1573,8 +1780,8 @@ def test_duplicate_transformer_parameters_id():
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
     tr1 = Transformer("Tr 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
     tr2 = Transformer("Tr 2", bus_hv=bus1, bus_lv=bus2, parameters=tp2)
-    assert tp1._elements == {tr1}
-    assert tp2._elements == {tr2}
+    assert set(tp1._elements) == {tr1}
+    assert set(tp2._elements) == {tr2}
     with pytest.raises(RoseauLoadFlowException) as e:
         en = ElectricalNetwork.from_element(bus1)
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
@@ -1604,7 +1811,7 @@ def test_duplicate_transformer_parameters_id():
     tp1 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=100e3, z2=0.1, ym=0.1j)
     tr1 = Transformer("Tr 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
     tr2 = Transformer("Tr 2", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
-    assert tp1._elements == {tr1, tr2}
+    assert set(tp1._elements) == {tr1, tr2}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["transformer"] == {tp1.id: tp1}
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
@@ -1621,13 +1828,13 @@ def test_duplicate_transformer_parameters_id():
     VoltageSource("Source", bus=bus1, voltage=20e3)
     tp1 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=100e3, z2=0.1, ym=0.1j)
     tr1 = Transformer("Tr 1", bus_hv=bus1, bus_lv=bus2, parameters=tp1)
-    assert tp1._elements == {tr1}
+    assert set(tp1._elements) == {tr1}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["transformer"] == {tp1.id: tp1}
     tp2 = TransformerParameters("TP", vg="Dyn11", uhv=20e3, ulv=400, sn=160e3, z2=0.01, ym=0.01j)
     tr1.parameters = tp2
-    assert tp1._elements == set()
-    assert tp2._elements == {tr1}
+    assert set(tp1._elements) == set()
+    assert set(tp2._elements) == {tr1}
     assert en._parameters["transformer"] == {tp2.id: tp2}
 
 
@@ -1640,8 +1847,8 @@ def test_duplicate_regulator_parameters_id():
     rp2 = RegulatorParameters("RP", un=20e3, sn=160e3, z2=0.01, ym=0.01j)
     reg1 = VoltageRegulator("Reg 1", bus1=bus1, bus2=bus2, parameters=rp1)
     reg2 = VoltageRegulator("Reg 2", bus1=bus1, bus2=bus2, parameters=rp2)
-    assert rp1._elements == {reg1}
-    assert rp2._elements == {reg2}
+    assert set(rp1._elements) == {reg1}
+    assert set(rp2._elements) == {reg2}
     with pytest.raises(RoseauLoadFlowException) as e:
         ElectricalNetwork.from_element(bus1)
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_PARAMETERS_ID
@@ -1667,7 +1874,7 @@ def test_duplicate_regulator_parameters_id():
     rp1 = RegulatorParameters("RP", un=20e3, sn=100e3, z2=0.1, ym=0.1j)
     reg1 = VoltageRegulator("Reg 1", bus1=bus1, bus2=bus2, parameters=rp1)
     reg2 = VoltageRegulator("Reg 2", bus1=bus1, bus2=bus2, parameters=rp1)
-    assert rp1._elements == {reg1, reg2}
+    assert set(rp1._elements) == {reg1, reg2}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["regulator"] == {rp1.id: rp1}
     rp2 = RegulatorParameters("RP", un=20e3, sn=160e3, z2=0.01, ym=0.01j)
@@ -1684,13 +1891,13 @@ def test_duplicate_regulator_parameters_id():
     VoltageSource("Source", bus=bus1, voltage=20e3)
     rp1 = RegulatorParameters("RP", un=20e3, sn=100e3, z2=0.1, ym=0.1j)
     reg1 = VoltageRegulator("Reg 1", bus1=bus1, bus2=bus2, parameters=rp1)
-    assert rp1._elements == {reg1}
+    assert set(rp1._elements) == {reg1}
     en = ElectricalNetwork.from_element(bus1)
     assert en._parameters["regulator"] == {rp1.id: rp1}
     rp2 = RegulatorParameters("RP", un=20e3, sn=160e3, z2=0.01, ym=0.01j)
     reg1.parameters = rp2
-    assert rp1._elements == set()
-    assert rp2._elements == {reg1}
+    assert set(rp1._elements) == set()
+    assert set(rp2._elements) == {reg1}
     assert en._parameters["regulator"] == {rp2.id: rp2}
 
 
@@ -1719,3 +1926,71 @@ def test_propagate_voltages_voltage_regulators():
     ElectricalNetwork.from_element(bus1)
     npt.assert_allclose(bus1.initial_voltage.m, 20e3)
     npt.assert_allclose(bus2.initial_voltage.m, 21e3)  # <- regulation voltage
+
+
+def test_diff(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    other = en.copy(include_results=True)
+    assert en.diff(other).equal
+
+    other.lines["line0"].length = 2.0
+    other.loads["load0"].power = 150
+    diff = en.diff(other, include_results=False)
+    assert diff.differences.index.tolist() == [("lines", "line0", "length"), ("loads", "load0", "power")]
+    assert diff.differences["max_difference"].tolist() == [0.5, pytest.approx(abs(100 + 5j - 150))]
+
+    # The flexible parameters and the taps of the regulators
+    other = en.copy(include_results=True)
+    fp_data = en.loads["load3"].flexible_param.to_dict() | {"s_max": 2.0}
+    other.loads["load3"]._flexible_param = FlexibleParameter.from_dict(fp_data)  # the copies share the parameters
+    other.regulators["reg0"]._res_tap = 1.05
+    diff = en.diff(other)
+    assert diff.differences.index.tolist() == [
+        ("regulators", "reg0", "results.tap"),
+        ("loads", "load3", "flexible_param.s_max"),
+    ]
+    assert diff.differences.loc[("regulators", "reg0", "results.tap"), "other_value"] == 1.05
+
+    # Single-phase and multi-phase networks cannot be compared
+    with pytest.raises(TypeError, match=r"Expected a network of type"):
+        en.diff(ElectricalNetworkMulti.from_catalogue(name="LVFeeder00939", load_point_name="Summer"))
+
+
+def test_from_frames(all_elements_network):
+    en = all_elements_network
+    loads = en.loads_frame
+    loads = loads[~loads["flexible"]]  # flexible loads are not supported
+    sources = en.sources_frame
+    new_en = ElectricalNetwork.from_frames(
+        buses=en.buses_frame,
+        lines=en.lines_frame,
+        transformers=en.transformers_frame,
+        switches=en.switches_frame,
+        regulators=en.regulators_frame,
+        loads=loads,
+        sources=sources,
+        lines_params=[line.parameters for line in en.lines.values()],
+        transformers_params=[tr.parameters for tr in en.transformers.values()],
+        regulators_params=[reg.parameters for reg in en.regulators.values()],
+        crs=en.crs,
+    )
+    diff = en.diff(new_en, include_results=False)
+    assert diff.only_in_network == {"loads": [f"load{i}" for i in range(3, 9)]}
+    assert diff.only_in_other == {}
+    assert diff.differences.empty
+
+    # Errors
+    buses = en.buses_frame
+    buses["nominal_voltage"] = "400 V"
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ElectricalNetwork.from_frames(buses=buses)
+    assert e.value.msg == "The column 'nominal_voltage' of the buses frame must contain numbers."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ElectricalNetwork.from_frames(buses=en.buses_frame, sources=sources.drop(columns="voltage"))
+    assert e.value.msg == "The sources frame is missing the required columns ['voltage']."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_DATA_FRAME
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ElectricalNetwork.from_frames(buses=en.buses_frame.drop(index="bus4"), loads=loads)
+    assert e.value.msg == "The column 'bus_id' of the loads frame references the unknown ID 'bus4'."
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_BUS_ID
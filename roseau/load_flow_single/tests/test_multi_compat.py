@@ -16,6 +16,10 @@ def test_import():
         "Ground",
         "PotentialRef",
         "GroundConnection",
+        # Tap control of multi-phase transformers
+        "TapChanger",
+        "TapControlResult",
+        "tap_control",
         # Sequences
         "NegativeSequence",
         "PositiveSequence",
@@ -28,6 +32,7 @@ def test_import():
         # Underscore things
         "__getattr__",
         "__about__",
+        "_parallel",
         "_solvers",
         # Unrelated imports
         "Any",
@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.testing as npt
+
 import roseau.load_flow_single as rlfs
 from roseau.load_flow.testing import assert_json_close
 
@@ -157,3 +160,26 @@ def test_voltage_profile_parallel_branches():
     assert sorted(profile.lines) == ["Line 1", "Line 2"]
     assert profile.buses["Bus 1"]["distance"] == 0.0
     assert profile.buses["Bus 2"]["distance"] == 1.0  # both paths equal length
+
+
+def test_voltage_profile_data(all_elements_network_with_results):
+    en = all_elements_network_with_results
+    for bus_id, vn in en._get_nominal_voltages().items():
+        en.buses[bus_id].nominal_voltage = vn
+    data = rlfs.plotting.voltage_profile_data(en, traverse_transformers=True)
+    profile = rlfs.plotting.voltage_profile(en, traverse_transformers=True)
+    assert data.edge_types == ["line", "line", "transformer", "switch", "regulator"]
+    assert list(profile.buses) == data.bus_ids
+    npt.assert_allclose(data.distances, [bus["distance"] for bus in profile.buses.values()])
+    npt.assert_allclose(data.voltages_min, [bus["voltage"] for bus in profile.buses.values()])
+    npt.assert_array_equal(data.voltages_min, data.voltages_max)
+    edges = [*profile.lines.values(), *profile.transformers.values()]
+    npt.assert_allclose(data.loadings[:3], [edge["loading"] for edge in edges])
+    assert np.isnan(data.loadings[3])  # switch
+    assert data.loadings[4] == profile.regulators["reg0"]["loading"]
+
+    # Opening a switch changes the shortest paths
+    tree = data._tree
+    en.switches["switch0"].open()
+    assert en._shortest_path_trees == {}
+    assert en._get_shortest_path_tree("bus0", traverse_transformers=True, switch_length=data.switch_length) is not tree